@@ -0,0 +1,3 @@
+# Benchmarks de rendimiento del sistema PythonForestal.
+# Ejecutar desde la raíz del proyecto, por ejemplo:
+#   python -m benchmarks.benchmark_almacenamiento_columnar
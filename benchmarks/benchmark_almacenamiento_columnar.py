@@ -0,0 +1,64 @@
+"""
+Benchmark de memoria y velocidad de recorrido: lista de objetos vs. almacenamiento columnar.
+
+Uso:
+    python -m benchmarks.benchmark_almacenamiento_columnar [CANTIDAD]
+"""
+import sys
+import time
+import tracemalloc
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 1_000_000
+
+
+def poblar(plantacion: Plantacion, cantidad: int) -> None:
+    """Agrega `cantidad` cultivos alternando los cuatro tipos."""
+    for indice in range(cantidad):
+        plantacion.agregar_cultivo(CultivoFactory.crear_cultivo(TIPOS[indice % len(TIPOS)]))
+
+
+def medir_memoria(columnar: bool, cantidad: int) -> tuple[Plantacion, int]:
+    """Construye una plantación y devuelve los bytes retenidos por ella."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    plantacion = Plantacion("Benchmark", float("inf"), 0, columnar=columnar)
+    poblar(plantacion, cantidad)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return plantacion, despues - antes
+
+
+def medir_recorrido(plantacion: Plantacion) -> tuple[float, float]:
+    """Tiempo de sumar superficies recorriendo cultivos y, si aplica, la columna directa."""
+    inicio = time.perf_counter()
+    sum(cultivo.superficie for cultivo in plantacion.cultivos)
+    por_objeto = time.perf_counter() - inicio
+
+    por_columna = float("nan")
+    if plantacion.es_columnar:
+        inicio = time.perf_counter()
+        sum(plantacion.cultivos.superficie)
+        por_columna = time.perf_counter() - inicio
+    return por_objeto, por_columna
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    print(f"Cultivos: {cantidad:,}")
+    print(f"{'Formato':<12}{'Memoria (MB)':>14}{'B/cultivo':>12}{'Recorrido (s)':>16}{'Columna (s)':>14}")
+    for columnar in (False, True):
+        plantacion, memoria = medir_memoria(columnar, cantidad)
+        por_objeto, por_columna = medir_recorrido(plantacion)
+        nombre = "columnar" if columnar else "lista"
+        print(f"{nombre:<12}{memoria / 1e6:>14.1f}{memoria / cantidad:>12.1f}"
+              f"{por_objeto:>16.3f}{por_columna:>14.3f}")
+        del plantacion
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Benchmark del historial de sensores en disco (ArchivoSerie): escritura de
+meses de lecturas y consultas por rango vía mmap e índice disperso, frente
+a leer todos los segmentos y filtrar. Las páginas tocadas se aproximan con
+los fallos de página menores del proceso (cada consulta abre el historial
+de nuevo, así que el mapa arranca sin páginas).
+
+Uso:
+    python -m benchmarks.benchmark_archivo_serie [DIAS] [INTERVALO_S]
+"""
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from array import array
+
+from python_forestacion.riego.historial.archivo_serie import ArchivoSerie
+from python_forestacion.servicios.negocio.persistencia.formato_segmento_serie import CABECERA
+from constante import INTERVALO_SENSOR_TEMPERATURA, EXTENSION_SEGMENTO_SERIE
+
+DIAS_POR_DEFECTO = 90
+DIA = 86400.0
+
+
+def _fallos_menores() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+
+
+def escribir(directorio: str, dias: int, intervalo: float) -> float:
+    azar = random.Random(42)
+    lecturas = int(dias * DIA / intervalo)
+    inicio = time.perf_counter()
+    with ArchivoSerie(directorio) as archivo:
+        for indice in range(lecturas):
+            archivo.agregar(azar.uniform(5, 40), indice * intervalo)
+    duracion = time.perf_counter() - inicio
+    tamano = sum(os.path.getsize(os.path.join(directorio, nombre)) for nombre in os.listdir(directorio))
+    print(f"Escritura: {lecturas:,} lecturas en {duracion:.2f} s ({duracion / lecturas * 1e9:.0f} ns/lectura), "
+          f"{tamano / 1e6:,.1f} MB en {len(os.listdir(directorio)) // 2} segmentos")
+    return lecturas * intervalo
+
+
+def leer_todo(directorio: str, desde: float, hasta: float) -> int:
+    """Línea de base: lee todos los segmentos completos y filtra."""
+    cantidad = 0
+    for nombre in sorted(os.listdir(directorio)):
+        if not nombre.endswith(EXTENSION_SEGMENTO_SERIE):
+            continue
+        registros = array("d")
+        with open(os.path.join(directorio, nombre), "rb") as archivo:
+            contenido = archivo.read()
+        registros.frombytes(contenido[CABECERA.size:])
+        cantidad += sum(1 for instante in registros[0::2] if desde <= instante <= hasta)
+    return cantidad
+
+
+def consultar(directorio: str, nombre: str, desde: float, hasta: float) -> None:
+    fallos = _fallos_menores()
+    inicio = time.perf_counter()
+    with ArchivoSerie(directorio, solo_lectura=True) as archivo:
+        abierto = time.perf_counter()
+        _, valores = archivo.rango(desde, hasta)
+        fin = time.perf_counter()
+    fallos = _fallos_menores() - fallos
+    inicio_base = time.perf_counter()
+    cantidad_base = leer_todo(directorio, desde, hasta)
+    duracion_base = time.perf_counter() - inicio_base
+    assert cantidad_base == len(valores)
+    print(f"{nombre:>22}{len(valores):>12,}{(abierto - inicio) * 1000:>10.2f}{(fin - abierto) * 1000:>12.2f}"
+          f"{fallos:>10,}{len(valores) * 16 / 4096:>12,.0f}{duracion_base * 1000:>14.1f}")
+
+
+def main() -> int:
+    dias = int(sys.argv[1]) if len(sys.argv) > 1 else DIAS_POR_DEFECTO
+    intervalo = float(sys.argv[2]) if len(sys.argv) > 2 else INTERVALO_SENSOR_TEMPERATURA
+    directorio = tempfile.mkdtemp()
+    try:
+        ahora = escribir(directorio, dias, intervalo)
+        print(f"{'Consulta':>22}{'Lecturas':>12}{'Abrir ms':>10}{'Rango ms':>12}{'Fallos':>10}"
+              f"{'Páginas':>12}{'Leer todo ms':>14}")
+        consultar(directorio, "última hora", ahora - 3600, ahora)
+        consultar(directorio, "hora a mitad", ahora / 2, ahora / 2 + 3600)
+        consultar(directorio, "último día", ahora - DIA, ahora)
+        consultar(directorio, "últimos 30 días", ahora - 30 * DIA, ahora)
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
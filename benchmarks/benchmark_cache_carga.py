@@ -0,0 +1,72 @@
+"""
+Benchmark de la caché de carga de Paquete: tiempo medio de cargar el mismo
+.dat repetidas veces sin caché y con CacheCarga, para el
+formato pickle comprimido y para el formato binario, con los contadores de
+aciertos y la memoria que ocupa la caché.
+
+Uso:
+    python -m benchmarks.benchmark_cache_carga [CANTIDAD] [REPETICIONES]
+"""
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.negocio.persistencia.cache_carga import CacheCarga
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 100_000
+REPETICIONES_POR_DEFECTO = 20
+PLANTACIONES = 50
+FORMATOS = (
+    ("pickle", {}),
+    ("pickle lzma", {"compresion": "lzma"}),
+    ("binario", {"formato": "binario"}),
+)
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    registro = RegistroForestal()
+    por_tipo = cantidad // PLANTACIONES // len(TIPOS)
+    for indice in range(PLANTACIONES):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, por_tipo)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def medir(paquete: Paquete, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        registro = paquete.cargar("registro")
+        registro.buscar_por_padron(0).superficie_ocupada
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else REPETICIONES_POR_DEFECTO
+    registro = crear_registro(cantidad)
+    print(f"Cultivos: {cantidad:,}, cargas por caso: {repeticiones}")
+    print(f"{'Formato':<14}{'Caché':<14}{'Carga media (ms)':>18}{'Aciertos':>10}{'Memoria (MB)':>14}")
+    directorio = tempfile.mkdtemp()
+    try:
+        for nombre, opciones in FORMATOS:
+            Paquete(directorio, **opciones).guardar(registro, "registro")
+            media = medir(Paquete(directorio, **opciones), repeticiones)
+            print(f"{nombre:<14}{'sin caché':<14}{media * 1000:>18.1f}{'-':>10}{'-':>14}")
+            cache = CacheCarga()
+            media = medir(Paquete(directorio, cache=cache, **opciones), repeticiones)
+            print(f"{nombre:<14}{cache.modo:<14}{media * 1000:>18.1f}"
+                  f"{cache.aciertos:>10}{cache.tamano_bytes / 1e6:>14.2f}")
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
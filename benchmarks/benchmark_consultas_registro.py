@@ -0,0 +1,68 @@
+"""
+Benchmark de consultas sobre RegistroForestal: índices vs. recorrido completo.
+
+Uso:
+    python -m benchmarks.benchmark_consultas_registro [CANTIDAD]
+"""
+import sys
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.consultas.predicados import Rango, ContieneTipo, Igual, Filtro
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 50_000
+REPETICIONES = 200
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    registro = RegistroForestal()
+    for indice in range(cantidad):
+        plantacion = Plantacion(f"Finca {indice}", 100.0 + indice % 1000, float(indice % 5000))
+        # Olivo poco frecuente para que la consulta por tipo sea selectiva
+        plantacion.plantar_lote(TIPOS[1] if indice % 97 == 0 else TIPOS[indice % 2 * 2], 1)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def _agua_baja(plantacion: Plantacion) -> bool:
+    return 100 <= plantacion.agua_disponible <= 110
+
+
+def _tiene_olivo(plantacion: Plantacion) -> bool:
+    return Olivo in plantacion.contar_por_tipo()
+
+
+def _padron_42(plantacion: Plantacion) -> bool:
+    return plantacion.nombre == "Finca 42"
+
+
+def cronometrar(registro: RegistroForestal, predicados: tuple, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        registro.consultar(*predicados)
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    registro = crear_registro(cantidad)
+    consultas = [
+        ("agua en rango", (Rango("agua_disponible", 100, 110),), (Filtro(_agua_baja),)),
+        ("contiene Olivo", (ContieneTipo(Olivo),), (Filtro(_tiene_olivo),)),
+        ("por padrón", (Igual("id_padron", 42),), (Filtro(_padron_42),)),
+    ]
+    print(f"Plantaciones: {cantidad:,}")
+    print(f"{'Consulta':<18}{'Resultados':>12}{'Índice (ms)':>14}{'Recorrido (ms)':>16}")
+    for nombre, indexada, recorrido in consultas:
+        resultados = len(registro.consultar(*indexada))
+        tiempo_indice = cronometrar(registro, indexada, REPETICIONES) * 1000
+        tiempo_recorrido = cronometrar(registro, recorrido, max(1, REPETICIONES // 20)) * 1000
+        print(f"{nombre:<18}{resultados:>12,}{tiempo_indice:>14.3f}{tiempo_recorrido:>16.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Benchmark del costo de creación por cultivo en CultivoFactory.
+
+Compara la versión anterior (cadena if/elif con lower() y armado de
+argumentos en cada llamada) con el registro por tipo y con crear_lote.
+
+Uso:
+    python -m benchmarks.benchmark_cultivo_factory [CANTIDAD]
+"""
+import gc
+import sys
+import time
+
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 200_000
+
+
+def crear_cultivo_anterior(tipo: str, **kwargs):
+    """Implementación previa de CultivoFactory.crear_cultivo, como referencia."""
+    tipo = tipo.lower()
+    if tipo == "pino":
+        return Pino(kwargs.get("superficie", 10), kwargs.get("altura", 1.0))
+    elif tipo == "olivo":
+        tipo_aceituna = kwargs.get("tipo_aceituna", TipoAceituna.MANZANILLA)
+        return Olivo(kwargs.get("superficie", 8), kwargs.get("altura", 1.2), tipo_aceituna)
+    elif tipo == "lechuga":
+        return Lechuga(kwargs.get("superficie", 2), kwargs.get("dias_crecimiento", 60))
+    elif tipo == "zanahoria":
+        return Zanahoria(kwargs.get("superficie", 3), kwargs.get("dias_crecimiento", 80), kwargs.get("profundidad", 0.3))
+    raise ValueError(f"Tipo de cultivo no reconocido: {tipo}")
+
+
+def cronometrar(funcion, *args) -> float:
+    """Mide una creación masiva reteniendo los cultivos y sin recolector de basura."""
+    gc.collect()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        cultivos = funcion(*args)
+        transcurrido = time.perf_counter() - inicio
+    finally:
+        gc.enable()
+    del cultivos
+    return transcurrido
+
+
+def por_cultivo(crear, tipo: str, cantidad: int) -> list:
+    return [crear(tipo) for _ in range(cantidad)]
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    print(f"Cultivos por tipo: {cantidad:,}  (ns por cultivo)")
+    print(f"{'Tipo':<12}{'anterior':>12}{'registro':>12}{'crear_lote':>12}")
+    for tipo in TIPOS:
+        anterior = cronometrar(por_cultivo, crear_cultivo_anterior, tipo, cantidad)
+        registro = cronometrar(por_cultivo, CultivoFactory.crear_cultivo, tipo, cantidad)
+        lote = cronometrar(CultivoFactory.crear_lote, tipo, cantidad)
+        print(f"{tipo:<12}{anterior / cantidad * 1e9:>12.0f}{registro / cantidad * 1e9:>12.0f}"
+              f"{lote / cantidad * 1e9:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
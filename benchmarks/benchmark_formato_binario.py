@@ -0,0 +1,86 @@
+"""
+Benchmark del codec binario (formato_binario) frente a pickle: velocidad
+de codificación y decodificación y tamaño, para un registro forestal y
+para una lista de trabajadores con tareas.
+
+Uso:
+    python -m benchmarks.benchmark_formato_binario [CANTIDAD] [columnar|lista]
+"""
+import pickle
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.servicios.negocio.persistencia import formato_binario
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 200_000
+PLANTACIONES = 100
+TRABAJADORES = 2_000
+TAREAS_POR_TRABAJADOR = 10
+
+
+def crear_registro(cantidad: int, columnar: bool) -> RegistroForestal:
+    azar = random.Random(42)
+    registro = RegistroForestal()
+    por_tipo = cantidad // PLANTACIONES // len(TIPOS)
+    for indice in range(PLANTACIONES):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0, columnar=columnar)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, por_tipo)
+        for cultivo in plantacion.cultivos:
+            if hasattr(cultivo, "altura"):
+                cultivo.altura = round(azar.uniform(0.5, 20.0), 2)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def crear_trabajadores() -> list[Trabajador]:
+    inicio = date(2026, 1, 1)
+    trabajadores = []
+    for indice in range(TRABAJADORES):
+        trabajador = Trabajador(f"Trabajador {indice}", str(30_000_000 + indice), 20 + indice % 40)
+        for numero in range(TAREAS_POR_TRABAJADOR):
+            trabajador.asignar_tarea(Tarea(f"Tarea {numero}", inicio + timedelta(days=numero),
+                                           Herramienta("Pala", "operativa")))
+        trabajadores.append(trabajador)
+    return trabajadores
+
+
+def cronometrar(funcion, *args) -> tuple[float, object]:
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def comparar(nombre: str, objeto) -> None:
+    tiempo_pickle, datos_pickle = cronometrar(pickle.dumps, objeto, 5)
+    tiempo_carga_pickle, _ = cronometrar(pickle.loads, datos_pickle)
+    tiempo_binario, datos_binario = cronometrar(formato_binario.codificar, objeto)
+    tiempo_carga_binario, _ = cronometrar(formato_binario.decodificar, datos_binario)
+    for formato, codificar, decodificar, datos in (
+        ("pickle 5", tiempo_pickle, tiempo_carga_pickle, datos_pickle),
+        ("binario", tiempo_binario, tiempo_carga_binario, datos_binario),
+    ):
+        print(f"{nombre:<22}{formato:<10}{codificar:>15.3f}{decodificar:>17.3f}{len(datos) / 1e6:>14.2f}")
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    columnar = (sys.argv[2] if len(sys.argv) > 2 else "lista") == "columnar"
+    print(f"Cultivos: {cantidad:,} ({'columnar' if columnar else 'lista'}), "
+          f"trabajadores: {TRABAJADORES:,} x {TAREAS_POR_TRABAJADOR} tareas")
+    print(f"{'Objeto':<22}{'Formato':<10}{'Codificar (s)':>15}{'Decodificar (s)':>17}{'Tamaño (MB)':>14}")
+    comparar("RegistroForestal", crear_registro(cantidad, columnar))
+    comparar("Trabajadores", crear_trabajadores())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
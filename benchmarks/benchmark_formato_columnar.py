@@ -0,0 +1,75 @@
+"""
+Benchmark de apertura: pickle completo vs. snapshot columnar con mmap.
+
+Uso:
+    python -m benchmarks.benchmark_formato_columnar [CANTIDAD]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.paquete import Paquete
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 1_000_000
+PLANTACIONES = 200
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    registro = RegistroForestal()
+    por_plantacion = cantidad // PLANTACIONES
+    for indice in range(PLANTACIONES):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0, columnar=True)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, por_plantacion // len(TIPOS))
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    directorio = tempfile.mkdtemp()
+    try:
+        paquete = Paquete(directorio)
+        registro = crear_registro(cantidad)
+        paquete.guardar(registro, "registro")
+        paquete.guardar_columnar(registro, "registro")
+        del registro
+
+        tiempo_pickle, cargado = cronometrar(paquete.cargar, "registro")
+        nombres_pickle = [p.nombre for p in cargado.listar_todas()]
+        del cargado
+
+        tiempo_abrir, abierto = cronometrar(paquete.abrir_columnar, "registro")
+        tiempo_resumen, resumenes = cronometrar(list, map(abierto.resumen, abierto.nombres()))
+        tiempo_una, _ = cronometrar(abierto.buscar_plantacion, "Finca 0")
+        abierto.cerrar()
+        assert len(resumenes) == len(nombres_pickle)
+
+        print(f"Cultivos: {cantidad:,} en {PLANTACIONES} plantaciones")
+        print(f"{'Operación':<36}{'Tiempo (ms)':>12}{'Archivo (MB)':>14}")
+        for nombre, tiempo, extension in (
+            ("pickle: cargar todo", tiempo_pickle, ".dat"),
+            ("columnar: abrir + directorio", tiempo_abrir, ".pfc"),
+            ("columnar: resúmenes de todas", tiempo_resumen, ""),
+            ("columnar: decodificar una", tiempo_una, ""),
+        ):
+            tamano = f"{os.path.getsize(os.path.join(directorio, f'registro{extension}')) / 1e6:.1f}" if extension else "-"
+            print(f"{nombre:<36}{tiempo * 1000:>12.2f}{tamano:>14}")
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Benchmark de formatos de Paquete: protocolo, buffers fuera de banda y compresión.
+Mide guardar, cargar y tamaño de archivo sobre un registro sintético.
+
+Uso:
+    python -m benchmarks.benchmark_formato_paquete [CANTIDAD] [columnar|lista]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.paquete import Paquete
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 1_000_000
+PLANTACIONES = 100
+PROTOCOLOS = ((4, False), (5, False), (5, True))
+COMPRESIONES = (None, "zlib", "bz2", "lzma")
+
+
+def crear_registro(cantidad: int, columnar: bool) -> RegistroForestal:
+    # Alturas y días al azar (semilla fija) para que la compresión no sea trivial
+    azar = random.Random(42)
+    registro = RegistroForestal()
+    por_tipo = cantidad // PLANTACIONES // len(TIPOS)
+    for indice in range(PLANTACIONES):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0, columnar=columnar)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, por_tipo)
+        for cultivo in plantacion.cultivos:
+            if hasattr(cultivo, "altura"):
+                cultivo.altura = round(azar.uniform(0.5, 20.0), 2)
+            else:
+                cultivo.dias_crecimiento = azar.randint(30, 120)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def cronometrar(funcion, *args) -> float:
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    columnar = (sys.argv[2] if len(sys.argv) > 2 else "columnar") == "columnar"
+    registro = crear_registro(cantidad, columnar)
+    directorio = tempfile.mkdtemp()
+    try:
+        ruta = os.path.join(directorio, "registro.dat")
+        print(f"Cultivos: {cantidad:,} ({'columnar' if columnar else 'lista'})")
+        print(f"{'Protocolo':<12}{'Compresión':<12}{'Guardar (s)':>12}{'Cargar (s)':>12}{'Archivo (MB)':>14}")
+        for protocolo, fuera_de_banda in PROTOCOLOS:
+            for compresion in COMPRESIONES:
+                paquete = Paquete(directorio, protocolo=protocolo, compresion=compresion,
+                                  fuera_de_banda=fuera_de_banda)
+                guardar = cronometrar(paquete.guardar, registro, "registro")
+                cargar = cronometrar(paquete.cargar, "registro")
+                nombre = f"{protocolo}{' + oob' if fuera_de_banda else ''}"
+                print(f"{nombre:<12}{compresion or '-':<12}{guardar:>12.3f}{cargar:>12.3f}"
+                      f"{os.path.getsize(ruta) / 1e6:>14.2f}")
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
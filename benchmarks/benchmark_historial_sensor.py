@@ -0,0 +1,79 @@
+"""
+Benchmark del historial de sensores (SerieSensor): costo por lectura
+agregada, latencia de los resúmenes por ventana en cada resolución y
+memoria, frente a guardar las lecturas en una lista de tuplas.
+
+Uso:
+    python -m benchmarks.benchmark_historial_sensor [LECTURAS] [INTERVALO_S]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from python_forestacion.riego.historial.serie_sensor import SerieSensor
+from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
+from constante import INTERVALO_SENSOR_TEMPERATURA
+
+LECTURAS_POR_DEFECTO = 1_000_000
+VENTANAS = (60, 1800, 6 * 3600, 7 * 86400)
+CONSULTAS = 1_000
+
+
+def medir_agregado(lecturas: int, intervalo: float) -> SerieSensor:
+    azar = random.Random(42)
+    valores = [azar.uniform(5, 40) for _ in range(lecturas)]
+    serie = SerieSensor()
+    inicio = time.perf_counter()
+    for indice, valor in enumerate(valores):
+        serie.agregar(valor, indice * intervalo)
+    duracion = time.perf_counter() - inicio
+    memoria_serie = serie.memoria_bytes()
+
+    tracemalloc.start()
+    lista = [(indice * intervalo, valor) for indice, valor in enumerate(valores)]
+    memoria_lista = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lista
+    print(f"Agregar: {duracion / lecturas * 1e9:.0f} ns/lectura")
+    print(f"Memoria SerieSensor: {memoria_serie / 1e3:,.1f} KB (fija) | lista de tuplas: {memoria_lista / 1e6:,.1f} MB")
+    return serie
+
+
+def medir_resumenes(serie: SerieSensor, ahora: float) -> None:
+    print(f"{'Ventana (s)':>12}{'Resolución':>12}{'Lecturas':>11}{'µs/consulta':>14}")
+    for ventana in VENTANAS:
+        inicio = time.perf_counter()
+        for _ in range(CONSULTAS):
+            resumen = serie.resumen(ventana, ahora)
+        duracion = (time.perf_counter() - inicio) / CONSULTAS
+        print(f"{ventana:>12,}{resumen['resolucion']:>12}{resumen['cantidad']:>11,}{duracion * 1e6:>14.1f}")
+
+
+def medir_sensor(lecturas: int) -> None:
+    sensor = TemperaturaReaderTask()
+    inicio = time.perf_counter()
+    for _ in range(lecturas):
+        sensor.leer()
+    sin_serie = time.perf_counter() - inicio
+    SerieSensor.adjuntar(sensor)
+    inicio = time.perf_counter()
+    for _ in range(lecturas):
+        sensor.leer()
+    con_serie = time.perf_counter() - inicio
+    print(f"TemperaturaReaderTask.leer(): {sin_serie / lecturas * 1e9:.0f} ns sin historial, "
+          f"{con_serie / lecturas * 1e9:.0f} ns con historial")
+
+
+def main() -> int:
+    lecturas = int(sys.argv[1]) if len(sys.argv) > 1 else LECTURAS_POR_DEFECTO
+    intervalo = float(sys.argv[2]) if len(sys.argv) > 2 else INTERVALO_SENSOR_TEMPERATURA
+    print(f"Lecturas: {lecturas:,} cada {intervalo:g} s ({lecturas * intervalo / 86400:,.1f} días)")
+    serie = medir_agregado(lecturas, intervalo)
+    medir_resumenes(serie, lecturas * intervalo)
+    medir_sensor(min(lecturas, 200_000))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
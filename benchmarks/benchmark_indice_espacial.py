@@ -0,0 +1,66 @@
+"""
+Benchmark de consultas por zona: índice espacial vs. recorrido de todos los cultivos.
+
+Uso:
+    python -m benchmarks.benchmark_indice_espacial [CANTIDAD]
+"""
+import math
+import sys
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+
+CANTIDAD_POR_DEFECTO = 250_000
+SEPARACION = 2.0
+RADIO = 10.0
+REPETICIONES = 200
+
+
+def crear_plantacion(cantidad: int) -> tuple[Plantacion, dict]:
+    lado = math.ceil(math.sqrt(cantidad))
+    plantacion = Plantacion("Benchmark", float("inf"), 0.0)
+    plantacion.habilitar_indice_espacial(lado * SEPARACION, lado * SEPARACION)
+    posiciones = {}
+    for indice in range(cantidad):
+        x = (indice % lado + 0.5) * SEPARACION
+        y = (indice // lado + 0.5) * SEPARACION
+        lechuga = Lechuga(1, 60)
+        plantacion.agregar_cultivo(lechuga, posicion=(x, y))
+        posiciones[id(lechuga)] = (x, y)
+    return plantacion, posiciones
+
+
+def recorrer(plantacion: Plantacion, posiciones: dict, x: float, y: float, radio: float) -> list:
+    radio2 = radio * radio
+    resultado = []
+    for cultivo in plantacion.cultivos:
+        cx, cy = posiciones[id(cultivo)]
+        if (cx - x) ** 2 + (cy - y) ** 2 <= radio2:
+            resultado.append(cultivo)
+    return resultado
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    plantacion, posiciones = crear_plantacion(cantidad)
+    centro = plantacion.indice_espacial.ancho / 2
+
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        encontrados = plantacion.cultivos_en_radio(centro, centro, RADIO)
+    tiempo_indice = (time.perf_counter() - inicio) / REPETICIONES
+
+    inicio = time.perf_counter()
+    esperado = recorrer(plantacion, posiciones, centro, centro, RADIO)
+    tiempo_recorrido = time.perf_counter() - inicio
+
+    assert len(encontrados) == len(esperado)
+    print(f"Cultivos: {cantidad:,}  radio: {RADIO} m  encontrados: {len(encontrados)}")
+    print(f"{'Índice espacial (ms)':<24}{tiempo_indice * 1000:>10.3f}")
+    print(f"{'Recorrido completo (ms)':<24}{tiempo_recorrido * 1000:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark de memoria por instancia: entidades con __slots__ vs. el esquema
+anterior basado en __dict__, medido con tracemalloc.
+
+Uso:
+    python -m benchmarks.benchmark_memoria_entidades [CANTIDAD]
+"""
+import sys
+import tracemalloc
+
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+
+CANTIDAD_POR_DEFECTO = 200_000
+
+
+class PinoAnterior:
+    """Pino con el esquema anterior (atributos en __dict__), como referencia."""
+
+    def __init__(self, superficie: float, altura: float):
+        self.nombre = "Pino"
+        self.superficie = superficie
+        self.altura = altura
+        self.produccion_anual = 0
+
+
+class OlivoAnterior:
+    """Olivo con el esquema anterior, como referencia."""
+
+    def __init__(self, superficie: float, altura: float, tipo_aceituna: TipoAceituna):
+        self.nombre = "Olivo"
+        self.superficie = superficie
+        self.altura = altura
+        self.produccion_anual = 0
+        self.tipo_aceituna = tipo_aceituna
+
+
+class TrabajadorAnterior:
+    """Trabajador con el esquema anterior, como referencia."""
+
+    def __init__(self, nombre: str, dni: str, edad: int):
+        self.nombre = nombre
+        self.dni = dni
+        self.edad = edad
+        self.apto_medico = None
+        self.tareas = []
+
+
+def crear_pino(clase, indice: int):
+    return clase(float(indice), 1.0)
+
+
+def crear_olivo(clase, indice: int):
+    return clase(float(indice), 1.2, TipoAceituna.PICUAL)
+
+
+def crear_trabajador(clase, indice: int):
+    return clase("Trabajador", str(indice), 30)
+
+
+def bytes_por_instancia(crear, clase, cantidad: int) -> float:
+    """Memoria retenida por `cantidad` instancias, dividida por la cantidad."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    instancias = [crear(clase, indice) for indice in range(cantidad)]
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instancias
+    return (despues - antes) / cantidad
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    casos = [
+        ("Pino", crear_pino, PinoAnterior, Pino),
+        ("Olivo", crear_olivo, OlivoAnterior, Olivo),
+        ("Trabajador", crear_trabajador, TrabajadorAnterior, Trabajador),
+    ]
+    print(f"Instancias: {cantidad:,}  (bytes por instancia, incluye la lista contenedora)")
+    print(f"{'Entidad':<12}{'__dict__':>12}{'__slots__':>12}{'Ahorro':>10}")
+    for nombre, crear, anterior, actual in casos:
+        con_dict = bytes_por_instancia(crear, anterior, cantidad)
+        con_slots = bytes_por_instancia(crear, actual, cantidad)
+        print(f"{nombre:<12}{con_dict:>12.1f}{con_slots:>12.1f}{1 - con_slots / con_dict:>10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Benchmark de Observable: altas y bajas con muchos observadores,
+costo de notificar y contención con muchos hilos que notifican mientras
+otros se suscriben y desuscriben. Se compara con la implementación
+anterior (lista sin cerrojo). "Perdidas" cuenta las notificaciones que no
+le llegaron a un observador suscripto durante toda la prueba.
+
+Uso:
+    python -m benchmarks.benchmark_observable [DURACION_S] [HILOS...]
+"""
+import sys
+import threading
+import time
+from functools import partial
+from itertools import count
+
+from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.patrones.observer.observer import Observer
+
+DURACION_POR_DEFECTO = 2.0
+HILOS_POR_DEFECTO = (2, 8, 32)
+CANTIDADES_ALTAS = (10, 1_000, 10_000)
+CANTIDADES_NOTIFICAR = (1, 10, 100)
+REPETICIONES = 20_000
+
+
+class _ObservableLista:
+    """Implementación anterior: lista con pertenencia lineal y sin cerrojo."""
+
+    def __init__(self):
+        self._observadores = []
+
+    def agregar_observador(self, observador):
+        if observador not in self._observadores:
+            self._observadores.append(observador)
+
+    def eliminar_observador(self, observador):
+        if observador in self._observadores:
+            self._observadores.remove(observador)
+
+    def notificar(self, *args, **kwargs):
+        for observador in self._observadores:
+            observador.actualizar(self, *args, **kwargs)
+
+
+class _Contador(Observer):
+    def __init__(self):
+        self._recibidas = count()
+
+    def actualizar(self, observable, *args, **kwargs):
+        next(self._recibidas)
+
+    def recibidas(self) -> int:
+        # next() es atómico: no se pierden cuentas entre hilos
+        return next(self._recibidas)
+
+
+IMPLEMENTACIONES = {
+    "lista (anterior)": _ObservableLista,
+    "cow": Observable,
+    "cow débil": partial(Observable, debiles=True),
+}
+
+
+def medir_altas() -> None:
+    print(f"{'Altas y bajas':<18}" + "".join(f"{f'{cantidad:,} obs':>14}" for cantidad in CANTIDADES_ALTAS) + "  (µs/par)")
+    for nombre, crear in IMPLEMENTACIONES.items():
+        fila = f"{nombre:<18}"
+        for cantidad in CANTIDADES_ALTAS:
+            observable = crear()
+            fijos = [_Contador() for _ in range(cantidad)]
+            for observador in fijos:
+                observable.agregar_observador(observador)
+            nuevo = _Contador()
+            repeticiones = REPETICIONES // 10 if cantidad >= 1_000 else REPETICIONES
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                observable.agregar_observador(nuevo)
+                observable.eliminar_observador(nuevo)
+            fila += f"{(time.perf_counter() - inicio) / repeticiones * 1e6:>14.2f}"
+        print(fila)
+
+
+def medir_notificar() -> None:
+    print(f"{'Notificar':<18}" + "".join(f"{f'{cantidad:,} obs':>14}" for cantidad in CANTIDADES_NOTIFICAR) + "  (µs)")
+    for nombre, crear in IMPLEMENTACIONES.items():
+        fila = f"{nombre:<18}"
+        for cantidad in CANTIDADES_NOTIFICAR:
+            observable = crear()
+            fijos = [_Contador() for _ in range(cantidad)]
+            for observador in fijos:
+                observable.agregar_observador(observador)
+            inicio = time.perf_counter()
+            for _ in range(REPETICIONES):
+                observable.notificar(valor=1.0)
+            fila += f"{(time.perf_counter() - inicio) / REPETICIONES * 1e6:>14.2f}"
+        print(fila)
+
+
+def _notificar(observable, detener: threading.Event, enviadas: list) -> None:
+    cantidad = 0
+    while not detener.is_set():
+        for _ in range(100):
+            observable.notificar(valor=1.0)
+        cantidad += 100
+    enviadas.append(cantidad)
+
+
+def _suscribir(observable, detener: threading.Event, cambios: list) -> None:
+    propios = [_Contador() for _ in range(4)]
+    cantidad = 0
+    while not detener.is_set():
+        for observador in propios:
+            observable.agregar_observador(observador)
+        for observador in propios:
+            observable.eliminar_observador(observador)
+        cantidad += 2 * len(propios)
+    cambios.append(cantidad)
+
+
+def medir_contencion(hilos: int, duracion: float, nombre: str, crear) -> None:
+    observable = crear()
+    fijo = _Contador()
+    observable.agregar_observador(fijo)
+    # Se guardan para que sigan vivos también con referencias débiles
+    otros = [_Contador() for _ in range(16)]
+    for observador in otros:
+        observable.agregar_observador(observador)
+    detener = threading.Event()
+    enviadas: list[int] = []
+    cambios: list[int] = []
+    trabajadores = [threading.Thread(target=_notificar, args=(observable, detener, enviadas)) for _ in range(hilos // 2)]
+    trabajadores += [threading.Thread(target=_suscribir, args=(observable, detener, cambios))
+                     for _ in range(hilos - hilos // 2)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    time.sleep(duracion)
+    detener.set()
+    for trabajador in trabajadores:
+        trabajador.join()
+    notificaciones = sum(enviadas)
+    perdidas = notificaciones - fijo.recibidas()
+    print(f"{hilos:>6}{nombre:>18}{notificaciones / duracion:>16,.0f}{sum(cambios) / duracion:>14,.0f}"
+          f"{perdidas:>10,}")
+
+
+def main() -> int:
+    duracion = float(sys.argv[1]) if len(sys.argv) > 1 else DURACION_POR_DEFECTO
+    hilos = [int(valor) for valor in sys.argv[2:]] or HILOS_POR_DEFECTO
+    medir_altas()
+    print()
+    medir_notificar()
+    print()
+    print(f"Contención ({duracion:g} s; la mitad de los hilos notifica y la otra mitad se suscribe y desuscribe)")
+    print(f"{'Hilos':>6}{'Implementación':>18}{'Notificar/s':>16}{'Altas+bajas/s':>14}{'Perdidas':>10}")
+    for cantidad in hilos:
+        for nombre, crear in IMPLEMENTACIONES.items():
+            medir_contencion(cantidad, duracion, nombre, crear)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
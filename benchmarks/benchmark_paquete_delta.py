@@ -0,0 +1,91 @@
+"""
+Benchmark de snapshots incrementales: espacio y tiempo de guardar varias
+versiones seguidas con PaqueteDelta frente a copias completas con Paquete.
+
+Uso:
+    python -m benchmarks.benchmark_paquete_delta [PLANTACIONES] [VERSIONES] [MODIFICADAS]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.negocio.paquete_delta import PaqueteDelta
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+PLANTACIONES_POR_DEFECTO = 200
+VERSIONES_POR_DEFECTO = 10
+MODIFICADAS_POR_DEFECTO = 5
+CULTIVOS_POR_TIPO = 2_500
+
+
+def crear_registro(cantidad: int, azar: random.Random) -> RegistroForestal:
+    registro = RegistroForestal()
+    for indice in range(cantidad):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0, columnar=True)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, CULTIVOS_POR_TIPO)
+        for fila in range(len(plantacion.cultivos)):
+            plantacion.cultivos.altura[fila] = round(azar.uniform(0.5, 20.0), 2)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def modificar(registro: RegistroForestal, cantidad: int, azar: random.Random) -> None:
+    """Cambia un cultivo al azar en `cantidad` plantaciones."""
+    for plantacion in azar.sample(registro.listar_todas(), cantidad):
+        almacen = plantacion.cultivos
+        almacen.altura[azar.randrange(len(almacen))] += 0.1
+
+
+def tamano_directorio(directorio: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(raiz, nombre))
+        for raiz, _, nombres in os.walk(directorio) for nombre in nombres
+    )
+
+
+def main() -> int:
+    plantaciones = int(sys.argv[1]) if len(sys.argv) > 1 else PLANTACIONES_POR_DEFECTO
+    versiones = int(sys.argv[2]) if len(sys.argv) > 2 else VERSIONES_POR_DEFECTO
+    modificadas = int(sys.argv[3]) if len(sys.argv) > 3 else MODIFICADAS_POR_DEFECTO
+    azar = random.Random(42)
+    registro = crear_registro(plantaciones, azar)
+    dir_completo = tempfile.mkdtemp()
+    dir_delta = tempfile.mkdtemp()
+    try:
+        completo = Paquete(dir_completo)
+        delta = PaqueteDelta(dir_delta)
+        tiempo_completo = tiempo_delta = 0.0
+        for version in range(versiones):
+            if version:
+                modificar(registro, modificadas, azar)
+            inicio = time.perf_counter()
+            completo.guardar(registro, f"registro_{version}")
+            tiempo_completo += time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            delta.guardar(registro, f"registro_{version}")
+            tiempo_delta += time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        delta.cargar(f"registro_{versiones - 1}")
+        tiempo_carga = time.perf_counter() - inicio
+
+        print(f"Plantaciones: {plantaciones:,}, versiones: {versiones}, modificadas por versión: {modificadas}")
+        print(f"{'Formato':<16}{'Disco (MB)':>12}{'Guardar total (s)':>20}")
+        print(f"{'Paquete':<16}{tamano_directorio(dir_completo) / 1e6:>12.2f}{tiempo_completo:>20.3f}")
+        print(f"{'PaqueteDelta':<16}{tamano_directorio(dir_delta) / 1e6:>12.2f}{tiempo_delta:>20.3f}")
+        print(f"Carga de la última versión delta: {tiempo_carga:.3f} s")
+    finally:
+        shutil.rmtree(dir_completo)
+        shutil.rmtree(dir_delta)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
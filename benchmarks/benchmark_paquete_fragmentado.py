@@ -0,0 +1,74 @@
+"""
+Benchmark de PaqueteFragmentado frente a Paquete: guardado completo,
+guardado incremental con pocas plantaciones modificadas y carga
+secuencial contra carga con un pool de hilos.
+
+Uso:
+    python -m benchmarks.benchmark_paquete_fragmentado [PLANTACIONES] [MODIFICADAS]
+"""
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.negocio.paquete_fragmentado import PaqueteFragmentado
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+PLANTACIONES_POR_DEFECTO = 20_000
+MODIFICADAS_POR_DEFECTO = 300
+CULTIVOS_POR_TIPO = 10
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    registro = RegistroForestal()
+    for indice in range(cantidad):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, CULTIVOS_POR_TIPO)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def cronometrar(funcion, *args) -> tuple[float, object]:
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else PLANTACIONES_POR_DEFECTO
+    modificadas = int(sys.argv[2]) if len(sys.argv) > 2 else MODIFICADAS_POR_DEFECTO
+    registro = crear_registro(cantidad)
+    directorio = tempfile.mkdtemp()
+    try:
+        print(f"Plantaciones: {cantidad:,}, modificadas por guardado: {modificadas:,}")
+        tiempo, _ = cronometrar(Paquete(directorio).guardar, registro, "registro")
+        print(f"{'Paquete guardar':<36}{tiempo:>10.3f} s")
+        tiempo, _ = cronometrar(Paquete(directorio).cargar, "registro")
+        print(f"{'Paquete cargar':<36}{tiempo:>10.3f} s")
+
+        fragmentado = PaqueteFragmentado(directorio, compresion="zlib")
+        tiempo, escritas = cronometrar(fragmentado.guardar, registro, "fragmentado")
+        print(f"{'Fragmentado guardar completo':<36}{tiempo:>10.3f} s ({escritas:,} archivos)")
+
+        plantaciones = registro.listar_todas()
+        for plantacion in random.Random(42).sample(plantaciones, min(modificadas, len(plantaciones))):
+            plantacion.plantar_lote("Pino", 1)
+        tiempo, escritas = cronometrar(fragmentado.guardar, registro, "fragmentado")
+        print(f"{'Fragmentado guardar incremental':<36}{tiempo:>10.3f} s ({escritas:,} archivos)")
+
+        tiempo, _ = cronometrar(PaqueteFragmentado(directorio, hilos=1).cargar, "fragmentado")
+        print(f"{'Fragmentado cargar secuencial':<36}{tiempo:>10.3f} s")
+        tiempo, _ = cronometrar(PaqueteFragmentado(directorio).cargar, "fragmentado")
+        print(f"{'Fragmentado cargar con hilos':<36}{tiempo:>10.3f} s")
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Benchmark de carga perezosa: un trabajo que usa una fracción de las
+plantaciones, con carga completa frente a RegistroPerezoso, sobre el
+formato columnar y sobre fragmentos por plantación.
+
+Uso:
+    python -m benchmarks.benchmark_registro_perezoso [PLANTACIONES] [FRACCION]
+"""
+import random
+import shutil
+import sys
+import tempfile
+import time
+from functools import partial
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.negocio.paquete_fragmentado import PaqueteFragmentado
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+PLANTACIONES_POR_DEFECTO = 2_000
+FRACCION_POR_DEFECTO = 0.05
+CULTIVOS_POR_TIPO = 250
+
+
+def crear_registro(cantidad: int) -> RegistroForestal:
+    registro = RegistroForestal()
+    for indice in range(cantidad):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, CULTIVOS_POR_TIPO)
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def trabajo(registro, padrones: list[int]) -> float:
+    """Suma la superficie ocupada de las plantaciones pedidas."""
+    return sum(registro.buscar_por_padron(padron).superficie_ocupada for padron in padrones)
+
+
+def columnar_completo(paquete: Paquete) -> RegistroForestal:
+    with paquete.abrir_columnar("registro") as registro_columnar:
+        return registro_columnar.a_registro()
+
+
+def cronometrar(abrir, padrones: list[int]) -> float:
+    inicio = time.perf_counter()
+    trabajo(abrir(), padrones)
+    return time.perf_counter() - inicio
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else PLANTACIONES_POR_DEFECTO
+    fraccion = float(sys.argv[2]) if len(sys.argv) > 2 else FRACCION_POR_DEFECTO
+    registro = crear_registro(cantidad)
+    padrones = random.Random(42).sample(range(cantidad), max(1, int(cantidad * fraccion)))
+    directorio = tempfile.mkdtemp()
+    try:
+        paquete = Paquete(directorio)
+        paquete.guardar(registro, "registro")
+        paquete.guardar_columnar(registro, "registro")
+        fragmentado = PaqueteFragmentado(directorio)
+        fragmentado.guardar(registro, "fragmentos")
+
+        casos = [
+            ("Paquete.cargar (.dat)", partial(paquete.cargar, "registro")),
+            ("columnar completo", partial(columnar_completo, paquete)),
+            ("columnar perezoso", partial(paquete.cargar_perezoso, "registro")),
+            ("fragmentos completo", partial(fragmentado.cargar, "fragmentos")),
+            ("fragmentos perezoso", partial(fragmentado.cargar_perezoso, "fragmentos")),
+        ]
+        print(f"Plantaciones: {cantidad:,}, usadas por el trabajo: {len(padrones):,}")
+        print(f"{'Modo':<24}{'Tiempo (s)':>12}")
+        for nombre, abrir in casos:
+            print(f"{nombre:<24}{cronometrar(abrir, padrones):>12.3f}")
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Benchmark de riego: absorber_agua por cultivo vs. MotorRiegoLote.
+
+Uso:
+    python -m benchmarks.benchmark_riego_lote [CANTIDAD]
+"""
+import sys
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.riego.lote.motor_riego_lote import MotorRiegoLote
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+CANTIDAD_POR_DEFECTO = 500_000
+LITROS = 12
+
+
+def crear_plantacion(columnar: bool, cantidad: int) -> Plantacion:
+    plantacion = Plantacion("Benchmark", float("inf"), float("inf"), columnar=columnar)
+    for indice in range(cantidad):
+        plantacion.agregar_cultivo(CultivoFactory.crear_cultivo(TIPOS[indice % len(TIPOS)]))
+    return plantacion
+
+
+def cronometrar(funcion, *args) -> float:
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+def main() -> int:
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO
+    print(f"Cultivos: {cantidad:,}")
+    print(f"{'Formato':<10}{'Modo':<22}{'Tiempo (s)':>12}")
+    for columnar in (False, True):
+        plantacion = crear_plantacion(columnar, cantidad)
+        formato = "columnar" if columnar else "lista"
+        modos = [("por cultivo", plantacion.regar_todos, LITROS)]
+        modos.append(("lote python", MotorRiegoLote(usar_numpy=False).regar, plantacion.cultivos, LITROS))
+        if columnar and MotorRiegoLote().usa_numpy:
+            modos.append(("lote numpy", MotorRiegoLote().regar, plantacion.cultivos, LITROS))
+        for nombre, funcion, *args in modos:
+            print(f"{formato:<10}{nombre:<22}{cronometrar(funcion, *args):>12.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
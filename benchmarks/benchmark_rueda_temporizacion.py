@@ -0,0 +1,78 @@
+"""
+Benchmark de las agendas de turnos de RuntimeSensores: costo de gestionar
+los temporizadores (programar, vencer, reprogramar y cancelar) por segundo
+simulado, con trabajos periódicos de sensores y de control de riego con
+los intervalos de constante.py. El reloj es simulado y los trabajos no
+hacen nada: se mide solo la agenda.
+
+En cada tick de RESOLUCION_RUEDA se extraen los vencidos y se reprograma
+cada uno en su grilla; además, cada segundo simulado se cancela y se
+vuelve a programar un porcentaje de los trabajos (altas y bajas).
+
+Uso:
+    python -m benchmarks.benchmark_rueda_temporizacion [SEGUNDOS] [CANTIDADES...]
+"""
+import random
+import sys
+import time
+
+from python_forestacion.riego.runtime.agenda_monticulo import AgendaMonticulo
+from python_forestacion.riego.runtime.rueda_temporizacion import RuedaTemporizacion
+from constante import (
+    INTERVALO_SENSOR_TEMPERATURA, INTERVALO_SENSOR_HUMEDAD, INTERVALO_CONTROL_RIEGO, RESOLUCION_RUEDA,
+)
+
+SEGUNDOS_POR_DEFECTO = 5
+CANTIDADES_POR_DEFECTO = (10_000, 100_000, 1_000_000)
+INTERVALOS = (INTERVALO_SENSOR_TEMPERATURA, INTERVALO_SENSOR_HUMEDAD, INTERVALO_CONTROL_RIEGO)
+PORCENTAJE_RECAMBIO = 1
+AGENDAS = (
+    ("monticulo", AgendaMonticulo),
+    ("rueda", RuedaTemporizacion),
+)
+
+
+def simular(clase, cantidad: int, segundos: int) -> tuple[float, float, int]:
+    """(segundos de alta inicial, segundos de gestión por segundo simulado, turnos vencidos)."""
+    azar = random.Random(42)
+    trabajos = [(indice, INTERVALOS[indice % len(INTERVALOS)]) for indice in range(cantidad)]
+    agenda = clase(0.0)
+    inicio = time.perf_counter()
+    entradas = [agenda.programar(azar.uniform(0, intervalo), (indice, intervalo)) for indice, intervalo in trabajos]
+    alta = time.perf_counter() - inicio
+
+    recambio = cantidad * PORCENTAJE_RECAMBIO // 100
+    ticks_por_segundo = round(1 / RESOLUCION_RUEDA)
+    vencidos = 0
+    inicio = time.perf_counter()
+    for tick in range(1, segundos * ticks_por_segundo + 1):
+        ahora = tick * RESOLUCION_RUEDA
+        for instante, trabajo in agenda.vencidos(ahora):
+            entradas[trabajo[0]] = agenda.programar(instante + trabajo[1], trabajo)
+            vencidos += 1
+        if tick % ticks_por_segundo == 0:
+            for indice in azar.sample(range(cantidad), recambio):
+                agenda.cancelar(entradas[indice])
+                entradas[indice] = agenda.programar(ahora + azar.uniform(0, trabajos[indice][1]), trabajos[indice])
+        agenda.proximo()
+    return alta, (time.perf_counter() - inicio) / segundos, vencidos
+
+
+def main() -> int:
+    segundos = int(sys.argv[1]) if len(sys.argv) > 1 else SEGUNDOS_POR_DEFECTO
+    cantidades = [int(valor) for valor in sys.argv[2:]] or CANTIDADES_POR_DEFECTO
+    print(f"Segundos simulados: {segundos}, tick: {RESOLUCION_RUEDA * 1000:g} ms, "
+          f"intervalos: {', '.join(f'{intervalo:g} s' for intervalo in INTERVALOS)}, "
+          f"recambio: {PORCENTAJE_RECAMBIO}%/s")
+    print(f"{'Trabajos':>10}{'Agenda':>12}{'Alta (s)':>11}{'Gestión s/s':>14}{'Turnos/s':>12}{'ns/turno':>11}")
+    for cantidad in cantidades:
+        for nombre, clase in AGENDAS:
+            alta, por_segundo, vencidos = simular(clase, cantidad, segundos)
+            turnos = vencidos / segundos
+            print(f"{cantidad:>10,}{nombre:>12}{alta:>11.3f}{por_segundo:>14.3f}"
+                  f"{turnos:>12,.0f}{por_segundo / turnos * 1e9:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Benchmark del runtime asyncio de sensores: miles de sensores de
+temperatura y humedad en un único event loop, con los intervalos de
+constante.py escalados. Informa lecturas por segundo, jitter, deriva,
+turnos salteados y el tiempo de cierre, con cada agenda de turnos.
+
+Uso:
+    python -m benchmarks.benchmark_runtime_sensores [DURACION] [ESCALA] [CANTIDADES...]
+"""
+import asyncio
+import sys
+import time
+
+from python_forestacion.riego.runtime.runtime_sensores import RuntimeSensores, INTERVALOS_SENSOR
+from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
+from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+from constante import AGENDAS_RUNTIME
+
+DURACION_POR_DEFECTO = 5.0
+ESCALA_POR_DEFECTO = 0.1
+CANTIDADES_POR_DEFECTO = (1_000, 10_000, 50_000)
+
+
+def medir(cantidad: int, duracion: float, escala: float, agenda: str) -> None:
+    runtime = RuntimeSensores(agenda=agenda)
+    controlador = ControlRiegoTask()
+    for indice in range(cantidad):
+        sensor = TemperaturaReaderTask() if indice % 2 else HumedadReaderTask()
+        sensor.agregar_observador(controlador)
+        runtime.agregar_sensor(sensor, INTERVALOS_SENSOR[sensor.tipo] * escala)
+    inicio = time.perf_counter()
+    asyncio.run(runtime.ejecutar(duracion))
+    cierre = time.perf_counter() - inicio - duracion
+    estadisticas = runtime.estadisticas()
+    print(f"{cantidad:>10,}{agenda:>11}{estadisticas['ejecuciones'] / duracion:>14,.0f}"
+          f"{estadisticas['jitter_medio'] * 1000:>11.2f}{estadisticas['jitter_p99'] * 1000:>11.2f}"
+          f"{estadisticas['jitter_max'] * 1000:>11.2f}{estadisticas['deriva_max'] * 1000:>12.2f}"
+          f"{estadisticas['omitidas']:>10,}{cierre * 1000:>12.1f}")
+
+
+def main() -> int:
+    duracion = float(sys.argv[1]) if len(sys.argv) > 1 else DURACION_POR_DEFECTO
+    escala = float(sys.argv[2]) if len(sys.argv) > 2 else ESCALA_POR_DEFECTO
+    cantidades = [int(valor) for valor in sys.argv[3:]] or CANTIDADES_POR_DEFECTO
+    print(f"Duración: {duracion} s, intervalos x{escala} "
+          f"({', '.join(f'{tipo} {intervalo * escala:g} s' for tipo, intervalo in INTERVALOS_SENSOR.items())})")
+    print(f"{'Sensores':>10}{'Agenda':>11}{'Lecturas/s':>14}{'Jitter ms':>11}{'p99 ms':>11}{'Máx ms':>11}"
+          f"{'Deriva ms':>12}{'Omitidas':>10}{'Cierre ms':>12}")
+    for cantidad in cantidades:
+        for agenda in AGENDAS_RUNTIME:
+            medir(cantidad, duracion, escala, agenda)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
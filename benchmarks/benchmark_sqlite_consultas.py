@@ -0,0 +1,77 @@
+"""
+Benchmark de latencia de consultas de cultivos: SQL con índices en
+BaseSQLite frente al recorrido en Python de FincasService sin base.
+
+Uso:
+    python -m benchmarks.benchmark_sqlite_consultas [PLANTACIONES]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.arbol import Arbol
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.negocio.persistencia.base_sqlite import BaseSQLite
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+PLANTACIONES_POR_DEFECTO = 500
+CULTIVOS_POR_TIPO = 100
+REPETICIONES = 20
+
+
+def poblar(servicio: FincasService, plantaciones: int) -> None:
+    azar = random.Random(42)
+    for indice in range(plantaciones):
+        servicio.crear_finca(indice, 1e9, f"Ruta {indice}", f"Finca {indice}")
+        plantacion = servicio.buscar_plantacion(f"Finca {indice}")
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, CULTIVOS_POR_TIPO)
+        for cultivo in plantacion.cultivos:
+            if hasattr(cultivo, "produccion_anual"):
+                cultivo.produccion_anual = round(azar.uniform(0.0, 100.0), 2)
+                cultivo.altura = round(azar.uniform(0.5, 20.0), 2)
+        plantacion.marcar_modificada()
+
+
+def cronometrar(servicio: FincasService, consulta: tuple) -> tuple[float, int]:
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        resultados = servicio.buscar_cultivos(*consulta)
+    return (time.perf_counter() - inicio) / REPETICIONES, len(resultados)
+
+
+def main() -> int:
+    plantaciones = int(sys.argv[1]) if len(sys.argv) > 1 else PLANTACIONES_POR_DEFECTO
+    directorio = tempfile.mkdtemp()
+    try:
+        base = BaseSQLite(os.path.join(directorio, "forestal.db"))
+        en_memoria = FincasService()
+        en_base = FincasService(base)
+        poblar(en_memoria, plantaciones)
+        poblar(en_base, plantaciones)
+        en_base.guardar_cambios()
+
+        consultas = [
+            ("Olivo produccion > 99", (Olivo, "produccion_anual", 99.0)),
+            ("Arbol altura <= 1", (Arbol, "altura", None, 1.0)),
+            ("Zanahoria (todas)", (Zanahoria,)),
+        ]
+        print(f"Plantaciones: {plantaciones:,}, cultivos: {plantaciones * CULTIVOS_POR_TIPO * len(TIPOS):,}")
+        print(f"{'Consulta':<24}{'Resultados':>12}{'SQLite (ms)':>14}{'Python (ms)':>14}")
+        for nombre, consulta in consultas:
+            tiempo_sql, resultados = cronometrar(en_base, consulta)
+            tiempo_python, _ = cronometrar(en_memoria, consulta)
+            print(f"{nombre:<24}{resultados:>12,}{tiempo_sql * 1000:>14.3f}{tiempo_python * 1000:>14.3f}")
+        base.cerrar()
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
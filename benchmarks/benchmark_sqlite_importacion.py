@@ -0,0 +1,66 @@
+"""
+Benchmark de importación masiva a BaseSQLite: executemany por plantación
+en una sola transacción, frente a guardar cada plantación por separado.
+
+Uso:
+    python -m benchmarks.benchmark_sqlite_importacion [PLANTACIONES] [CULTIVOS_POR_PLANTACION]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.servicios.negocio.persistencia.base_sqlite import BaseSQLite
+
+TIPOS = ("Pino", "Olivo", "Lechuga", "Zanahoria")
+PLANTACIONES_POR_DEFECTO = 1_000
+CULTIVOS_POR_DEFECTO = 400
+
+
+def crear_registro(plantaciones: int, cultivos: int) -> RegistroForestal:
+    registro = RegistroForestal()
+    for indice in range(plantaciones):
+        plantacion = Plantacion(f"Finca {indice}", float("inf"), 100.0)
+        for tipo in TIPOS:
+            plantacion.plantar_lote(tipo, cultivos // len(TIPOS))
+        registro.agregar_plantacion(plantacion, id_padron=indice)
+    return registro
+
+
+def importar_en_lote(ruta: str, registro: RegistroForestal) -> None:
+    with BaseSQLite(ruta) as base:
+        base.importar(registro)
+
+
+def importar_de_a_una(ruta: str, registro: RegistroForestal) -> None:
+    with BaseSQLite(ruta) as base:
+        for plantacion in registro.listar_todas():
+            base.guardar_plantaciones([(plantacion, registro.padron_de(plantacion.nombre))])
+
+
+def main() -> int:
+    plantaciones = int(sys.argv[1]) if len(sys.argv) > 1 else PLANTACIONES_POR_DEFECTO
+    cultivos = int(sys.argv[2]) if len(sys.argv) > 2 else CULTIVOS_POR_DEFECTO
+    registro = crear_registro(plantaciones, cultivos)
+    total = plantaciones * (cultivos // len(TIPOS) * len(TIPOS))
+    directorio = tempfile.mkdtemp()
+    try:
+        print(f"Plantaciones: {plantaciones:,}, cultivos: {total:,}")
+        print(f"{'Modo':<24}{'Tiempo (s)':>12}{'Cultivos/s':>14}{'Base (MB)':>12}")
+        for nombre, importar in (("una transacción", importar_en_lote),
+                                 ("transacción por finca", importar_de_a_una)):
+            ruta = os.path.join(directorio, f"{nombre}.db")
+            inicio = time.perf_counter()
+            importar(ruta, registro)
+            tiempo = time.perf_counter() - inicio
+            print(f"{nombre:<24}{tiempo:>12.3f}{total / tiempo:>14,.0f}{os.path.getsize(ruta) / 1e6:>12.2f}")
+    finally:
+        shutil.rmtree(directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
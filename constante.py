@@ -4,11 +4,39 @@ TEMP_MIN_RIEGO = 8
 TEMP_MAX_RIEGO = 15
 HUMEDAD_MAX_RIEGO = 50
 
+# Riego por tipo de cultivo (litros mínimos y efecto de cada riego)
+AGUA_MINIMA_PINO = 10
+AGUA_MINIMA_OLIVO = 5
+AGUA_MINIMA_LECHUGA = 1
+AGUA_MINIMA_ZANAHORIA = 0.5
+CRECIMIENTO_RIEGO_PINO = 0.05
+FACTOR_PRODUCCION_OLIVO = 0.2
+
 # Sensores (segundos)
 INTERVALO_SENSOR_TEMPERATURA = 2.0
 INTERVALO_SENSOR_HUMEDAD = 3.0
 INTERVALO_CONTROL_RIEGO = 2.5
 THREAD_JOIN_TIMEOUT = 2.0
+MUESTRAS_JITTER_SENSORES = 10_000
+DURACION_DEMO_SENSORES = 7.5
+AGENDAS_RUNTIME = ("monticulo", "rueda")
+RESOLUCION_RUEDA = 0.01
+RANURAS_RUEDA = 256
+NIVELES_RUEDA = 4
+
+# Historial de sensores (cantidad de lecturas o intervalos que se conservan)
+CAPACIDAD_SERIE_CRUDA = 1024
+CAPACIDAD_SERIE_MINUTOS = 360
+CAPACIDAD_SERIE_HORAS = 336
+ANCHO_ROLLUP_MINUTO = 60.0
+ANCHO_ROLLUP_HORA = 3600.0
+
+# Historial de sensores en disco (cantidad de registros)
+EXTENSION_SEGMENTO_SERIE = ".pfs"
+EXTENSION_INDICE_SERIE = ".pfi"
+REGISTROS_POR_SEGMENTO_SERIE = 1 << 20
+REGISTROS_POR_ENTRADA_INDICE_SERIE = 256
+REGISTROS_BUFFER_SERIE = 256
 
 # Rango sensores
 SENSOR_TEMP_MIN = -25
@@ -31,9 +59,30 @@ AGUA_INICIAL_LECHUGA = 1.0
 SUPERFICIE_ZANAHORIA = 0.15
 AGUA_INICIAL_ZANAHORIA = 0.0
 
+# Ubicación de cultivos (metros)
+TAMANO_CELDA_ESPACIAL = 10.0
+
+# Cosecha
+MAX_HILOS_COSECHA = 8
+ATRIBUTOS_COSECHA = ("superficie", "altura", "produccion_anual", "dias_crecimiento", "profundidad")
+
 # Persistencia
 DIRECTORIO_DATA = "data"
 EXTENSION_DATA = ".dat"
+EXTENSION_JOURNAL = ".wal"
+EXTENSION_COLUMNAR = ".pfc"
+COMPACTAR_JOURNAL_CADA = 1000
+NOMBRE_MANIFIESTO = "manifiesto.json"
+UMBRAL_CARGA_PARALELA = 64
+COMPRESION_FRAGMENTOS = "zlib"
+NOMBRE_BASE_SQLITE = "forestal.db"
+EXTENSION_VERSION = ".ver"
+DIRECTORIO_BLOQUES = "bloques"
+CULTIVOS_POR_BLOQUE_DELTA = 4096
+CAPACIDAD_CACHE_PLANTACIONES = 256
+FORMATOS_PAQUETE = ("pickle", "binario")
+CAPACIDAD_CACHE_CARGA_BYTES = 256 * 1024 * 1024
+MODOS_CACHE_CARGA = ("copia",)
 
 # Estacionalidad ejemplo
 MES_INICIO_VERANO = 3
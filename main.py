@@ -10,8 +10,9 @@ Patrones demostrados:
 - REGISTRY: Dispatch polimórfico sin isinstance()
 """
 
-import time
+import asyncio
 from datetime import date
+from functools import partial
 
 # Servicios principales
 from python_forestacion.servicios.negocio.fincas_service import FincasService
@@ -40,9 +41,10 @@ from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
 from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
 from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
 from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+from python_forestacion.riego.runtime.runtime_sensores import RuntimeSensores
 
 # Constantes
-from constante import THREAD_JOIN_TIMEOUT
+from constante import INTERVALO_CONTROL_RIEGO, DURACION_DEMO_SENSORES
 
 
 def imprimir_encabezado(titulo: str, caracter: str = "=", ancho: int = 70):
@@ -111,6 +113,13 @@ def demostrar_factory(plantacion_service: PlantacionService, plantacion: Plantac
     print("   [OK] Factory Method funciono correctamente")
 
 
+def mostrar_estado_riego(sensor_temp: TemperaturaReaderTask, sensor_hum: HumedadReaderTask,
+                         controlador: ControlRiegoTask):
+    """Imprime la última lectura de cada sensor y el estado del riego."""
+    print(f"\n   Temperatura: {sensor_temp.valor} grados C | Humedad: {sensor_hum.valor}%")
+    print(f"     Estado: {controlador.estado_riego()}")
+
+
 def demostrar_observer():
     """Demuestra el patrón OBSERVER."""
     imprimir_seccion("PATRON OBSERVER: Sistema de sensores y eventos")
@@ -130,21 +139,21 @@ def demostrar_observer():
     sensor_hum.agregar_observador(controlador)
     print("   [OK] Controlador suscrito a sensores")
     
-    print("\n4. Simulando lecturas de sensores (5 iteraciones):")
+    print(f"\n4. Simulando lecturas de sensores ({DURACION_DEMO_SENSORES} s, runtime asyncio):")
     print("   " + "=" * 60)
     
-    for i in range(5):
-        temp = sensor_temp.leer_temperatura()
-        hum = sensor_hum.leer_humedad()
-        
-        print(f"\n   Lectura {i+1}:")
-        print(f"     Temperatura: {temp} grados C")
-        print(f"     Humedad: {hum}%")
-        print(f"     Estado: {controlador.estado_riego()}")
-        
-        time.sleep(1)
+    runtime = RuntimeSensores()
+    runtime.agregar_sensor(sensor_temp)
+    runtime.agregar_sensor(sensor_hum)
+    runtime.agregar_periodica("control", partial(mostrar_estado_riego, sensor_temp, sensor_hum, controlador),
+                              INTERVALO_CONTROL_RIEGO)
+    asyncio.run(runtime.ejecutar(DURACION_DEMO_SENSORES))
     
+    estadisticas = runtime.estadisticas()
     print("\n   " + "=" * 60)
+    print(f"   Lecturas: {estadisticas['ejecuciones']} | "
+          f"Jitter max: {estadisticas['jitter_max'] * 1000:.1f} ms | "
+          f"Deriva max: {estadisticas['deriva_max'] * 1000:.1f} ms")
     print("   [OK] Patron Observer funciono correctamente")
     print("   [OK] Notificaciones automaticas funcionaron")
     
@@ -171,22 +180,15 @@ def demostrar_strategy(plantacion: Plantacion, registry: CultivoServiceRegistry)
     print("   (Cada tipo usa una estrategia diferente)")
     print("   " + "-" * 60)
     
-    # Agrupar cultivos por tipo
-    tipos_contados = {}
-    for cultivo in plantacion.cultivos:
-        tipo = type(cultivo).__name__
-        if tipo not in tipos_contados:
-            tipos_contados[tipo] = []
-        tipos_contados[tipo].append(cultivo)
-    
-    # Mostrar absorción por tipo
-    for tipo, cultivos_del_tipo in tipos_contados.items():
+    # Cantidad por tipo desde el índice de la plantación (sin recorrer cultivos)
+    for clase, cantidad in plantacion.contar_por_tipo().items():
+        tipo = clase.__name__
         print(f"\n   {tipo}:")
         if tipo in ["Pino", "Olivo"]:
             print(f"     Estrategia: SEASONAL (5L verano, 2L invierno)")
         else:
             print(f"     Estrategia: CONSTANTE (1-2L siempre)")
-        print(f"     Cantidad plantada: {len(cultivos_del_tipo)}")
+        print(f"     Cantidad plantada: {cantidad}")
     
     print("\n   " + "-" * 60)
     print("   [OK] Patron Strategy funciono correctamente")
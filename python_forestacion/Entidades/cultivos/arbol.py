@@ -3,6 +3,8 @@ from python_forestacion.Entidades.cultivos.cultivo import Cultivo
 class Arbol(Cultivo):
     """Clase base para árboles (Pino, Olivo)."""
 
+    __slots__ = ("altura", "produccion_anual")
+
     def __init__(self, nombre: str, superficie: float, altura: float):
         super().__init__(nombre, superficie)
         self.altura = altura
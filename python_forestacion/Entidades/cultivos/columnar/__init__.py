@@ -0,0 +1,2 @@
+# Almacenamiento columnar de cultivos.
+# Guarda un arreglo tipado por atributo y expone vistas livianas por fila.
@@ -0,0 +1,301 @@
+import sys
+from array import array
+from bisect import bisect_left
+from pickle import PickleBuffer
+
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.columnar.vistas_cultivo import (
+    TIPOS_ACEITUNA,
+    VistaPino,
+    VistaOlivo,
+    VistaLechuga,
+    VistaZanahoria,
+)
+
+# El código de tipo de cada fila es la posición de la clase en estas tuplas.
+TIPOS_COLUMNARES = (Pino, Olivo, Lechuga, Zanahoria)
+VISTAS_COLUMNARES = (VistaPino, VistaOlivo, VistaLechuga, VistaZanahoria)
+
+# (nombre de columna, typecode de array) — anchos fijos en todas las plataformas.
+COLUMNAS = (
+    ("tipo", "b"),
+    ("superficie", "d"),
+    ("altura", "d"),
+    ("produccion_anual", "d"),
+    ("dias_crecimiento", "q"),
+    ("regada", "b"),
+    ("profundidad", "d"),
+    ("tipo_aceituna", "b"),
+)
+NOMBRES_COLUMNAS = tuple(nombre for nombre, _ in COLUMNAS)
+SIN_CODIGO = -1
+
+_CODIGOS = {}
+for _codigo, (_tipo, _vista) in enumerate(zip(TIPOS_COLUMNARES, VISTAS_COLUMNARES)):
+    _CODIGOS[_tipo] = _codigo
+    _CODIGOS[_vista] = _codigo
+
+
+class AlmacenColumnar:
+    """
+    Almacenamiento columnar de cultivos: un arreglo tipado por atributo.
+    Se usa como una lista de cultivos, pero cada elemento que devuelve es
+    una vista liviana sobre su fila en lugar de un objeto completo.
+
+    Cada fila tiene además un identificador que no cambia al borrar otras
+    filas (crecen con el orden de las filas y no se persisten). Una vista
+    guarda el de su fila: si un borrado desplaza la fila, la vista la
+    vuelve a ubicar, y si la fila ya no está, usarla lanza ValueError. Los
+    borrados cambian `_generacion`: mientras no cambie, la vista usa la
+    posición que ya tenía sin buscarla.
+    """
+
+    def __init__(self):
+        for nombre, typecode in COLUMNAS:
+            setattr(self, nombre, array(typecode))
+        # Índice por tipo: filas de cada código, en orden ascendente
+        self._filas_por_codigo = [array("q") for _ in TIPOS_COLUMNARES]
+        self._ids = array("q")
+        self._proximo_id = 0
+        self._generacion = 0
+
+    def __getstate__(self) -> dict:
+        estado = dict(self.__dict__)
+        for nombre in _TRANSITORIOS:
+            del estado[nombre]
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        self.__dict__.update(estado)
+        self._reindexar()
+        self._numerar()
+
+    def __reduce_ex__(self, protocolo):
+        if protocolo < 5:
+            return super().__reduce_ex__(protocolo)
+        # Protocolo 5: cada columna viaja como buffer crudo, que puede ir
+        # fuera de banda (sin copiarse dentro del pickle)
+        buffers = tuple(PickleBuffer(columna) for columna in self.columnas())
+        return _almacen_desde_buffers, (sys.byteorder, buffers)
+
+    def _reindexar(self) -> None:
+        """Reconstruye el índice de filas por tipo a partir de la columna `tipo`."""
+        filas_por_codigo = [array("q") for _ in TIPOS_COLUMNARES]
+        for fila, codigo in enumerate(self.tipo):
+            filas_por_codigo[codigo].append(fila)
+        self._filas_por_codigo = filas_por_codigo
+
+    def _numerar(self) -> None:
+        """Asigna identificadores nuevos a todas las filas."""
+        self._ids = array("q", range(len(self)))
+        self._proximo_id = len(self)
+        self._generacion = 0
+
+    def _nuevos_ids(self, cantidad: int) -> None:
+        self._ids.extend(range(self._proximo_id, self._proximo_id + cantidad))
+        self._proximo_id += cantidad
+
+    def ubicar(self, id_fila: int, indice: int) -> int:
+        """
+        Posición actual de la fila con identificador `id_fila`; `indice` es
+        donde estaba la última vez (se prueba primero).
+
+        Raises:
+            ValueError: si la fila ya no está en el almacén.
+        """
+        ids = self._ids
+        if indice < len(ids) and ids[indice] == id_fila:
+            return indice
+        indice = bisect_left(ids, id_fila)
+        if indice == len(ids) or ids[indice] != id_fila:
+            raise ValueError("El cultivo ya no está en este almacén columnar.")
+        return indice
+
+    def fila_de(self, vista) -> int:
+        """
+        Posición actual de la fila de `vista`, verificando que la vista sea
+        de este almacén y que la fila siga siendo de su tipo.
+
+        Raises:
+            ValueError: si la vista es de otro almacén o su fila ya no está.
+        """
+        if getattr(vista, "_almacen", None) is not self:
+            raise ValueError("El cultivo no pertenece a este almacén columnar.")
+        indice = vista._fila()
+        if self.tipo[indice] != self.codigo_de(type(vista)):
+            raise ValueError("La fila del cultivo cambió de tipo.")
+        return indice
+
+    @classmethod
+    def desde_columnas(cls, columnas: list[array]) -> "AlmacenColumnar":
+        """
+        Crea un almacén a partir de columnas ya armadas, en el orden de
+        COLUMNAS (sin copiarlas).
+
+        Raises:
+            ValueError: si las columnas no coinciden en typecode o largo.
+        """
+        if len(columnas) != len(COLUMNAS):
+            raise ValueError("Cantidad de columnas inválida.")
+        largo = len(columnas[0])
+        for columna, (nombre, typecode) in zip(columnas, COLUMNAS):
+            if columna.typecode != typecode or len(columna) != largo:
+                raise ValueError(f"Columna {nombre!r} inválida.")
+        almacen = cls.__new__(cls)
+        for columna, nombre in zip(columnas, NOMBRES_COLUMNAS):
+            setattr(almacen, nombre, columna)
+        almacen._reindexar()
+        almacen._numerar()
+        return almacen
+
+    @staticmethod
+    def codigo_de(tipo: type) -> int:
+        """Devuelve el código de fila de un tipo de cultivo o de su vista."""
+        codigo = _CODIGOS.get(tipo)
+        if codigo is None:
+            raise ValueError(f"Tipo de cultivo no soportado en modo columnar: {tipo.__name__}")
+        return codigo
+
+    def columnas(self) -> list[array]:
+        """Devuelve las columnas en el orden de COLUMNAS."""
+        return [getattr(self, nombre) for nombre in NOMBRES_COLUMNAS]
+
+    def _fila(self, cultivo) -> tuple:
+        aceituna = getattr(cultivo, "tipo_aceituna", None)
+        return (
+            self.codigo_de(type(cultivo)),
+            cultivo.superficie,
+            getattr(cultivo, "altura", 0.0),
+            getattr(cultivo, "produccion_anual", 0.0),
+            getattr(cultivo, "dias_crecimiento", 0),
+            1 if getattr(cultivo, "regada", False) else 0,
+            getattr(cultivo, "profundidad", 0.0),
+            SIN_CODIGO if aceituna is None else TIPOS_ACEITUNA.index(aceituna),
+        )
+
+    def append(self, cultivo) -> None:
+        fila = self._fila(cultivo)
+        self._filas_por_codigo[fila[0]].append(len(self))
+        for columna, valor in zip(self.columnas(), fila):
+            columna.append(valor)
+        self._nuevos_ids(1)
+
+    def extend(self, cultivos) -> None:
+        # Arma todas las filas primero y extiende cada columna una sola vez
+        filas = [self._fila(cultivo) for cultivo in cultivos]
+        inicio = len(self)
+        for desplazamiento, fila in enumerate(filas):
+            self._filas_por_codigo[fila[0]].append(inicio + desplazamiento)
+        for columna, valores in zip(self.columnas(), zip(*filas)):
+            columna.extend(valores)
+        self._nuevos_ids(len(filas))
+
+    def agregar_repetido(self, cultivo, cantidad: int) -> None:
+        """Agrega `cantidad` filas idénticas a `cultivo` extendiendo cada columna una sola vez."""
+        fila = self._fila(cultivo)
+        inicio = len(self)
+        self._filas_por_codigo[fila[0]].extend(range(inicio, inicio + cantidad))
+        for columna, valor in zip(self.columnas(), fila):
+            columna.extend(array(columna.typecode, (valor,)) * cantidad)
+        self._nuevos_ids(cantidad)
+
+    def filas_de_codigo(self, codigo: int) -> array:
+        """Filas (ascendentes) cuyo código de tipo es `codigo`; no copiar para modificar."""
+        return self._filas_por_codigo[codigo]
+
+    def vistas_de_codigos(self, codigos) -> list:
+        """Vistas de las filas de los códigos indicados, agrupadas por código."""
+        vistas = []
+        for codigo in codigos:
+            vista = VISTAS_COLUMNARES[codigo]
+            vistas.extend(vista(self, fila) for fila in self._filas_por_codigo[codigo])
+        return vistas
+
+    def remover_codigos(self, codigos) -> list:
+        """
+        Quita todas las filas de los códigos indicados y las devuelve
+        materializadas. Reescribe cada columna una vez: O(n) en filas.
+        """
+        removidos = [vista.materializar() for vista in self.vistas_de_codigos(codigos)]
+        if removidos:
+            quitar = set(codigos)
+            conservar = [codigo not in quitar for codigo in self.tipo]
+            for nombre, typecode in COLUMNAS + (("_ids", "q"),):
+                columna = getattr(self, nombre)
+                setattr(self, nombre, array(typecode, (v for v, c in zip(columna, conservar) if c)))
+            self._generacion += 1
+            self._reindexar()
+        return removidos
+
+    def remove(self, cultivo) -> None:
+        """
+        Quita la fila de la vista `cultivo`.
+
+        Raises:
+            ValueError: si la vista es de otro almacén o su fila ya no está.
+        """
+        del self[self.fila_de(cultivo)]
+
+    def pop(self, indice: int = -1):
+        """Quita la fila indicada y la devuelve como cultivo materializado."""
+        cultivo = self[indice].materializar()
+        del self[indice]
+        return cultivo
+
+    def __len__(self) -> int:
+        return len(self.tipo)
+
+    def __getitem__(self, indice):
+        if type(indice) is slice:
+            return [VISTAS_COLUMNARES[self.tipo[i]](self, i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de cultivo fuera de rango.")
+        return VISTAS_COLUMNARES[self.tipo[indice]](self, indice)
+
+    def __delitem__(self, indice: int) -> None:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de cultivo fuera de rango.")
+        for columna in self.columnas():
+            del columna[indice]
+        del self._ids[indice]
+        self._generacion += 1
+        # Las filas siguientes se desplazan: el índice por tipo se recalcula (O(n))
+        self._reindexar()
+
+    def __iter__(self):
+        vistas = VISTAS_COLUMNARES
+        for indice, codigo in enumerate(self.tipo):
+            yield vistas[codigo](self, indice)
+
+    def materializar(self) -> list:
+        """Devuelve la lista de cultivos completos (formato lista de objetos)."""
+        # Recorre las columnas de una vez en lugar de leer cada campo por vista
+        constructores = [vista.desde_fila for vista in VISTAS_COLUMNARES]
+        return [constructores[fila[0]](fila) for fila in zip(*self.columnas())]
+
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados por los datos de todas las columnas."""
+        return sum(columna.itemsize * len(columna) for columna in self.columnas())
+
+
+# Estado derivado de las columnas: no se persiste
+_TRANSITORIOS = ("_filas_por_codigo", "_ids", "_proximo_id", "_generacion")
+
+
+def _almacen_desde_buffers(orden_bytes: str, buffers) -> AlmacenColumnar:
+    """Reconstruye un AlmacenColumnar serializado con protocolo 5."""
+    columnas = []
+    for (_, typecode), buffer in zip(COLUMNAS, buffers):
+        columna = array(typecode)
+        columna.frombytes(buffer)
+        if orden_bytes != sys.byteorder:
+            columna.byteswap()
+        columnas.append(columna)
+    return AlmacenColumnar.desde_columnas(columnas)
@@ -0,0 +1,203 @@
+from abc import ABC, abstractmethod
+
+from python_forestacion.Entidades.cultivos.cultivo import Cultivo
+from python_forestacion.Entidades.cultivos.arbol import Arbol
+from python_forestacion.Entidades.cultivos.hortaliza import Hortaliza
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+
+TIPOS_ACEITUNA = tuple(TipoAceituna)
+
+
+def _columna(nombre: str) -> property:
+    """Crea una propiedad que lee y escribe la columna indicada del almacén."""
+
+    def leer(vista):
+        almacen = vista._almacen
+        indice = vista._indice if vista._generacion == almacen._generacion else vista._fila()
+        return getattr(almacen, nombre)[indice]
+
+    def escribir(vista, valor):
+        getattr(vista._almacen, nombre)[vista._fila()] = valor
+
+    return property(leer, escribir)
+
+
+def _columna_booleana(nombre: str) -> property:
+    """Igual que _columna, pero expone la columna como bool."""
+
+    def leer(vista) -> bool:
+        return bool(getattr(vista._almacen, nombre)[vista._fila()])
+
+    def escribir(vista, valor: bool):
+        getattr(vista._almacen, nombre)[vista._fila()] = 1 if valor else 0
+
+    return property(leer, escribir)
+
+
+class VistaCultivo(ABC):
+    """
+    Vista liviana sobre una fila de un AlmacenColumnar.
+    Se comporta como el cultivo original pero no guarda datos propios:
+    lee y escribe directamente en las columnas del almacén.
+    `tipo_cultivo` es la clase de entidad que representa la vista.
+
+    Identifica su fila por el identificador estable del almacén: sigue
+    siendo válida si se borran otras filas, y lanza ValueError si se borró
+    la suya.
+    """
+
+    __slots__ = ("_almacen", "_indice", "_id", "_generacion")
+
+    nombre = ""
+    tipo_cultivo = Cultivo
+    superficie = _columna("superficie")
+    __str__ = Cultivo.__str__
+
+    def __init__(self, almacen, indice: int):
+        self._almacen = almacen
+        self._indice = indice
+        self._id = almacen._ids[indice]
+        # Generación del almacén en la que `_indice` se verificó
+        self._generacion = almacen._generacion
+
+    def _fila(self) -> int:
+        """Posición actual de la fila (se actualiza si un borrado la desplazó)."""
+        almacen = self._almacen
+        if self._generacion != almacen._generacion:
+            self._indice = almacen.ubicar(self._id, self._indice)
+            self._generacion = almacen._generacion
+        return self._indice
+
+    def __eq__(self, otro) -> bool:
+        if type(otro) is not type(self):
+            return NotImplemented
+        return self._almacen is otro._almacen and self._id == otro._id
+
+    def __hash__(self) -> int:
+        return hash((id(self._almacen), self._id))
+
+    @abstractmethod
+    def materializar(self) -> Cultivo:
+        """Construye el objeto de cultivo completo equivalente a la fila."""
+
+    @classmethod
+    @abstractmethod
+    def desde_fila(cls, fila: tuple) -> Cultivo:
+        """Como materializar, a partir de los valores de una fila en el orden de COLUMNAS."""
+
+
+class VistaArbol(VistaCultivo):
+    """Vista de una fila de tipo árbol (Pino, Olivo)."""
+
+    __slots__ = ()
+
+    altura = _columna("altura")
+    produccion_anual = _columna("produccion_anual")
+    crecer = Arbol.crecer
+
+
+class VistaHortaliza(VistaCultivo):
+    """Vista de una fila de tipo hortaliza (Lechuga, Zanahoria)."""
+
+    __slots__ = ()
+
+    dias_crecimiento = _columna("dias_crecimiento")
+    regada = _columna_booleana("regada")
+    regar = Hortaliza.regar
+
+
+class VistaPino(VistaArbol):
+    """Vista columnar de un Pino."""
+
+    __slots__ = ()
+
+    nombre = "Pino"
+    tipo_cultivo = Pino
+    absorber_agua = Pino.absorber_agua
+
+    def materializar(self) -> Pino:
+        pino = Pino(self.superficie, self.altura)
+        pino.produccion_anual = self.produccion_anual
+        return pino
+
+    @classmethod
+    def desde_fila(cls, fila: tuple) -> Pino:
+        pino = Pino(fila[1], fila[2])
+        pino.produccion_anual = fila[3]
+        return pino
+
+
+class VistaOlivo(VistaArbol):
+    """Vista columnar de un Olivo."""
+
+    __slots__ = ()
+
+    nombre = "Olivo"
+    tipo_cultivo = Olivo
+    absorber_agua = Olivo.absorber_agua
+
+    @property
+    def tipo_aceituna(self) -> TipoAceituna:
+        return TIPOS_ACEITUNA[self._almacen.tipo_aceituna[self._fila()]]
+
+    @tipo_aceituna.setter
+    def tipo_aceituna(self, valor: TipoAceituna):
+        self._almacen.tipo_aceituna[self._fila()] = TIPOS_ACEITUNA.index(valor)
+
+    def materializar(self) -> Olivo:
+        olivo = Olivo(self.superficie, self.altura, self.tipo_aceituna)
+        olivo.produccion_anual = self.produccion_anual
+        return olivo
+
+    @classmethod
+    def desde_fila(cls, fila: tuple) -> Olivo:
+        olivo = Olivo(fila[1], fila[2], TIPOS_ACEITUNA[fila[7]])
+        olivo.produccion_anual = fila[3]
+        return olivo
+
+
+class VistaLechuga(VistaHortaliza):
+    """Vista columnar de una Lechuga."""
+
+    __slots__ = ()
+
+    nombre = "Lechuga"
+    tipo_cultivo = Lechuga
+    absorber_agua = Lechuga.absorber_agua
+
+    def materializar(self) -> Lechuga:
+        lechuga = Lechuga(self.superficie, self.dias_crecimiento)
+        lechuga.regada = self.regada
+        return lechuga
+
+    @classmethod
+    def desde_fila(cls, fila: tuple) -> Lechuga:
+        lechuga = Lechuga(fila[1], fila[4])
+        lechuga.regada = bool(fila[5])
+        return lechuga
+
+
+class VistaZanahoria(VistaHortaliza):
+    """Vista columnar de una Zanahoria."""
+
+    __slots__ = ()
+
+    nombre = "Zanahoria"
+    tipo_cultivo = Zanahoria
+    profundidad = _columna("profundidad")
+    absorber_agua = Zanahoria.absorber_agua
+
+    def materializar(self) -> Zanahoria:
+        zanahoria = Zanahoria(self.superficie, self.dias_crecimiento, self.profundidad)
+        zanahoria.regada = self.regada
+        return zanahoria
+
+    @classmethod
+    def desde_fila(cls, fila: tuple) -> Zanahoria:
+        zanahoria = Zanahoria(fila[1], fila[4], fila[6])
+        zanahoria.regada = bool(fila[5])
+        return zanahoria
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
 
-class Cultivo(ABC):
+class Cultivo(EntidadCompacta, ABC):
     """Clase base para todos los cultivos."""
 
+    __slots__ = ("nombre", "superficie")
+
     def __init__(self, nombre: str, superficie: float):
         self.nombre = nombre
         self.superficie = superficie
@@ -3,6 +3,8 @@ from python_forestacion.Entidades.cultivos.cultivo import Cultivo
 class Hortaliza(Cultivo):
     """Clase base para hortalizas (Lechuga, Zanahoria)."""
 
+    __slots__ = ("dias_crecimiento", "regada")
+
     def __init__(self, nombre: str, superficie: float, dias_crecimiento: int):
         super().__init__(nombre, superficie)
         self.dias_crecimiento = dias_crecimiento
@@ -1,12 +1,15 @@
 from python_forestacion.Entidades.cultivos.hortaliza import Hortaliza
+from constante import AGUA_MINIMA_LECHUGA
 
 class Lechuga(Hortaliza):
     """Cultivo tipo Lechuga."""
 
+    __slots__ = ()
+
     def __init__(self, superficie: float, dias_crecimiento: int):
         super().__init__("Lechuga", superficie, dias_crecimiento)
 
     def absorber_agua(self, cantidad: float) -> None:
-        if cantidad < 1:
+        if cantidad < AGUA_MINIMA_LECHUGA:
             raise ValueError("La lechuga necesita al menos 1 L de agua.")
         self.regar()
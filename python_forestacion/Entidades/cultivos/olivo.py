@@ -1,15 +1,18 @@
 from python_forestacion.Entidades.cultivos.arbol import Arbol
 from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from constante import AGUA_MINIMA_OLIVO, FACTOR_PRODUCCION_OLIVO
 
 class Olivo(Arbol):
     """Cultivo tipo Olivo."""
 
+    __slots__ = ("tipo_aceituna",)
+
     def __init__(self, superficie: float, altura: float, tipo_aceituna: TipoAceituna):
         super().__init__("Olivo", superficie, altura)
         self.tipo_aceituna = tipo_aceituna
         self.produccion_anual = 0
 
     def absorber_agua(self, cantidad: float) -> None:
-        if cantidad < 5:
+        if cantidad < AGUA_MINIMA_OLIVO:
             raise ValueError("El olivo necesita al menos 5 L de agua para mantenerse.")
-        self.produccion_anual += cantidad * 0.2
+        self.produccion_anual += cantidad * FACTOR_PRODUCCION_OLIVO
@@ -1,12 +1,15 @@
 from python_forestacion.Entidades.cultivos.arbol import Arbol
+from constante import AGUA_MINIMA_PINO, CRECIMIENTO_RIEGO_PINO
 
 class Pino(Arbol):
     """Cultivo tipo Pino."""
 
+    __slots__ = ()
+
     def __init__(self, superficie: float, altura: float):
         super().__init__("Pino", superficie, altura)
 
     def absorber_agua(self, cantidad: float) -> None:
-        if cantidad < 10:
+        if cantidad < AGUA_MINIMA_PINO:
             raise ValueError("El pino requiere al menos 10 L de agua para absorber correctamente.")
-        self.altura += 0.05
+        self.altura += CRECIMIENTO_RIEGO_PINO
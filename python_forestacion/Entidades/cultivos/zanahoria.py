@@ -1,13 +1,16 @@
 from python_forestacion.Entidades.cultivos.hortaliza import Hortaliza
+from constante import AGUA_MINIMA_ZANAHORIA
 
 class Zanahoria(Hortaliza):
     """Cultivo tipo Zanahoria."""
 
+    __slots__ = ("profundidad",)
+
     def __init__(self, superficie: float, dias_crecimiento: int, profundidad: float):
         super().__init__("Zanahoria", superficie, dias_crecimiento)
         self.profundidad = profundidad
 
     def absorber_agua(self, cantidad: float) -> None:
-        if cantidad < 0.5:
+        if cantidad < AGUA_MINIMA_ZANAHORIA:
             raise ValueError("La zanahoria requiere al menos 0.5 L de agua.")
         self.regar()
@@ -0,0 +1,76 @@
+_FALTANTE = object()
+
+
+class EntidadCompacta:
+    """
+    Base de las entidades con __slots__: las instancias no llevan __dict__.
+    Mantiene la compatibilidad con pickle (y con Paquete): el estado se
+    guarda como dict y al cargar se acepta tanto ese formato como el de los
+    .dat escritos cuando las entidades usaban __dict__.
+
+    Las subclases pueden declarar en `_TRANSITORIOS` atributos que no se
+    persisten y reconstruirlos en `_al_cargar`.
+    """
+
+    __slots__ = ()
+    _TRANSITORIOS: tuple[str, ...] = ()
+
+    @classmethod
+    def nombres_slots(cls) -> tuple[str, ...]:
+        """Todos los slots de datos de la clase, incluidos los heredados."""
+        nombres = cls.__dict__.get("_slots_resueltos")
+        if nombres is None:
+            nombres = []
+            for clase in reversed(cls.__mro__):
+                slots = clase.__dict__.get("__slots__", ())
+                if type(slots) is str:
+                    slots = (slots,)
+                nombres.extend(nombre for nombre in slots
+                               if nombre not in ("__dict__", "__weakref__") and nombre not in nombres)
+            nombres = tuple(nombres)
+            cls._slots_resueltos = nombres
+        return nombres
+
+    def __getstate__(self) -> dict:
+        estado = {}
+        for nombre in self.nombres_slots():
+            if nombre in self._TRANSITORIOS:
+                continue
+            valor = getattr(self, nombre, _FALTANTE)
+            if valor is not _FALTANTE:
+                estado[nombre] = valor
+        # Subclases sin __slots__ (por ejemplo, cultivos definidos por usuarios)
+        estado.update(getattr(self, "__dict__", {}))
+        return estado
+
+    def __setstate__(self, estado) -> None:
+        if type(estado) is tuple:
+            # Formato (dict, slots) que pickle usa para objetos con ambos
+            dict_estado, slots_estado = estado
+            estado = dict(dict_estado or {})
+            estado.update(slots_estado or {})
+        for nombre, valor in estado.items():
+            setattr(self, nombre, valor)
+        self._al_cargar()
+
+    def _al_cargar(self) -> None:
+        """Gancho para reconstruir el estado transitorio después de cargar."""
+
+    def clonar(self, cantidad: int) -> list:
+        """
+        Devuelve `cantidad` copias superficiales sin ejecutar el constructor.
+        Los atributos transitorios se reconstruyen como al cargar.
+        """
+        clase = type(self)
+        pares = list(self.__getstate__().items())
+        nuevo = object.__new__
+        clones = []
+        for _ in range(cantidad):
+            clon = nuevo(clase)
+            for nombre, valor in pares:
+                setattr(clon, nombre, valor)
+            clones.append(clon)
+        if self._TRANSITORIOS:
+            for clon in clones:
+                clon._al_cargar()
+        return clones
@@ -1,8 +1,11 @@
 from datetime import date
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
 
-class AptoMedico:
+class AptoMedico(EntidadCompacta):
     """Certificación médica del trabajador."""
 
+    __slots__ = ("fecha_emision", "valido_hasta", "observaciones")
+
     def __init__(self, fecha_emision: date, valido_hasta: date, observaciones: str):
         self.fecha_emision = fecha_emision
         self.valido_hasta = valido_hasta
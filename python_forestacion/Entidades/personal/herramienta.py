@@ -1,6 +1,10 @@
-class Herramienta:
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
+
+class Herramienta(EntidadCompacta):
     """Representa una herramienta de trabajo."""
 
+    __slots__ = ("nombre", "estado")
+
     def __init__(self, nombre: str, estado: str):
         self.nombre = nombre
         self.estado = estado
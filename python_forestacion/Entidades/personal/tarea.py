@@ -1,9 +1,12 @@
 from datetime import date
 from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
 
-class Tarea:
+class Tarea(EntidadCompacta):
     """Actividad asignada a un trabajador."""
 
+    __slots__ = ("descripcion", "fecha", "herramienta", "completada")
+
     def __init__(self, descripcion: str, fecha: date, herramienta: Herramienta):
         self.descripcion = descripcion
         self.fecha = fecha
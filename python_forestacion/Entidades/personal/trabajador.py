@@ -1,6 +1,10 @@
-class Trabajador:
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
+
+class Trabajador(EntidadCompacta):
     """Representa un trabajador agrícola."""
 
+    __slots__ = ("nombre", "dni", "edad", "apto_medico", "tareas")
+
     def __init__(self, nombre: str, dni: str, edad: int):
         self.nombre = nombre
         self.dni = dni
@@ -0,0 +1,2 @@
+# Consultas sobre el registro forestal.
+# Índices secundarios mantenidos por RegistroForestal y predicados que los aprovechan.
@@ -0,0 +1,39 @@
+from bisect import bisect_left, bisect_right, insort
+
+# Centinelas para acotar los pares (valor, nombre) en las búsquedas por rango
+_NOMBRE_MINIMO = ""
+_NOMBRE_MAXIMO = "\U0010ffff"
+
+
+class IndiceOrdenado:
+    """
+    Índice ordenado de (valor, nombre de plantación) para consultas por rango.
+    Altas, bajas y movimientos cuestan O(log n) en la búsqueda más el
+    corrimiento de la lista; un rango cuesta O(log n + resultados).
+    """
+
+    def __init__(self, pares=()):
+        self._pares: list[tuple[float, str]] = sorted(pares)
+
+    def __len__(self) -> int:
+        return len(self._pares)
+
+    def agregar(self, valor: float, nombre: str) -> None:
+        insort(self._pares, (valor, nombre))
+
+    def quitar(self, valor: float, nombre: str) -> None:
+        pares = self._pares
+        posicion = bisect_left(pares, (valor, nombre))
+        if posicion < len(pares) and pares[posicion] == (valor, nombre):
+            del pares[posicion]
+
+    def mover(self, nombre: str, anterior: float, nuevo: float) -> None:
+        self.quitar(anterior, nombre)
+        self.agregar(nuevo, nombre)
+
+    def rango(self, minimo: float | None = None, maximo: float | None = None) -> list[str]:
+        """Nombres con minimo <= valor <= maximo (extremos None: sin cota), ordenados por valor."""
+        pares = self._pares
+        inicio = 0 if minimo is None else bisect_left(pares, (minimo, _NOMBRE_MINIMO))
+        fin = len(pares) if maximo is None else bisect_right(pares, (maximo, _NOMBRE_MAXIMO))
+        return [nombre for _, nombre in pares[inicio:fin]]
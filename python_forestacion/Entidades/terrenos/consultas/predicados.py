@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+
+
+class Predicado(ABC):
+    """
+    Condición sobre una plantación del RegistroForestal.
+    Si el registro tiene un índice para la condición, `candidatos` devuelve
+    los nombres que la cumplen; si no, devuelve None y el registro recorre
+    las plantaciones llamando a `evaluar`.
+    """
+
+    def candidatos(self, registro) -> list[str] | None:
+        return None
+
+    @abstractmethod
+    def evaluar(self, plantacion, registro) -> bool:
+        """Indica si la plantación cumple la condición."""
+
+
+class Igual(Predicado):
+    """campo == valor. Indexado para nombre, id_padron, agua_disponible y superficie."""
+
+    def __init__(self, campo: str, valor):
+        self.campo = campo
+        self.valor = valor
+
+    def candidatos(self, registro) -> list[str] | None:
+        if self.campo == "nombre":
+            return [self.valor] if registro.buscar_plantacion(self.valor) is not None else []
+        if self.campo == "id_padron":
+            return registro.nombres_por_padron(self.valor)
+        indice = registro.indice_ordenado(self.campo)
+        return None if indice is None else indice.rango(self.valor, self.valor)
+
+    def evaluar(self, plantacion, registro) -> bool:
+        return registro.valor_campo(plantacion, self.campo) == self.valor
+
+
+class Rango(Predicado):
+    """minimo <= campo <= maximo (None: sin cota). Indexado para agua_disponible y superficie."""
+
+    def __init__(self, campo: str, minimo=None, maximo=None):
+        self.campo = campo
+        self.minimo = minimo
+        self.maximo = maximo
+
+    def candidatos(self, registro) -> list[str] | None:
+        indice = registro.indice_ordenado(self.campo)
+        return None if indice is None else indice.rango(self.minimo, self.maximo)
+
+    def evaluar(self, plantacion, registro) -> bool:
+        valor = registro.valor_campo(plantacion, self.campo)
+        if valor is None:
+            return False
+        if self.minimo is not None and valor < self.minimo:
+            return False
+        return self.maximo is None or valor <= self.maximo
+
+
+class ContieneTipo(Predicado):
+    """La plantación tiene cultivos de la clase `tipo` o de sus subclases. Siempre indexado."""
+
+    def __init__(self, tipo: type):
+        self.tipo = tipo
+
+    def candidatos(self, registro) -> list[str] | None:
+        return registro.nombres_con_tipo(self.tipo)
+
+    def evaluar(self, plantacion, registro) -> bool:
+        for tipo in plantacion.contar_por_tipo():
+            if issubclass(tipo, self.tipo):
+                return True
+        return False
+
+
+class Filtro(Predicado):
+    """Condición arbitraria `funcion(plantacion) -> bool`; siempre se evalúa recorriendo."""
+
+    def __init__(self, funcion):
+        self.funcion = funcion
+
+    def evaluar(self, plantacion, registro) -> bool:
+        return bool(self.funcion(plantacion))
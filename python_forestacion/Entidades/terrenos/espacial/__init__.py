@@ -0,0 +1,2 @@
+# Ubicación de cultivos dentro de una plantación.
+# Índice de grilla uniforme para consultas por zona y búsqueda de lugar libre.
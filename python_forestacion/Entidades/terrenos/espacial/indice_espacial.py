@@ -0,0 +1,155 @@
+from math import floor, sqrt
+
+# Tolerancia para bordes que coinciden exactamente (errores de redondeo)
+_EPSILON = 1e-9
+
+
+class IndiceEspacial:
+    """
+    Grilla uniforme de celdas cuadradas sobre un terreno de ancho x alto.
+    Cada cultivo ubicado ocupa un cuadrado de lado sqrt(superficie) centrado
+    en (x, y); la celda de su centro lo referencia. Las consultas por
+    rectángulo o radio solo revisan las celdas que tocan la zona.
+
+    Los cultivos se identifican por id(): el índice guarda la referencia,
+    así que un id no se reutiliza mientras el cultivo esté ubicado.
+    """
+
+    def __init__(self, ancho: float, alto: float, tamano_celda: float):
+        if ancho <= 0 or alto <= 0 or tamano_celda <= 0:
+            raise ValueError("El terreno y las celdas deben tener dimensiones positivas.")
+        self.ancho = ancho
+        self.alto = alto
+        self.tamano_celda = tamano_celda
+        self._celdas: dict[tuple[int, int], dict[int, object]] = {}
+        # id(cultivo) -> (cultivo, x, y, medio lado)
+        self._ubicaciones: dict[int, tuple] = {}
+        self._medio_lado_maximo = 0.0
+
+    def __len__(self) -> int:
+        return len(self._ubicaciones)
+
+    def __getstate__(self) -> dict:
+        # Las celdas dependen de id(): se guardan las ubicaciones y se reindexa al cargar
+        return {
+            "ancho": self.ancho,
+            "alto": self.alto,
+            "tamano_celda": self.tamano_celda,
+            "ubicaciones": [(cultivo, x, y) for cultivo, x, y, _ in self._ubicaciones.values()],
+        }
+
+    def __setstate__(self, estado: dict) -> None:
+        self.__init__(estado["ancho"], estado["alto"], estado["tamano_celda"])
+        for cultivo, x, y in estado["ubicaciones"]:
+            self._insertar(cultivo, x, y, sqrt(cultivo.superficie) / 2)
+
+    def _celda(self, x: float, y: float) -> tuple[int, int]:
+        return floor(x / self.tamano_celda), floor(y / self.tamano_celda)
+
+    def _insertar(self, cultivo, x: float, y: float, medio_lado: float) -> None:
+        celda = self._celda(x, y)
+        ocupantes = self._celdas.get(celda)
+        if ocupantes is None:
+            ocupantes = self._celdas[celda] = {}
+        ocupantes[id(cultivo)] = cultivo
+        self._ubicaciones[id(cultivo)] = (cultivo, x, y, medio_lado)
+        if medio_lado > self._medio_lado_maximo:
+            self._medio_lado_maximo = medio_lado
+
+    def posicion(self, cultivo) -> tuple[float, float] | None:
+        ubicacion = self._ubicaciones.get(id(cultivo))
+        return None if ubicacion is None else ubicacion[1:3]
+
+    def hay_lugar(self, x: float, y: float, superficie: float, ignorar=None) -> bool:
+        """Indica si un cultivo de `superficie` centrado en (x, y) entra sin superponerse."""
+        medio_lado = sqrt(superficie) / 2
+        if (x - medio_lado < -_EPSILON or y - medio_lado < -_EPSILON
+                or x + medio_lado > self.ancho + _EPSILON or y + medio_lado > self.alto + _EPSILON):
+            return False
+        # Un cultivo superpuesto tiene el centro a menos de medio_lado + su medio lado
+        alcance = medio_lado + self._medio_lado_maximo
+        for otro, ox, oy, otro_medio in self._candidatos(x - alcance, y - alcance, x + alcance, y + alcance):
+            if otro is ignorar:
+                continue
+            limite = medio_lado + otro_medio - _EPSILON
+            if abs(ox - x) < limite and abs(oy - y) < limite:
+                return False
+        return True
+
+    def agregar(self, cultivo, x: float, y: float) -> None:
+        """
+        Ubica un cultivo (o lo mueve si ya estaba ubicado).
+
+        Raises:
+            ValueError: si queda fuera del terreno o se superpone con otro cultivo.
+        """
+        if not self.hay_lugar(x, y, cultivo.superficie, ignorar=cultivo):
+            raise ValueError(f"No hay lugar libre para el cultivo en ({x}, {y}).")
+        self.quitar(cultivo)
+        self._insertar(cultivo, x, y, sqrt(cultivo.superficie) / 2)
+
+    def quitar(self, cultivo) -> bool:
+        ubicacion = self._ubicaciones.pop(id(cultivo), None)
+        if ubicacion is None:
+            return False
+        celda = self._celda(ubicacion[1], ubicacion[2])
+        ocupantes = self._celdas[celda]
+        del ocupantes[id(cultivo)]
+        if not ocupantes:
+            del self._celdas[celda]
+        return True
+
+    def _candidatos(self, x_min: float, y_min: float, x_max: float, y_max: float):
+        """Ubicaciones de las celdas que tocan el rectángulo (sin filtrar por posición)."""
+        cx_min, cy_min = self._celda(x_min, y_min)
+        cx_max, cy_max = self._celda(x_max, y_max)
+        celdas_en_rango = (cx_max - cx_min + 1) * (cy_max - cy_min + 1)
+        ubicaciones = self._ubicaciones
+        if celdas_en_rango > len(self._celdas):
+            # Zona más grande que las celdas ocupadas: recorrer solo las ocupadas
+            for (cx, cy), ocupantes in self._celdas.items():
+                if cx_min <= cx <= cx_max and cy_min <= cy <= cy_max:
+                    for clave in ocupantes:
+                        yield ubicaciones[clave]
+            return
+        celdas = self._celdas
+        for cx in range(cx_min, cx_max + 1):
+            for cy in range(cy_min, cy_max + 1):
+                ocupantes = celdas.get((cx, cy))
+                if ocupantes:
+                    for clave in ocupantes:
+                        yield ubicaciones[clave]
+
+    def en_rectangulo(self, x_min: float, y_min: float, x_max: float, y_max: float) -> list:
+        """Cultivos con el centro dentro del rectángulo (bordes incluidos)."""
+        return [
+            cultivo for cultivo, x, y, _ in self._candidatos(x_min, y_min, x_max, y_max)
+            if x_min <= x <= x_max and y_min <= y <= y_max
+        ]
+
+    def en_radio(self, x: float, y: float, radio: float) -> list:
+        """Cultivos con el centro a distancia <= radio de (x, y)."""
+        radio2 = radio * radio
+        return [
+            cultivo for cultivo, cx, cy, _ in self._candidatos(x - radio, y - radio, x + radio, y + radio)
+            if (cx - x) ** 2 + (cy - y) ** 2 <= radio2
+        ]
+
+    def buscar_lugar(self, superficie: float) -> tuple[float, float] | None:
+        """
+        Primera posición libre (recorriendo el terreno por filas, con paso
+        igual al lado del cultivo) donde entra un cultivo de `superficie`.
+        Devuelve None si no hay lugar.
+        """
+        lado = sqrt(superficie)
+        if lado <= 0:
+            return None
+        columnas = floor(self.ancho / lado + _EPSILON)
+        filas = floor(self.alto / lado + _EPSILON)
+        for fila in range(filas):
+            y = (fila + 0.5) * lado
+            for columna in range(columnas):
+                x = (columna + 0.5) * lado
+                if self.hay_lugar(x, y, superficie):
+                    return x, y
+        return None
@@ -1,22 +1,443 @@
+import os
+
 from python_forestacion.Entidades.cultivos.cultivo import Cultivo
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
+from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.Entidades.terrenos.espacial.indice_espacial import IndiceEspacial
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import AlmacenColumnar, TIPOS_COLUMNARES
+from python_forestacion.riego.lote.motor_riego_lote import MotorRiegoLote
+from python_forestacion.riego.lote.resultado_riego import ResultadoRiego
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.excepciones.superficie_insuficiente_exception import SuperficieInsuficienteException
+from constante import TAMANO_CELDA_ESPACIAL
+
+class Plantacion(EntidadCompacta, Observable):
+    """
+    Conjunto de cultivos dentro de una tierra.
+    Con columnar=True los cultivos se guardan en un AlmacenColumnar
+    (un arreglo por atributo) en lugar de una lista de objetos.
+
+    Mantiene un índice por clase de cultivo (buckets) para que las
+    consultas y bajas por tipo cuesten en proporción a los cultivos del
+    tipo y no al total de la plantación.
+
+    Es observable: notifica a sus observadores (por ejemplo, los índices de
+    RegistroForestal) los cambios de agua_disponible, de superficie y del
+    conjunto de tipos de cultivo presentes, con
+    actualizar(plantacion, cambio, anterior).
+    """
 
-class Plantacion:
-    """Conjunto de cultivos dentro de una tierra."""
+    __slots__ = (
+        "nombre", "_superficie", "_agua_disponible", "_cultivos",
+        "_conteo_por_tipo", "_superficie_ocupada", "_cultivos_por_tipo", "_pendientes", "_espacial",
+        "_modificada", "_huella", "__weakref__",
+    )
 
-    def __init__(self, nombre: str, superficie: float, agua_disponible: float):
+    # Estado derivado de `cultivos`, observadores y marca de cambios: no se persisten
+    _TRANSITORIOS = (
+        "_conteo_por_tipo", "_superficie_ocupada", "_cultivos_por_tipo", "_pendientes", "_observadores",
+        "_instantanea", "_cerrojo", "_debiles", "_modificada",
+    )
+
+    def __init__(self, nombre: str, superficie: float, agua_disponible: float, columnar: bool = False):
+        Observable.__init__(self)
+        # Cambios sin guardar; ver marcar_guardada
+        self._modificada = True
+        # Identificador del contenido actual; ver huella
+        self._huella: str | None = None
         self.nombre = nombre
-        self.superficie = superficie
-        self.agua_disponible = agua_disponible
-        self.cultivos: list[Cultivo] = []
+        self._superficie = superficie
+        self._agua_disponible = agua_disponible
+        self._cultivos: list[Cultivo] | AlmacenColumnar = AlmacenColumnar() if columnar else []
+        self._conteo_por_tipo: dict[type, int] = {}
+        self._superficie_ocupada = 0.0
+        # Modo lista: clase -> {id(cultivo): cultivo}, en orden de alta
+        self._cultivos_por_tipo: dict[type, dict[int, Cultivo]] = {}
+        # Bajas por tipo aún no quitadas de la lista; se guardan las
+        # referencias para que sus id() no se reutilicen antes de compactar
+        self._pendientes: dict[int, Cultivo] = {}
+        # Ubicación (x, y) opcional de los cultivos; ver habilitar_indice_espacial
+        self._espacial: IndiceEspacial | None = None
+
+    @classmethod
+    def desde_cultivos(cls, nombre: str, superficie: float, agua_disponible: float,
+                       cultivos: list[Cultivo] | AlmacenColumnar) -> "Plantacion":
+        """Crea una plantación con sus cultivos ya armados (por ejemplo, al decodificar un snapshot)."""
+        plantacion = cls(nombre, superficie, agua_disponible)
+        plantacion._cultivos = cultivos
+        plantacion._reconstruir_indices()
+        return plantacion
+
+    @property
+    def cultivos(self) -> list[Cultivo] | AlmacenColumnar:
+        if self._pendientes:
+            self._compactar()
+        return self._cultivos
+
+    @cultivos.setter
+    def cultivos(self, cultivos: list[Cultivo] | AlmacenColumnar) -> None:
+        # Usado al cargar pickles que guardaban el slot público `cultivos`
+        self._cultivos = cultivos
+
+    @property
+    def agua_disponible(self) -> float:
+        return self._agua_disponible
+
+    @agua_disponible.setter
+    def agua_disponible(self, agua: float) -> None:
+        anterior = getattr(self, "_agua_disponible", None)
+        self._agua_disponible = agua
+        self._notificar_cambio("agua_disponible", anterior)
+
+    @property
+    def superficie(self) -> float:
+        return self._superficie
+
+    @superficie.setter
+    def superficie(self, superficie: float) -> None:
+        anterior = getattr(self, "_superficie", None)
+        self._superficie = superficie
+        self._notificar_cambio("superficie", anterior)
+
+    def _notificar_cambio(self, cambio: str, anterior=None) -> None:
+        self.marcar_modificada()
+        # Al cargar un pickle los observadores todavía no existen
+        if getattr(self, "_observadores", None):
+            self.notificar(cambio, anterior)
+
+    @property
+    def modificada(self) -> bool:
+        """
+        True si la plantación cambió desde marcar_guardada. Cubre altas, bajas,
+        riego, agua, superficie y ubicaciones; los cambios hechos directamente
+        sobre un cultivo deben avisarse con marcar_modificada.
+        """
+        return self._modificada
+
+    def marcar_modificada(self) -> None:
+        self._huella = None
+        # Al cargar un pickle anterior la marca todavía no existe
+        if not getattr(self, "_modificada", False):
+            self._modificada = True
+            # Solo se avisa el primer cambio después de guardar
+            if getattr(self, "_observadores", None):
+                self.notificar("modificada")
+
+    def marcar_guardada(self) -> None:
+        self._modificada = False
+
+    @property
+    def huella(self) -> str:
+        """
+        Identificador del contenido actual: se genera al pedirlo, se persiste
+        con la plantación y se descarta con cada cambio (marcar_modificada).
+        Dos plantaciones con la misma huella tienen el mismo contenido, así
+        que cada destino puede recordar qué guardó sin depender de la marca
+        de modificada, que es una sola para todos los destinos.
+        """
+        if self._huella is None:
+            self._huella = os.urandom(8).hex()
+        return self._huella
+
+    @property
+    def es_columnar(self) -> bool:
+        return type(self._cultivos) is AlmacenColumnar
+
+    @property
+    def superficie_ocupada(self) -> float:
+        return self._superficie_ocupada
+
+    @property
+    def superficie_libre(self) -> float:
+        return self.superficie - self._superficie_ocupada
+
+    @staticmethod
+    def _tipo_de(cultivo) -> type:
+        """Clase de entidad del cultivo (las vistas columnares informan la suya)."""
+        return getattr(cultivo, "tipo_cultivo", type(cultivo))
+
+    def _contabilizar(self, tipo: type, cantidad: int, superficie: float) -> None:
+        previo = self._conteo_por_tipo.get(tipo, 0)
+        self._conteo_por_tipo[tipo] = previo + cantidad
+        self._superficie_ocupada += superficie
+        self.marcar_modificada()
+        if not previo or not previo + cantidad:
+            self._notificar_cambio("tipos")
+
+    def _indexar(self, tipo: type, cultivos) -> None:
+        bucket = self._cultivos_por_tipo.get(tipo)
+        if bucket is None:
+            bucket = self._cultivos_por_tipo[tipo] = {}
+        for cultivo in cultivos:
+            bucket[id(cultivo)] = cultivo
+
+    def _compactar(self) -> None:
+        """Quita de la lista, en una sola pasada, los cultivos dados de baja por tipo."""
+        pendientes = self._pendientes
+        self._cultivos[:] = [cultivo for cultivo in self._cultivos if id(cultivo) not in pendientes]
+        pendientes.clear()
+
+    def _tipos_de(self, cls: type) -> list[type]:
+        """Clases presentes en la plantación que son `cls` o subclases de ella."""
+        return [tipo for tipo, cantidad in self._conteo_por_tipo.items() if cantidad and issubclass(tipo, cls)]
+
+    def cultivos_de_tipo(self, cls: type) -> list:
+        """
+        Cultivos de la clase `cls` o de sus subclases (Arbol devuelve Pinos
+        y Olivos), agrupados por clase. En modo columnar devuelve vistas.
+        """
+        tipos = self._tipos_de(cls)
+        if self.es_columnar:
+            return self._cultivos.vistas_de_codigos([AlmacenColumnar.codigo_de(tipo) for tipo in tipos])
+        return [cultivo for tipo in tipos for cultivo in self._cultivos_por_tipo[tipo].values()]
+
+    def contar_por_tipo(self) -> dict[type, int]:
+        """Cantidad de cultivos por clase, sin recorrer los cultivos."""
+        return {tipo: cantidad for tipo, cantidad in self._conteo_por_tipo.items() if cantidad}
+
+    def remover_tipo(self, cls: type) -> list[Cultivo]:
+        """
+        Quita todos los cultivos de la clase `cls` o de sus subclases y los
+        devuelve. En modo lista la baja cuesta O(cultivos del tipo) y la lista
+        se compacta en el próximo acceso a `cultivos`; en modo columnar se
+        reescriben las columnas (O(n)) y se devuelven cultivos materializados.
+        """
+        tipos = self._tipos_de(cls)
+        if self.es_columnar:
+            removidos = self._cultivos.remover_codigos([AlmacenColumnar.codigo_de(tipo) for tipo in tipos])
+        else:
+            removidos = []
+            for tipo in tipos:
+                bucket = self._cultivos_por_tipo.pop(tipo)
+                self._pendientes.update(bucket)
+                removidos.extend(bucket.values())
+            if self._espacial is not None:
+                for cultivo in removidos:
+                    self._espacial.quitar(cultivo)
+        for tipo in tipos:
+            del self._conteo_por_tipo[tipo]
+        self._superficie_ocupada -= sum(cultivo.superficie for cultivo in removidos)
+        if tipos:
+            self._notificar_cambio("tipos")
+        return removidos
 
-    def agregar_cultivo(self, cultivo: Cultivo) -> None:
-        if cultivo.superficie > self.superficie:
-            raise ValueError("Superficie insuficiente para agregar el cultivo.")
-        self.cultivos.append(cultivo)
+    # Ubicación espacial (opcional, solo modo lista)
 
-    def regar_todos(self, cantidad: float) -> None:
+    @property
+    def indice_espacial(self) -> IndiceEspacial | None:
+        return self._espacial
+
+    def habilitar_indice_espacial(self, ancho: float, alto: float, tamano_celda: float = TAMANO_CELDA_ESPACIAL) -> None:
+        """
+        Activa la ubicación (x, y) de cultivos sobre un terreno de ancho x alto.
+        Los cultivos ya plantados quedan sin ubicar hasta llamar a ubicar_cultivo.
+
+        Raises:
+            ValueError: en modo columnar (las vistas por fila no tienen identidad estable).
+        """
+        if self.es_columnar:
+            raise ValueError("El índice espacial requiere una plantación en modo lista.")
+        self._espacial = IndiceEspacial(ancho, alto, tamano_celda)
+        self.marcar_modificada()
+
+    def _requiere_espacial(self) -> IndiceEspacial:
+        if self._espacial is None:
+            raise ValueError("La plantación no tiene índice espacial habilitado.")
+        return self._espacial
+
+    def ubicar_cultivo(self, cultivo: Cultivo, x: float, y: float) -> None:
+        """
+        Ubica (o mueve) un cultivo de la plantación en (x, y).
+
+        Raises:
+            ValueError: sin índice espacial, si el cultivo no es de la plantación,
+                o si la posición queda fuera del terreno o superpuesta.
+        """
+        espacial = self._requiere_espacial()
+        if id(cultivo) not in self._cultivos_por_tipo.get(self._tipo_de(cultivo), {}):
+            raise ValueError("El cultivo no pertenece a esta plantación.")
+        espacial.agregar(cultivo, x, y)
+        self.marcar_modificada()
+
+    def posicion_de(self, cultivo: Cultivo) -> tuple[float, float] | None:
+        return None if self._espacial is None else self._espacial.posicion(cultivo)
+
+    def cultivos_en_rectangulo(self, x_min: float, y_min: float, x_max: float, y_max: float) -> list[Cultivo]:
+        """Cultivos ubicados con centro dentro del rectángulo."""
+        return self._requiere_espacial().en_rectangulo(x_min, y_min, x_max, y_max)
+
+    def cultivos_en_radio(self, x: float, y: float, radio: float) -> list[Cultivo]:
+        """Cultivos ubicados a distancia <= radio de (x, y), p. ej. el alcance de un aspersor."""
+        return self._requiere_espacial().en_radio(x, y, radio)
+
+    def buscar_lugar(self, superficie: float) -> tuple[float, float] | None:
+        """Posición libre donde entra un cultivo de `superficie`, o None."""
+        return self._requiere_espacial().buscar_lugar(superficie)
+
+    def agregar_cultivo(self, cultivo: Cultivo, posicion: tuple[float, float] | None = None) -> None:
+        """
+        Agrega un cultivo si entra en la superficie libre, opcionalmente
+        ubicado en `posicion` (requiere índice espacial).
+
+        Raises:
+            SuperficieInsuficienteException: si el cultivo excede la superficie libre.
+            ValueError: si la posición no es válida (ver ubicar_cultivo).
+        """
+        if cultivo.superficie > self.superficie_libre:
+            raise SuperficieInsuficienteException()
+        if posicion is not None:
+            self._requiere_espacial().agregar(cultivo, *posicion)
+        tipo = self._tipo_de(cultivo)
+        if id(cultivo) in self._pendientes:
+            # Vuelve un cultivo dado de baja por tipo: se quita la entrada vieja antes de agregarlo
+            self._compactar()
+        self._cultivos.append(cultivo)
+        if not self.es_columnar:
+            self._indexar(tipo, (cultivo,))
+        self._contabilizar(tipo, 1, cultivo.superficie)
+
+    def plantar_lote(self, tipo: str, cantidad: int, **kwargs) -> None:
+        """
+        Planta `cantidad` cultivos del tipo indicado en un solo paso.
+        La superficie total se valida antes de crear o agregar ningún cultivo.
+
+        Args:
+            tipo: Nombre del tipo de cultivo, como en CultivoFactory.
+            cantidad: Cantidad de cultivos a plantar.
+            **kwargs: Atributos del cultivo, como en CultivoFactory.
+
+        Raises:
+            SuperficieInsuficienteException: si el lote completo no entra en la superficie libre.
+        """
+        if cantidad < 0:
+            raise ValueError("La cantidad de cultivos no puede ser negativa.")
+        if cantidad == 0:
+            return
+        prototipo = CultivoFactory.crear_cultivo(tipo, **kwargs)
+        superficie_total = prototipo.superficie * cantidad
+        if superficie_total > self.superficie_libre:
+            raise SuperficieInsuficienteException()
+
+        if self.es_columnar:
+            self._cultivos.agregar_repetido(prototipo, cantidad)
+        else:
+            lote = [prototipo]
+            lote.extend(CultivoFactory.clonar(prototipo, cantidad - 1))
+            self._cultivos.extend(lote)
+            self._indexar(self._tipo_de(prototipo), lote)
+        self._contabilizar(self._tipo_de(prototipo), cantidad, superficie_total)
+
+    def remover_cultivo(self, cultivo: Cultivo) -> None:
+        """
+        Quita un cultivo (en modo columnar, una vista de esta plantación) y libera su superficie.
+
+        Raises:
+            ValueError: si el cultivo no es de la plantación o ya se quitó
+                (en modo columnar, si la fila de la vista ya no está o es de otro tipo).
+        """
+        if self.es_columnar:
+            almacen = self._cultivos
+            # Verifica identidad y tipo de la fila antes de tocar los conteos
+            fila = almacen.fila_de(cultivo)
+            tipo = TIPOS_COLUMNARES[almacen.tipo[fila]]
+            superficie = almacen.superficie[fila]
+            del almacen[fila]
+        else:
+            tipo = self._tipo_de(cultivo)
+            if self._cultivos_por_tipo.get(tipo, {}).pop(id(cultivo), None) is None:
+                raise ValueError("El cultivo no pertenece a esta plantación.")
+            superficie = cultivo.superficie
+            self.cultivos.remove(cultivo)
+            if self._espacial is not None:
+                self._espacial.quitar(cultivo)
+        self._contabilizar(tipo, -1, -superficie)
+
+    def regar_todos(self, cantidad: float, en_lote: bool = False) -> None:
+        """
+        Riega todos los cultivos con `cantidad` litros.
+        Con en_lote=True usa MotorRiegoLote: una verificación por tipo de
+        cultivo y actualización en bloque en lugar de absorber_agua por cultivo.
+        """
         if cantidad > self.agua_disponible:
             raise ValueError("Agua insuficiente en la plantación.")
-        for cultivo in self.cultivos:
-            cultivo.absorber_agua(cantidad)
+        if en_lote:
+            self._regar_motor(MotorRiegoLote(), cantidad)
+        else:
+            for cultivo in self.cultivos:
+                cultivo.absorber_agua(cantidad)
+        self.agua_disponible -= cantidad
+
+    def regar_transaccional(self, cantidad: float, motor: MotorRiegoLote | None = None) -> ResultadoRiego:
+        """
+        Riego todo-o-nada. Valida el agua disponible y el mínimo de cada tipo
+        de cultivo presente (O(tipos)) antes de modificar nada; si todo es
+        válido aplica el riego en lote y descuenta el agua. Nunca lanza por
+        un rechazo: lo informa en el ResultadoRiego.
+        """
+        motor = motor or MotorRiegoLote()
+        total = sum(self._conteo_por_tipo.values())
+
+        if cantidad > self.agua_disponible:
+            return ResultadoRiego(False, cantidad, 0, self.agua_disponible,
+                                  motivo="Agua insuficiente en la plantación.")
+
+        rechazos = {}
+        for tipo, cantidad_tipo in self._conteo_por_tipo.items():
+            if not cantidad_tipo:
+                continue
+            regla = motor.regla_de(tipo)
+            if regla is None:
+                rechazos[tipo.__name__] = "sin regla de riego registrada para validar el lote"
+            elif not regla.acepta(cantidad):
+                rechazos[tipo.__name__] = f"requiere al menos {regla.agua_minima} L"
+        if rechazos:
+            return ResultadoRiego(False, cantidad, 0, self.agua_disponible, rechazos,
+                                  motivo="Cantidad de agua rechazada por tipo de cultivo.")
+
+        self._regar_motor(motor, cantidad)
         self.agua_disponible -= cantidad
+        return ResultadoRiego(True, cantidad, total, self.agua_disponible)
+
+    def _regar_motor(self, motor: MotorRiegoLote, cantidad: float) -> None:
+        # En modo lista los buckets ya son los grupos por tipo del motor
+        if self.es_columnar:
+            motor.regar(self._cultivos, cantidad)
+        else:
+            motor.regar_grupos({tipo: bucket.values() for tipo, bucket in self._cultivos_por_tipo.items()}, cantidad)
+
+    def __getstate__(self) -> dict:
+        if self._pendientes:
+            self._compactar()
+        return super().__getstate__()
+
+    def _al_cargar(self) -> None:
+        Observable.__init__(self)
+        self._modificada = True
+        if not hasattr(self, "_espacial"):
+            # .dat anteriores al índice espacial
+            self._espacial = None
+        # .dat anteriores a la huella: contenido sin identificar
+        huella = getattr(self, "_huella", None)
+        self._reconstruir_indices()
+        # Reconstruir el estado derivado no cambia el contenido
+        self._huella = huella
+
+    def _reconstruir_indices(self) -> None:
+        """Recalcula el estado derivado a partir de `cultivos`."""
+        self._conteo_por_tipo = {}
+        self._superficie_ocupada = 0.0
+        self._cultivos_por_tipo = {}
+        self._pendientes = {}
+        if self.es_columnar:
+            # Conteos desde el índice por tipo del almacén, sin crear vistas por fila
+            almacen = self._cultivos
+            for codigo, tipo in enumerate(TIPOS_COLUMNARES):
+                cantidad = len(almacen.filas_de_codigo(codigo))
+                if cantidad:
+                    self._conteo_por_tipo[tipo] = cantidad
+            self._superficie_ocupada = float(sum(almacen.superficie))
+            return
+        for cultivo in self._cultivos:
+            tipo = self._tipo_de(cultivo)
+            self._indexar(tipo, (cultivo,))
+            self._contabilizar(tipo, 1, cultivo.superficie)
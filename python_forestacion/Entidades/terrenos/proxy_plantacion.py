@@ -0,0 +1,53 @@
+def _desempaquetar(plantacion):
+    """Al cargar, la proxy serializada es directamente su plantación."""
+    return plantacion
+
+
+class ProxyPlantacion:
+    """
+    Entrada de un RegistroPerezoso en lugar de la plantación. Solo guarda el
+    nombre: cualquier otro atributo o método se resuelve sobre la plantación
+    real, que el registro toma de su caché o carga en ese momento. No
+    retiene la plantación, así que no impide que la caché la expulse.
+
+    Al serializarse se guarda como la plantación real.
+    """
+
+    __slots__ = ("nombre", "_registro")
+
+    def __init__(self, nombre: str, registro):
+        object.__setattr__(self, "nombre", nombre)
+        object.__setattr__(self, "_registro", registro)
+
+    @property
+    def plantacion(self):
+        """La plantación real (la carga si no está en memoria)."""
+        return self._registro.cargar_plantacion(self.nombre)
+
+    @property
+    def cargada(self) -> bool:
+        return self._registro.en_memoria(self.nombre) is not None
+
+    @property
+    def modificada(self) -> bool:
+        """Como Plantacion.modificada, pero sin cargar: una plantación no cargada no cambió."""
+        plantacion = self._registro.en_memoria(self.nombre)
+        return plantacion is not None and plantacion.modificada
+
+    @property
+    def huella(self) -> str:
+        """Como Plantacion.huella, pero sin cargar si el registro ya la conoce."""
+        huella = self._registro.huella_de(self.nombre)
+        return self.plantacion.huella if huella is None else huella
+
+    def __getattr__(self, atributo: str):
+        return getattr(self.plantacion, atributo)
+
+    def __setattr__(self, atributo: str, valor) -> None:
+        setattr(self.plantacion, atributo, valor)
+
+    def __reduce_ex__(self, protocolo):
+        return _desempaquetar, (self.plantacion,)
+
+    def __repr__(self) -> str:
+        return f"ProxyPlantacion({self.nombre!r})"
@@ -1,13 +1,89 @@
+import threading
+
 from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.consultas.indice_ordenado import IndiceOrdenado
+from python_forestacion.Entidades.terrenos.consultas.predicados import Predicado
+from python_forestacion.patrones.observer.observer import Observer
+
+class RegistroForestal(Observer):
+    """
+    Registro centralizado de todas las plantaciones.
+    Mantiene índices secundarios (padrón, tipo de cultivo y rangos de agua y
+    superficie) actualizados observando cada plantación registrada; consultar
+    los usa cuando un predicado tiene índice y recorre el resto.
+
+    Las plantaciones pueden notificar cambios desde otros hilos (por
+    ejemplo, la cosecha en paralelo de FincasService): las altas, bajas y
+    actualizaciones de índices se hacen bajo un cerrojo.
+    """
 
-class RegistroForestal:
-    """Registro centralizado de todas las plantaciones."""
+    CAMPOS_ORDENADOS = ("agua_disponible", "superficie")
 
     def __init__(self):
+        self._cerrojo = threading.RLock()
         self._plantaciones: dict[str, Plantacion] = {}
+        self._padron_de: dict[str, int] = {}
+        self._reconstruir_indices()
+
+    def __getstate__(self) -> dict:
+        # Los índices se reconstruyen al cargar; el padrón no se puede derivar
+        return {"_plantaciones": self._plantaciones, "_padron_de": self._padron_de}
+
+    def __setstate__(self, estado: dict) -> None:
+        self._cerrojo = threading.RLock()
+        self._plantaciones = estado["_plantaciones"]
+        self._padron_de = estado.get("_padron_de", {})
+        self._reconstruir_indices()
 
-    def agregar_plantacion(self, plantacion: Plantacion) -> None:
-        self._plantaciones[plantacion.nombre] = plantacion
+    def _reconstruir_indices(self) -> None:
+        self._por_padron: dict[int, str] = {}
+        self._por_tipo: dict[type, dict[str, None]] = {}
+        self._tipos_de: dict[str, set[type]] = {}
+        self._ordenados = {
+            campo: IndiceOrdenado((getattr(p, campo), nombre) for nombre, p in self._plantaciones.items())
+            for campo in self.CAMPOS_ORDENADOS
+        }
+        for nombre, plantacion in self._plantaciones.items():
+            padron = self._padron_de.get(nombre)
+            if padron is not None:
+                self._por_padron[padron] = nombre
+            self._indexar_tipos(plantacion)
+            plantacion.agregar_observador(self)
+
+    def _indexar_tipos(self, plantacion: Plantacion) -> None:
+        nombre = plantacion.nombre
+        anteriores = self._tipos_de.get(nombre, set())
+        actuales = set(plantacion.contar_por_tipo())
+        for tipo in anteriores - actuales:
+            nombres = self._por_tipo[tipo]
+            del nombres[nombre]
+            if not nombres:
+                del self._por_tipo[tipo]
+        for tipo in actuales - anteriores:
+            self._por_tipo.setdefault(tipo, {})[nombre] = None
+        self._tipos_de[nombre] = actuales
+
+    def agregar_plantacion(self, plantacion: Plantacion, id_padron: int | None = None) -> None:
+        """
+        Registra (o reemplaza, por nombre) una plantación, opcionalmente con
+        el padrón de su tierra. Si el padrón era de otra plantación, pasa a
+        la nueva y la anterior queda sin padrón.
+        """
+        with self._cerrojo:
+            nombre = plantacion.nombre
+            if nombre in self._plantaciones:
+                self.eliminar_plantacion(nombre)
+            self._plantaciones[nombre] = plantacion
+            if id_padron is not None:
+                duenio_anterior = self._por_padron.get(id_padron)
+                if duenio_anterior is not None:
+                    del self._padron_de[duenio_anterior]
+                self._padron_de[nombre] = id_padron
+                self._por_padron[id_padron] = nombre
+            for campo, indice in self._ordenados.items():
+                indice.agregar(getattr(plantacion, campo), nombre)
+            self._indexar_tipos(plantacion)
+            plantacion.agregar_observador(self)
 
     def listar_todas(self) -> list[Plantacion]:
         return list(self._plantaciones.values())
@@ -15,8 +91,91 @@ class RegistroForestal:
     def buscar_plantacion(self, nombre: str) -> Plantacion | None:
         return self._plantaciones.get(nombre)
 
+    def buscar_por_padron(self, id_padron: int) -> Plantacion | None:
+        nombre = self._por_padron.get(id_padron)
+        return None if nombre is None else self._plantaciones[nombre]
+
+    def padron_de(self, nombre: str) -> int | None:
+        return self._padron_de.get(nombre)
+
     def eliminar_plantacion(self, nombre: str) -> bool:
-        if nombre in self._plantaciones:
-            del self._plantaciones[nombre]
+        with self._cerrojo:
+            plantacion = self._plantaciones.pop(nombre, None)
+            if plantacion is None:
+                return False
+            plantacion.eliminar_observador(self)
+            padron = self._padron_de.pop(nombre, None)
+            if padron is not None:
+                del self._por_padron[padron]
+            for campo, indice in self._ordenados.items():
+                indice.quitar(getattr(plantacion, campo), nombre)
+            for tipo in self._tipos_de.pop(nombre):
+                nombres = self._por_tipo[tipo]
+                del nombres[nombre]
+                if not nombres:
+                    del self._por_tipo[tipo]
             return True
-        return False
+
+    def _es_registrada(self, plantacion: Plantacion) -> bool:
+        return self._plantaciones.get(plantacion.nombre) is plantacion
+
+    def actualizar(self, plantacion: Plantacion, cambio: str, anterior=None) -> None:
+        """Mantiene los índices ante los cambios que notifica una plantación registrada."""
+        with self._cerrojo:
+            if not self._es_registrada(plantacion):
+                return
+            indice = self._ordenados.get(cambio)
+            if indice is not None:
+                indice.mover(plantacion.nombre, anterior, getattr(plantacion, cambio))
+            elif cambio == "tipos":
+                self._indexar_tipos(plantacion)
+
+    # Acceso a índices usado por los predicados
+
+    def indice_ordenado(self, campo: str) -> IndiceOrdenado | None:
+        return self._ordenados.get(campo)
+
+    def nombres_por_padron(self, id_padron: int) -> list[str]:
+        nombre = self._por_padron.get(id_padron)
+        return [] if nombre is None else [nombre]
+
+    def nombres_con_tipo(self, tipo: type) -> list[str]:
+        """Plantaciones con cultivos de `tipo` o de sus subclases."""
+        nombres: dict[str, None] = {}
+        for tipo_indexado, plantaciones in self._por_tipo.items():
+            if issubclass(tipo_indexado, tipo):
+                nombres.update(plantaciones)
+        return list(nombres)
+
+    def valor_campo(self, plantacion: Plantacion, campo: str):
+        if campo == "id_padron":
+            return self.padron_de(plantacion.nombre)
+        return getattr(plantacion, campo, None)
+
+    def consultar(self, *predicados: Predicado) -> list[Plantacion]:
+        """
+        Plantaciones que cumplen todos los predicados.
+        Los predicados indexados se resuelven con sus índices, empezando por
+        el de menos candidatos (que fija el orden del resultado); el resto se
+        evalúa solo sobre esos candidatos. Sin predicados indexados se recorre
+        el registro completo.
+        """
+        indexados = []
+        restantes = []
+        for predicado in predicados:
+            candidatos = predicado.candidatos(self)
+            if candidatos is None:
+                restantes.append(predicado)
+            else:
+                indexados.append(candidatos)
+
+        if indexados:
+            indexados.sort(key=len)
+            otros = [set(candidatos) for candidatos in indexados[1:]]
+            plantaciones = [
+                self._plantaciones[nombre] for nombre in indexados[0]
+                if all(nombre in conjunto for conjunto in otros)
+            ]
+        else:
+            plantaciones = self._plantaciones.values()
+        return [p for p in plantaciones if all(predicado.evaluar(p, self) for predicado in restantes)]
@@ -0,0 +1,184 @@
+import pickle
+import threading
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.proxy_plantacion import ProxyPlantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.consultas.indice_ordenado import IndiceOrdenado
+from constante import CAPACIDAD_CACHE_PLANTACIONES
+
+
+class RegistroPerezoso(RegistroForestal):
+    """
+    RegistroForestal que no carga las plantaciones al crearse: cada entrada
+    es una ProxyPlantacion y la plantación real se pide a `cargador(nombre)`
+    la primera vez que se usa. Los índices se arman con los resúmenes de
+    cada plantación (id_padron, superficie, agua_disponible y
+    conteo_por_tipo), sin cargar ninguna; la huella (Plantacion.huella),
+    si el resumen la trae, permite saber sin cargarla qué contenido tiene.
+
+    Las plantaciones cargadas quedan en una caché LRU de `capacidad`
+    entradas. Expulsar una solo suelta la referencia: si nadie más la usa se
+    libera y se vuelve a cargar cuando haga falta; si sigue en uso se
+    reutiliza el mismo objeto. Las que tienen cambios sin guardar
+    (Plantacion.modificada) no se expulsan hasta que se avisa el guardado
+    con marcar_guardado.
+
+    Al serializarse (pickle, Paquete) se guarda como un RegistroForestal
+    común, con todas las plantaciones cargadas.
+    """
+
+    def __init__(self, resumenes: dict[str, dict], cargador, capacidad: int = CAPACIDAD_CACHE_PLANTACIONES):
+        if capacidad <= 0:
+            raise ValueError("La capacidad de la caché debe ser positiva.")
+        self._cerrojo = threading.RLock()
+        self._cargador = cargador
+        self._capacidad = capacidad
+        self._recientes: OrderedDict[str, Plantacion] = OrderedDict()
+        self._vivas: WeakValueDictionary[str, Plantacion] = WeakValueDictionary()
+        # Plantaciones pedidas al cargador (incluye recargas después de expulsar)
+        self.cargas = 0
+        # Plantaciones guardadas en otro destino que el del cargador: se releen de aquí
+        self._guardadas: dict[str, bytes] = {}
+        self._plantaciones = {nombre: ProxyPlantacion(nombre, self) for nombre in resumenes}
+        self._padron_de = {
+            nombre: resumen["id_padron"] for nombre, resumen in resumenes.items()
+            if resumen.get("id_padron") is not None
+        }
+        # Huella de las plantaciones que no están en memoria, si se conoce
+        self._huellas: dict[str, str] = {
+            nombre: resumen["huella"] for nombre, resumen in resumenes.items()
+            if resumen.get("huella") is not None
+        }
+        self._indexar_resumenes(resumenes)
+
+    def _indexar_resumenes(self, resumenes: dict[str, dict]) -> None:
+        self._por_padron = {padron: nombre for nombre, padron in self._padron_de.items()}
+        self._por_tipo = {}
+        self._tipos_de = {}
+        self._ordenados = {
+            campo: IndiceOrdenado((resumen[campo], nombre) for nombre, resumen in resumenes.items())
+            for campo in self.CAMPOS_ORDENADOS
+        }
+        for nombre, resumen in resumenes.items():
+            tipos = {tipo for tipo, cantidad in resumen["conteo_por_tipo"].items() if cantidad}
+            for tipo in tipos:
+                self._por_tipo.setdefault(tipo, {})[nombre] = None
+            self._tipos_de[nombre] = tipos
+
+    def __reduce_ex__(self, protocolo):
+        # Las proxies del estado se serializan como sus plantaciones
+        return RegistroForestal, (), self.__getstate__()
+
+    @property
+    def capacidad(self) -> int:
+        return self._capacidad
+
+    def en_memoria(self, nombre: str) -> Plantacion | None:
+        """La plantación si ya está cargada, sin cargarla."""
+        return self._vivas.get(nombre)
+
+    def huella_de(self, nombre: str) -> str | None:
+        """Huella de la plantación sin cargarla: la de memoria o la conocida, o None."""
+        plantacion = self._vivas.get(nombre)
+        return self._huellas.get(nombre) if plantacion is None else plantacion.huella
+
+    def cargadas(self) -> list[str]:
+        """Nombres de las plantaciones retenidas por la caché, de la menos a la más reciente."""
+        return list(self._recientes)
+
+    def cargar_plantacion(self, nombre: str) -> Plantacion:
+        """
+        Devuelve la plantación real, cargándola si hace falta.
+
+        Raises:
+            KeyError: si la plantación no está en el registro.
+        """
+        with self._cerrojo:
+            plantacion = self._recientes.get(nombre)
+            if plantacion is not None:
+                self._recientes.move_to_end(nombre)
+                return plantacion
+            if nombre not in self._plantaciones:
+                raise KeyError(nombre)
+            plantacion = self._vivas.get(nombre)
+            if plantacion is None:
+                serializada = self._guardadas.get(nombre)
+                plantacion = self._cargador(nombre) if serializada is None else pickle.loads(serializada)
+                plantacion.marcar_guardada()
+                plantacion.agregar_observador(self)
+                self._vivas[nombre] = plantacion
+                self.cargas += 1
+            self._recientes[nombre] = plantacion
+            self._expulsar()
+            return plantacion
+
+    def marcar_guardado(self, cargador=None) -> None:
+        """
+        Avisa que el registro se guardó completo: las plantaciones en memoria
+        dejan de contar como modificadas y la caché expulsa las que sobran.
+
+        `cargador` lee del destino recién escrito y reemplaza al anterior.
+        Sin él (el destino no admite cargar una plantación sola, como un
+        .dat) las plantaciones modificadas se retienen serializadas, para que
+        al volver a cargarlas no se relean sin los cambios guardados.
+        """
+        with self._cerrojo:
+            if cargador is not None:
+                self._cargador = cargador
+                self._guardadas = {}
+            for nombre, plantacion in list(self._vivas.items()):
+                if plantacion.modificada:
+                    if cargador is None:
+                        self._guardadas[nombre] = pickle.dumps(plantacion, protocol=5)
+                    plantacion.marcar_guardada()
+            self._expulsar()
+
+    def _expulsar(self) -> None:
+        exceso = len(self._recientes) - self._capacidad
+        if exceso <= 0:
+            return
+        expulsables = []
+        for nombre, plantacion in self._recientes.items():
+            if not plantacion.modificada:
+                expulsables.append(nombre)
+                if len(expulsables) == exceso:
+                    break
+        for nombre in expulsables:
+            # Si se libera, su huella sigue sirviendo: no cambia sin volver a la caché
+            self._huellas[nombre] = self._recientes.pop(nombre).huella
+
+    def agregar_plantacion(self, plantacion: Plantacion, id_padron: int | None = None) -> None:
+        with self._cerrojo:
+            super().agregar_plantacion(plantacion, id_padron)
+            nombre = plantacion.nombre
+            self._plantaciones[nombre] = ProxyPlantacion(nombre, self)
+            self._vivas[nombre] = plantacion
+            self._recientes[nombre] = plantacion
+            self._expulsar()
+
+    def eliminar_plantacion(self, nombre: str) -> bool:
+        with self._cerrojo:
+            if nombre not in self._plantaciones:
+                return False
+            # Quitarla de los índices ordenados requiere sus valores actuales
+            self._plantaciones[nombre] = self.cargar_plantacion(nombre)
+            super().eliminar_plantacion(nombre)
+            self._recientes.pop(nombre, None)
+            self._vivas.pop(nombre, None)
+            self._guardadas.pop(nombre, None)
+            self._huellas.pop(nombre, None)
+            return True
+
+    def _es_registrada(self, plantacion: Plantacion) -> bool:
+        return self._vivas.get(plantacion.nombre) is plantacion
+
+    def actualizar(self, plantacion: Plantacion, cambio: str, anterior=None) -> None:
+        with self._cerrojo:
+            super().actualizar(plantacion, cambio, anterior)
+            if cambio == "modificada" and self._es_registrada(plantacion):
+                # Una plantación expulsada pero todavía en uso que cambia vuelve a
+                # la caché, para no perder sus cambios cuando la suelten
+                self._recientes.setdefault(plantacion.nombre, plantacion)
@@ -1,8 +1,11 @@
 from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.entidad_compacta import EntidadCompacta
 
-class Tierra:
+class Tierra(EntidadCompacta):
     """Representa un terreno agrícola."""
 
+    __slots__ = ("id_padron", "superficie", "domicilio", "nombre_plantacion", "plantacion")
+
     def __init__(self, id_padron: int, superficie: float, domicilio: str, nombre_plantacion: str):
         self.id_padron = id_padron
         self.superficie = superficie
@@ -1,8 +1,12 @@
 from python_forestacion.excepciones.forestacion_exception import ForestacionException
 from python_forestacion.excepciones.mensajes_exception import MENSAJE_SUPERFICIE
 
-class SuperficieInsuficienteException(ForestacionException):
-    """Excepción lanzada cuando un cultivo excede la superficie disponible."""
+class SuperficieInsuficienteException(ForestacionException, ValueError):
+    """
+    Excepción lanzada cuando un cultivo excede la superficie disponible.
+    Es también un ValueError, lo que Plantacion.agregar_cultivo lanzaba
+    antes: el código que lo captura sigue funcionando.
+    """
 
     def __init__(self):
         super().__init__(MENSAJE_SUPERFICIE)
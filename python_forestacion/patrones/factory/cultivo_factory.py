@@ -1,3 +1,4 @@
+from python_forestacion.Entidades.cultivos.cultivo import Cultivo
 from python_forestacion.Entidades.cultivos.pino import Pino
 from python_forestacion.Entidades.cultivos.olivo import Olivo
 from python_forestacion.Entidades.cultivos.lechuga import Lechuga
@@ -5,18 +6,74 @@ from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
 from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
 
 class CultivoFactory:
+    """
+    Factory de cultivos basada en un registro: nombre de tipo -> (clase,
+    nombres de argumentos, valores por defecto). Los valores por defecto se
+    arman una sola vez al registrar; los tipos nuevos se agregan con
+    registrar_tipo, sin modificar la factory.
+    """
+
+    _registro: dict[str, tuple[type, tuple, tuple]] = {}
+    # Nombres ya resueltos tal como los escribió el llamador ("Pino", "PINO", ...)
+    _alias: dict[str, tuple[type, tuple, tuple]] = {}
+
+    @staticmethod
+    def registrar_tipo(nombre: str, clase: type, **valores_por_defecto) -> None:
+        """
+        Registra un tipo de cultivo.
+
+        Args:
+            nombre: Nombre del tipo (sin distinguir mayúsculas).
+            clase: Clase del cultivo.
+            **valores_por_defecto: Argumentos del constructor, en orden, con su valor por defecto.
+        """
+        entrada = (clase, tuple(valores_por_defecto), tuple(valores_por_defecto.values()))
+        CultivoFactory._registro[nombre.lower()] = entrada
+        CultivoFactory._alias.clear()
 
     @staticmethod
-    def crear_cultivo(tipo: str, **kwargs):
-        tipo = tipo.lower()
-        if tipo == "pino":
-            return Pino(kwargs.get("superficie", 10), kwargs.get("altura", 1.0))
-        elif tipo == "olivo":
-            tipo_aceituna = kwargs.get("tipo_aceituna", TipoAceituna.MANZANILLA)
-            return Olivo(kwargs.get("superficie", 8), kwargs.get("altura", 1.2), tipo_aceituna)
-        elif tipo == "lechuga":
-            return Lechuga(kwargs.get("superficie", 2), kwargs.get("dias_crecimiento", 60))
-        elif tipo == "zanahoria":
-            return Zanahoria(kwargs.get("superficie", 3), kwargs.get("dias_crecimiento", 80), kwargs.get("profundidad", 0.3))
-        else:
-            raise ValueError(f"Tipo de cultivo no reconocido: {tipo}")
+    def tipos_registrados() -> list[str]:
+        return list(CultivoFactory._registro)
+
+    @staticmethod
+    def _resolver(tipo: str) -> tuple[type, tuple, tuple]:
+        entrada = CultivoFactory._alias.get(tipo)
+        if entrada is None:
+            entrada = CultivoFactory._registro.get(tipo.lower())
+            if entrada is None:
+                raise ValueError(f"Tipo de cultivo no reconocido: {tipo.lower()}")
+            CultivoFactory._alias[tipo] = entrada
+        return entrada
+
+    @staticmethod
+    def crear_cultivo(tipo: str, **kwargs) -> Cultivo:
+        clase, nombres, valores = CultivoFactory._alias.get(tipo) or CultivoFactory._resolver(tipo)
+        if not kwargs:
+            return clase(*valores)
+        return clase(*[kwargs.get(nombre, valor) for nombre, valor in zip(nombres, valores)])
+
+    @staticmethod
+    def crear_lote(tipo: str, cantidad: int, **kwargs) -> list[Cultivo]:
+        """
+        Crea `cantidad` cultivos iguales. Se construye y valida un único
+        prototipo; el resto son clones suyos (ver clonar).
+        """
+        if cantidad <= 0:
+            return []
+        prototipo = CultivoFactory.crear_cultivo(tipo, **kwargs)
+        lote = [prototipo]
+        lote.extend(CultivoFactory.clonar(prototipo, cantidad - 1))
+        return lote
+
+    @staticmethod
+    def clonar(prototipo: Cultivo, cantidad: int) -> list[Cultivo]:
+        """
+        Devuelve `cantidad` copias superficiales de `prototipo` sin volver a
+        ejecutar el constructor (ver EntidadCompacta.clonar).
+        """
+        return prototipo.clonar(cantidad)
+
+CultivoFactory.registrar_tipo("pino", Pino, superficie=10, altura=1.0)
+CultivoFactory.registrar_tipo("olivo", Olivo, superficie=8, altura=1.2, tipo_aceituna=TipoAceituna.MANZANILLA)
+CultivoFactory.registrar_tipo("lechuga", Lechuga, superficie=2, dias_crecimiento=60)
+CultivoFactory.registrar_tipo("zanahoria", Zanahoria, superficie=3, dias_crecimiento=80, profundidad=0.3)
@@ -3,8 +3,8 @@ from python_forestacion.patrones.observer.observable import Observable
 class EventoPlantacion(Observable):
     """Evento observable asociado a acciones dentro de una plantación."""
 
-    def __init__(self, nombre: str):
-        super().__init__()
+    def __init__(self, nombre: str, debiles: bool = False):
+        super().__init__(debiles)
         self.nombre = nombre
 
     def registrar_evento(self, mensaje: str):
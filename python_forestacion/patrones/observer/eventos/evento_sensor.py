@@ -1,13 +1,19 @@
+from abc import ABC, abstractmethod
+
 from python_forestacion.patrones.observer.observable import Observable
 
-class EventoSensor(Observable):
+class EventoSensor(Observable, ABC):
     """Evento observable que notifica cambios en sensores ambientales."""
 
-    def __init__(self, tipo: str):
-        super().__init__()
+    def __init__(self, tipo: str, debiles: bool = False):
+        super().__init__(debiles)
         self.tipo = tipo
         self.valor = 0
 
     def actualizar_valor(self, nuevo_valor: float):
         self.valor = nuevo_valor
         self.notificar(valor=nuevo_valor)
+
+    @abstractmethod
+    def leer(self) -> float:
+        """Hace una lectura y la notifica (la usa RuntimeSensores)."""
@@ -1,17 +1,108 @@
+import threading
+import weakref
+
+
 class Observable:
-    """Clase Observable genérica que mantiene una lista de observadores."""
+    """
+    Clase Observable genérica, segura entre hilos.
+
+    Los observadores se guardan en un dict por identidad (alta, baja y
+    pertenencia en O(1), en orden de alta), modificado bajo un cerrojo.
+    notificar recorre una tupla inmutable con los observadores
+    (copy-on-write) sin tomar el cerrojo, así que un observador que se
+    agrega o quita durante una notificación no la altera y empieza a
+    recibir (o deja de recibir) desde la siguiente. Cada alta o baja
+    descarta la tupla y la próxima notificación la arma de nuevo: una
+    ráfaga de altas cuesta una sola copia.
 
-    def __init__(self):
-        self._observadores = []
+    Con debiles=True guarda referencias débiles: un observador que ya no se
+    usa en otro lado (por ejemplo, un controlador descartado) se libera y
+    deja de notificarse sin necesidad de eliminarlo.
+    """
+
+    # Permite combinarla con entidades que usan __slots__ (por ejemplo, Plantacion)
+    __slots__ = ("_observadores", "_instantanea", "_cerrojo", "_debiles")
+
+    def __init__(self, debiles: bool = False):
+        # id(observador) -> observador (o su referencia débil)
+        self._observadores: dict = {}
+        # Tupla que recorre notificar; None si hay que armarla de nuevo
+        self._instantanea: tuple | None = ()
+        self._cerrojo = threading.Lock()
+        self._debiles = debiles
 
     def agregar_observador(self, observador):
-        if observador not in self._observadores:
-            self._observadores.append(observador)
+        clave = id(observador)
+        with self._cerrojo:
+            actual = self._observadores.get(clave)
+            # Con referencias débiles el id puede ser de un observador ya liberado
+            if actual is not None and (actual() if self._debiles else actual) is observador:
+                return
+            self._observadores[clave] = weakref.ref(observador) if self._debiles else observador
+            self._instantanea = None
 
     def eliminar_observador(self, observador):
-        if observador in self._observadores:
-            self._observadores.remove(observador)
+        with self._cerrojo:
+            if self._observadores.pop(id(observador), None) is not None:
+                self._instantanea = None
+
+    def observadores(self) -> list:
+        """Observadores vigentes, en orden de alta."""
+        instantanea = self._instantanea
+        if instantanea is None:
+            instantanea = self._publicar()
+        if not self._debiles:
+            return list(instantanea)
+        return [observador for observador in map(_desreferenciar, instantanea) if observador is not None]
+
+    def _publicar(self) -> tuple:
+        """Arma la tupla que recorre notificar con los observadores vigentes."""
+        with self._cerrojo:
+            instantanea = self._instantanea
+            if instantanea is None:
+                instantanea = self._instantanea = tuple(self._observadores.values())
+            return instantanea
+
+    def _purgar(self) -> None:
+        """Quita las referencias débiles a observadores ya liberados."""
+        with self._cerrojo:
+            vivos = {clave: referencia for clave, referencia in self._observadores.items() if referencia() is not None}
+            if len(vivos) != len(self._observadores):
+                self._observadores = vivos
+                self._instantanea = None
 
     def notificar(self, *args, **kwargs):
-        for observador in self._observadores:
-            observador.actualizar(self, *args, **kwargs)
+        instantanea = self._instantanea
+        if instantanea is None:
+            instantanea = self._publicar()
+        if not self._debiles:
+            for observador in instantanea:
+                observador.actualizar(self, *args, **kwargs)
+            return
+        liberados = False
+        for referencia in instantanea:
+            observador = referencia()
+            if observador is None:
+                liberados = True
+            else:
+                observador.actualizar(self, *args, **kwargs)
+        if liberados:
+            self._purgar()
+
+    def __getstate__(self) -> tuple:
+        # El cerrojo no se puede serializar: se guardan los observadores vigentes y el modo
+        return getattr(self, "__dict__", None), {"_observadores": self.observadores(), "_debiles": self._debiles}
+
+    def __setstate__(self, estado: tuple) -> None:
+        dict_estado, slots_estado = estado
+        if dict_estado:
+            self.__dict__.update(dict_estado)
+        slots_estado = slots_estado or {}
+        # Los pickles anteriores guardaban solo la lista de observadores
+        Observable.__init__(self, slots_estado.get("_debiles", False))
+        for observador in slots_estado.get("_observadores", ()):
+            self.agregar_observador(observador)
+
+
+def _desreferenciar(referencia: weakref.ref):
+    return referencia()
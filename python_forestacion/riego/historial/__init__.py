@@ -0,0 +1,2 @@
+# Historial de lecturas de sensores en buffers circulares de tamaño fijo.
+# Series crudas con agregados por minuto y por hora, con memoria acotada.
@@ -0,0 +1,170 @@
+import os
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from python_forestacion.patrones.observer.observer import Observer
+from python_forestacion.servicios.negocio.persistencia.segmento_serie import SegmentoSerie
+from constante import (
+    EXTENSION_SEGMENTO_SERIE, REGISTROS_POR_SEGMENTO_SERIE, REGISTROS_POR_ENTRADA_INDICE_SERIE, REGISTROS_BUFFER_SERIE,
+)
+
+
+class ArchivoSerie(Observer):
+    """
+    Historial en disco de las lecturas de un sensor, pensado para meses de
+    datos: un directorio con segmentos numerados de solo agregado, cada uno
+    con registros (instante, valor) de ancho fijo y su índice disperso. Las
+    lecturas se acumulan en memoria y se escriben de a `registros_buffer`;
+    al llenarse un segmento (`registros_por_segmento`) se abre el siguiente.
+
+    Una consulta por rango ubica los segmentos por su primer instante y, en
+    cada uno, lee vía mmap solo las páginas del rango pedido.
+
+    Como SerieSensor, se suscribe a un EventoSensor con `adjuntar`; los
+    instantes los da `reloj` y no pueden retroceder.
+    """
+
+    def __init__(self, directorio: str, registros_por_segmento: int = REGISTROS_POR_SEGMENTO_SERIE,
+                 registros_por_entrada: int = REGISTROS_POR_ENTRADA_INDICE_SERIE,
+                 registros_buffer: int = REGISTROS_BUFFER_SERIE, solo_lectura: bool = False,
+                 sincronizar: bool = False, reloj=time.time):
+        if registros_por_segmento <= 0 or registros_buffer <= 0:
+            raise ValueError("Los registros por segmento y del buffer deben ser positivos.")
+        self.directorio = directorio
+        self._registros_por_segmento = registros_por_segmento
+        self._registros_por_entrada = registros_por_entrada
+        self._registros_buffer = registros_buffer
+        self._solo_lectura = solo_lectura
+        self._sincronizar = sincronizar
+        self._reloj = reloj
+        self._pendientes = array("d")
+        self._segmentos: list[SegmentoSerie] = []
+        if not solo_lectura:
+            os.makedirs(directorio, exist_ok=True)
+        try:
+            self._abrir_segmentos()
+        except Exception:
+            self.cerrar()
+            raise
+        ultimo = self._segmentos[-1].ultimo_instante if self._segmentos else None
+        self._ultimo_instante = float("-inf") if ultimo is None else ultimo
+
+    @classmethod
+    def adjuntar(cls, sensor, directorio: str, **opciones) -> "ArchivoSerie":
+        """Abre (o crea) el historial en `directorio` y lo suscribe a las lecturas de `sensor`."""
+        archivo = cls(directorio, **opciones)
+        sensor.agregar_observador(archivo)
+        return archivo
+
+    def _abrir_segmentos(self) -> None:
+        nombres = sorted(
+            nombre for nombre in os.listdir(self.directorio) if nombre.endswith(EXTENSION_SEGMENTO_SERIE)
+        )
+        for posicion, nombre in enumerate(nombres):
+            # Solo el último segmento puede seguir creciendo
+            solo_lectura = self._solo_lectura or posicion < len(nombres) - 1
+            self._segmentos.append(SegmentoSerie(os.path.join(self.directorio, nombre), solo_lectura))
+        if not self._segmentos and not self._solo_lectura:
+            self._nuevo_segmento()
+
+    def _nuevo_segmento(self) -> SegmentoSerie:
+        ruta = os.path.join(self.directorio, f"{len(self._segmentos):08d}{EXTENSION_SEGMENTO_SERIE}")
+        segmento = SegmentoSerie.crear(ruta, self._registros_por_entrada)
+        self._segmentos.append(segmento)
+        return segmento
+
+    def __enter__(self) -> "ArchivoSerie":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente y cierra los segmentos."""
+        try:
+            if self._pendientes:
+                self.vaciar()
+        finally:
+            for segmento in self._segmentos:
+                segmento.cerrar()
+            self._segmentos = []
+
+    def actualizar(self, observable, *args, **kwargs):
+        self.agregar(kwargs["valor"])
+
+    def agregar(self, valor: float, instante: float | None = None) -> None:
+        """
+        Registra una lectura (con el instante del reloj si no se indica).
+
+        Raises:
+            ValueError: si el historial es de solo lectura o el instante es
+                anterior a la última lectura.
+        """
+        if self._solo_lectura:
+            raise ValueError("El historial está abierto solo para lectura.")
+        if instante is None:
+            instante = self._reloj()
+        if instante < self._ultimo_instante:
+            raise ValueError(f"Lectura fuera de orden: {instante} < {self._ultimo_instante}.")
+        self._ultimo_instante = instante
+        self._pendientes.append(instante)
+        self._pendientes.append(valor)
+        if len(self._pendientes) >= 2 * self._registros_buffer:
+            self.vaciar()
+
+    def vaciar(self) -> None:
+        """Escribe en los segmentos las lecturas pendientes."""
+        pendientes, self._pendientes = self._pendientes, array("d")
+        posicion = 0
+        while posicion < len(pendientes):
+            segmento = self._segmentos[-1]
+            libres = self._registros_por_segmento - len(segmento)
+            if libres <= 0:
+                segmento = self._nuevo_segmento()
+                libres = self._registros_por_segmento
+            fin = min(posicion + 2 * libres, len(pendientes))
+            segmento.agregar(pendientes[posicion:fin])
+            posicion = fin
+        if self._sincronizar and self._segmentos:
+            self._segmentos[-1].sincronizar()
+
+    def __len__(self) -> int:
+        return sum(len(segmento) for segmento in self._segmentos) + len(self._pendientes) // 2
+
+    def rango(self, desde: float | None = None, hasta: float | None = None) -> tuple:
+        """(instantes, valores) de las lecturas con desde <= instante <= hasta, en orden."""
+        if self._pendientes:
+            self.vaciar()
+        segmentos = [segmento for segmento in self._segmentos if len(segmento)]
+        primero = 0
+        ultimo = len(segmentos)
+        if desde is not None:
+            # El segmento anterior al primero que empieza en `desde` puede terminar con lecturas de `desde`
+            primero = max(bisect_left(segmentos, desde, key=_primer_instante) - 1, 0)
+        if hasta is not None:
+            ultimo = bisect_right(segmentos, hasta, key=_primer_instante)
+        registros = array("d")
+        for segmento in segmentos[primero:ultimo]:
+            inicio = 0 if desde is None else segmento.buscar(desde)
+            fin = len(segmento) if hasta is None else segmento.buscar(hasta, despues=True)
+            registros.extend(segmento.leer(inicio, fin))
+        return registros[0::2], registros[1::2]
+
+    def resumen(self, segundos: float, ahora: float | None = None) -> dict:
+        """Mínimo, máximo, promedio y cantidad de las lecturas de los últimos `segundos`."""
+        if ahora is None:
+            ahora = self._reloj()
+        _, valores = self.rango(ahora - segundos, ahora)
+        if not valores:
+            return {"minimo": None, "maximo": None, "promedio": None, "cantidad": 0}
+        return {
+            "minimo": min(valores),
+            "maximo": max(valores),
+            "promedio": sum(valores) / len(valores),
+            "cantidad": len(valores),
+        }
+
+
+def _primer_instante(segmento: SegmentoSerie) -> float:
+    return segmento.primer_instante
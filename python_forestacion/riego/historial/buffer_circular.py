@@ -0,0 +1,102 @@
+from array import array
+
+
+class BufferCircular:
+    """
+    Buffer circular de capacidad fija con columnas paralelas en arreglos
+    tipados (una fila por elemento). Los arreglos se reservan completos al
+    crearlo, así que la memoria no crece con el uso: agregar una fila es
+    O(1) y, con el buffer lleno, pisa la más antigua.
+
+    Los índices lógicos van de 0 (la fila más antigua) a len - 1.
+    """
+
+    def __init__(self, capacidad: int, columnas: tuple[tuple[str, str], ...]):
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva.")
+        self._capacidad = capacidad
+        self._columnas = {
+            nombre: array(typecode, bytes(array(typecode).itemsize * capacidad)) for nombre, typecode in columnas
+        }
+        self._orden = list(self._columnas.values())
+        # Posición física de la fila más antigua
+        self._inicio = 0
+        self._cantidad = 0
+
+    @property
+    def capacidad(self) -> int:
+        return self._capacidad
+
+    @property
+    def lleno(self) -> bool:
+        return self._cantidad == self._capacidad
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def agregar(self, *valores) -> None:
+        """Agrega una fila (un valor por columna, en orden)."""
+        if self._cantidad < self._capacidad:
+            posicion = self._inicio + self._cantidad
+            if posicion >= self._capacidad:
+                posicion -= self._capacidad
+            self._cantidad += 1
+        else:
+            posicion = self._inicio
+            self._inicio = posicion + 1 if posicion + 1 < self._capacidad else 0
+        for columna, valor in zip(self._orden, valores):
+            columna[posicion] = valor
+
+    def _fisica(self, indice: int) -> int:
+        posicion = self._inicio + indice
+        return posicion - self._capacidad if posicion >= self._capacidad else posicion
+
+    def valor(self, nombre: str, indice: int):
+        """Valor de la columna en el índice lógico (negativos desde el final)."""
+        if indice < 0:
+            indice += self._cantidad
+        if not 0 <= indice < self._cantidad:
+            raise IndexError("Índice fuera del buffer.")
+        return self._columnas[nombre][self._fisica(indice)]
+
+    def buscar(self, nombre: str, valor) -> int:
+        """
+        Primer índice lógico cuyo valor en la columna es >= `valor` (len si
+        no hay). La columna debe estar ordenada, como una de instantes.
+        """
+        columna = self._columnas[nombre]
+        bajo, alto = 0, self._cantidad
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if columna[self._fisica(medio)] < valor:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+    def tramos(self, nombre: str, desde: int = 0) -> list[array]:
+        """
+        Valores de la columna desde el índice lógico `desde` hasta el final,
+        en a lo sumo dos tramos contiguos (por la vuelta del buffer).
+        """
+        columna = self._columnas[nombre]
+        if desde >= self._cantidad:
+            return []
+        inicio = self._fisica(desde)
+        fin = self._inicio + self._cantidad
+        if fin <= self._capacidad:
+            return [columna[inicio:fin]]
+        fin -= self._capacidad
+        if inicio < fin:
+            return [columna[inicio:fin]]
+        return [columna[inicio:], columna[:fin]]
+
+    def columna(self, nombre: str, desde: int = 0) -> array:
+        """Copia ordenada (de la más antigua a la más nueva) de la columna."""
+        resultado = array(self._columnas[nombre].typecode)
+        for tramo in self.tramos(nombre, desde):
+            resultado.extend(tramo)
+        return resultado
+
+    def memoria_bytes(self) -> int:
+        return sum(columna.itemsize * len(columna) for columna in self._orden)
@@ -0,0 +1,93 @@
+from python_forestacion.riego.historial.buffer_circular import BufferCircular
+
+COLUMNAS_ROLLUP = (
+    ("inicio", "d"),
+    ("minimo", "d"),
+    ("maximo", "d"),
+    ("suma", "d"),
+    ("cantidad", "q"),
+)
+
+
+class Rollup:
+    """
+    Agregados (mínimo, máximo, suma y cantidad) de una serie por intervalos
+    de `ancho` segundos alineados al reloj. El intervalo en curso se
+    acumula aparte y, al llegar una lectura de un intervalo posterior, se
+    cierra y pasa a un BufferCircular de `capacidad` intervalos (más el
+    que está en curso). Una lectura atrasada se suma al intervalo en curso.
+    """
+
+    def __init__(self, ancho: float, capacidad: int):
+        if ancho <= 0:
+            raise ValueError("El ancho del intervalo debe ser positivo.")
+        self._ancho = ancho
+        self._cerrados = BufferCircular(capacidad, COLUMNAS_ROLLUP)
+        # [inicio, mínimo, máximo, suma, cantidad] del intervalo en curso
+        self._abierto: list | None = None
+
+    @property
+    def ancho(self) -> float:
+        return self._ancho
+
+    def __len__(self) -> int:
+        return len(self._cerrados) + (self._abierto is not None)
+
+    def agregar(self, instante: float, valor: float) -> None:
+        abierto = self._abierto
+        inicio = instante - instante % self._ancho
+        if abierto is not None and inicio > abierto[0]:
+            self._cerrados.agregar(*abierto)
+            abierto = None
+        if abierto is None:
+            self._abierto = [inicio, valor, valor, valor, 1]
+            return
+        if valor < abierto[1]:
+            abierto[1] = valor
+        if valor > abierto[2]:
+            abierto[2] = valor
+        abierto[3] += valor
+        abierto[4] += 1
+
+    def cubre(self, desde: float) -> bool:
+        """True si conserva todos los intervalos que tocan el instante `desde`."""
+        if not self._cerrados.lleno:
+            return True
+        return self._cerrados.valor("inicio", 0) <= desde
+
+    def intervalos(self) -> list[tuple]:
+        """(inicio, mínimo, máximo, promedio, cantidad) de cada intervalo, del más antiguo al en curso."""
+        columnas = [self._cerrados.columna(nombre) for nombre, _ in COLUMNAS_ROLLUP]
+        intervalos = [
+            (inicio, minimo, maximo, suma / cantidad, cantidad)
+            for inicio, minimo, maximo, suma, cantidad in zip(*columnas)
+        ]
+        if self._abierto is not None:
+            inicio, minimo, maximo, suma, cantidad = self._abierto
+            intervalos.append((inicio, minimo, maximo, suma / cantidad, cantidad))
+        return intervalos
+
+    def agregado(self, desde: float) -> tuple:
+        """
+        (mínimo, máximo, suma, cantidad) de los intervalos que terminan
+        después de `desde`: la ventana se redondea a intervalos completos.
+        """
+        primero = self._cerrados.buscar("inicio", desde - self._ancho)
+        if primero < len(self._cerrados) and self._cerrados.valor("inicio", primero) + self._ancho <= desde:
+            primero += 1
+        minimos = [min(tramo) for tramo in self._cerrados.tramos("minimo", primero)]
+        maximos = [max(tramo) for tramo in self._cerrados.tramos("maximo", primero)]
+        suma = sum(sum(tramo) for tramo in self._cerrados.tramos("suma", primero))
+        cantidad = sum(sum(tramo) for tramo in self._cerrados.tramos("cantidad", primero))
+        abierto = self._abierto
+        if abierto is not None and abierto[0] + self._ancho > desde:
+            minimos.append(abierto[1])
+            maximos.append(abierto[2])
+            suma += abierto[3]
+            cantidad += abierto[4]
+        if not cantidad:
+            return None, None, 0.0, 0
+        return min(minimos), max(maximos), suma, cantidad
+
+    def memoria_bytes(self) -> int:
+        return self._cerrados.memoria_bytes()
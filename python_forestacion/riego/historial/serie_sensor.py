@@ -0,0 +1,104 @@
+import time
+
+from python_forestacion.patrones.observer.observer import Observer
+from python_forestacion.riego.historial.buffer_circular import BufferCircular
+from python_forestacion.riego.historial.rollup import Rollup
+from constante import (
+    CAPACIDAD_SERIE_CRUDA, CAPACIDAD_SERIE_MINUTOS, CAPACIDAD_SERIE_HORAS, ANCHO_ROLLUP_MINUTO, ANCHO_ROLLUP_HORA,
+)
+
+COLUMNAS_SERIE = (
+    ("instante", "d"),
+    ("valor", "d"),
+)
+
+
+class SerieSensor(Observer):
+    """
+    Historial de las lecturas de un sensor, en memoria acotada: las últimas
+    `capacidad` lecturas crudas (instante y valor en arreglos 'd' de un
+    BufferCircular) y, además, agregados por minuto y por hora con su
+    propia capacidad. Cada lectura cuesta O(1) y la memoria no depende del
+    tiempo de funcionamiento.
+
+    Se suscribe como observador de un EventoSensor (por ejemplo
+    TemperaturaReaderTask o HumedadReaderTask): registra el valor que el
+    sensor notifica, sin copiar nada más. Los instantes los da `reloj`.
+    """
+
+    def __init__(self, capacidad: int = CAPACIDAD_SERIE_CRUDA, capacidad_minutos: int = CAPACIDAD_SERIE_MINUTOS,
+                 capacidad_horas: int = CAPACIDAD_SERIE_HORAS, reloj=time.time):
+        self._crudas = BufferCircular(capacidad, COLUMNAS_SERIE)
+        self._minutos = Rollup(ANCHO_ROLLUP_MINUTO, capacidad_minutos)
+        self._horas = Rollup(ANCHO_ROLLUP_HORA, capacidad_horas)
+        self._reloj = reloj
+
+    @classmethod
+    def adjuntar(cls, sensor, **opciones) -> "SerieSensor":
+        """Crea una serie y la suscribe a las lecturas de `sensor`."""
+        serie = cls(**opciones)
+        sensor.agregar_observador(serie)
+        return serie
+
+    def actualizar(self, observable, *args, **kwargs):
+        self.agregar(kwargs["valor"])
+
+    def agregar(self, valor: float, instante: float | None = None) -> None:
+        if instante is None:
+            instante = self._reloj()
+        self._crudas.agregar(instante, valor)
+        self._minutos.agregar(instante, valor)
+        self._horas.agregar(instante, valor)
+
+    def __len__(self) -> int:
+        return len(self._crudas)
+
+    def lecturas(self, desde: float | None = None) -> tuple:
+        """(instantes, valores) de las lecturas crudas conservadas, desde `desde` si se indica."""
+        primera = 0 if desde is None else self._crudas.buscar("instante", desde)
+        return self._crudas.columna("instante", primera), self._crudas.columna("valor", primera)
+
+    def por_minuto(self) -> list[tuple]:
+        """(inicio, mínimo, máximo, promedio, cantidad) por minuto, incluido el minuto en curso."""
+        return self._minutos.intervalos()
+
+    def por_hora(self) -> list[tuple]:
+        """(inicio, mínimo, máximo, promedio, cantidad) por hora, incluida la hora en curso."""
+        return self._horas.intervalos()
+
+    def resumen(self, segundos: float, ahora: float | None = None) -> dict:
+        """
+        Mínimo, máximo, promedio y cantidad de lecturas de los últimos
+        `segundos`. Usa las lecturas crudas si todavía cubren la ventana; si
+        no, los agregados por minuto u hora (la ventana se redondea a
+        intervalos completos). "resolucion" indica cuál se usó.
+        """
+        if ahora is None:
+            ahora = self._reloj()
+        desde = ahora - segundos
+        crudas = self._crudas
+        if not crudas.lleno or crudas.valor("instante", 0) <= desde:
+            valores = crudas.tramos("valor", crudas.buscar("instante", desde))
+            cantidad = sum(len(tramo) for tramo in valores)
+            if not cantidad:
+                return {"minimo": None, "maximo": None, "promedio": None, "cantidad": 0, "resolucion": "cruda"}
+            return {
+                "minimo": min(min(tramo) for tramo in valores),
+                "maximo": max(max(tramo) for tramo in valores),
+                "promedio": sum(sum(tramo) for tramo in valores) / cantidad,
+                "cantidad": cantidad,
+                "resolucion": "cruda",
+            }
+        rollup, resolucion = (self._minutos, "minuto") if self._minutos.cubre(desde) else (self._horas, "hora")
+        minimo, maximo, suma, cantidad = rollup.agregado(desde)
+        return {
+            "minimo": minimo,
+            "maximo": maximo,
+            "promedio": suma / cantidad if cantidad else None,
+            "cantidad": cantidad,
+            "resolucion": resolucion,
+        }
+
+    def memoria_bytes(self) -> int:
+        """Bytes reservados por los arreglos (fijos desde la creación)."""
+        return self._crudas.memoria_bytes() + self._minutos.memoria_bytes() + self._horas.memoria_bytes()
@@ -0,0 +1,2 @@
+# Riego en lote de plantaciones completas.
+# Agrupa los cultivos por tipo y aplica el efecto del riego a cada grupo de una vez.
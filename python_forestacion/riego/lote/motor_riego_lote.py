@@ -0,0 +1,114 @@
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import AlmacenColumnar, TIPOS_COLUMNARES
+from python_forestacion.riego.lote.regla_riego import ReglaRiego, REGLAS_RIEGO
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el camino en Python puro
+    np = None
+
+
+class MotorRiegoLote:
+    """
+    Riego en lote de una colección de cultivos.
+    Agrupa los cultivos por tipo, verifica el mínimo de agua una sola vez por
+    tipo y aplica el efecto a todo el grupo sin despachar absorber_agua por
+    cultivo. Sobre almacenes columnares usa NumPy si está disponible.
+    """
+
+    def __init__(self, usar_numpy: bool = True):
+        self._numpy = np if usar_numpy else None
+        self._reglas: dict[type, ReglaRiego] = dict(REGLAS_RIEGO)
+        self._regar_por_almacen = {
+            list: self._regar_lista,
+            AlmacenColumnar: self._regar_columnar,
+        }
+
+    @property
+    def usa_numpy(self) -> bool:
+        return self._numpy is not None
+
+    def registrar_regla(self, tipo: type, regla: ReglaRiego) -> None:
+        self._reglas[tipo] = regla
+
+    def regla_de(self, tipo: type) -> ReglaRiego | None:
+        return self._reglas.get(tipo)
+
+    def regar(self, cultivos, cantidad: float) -> None:
+        """
+        Riega todos los cultivos con `cantidad` litros.
+        Si un tipo no alcanza su mínimo se lanza el mismo ValueError que el
+        cultivo; los grupos procesados antes ya quedaron regados.
+        """
+        regar = self._regar_por_almacen.get(type(cultivos), self._regar_lista)
+        regar(cultivos, cantidad)
+
+    @staticmethod
+    def agrupar_por_tipo(cultivos) -> dict[type, list]:
+        """Agrupa los cultivos por clase en orden de primera aparición."""
+        grupos: dict[type, list] = {}
+        for cultivo in cultivos:
+            grupo = grupos.get(type(cultivo))
+            if grupo is None:
+                grupo = grupos[type(cultivo)] = []
+            grupo.append(cultivo)
+        return grupos
+
+    def regar_grupos(self, grupos: dict, cantidad: float) -> None:
+        """
+        Igual que regar, pero con los cultivos ya agrupados por clase
+        (por ejemplo, los buckets por tipo de una Plantacion): evita la
+        pasada de agrupamiento.
+        """
+        for tipo, grupo in grupos.items():
+            if not grupo:
+                continue
+            regla = self._reglas.get(tipo)
+            if regla is None:
+                # Tipo sin regla registrada: despacho individual
+                for cultivo in grupo:
+                    cultivo.absorber_agua(cantidad)
+            elif not regla.acepta(cantidad):
+                # El propio cultivo lanza el error con su mensaje
+                next(iter(grupo)).absorber_agua(cantidad)
+            else:
+                regla.aplicar_objetos(grupo, cantidad)
+
+    def _regar_lista(self, cultivos, cantidad: float) -> None:
+        self.regar_grupos(self.agrupar_por_tipo(cultivos), cantidad)
+
+    def _regar_columnar(self, almacen: AlmacenColumnar, cantidad: float) -> None:
+        if not len(almacen):
+            return
+        if self._numpy is None:
+            self._regar_columnar_puro(almacen, cantidad)
+        else:
+            self._regar_columnar_numpy(almacen, cantidad)
+
+    def _rechazar(self, almacen: AlmacenColumnar, codigo: int, cantidad: float) -> None:
+        almacen[almacen.tipo.index(codigo)].absorber_agua(cantidad)
+
+    def _regar_columnar_puro(self, almacen: AlmacenColumnar, cantidad: float) -> None:
+        for codigo, tipo in enumerate(TIPOS_COLUMNARES):
+            filas = almacen.filas_de_codigo(codigo)
+            if not filas:
+                continue
+            regla = self._reglas[tipo]
+            if not regla.acepta(cantidad):
+                self._rechazar(almacen, codigo, cantidad)
+            regla.aplicar_columna(getattr(almacen, regla.atributo), filas, cantidad)
+
+    def _regar_columnar_numpy(self, almacen: AlmacenColumnar, cantidad: float) -> None:
+        numpy = self._numpy
+        tipos = numpy.frombuffer(almacen.tipo, dtype=almacen.tipo.typecode)
+        conteos = numpy.bincount(tipos, minlength=len(TIPOS_COLUMNARES))
+
+        for codigo, tipo in enumerate(TIPOS_COLUMNARES):
+            if not conteos[codigo]:
+                continue
+            regla = self._reglas[tipo]
+            if not regla.acepta(cantidad):
+                self._rechazar(almacen, codigo, cantidad)
+            columna = getattr(almacen, regla.atributo)
+            regla.aplicar_columna_numpy(
+                numpy.frombuffer(columna, dtype=columna.typecode), tipos == codigo, cantidad
+            )
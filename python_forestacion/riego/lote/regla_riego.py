@@ -0,0 +1,118 @@
+from abc import ABC, abstractmethod
+
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from constante import (
+    AGUA_MINIMA_PINO,
+    AGUA_MINIMA_OLIVO,
+    AGUA_MINIMA_LECHUGA,
+    AGUA_MINIMA_ZANAHORIA,
+    CRECIMIENTO_RIEGO_PINO,
+    FACTOR_PRODUCCION_OLIVO,
+)
+
+
+class ReglaRiego(ABC):
+    """
+    Efecto de un riego sobre todos los cultivos de un mismo tipo.
+    `atributo` es la columna que modifica en los almacenes columnares.
+    """
+
+    atributo = ""
+
+    def __init__(self, agua_minima: float):
+        self.agua_minima = agua_minima
+
+    def acepta(self, cantidad: float) -> bool:
+        return cantidad >= self.agua_minima
+
+    @abstractmethod
+    def aplicar_objetos(self, cultivos: list, cantidad: float) -> None:
+        """Aplica el riego a una lista de cultivos (objetos o vistas)."""
+
+    @abstractmethod
+    def aplicar_columna(self, columna, filas: list[int], cantidad: float) -> None:
+        """Aplica el riego a las filas indicadas de una columna array."""
+
+    @abstractmethod
+    def aplicar_columna_numpy(self, columna, mascara, cantidad: float) -> None:
+        """Aplica el riego a las filas de `mascara` sobre una columna NumPy."""
+
+
+class ReglaIncremento(ReglaRiego):
+    """Regla que suma un incremento dependiente de la cantidad de agua."""
+
+    @abstractmethod
+    def incremento(self, cantidad: float) -> float:
+        pass
+
+    def aplicar_columna(self, columna, filas: list[int], cantidad: float) -> None:
+        incremento = self.incremento(cantidad)
+        for fila in filas:
+            columna[fila] += incremento
+
+    def aplicar_columna_numpy(self, columna, mascara, cantidad: float) -> None:
+        columna[mascara] += self.incremento(cantidad)
+
+
+class ReglaCrecimiento(ReglaIncremento):
+    """Cada riego suma una altura fija (Pino)."""
+
+    atributo = "altura"
+
+    def __init__(self, agua_minima: float, crecimiento: float):
+        super().__init__(agua_minima)
+        self.crecimiento = crecimiento
+
+    def incremento(self, cantidad: float) -> float:
+        return self.crecimiento
+
+    def aplicar_objetos(self, cultivos: list, cantidad: float) -> None:
+        crecimiento = self.crecimiento
+        for cultivo in cultivos:
+            cultivo.altura += crecimiento
+
+
+class ReglaProduccion(ReglaIncremento):
+    """Cada riego suma producción proporcional al agua recibida (Olivo)."""
+
+    atributo = "produccion_anual"
+
+    def __init__(self, agua_minima: float, factor: float):
+        super().__init__(agua_minima)
+        self.factor = factor
+
+    def incremento(self, cantidad: float) -> float:
+        return cantidad * self.factor
+
+    def aplicar_objetos(self, cultivos: list, cantidad: float) -> None:
+        incremento = self.incremento(cantidad)
+        for cultivo in cultivos:
+            cultivo.produccion_anual += incremento
+
+
+class ReglaRegada(ReglaRiego):
+    """El riego marca la hortaliza como regada (Lechuga, Zanahoria)."""
+
+    atributo = "regada"
+
+    def aplicar_objetos(self, cultivos: list, cantidad: float) -> None:
+        for cultivo in cultivos:
+            cultivo.regada = True
+
+    def aplicar_columna(self, columna, filas: list[int], cantidad: float) -> None:
+        for fila in filas:
+            columna[fila] = 1
+
+    def aplicar_columna_numpy(self, columna, mascara, cantidad: float) -> None:
+        columna[mascara] = 1
+
+
+REGLAS_RIEGO = {
+    Pino: ReglaCrecimiento(AGUA_MINIMA_PINO, CRECIMIENTO_RIEGO_PINO),
+    Olivo: ReglaProduccion(AGUA_MINIMA_OLIVO, FACTOR_PRODUCCION_OLIVO),
+    Lechuga: ReglaRegada(AGUA_MINIMA_LECHUGA),
+    Zanahoria: ReglaRegada(AGUA_MINIMA_ZANAHORIA),
+}
@@ -0,0 +1,21 @@
+class ResultadoRiego:
+    """Resultado de un riego transaccional de una plantación."""
+
+    def __init__(self, exitoso: bool, cantidad: float, cultivos_regados: int, agua_restante: float,
+                 rechazos: dict[str, str] | None = None, motivo: str = ""):
+        self.exitoso = exitoso
+        self.cantidad = cantidad
+        self.cultivos_regados = cultivos_regados
+        self.agua_restante = agua_restante
+        self.rechazos = rechazos or {}
+        self.motivo = motivo
+
+    def __bool__(self) -> bool:
+        return self.exitoso
+
+    def __str__(self) -> str:
+        if self.exitoso:
+            return (f"Riego OK | {self.cultivos_regados} cultivos | {self.cantidad} L | "
+                    f"Agua restante: {self.agua_restante} L")
+        detalle = "; ".join(f"{tipo}: {motivo}" for tipo, motivo in self.rechazos.items())
+        return f"Riego RECHAZADO | {self.motivo} {detalle}".strip()
@@ -0,0 +1,2 @@
+# Runtime asyncio de tareas periódicas de sensores.
+# Un único despachador sobre un event loop recorre una agenda de turnos (montículo o rueda), con métricas de jitter y deriva.
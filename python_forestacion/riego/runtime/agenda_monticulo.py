@@ -0,0 +1,54 @@
+import heapq
+from itertools import count
+
+# Marca de las entradas canceladas (el dato puede ser cualquier valor, incluso None)
+_CANCELADA = object()
+
+
+class AgendaMonticulo:
+    """
+    Agenda de turnos sobre un montículo binario: programar y extraer cuestan
+    O(log n). Cancelar es O(1): la entrada se marca y se descarta cuando
+    llega al tope.
+
+    Misma interfaz que RuedaTemporizacion (programar, cancelar, proximo,
+    vencidos), para usarla como agenda de RuntimeSensores.
+    """
+
+    def __init__(self, origen: float = 0.0):
+        self._monticulo: list[list] = []
+        self._secuencia = count()
+        self._cantidad = 0
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def programar(self, instante: float, dato) -> list:
+        """Agrega un turno para `instante` y devuelve su entrada (para cancelarlo)."""
+        entrada = [instante, next(self._secuencia), dato]
+        heapq.heappush(self._monticulo, entrada)
+        self._cantidad += 1
+        return entrada
+
+    def cancelar(self, entrada: list) -> None:
+        if entrada[2] is not _CANCELADA:
+            entrada[2] = _CANCELADA
+            self._cantidad -= 1
+
+    def proximo(self) -> float | None:
+        """Instante del próximo turno, o None si no hay."""
+        monticulo = self._monticulo
+        while monticulo and monticulo[0][2] is _CANCELADA:
+            heapq.heappop(monticulo)
+        return monticulo[0][0] if monticulo else None
+
+    def vencidos(self, ahora: float) -> list[tuple]:
+        """Quita y devuelve los turnos con instante <= ahora, como (instante, dato)."""
+        monticulo = self._monticulo
+        vencidos = []
+        while monticulo and monticulo[0][0] <= ahora:
+            instante, _, dato = heapq.heappop(monticulo)
+            if dato is not _CANCELADA:
+                vencidos.append((instante, dato))
+        self._cantidad -= len(vencidos)
+        return vencidos
@@ -0,0 +1,154 @@
+import math
+
+from constante import RESOLUCION_RUEDA, RANURAS_RUEDA, NIVELES_RUEDA
+
+
+class _Entrada:
+    """Turno programado en una RuedaTemporizacion."""
+
+    __slots__ = ("instante", "tick", "dato", "cubeta")
+
+    def __init__(self, instante: float, tick: int, dato):
+        self.instante = instante
+        self.tick = tick
+        self.dato = dato
+        self.cubeta: dict | None = None
+
+
+class RuedaTemporizacion:
+    """
+    Rueda de temporización jerárquica: `niveles` ruedas de `ranuras`
+    cubetas cada una. El nivel 0 tiene una cubeta por tick de `resolucion`
+    segundos y cada nivel siguiente abarca `ranuras` veces más tiempo por
+    cubeta; un turno se ubica en el nivel más bajo que alcanza su
+    vencimiento y baja de nivel (cascada) a medida que se acerca.
+
+    Programar y cancelar son O(1) (cada cubeta es un dict). Los turnos se
+    agrupan por tick: todos los que vencen en el mismo tick se devuelven
+    juntos, a costa de hasta `resolucion` segundos de retraso. Con los
+    valores por defecto (10 ms, 256 ranuras, 4 niveles) el alcance es de
+    más de un año; los turnos más lejanos esperan en la última cubeta del
+    nivel superior y se reubican al llegar a ella.
+
+    Misma interfaz que AgendaMonticulo (programar, cancelar, proximo,
+    vencidos), para usarla como agenda de RuntimeSensores.
+    """
+
+    def __init__(self, origen: float = 0.0, resolucion: float = RESOLUCION_RUEDA,
+                 ranuras: int = RANURAS_RUEDA, niveles: int = NIVELES_RUEDA):
+        if resolucion <= 0:
+            raise ValueError("La resolución debe ser positiva.")
+        if ranuras < 2 or ranuras & (ranuras - 1):
+            raise ValueError("La cantidad de ranuras debe ser una potencia de 2.")
+        if niveles < 2:
+            raise ValueError("Debe haber al menos dos niveles.")
+        self._origen = origen
+        self._resolucion = resolucion
+        self._bits = ranuras.bit_length() - 1
+        self._mascara = ranuras - 1
+        self._niveles = [[{} for _ in range(ranuras)] for _ in range(niveles)]
+        # Último tick procesado: los turnos de ticks posteriores siguen pendientes
+        self._tick = 0
+        self._cantidad = 0
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def _instante_de(self, tick: int) -> float:
+        return self._origen + tick * self._resolucion
+
+    def programar(self, instante: float, dato) -> _Entrada:
+        """
+        Agrega un turno para `instante` y devuelve su entrada (para
+        cancelarlo). Vence en el primer tick que no sea anterior a
+        `instante`; si ese tick ya pasó, en el próximo.
+        """
+        tick = math.ceil((instante - self._origen) / self._resolucion)
+        if tick <= self._tick:
+            tick = self._tick + 1
+        entrada = _Entrada(instante, tick, dato)
+        self._colocar(entrada)
+        self._cantidad += 1
+        return entrada
+
+    def _colocar(self, entrada: _Entrada) -> None:
+        delta = entrada.tick - self._tick
+        if delta <= self._mascara:
+            # Caso común: vence dentro de la vuelta actual del nivel 0
+            cubeta = self._niveles[0][entrada.tick & self._mascara]
+        else:
+            bits = self._bits
+            ultimo = len(self._niveles) - 1
+            nivel = 1
+            while nivel < ultimo and delta >> (bits * (nivel + 1)):
+                nivel += 1
+            desplazamiento = bits * nivel
+            if delta >> (desplazamiento + bits):
+                # Fuera de alcance: la cubeta del nivel superior que se procesa más tarde
+                ranura = ((self._tick >> desplazamiento) - 1) & self._mascara
+            else:
+                ranura = (entrada.tick >> desplazamiento) & self._mascara
+            cubeta = self._niveles[nivel][ranura]
+        cubeta[entrada] = None
+        entrada.cubeta = cubeta
+
+    def cancelar(self, entrada: _Entrada) -> None:
+        if entrada.cubeta is not None:
+            del entrada.cubeta[entrada]
+            entrada.cubeta = None
+            self._cantidad -= 1
+
+    def proximo(self) -> float | None:
+        """
+        Instante hasta el que se puede dormir sin perder turnos, o None si
+        no hay: el del próximo tick con turnos en el nivel 0 o, si no hay
+        ninguno en esta vuelta, el de la próxima cascada.
+        """
+        if not self._cantidad:
+            return None
+        ranuras = self._niveles[0]
+        mascara = self._mascara
+        tick = self._tick + 1
+        while tick & mascara and not ranuras[tick & mascara]:
+            tick += 1
+        return self._instante_de(tick)
+
+    def vencidos(self, ahora: float) -> list[tuple]:
+        """
+        Avanza la rueda hasta `ahora` y devuelve los turnos vencidos como
+        (instante programado, dato), en orden de tick.
+        """
+        objetivo = math.floor((ahora - self._origen) / self._resolucion)
+        ranuras = self._niveles[0]
+        mascara = self._mascara
+        vencidos = []
+        while self._tick < objetivo:
+            if not self._cantidad:
+                # Rueda vacía: no hay nada que bajar de nivel, se salta directo
+                self._tick = objetivo
+                break
+            self._tick += 1
+            indice = self._tick & mascara
+            if not indice:
+                self._cascada()
+            cubeta = ranuras[indice]
+            if cubeta:
+                for entrada in cubeta:
+                    entrada.cubeta = None
+                    vencidos.append((entrada.instante, entrada.dato))
+                self._cantidad -= len(cubeta)
+                cubeta.clear()
+        return vencidos
+
+    def _cascada(self) -> None:
+        """Reubica las cubetas de los niveles superiores que empiezan en este tick."""
+        for nivel in range(1, len(self._niveles)):
+            indice = (self._tick >> (self._bits * nivel)) & self._mascara
+            cubeta = self._niveles[nivel][indice]
+            if cubeta:
+                entradas = list(cubeta)
+                cubeta.clear()
+                for entrada in entradas:
+                    self._colocar(entrada)
+            if indice:
+                break
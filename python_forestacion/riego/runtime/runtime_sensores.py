@@ -0,0 +1,253 @@
+import asyncio
+import inspect
+from collections import deque
+from functools import partial
+
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from python_forestacion.riego.runtime.tarea_periodica import TareaPeriodica
+from python_forestacion.riego.runtime.agenda_monticulo import AgendaMonticulo
+from python_forestacion.riego.runtime.rueda_temporizacion import RuedaTemporizacion
+from constante import (
+    INTERVALO_SENSOR_TEMPERATURA, INTERVALO_SENSOR_HUMEDAD, THREAD_JOIN_TIMEOUT, MUESTRAS_JITTER_SENSORES,
+    AGENDAS_RUNTIME,
+)
+
+# Intervalo por defecto según EventoSensor.tipo
+INTERVALOS_SENSOR = {
+    "temperatura": INTERVALO_SENSOR_TEMPERATURA,
+    "humedad": INTERVALO_SENSOR_HUMEDAD,
+}
+
+# Clase de agenda de turnos según el nombre elegido (ver AGENDAS_RUNTIME)
+_AGENDAS = {
+    "monticulo": AgendaMonticulo,
+    "rueda": RuedaTemporizacion,
+}
+
+# Los desfases iniciales siguen la secuencia de la razón áurea: las tareas
+# de igual intervalo quedan repartidas en el período en lugar de coincidir
+_RAZON_AUREA = 0.6180339887498949
+
+
+class RuntimeSensores:
+    """
+    Ejecuta miles de tareas periódicas (lecturas de sensores, controles) en
+    un único event loop de asyncio, en lugar de un hilo por sensor.
+
+    Los turnos de todas las tareas están en una agenda y una sola
+    corrutina despachadora duerme hasta el más próximo y ejecuta los
+    vencidos: no hay una corrutina ni un temporizador por tarea. La agenda
+    es un montículo ("monticulo", exacto) o una RuedaTemporizacion
+    ("rueda": programar y quitar O(1), y los turnos del mismo tick se
+    despiertan juntos; conviene con cientos de miles de tareas). Los
+    instantes forman una grilla fija por tarea, así que los retrasos no se
+    acumulan; si un turno se ejecuta después del siguiente, los perdidos se
+    saltean (y se cuentan) en lugar de ejecutarse en ráfaga.
+
+    Las funciones comunes se ejecutan en el despachador, así que deben ser
+    breves. Si devuelven un awaitable se ejecuta como tarea aparte, y esa
+    tarea no vuelve a leer mientras la lectura anterior siga en curso.
+    Las excepciones se cuentan como errores de la tarea y no la detienen.
+
+    Al detenerse no se empiezan más turnos y se espera a las lecturas
+    asíncronas en curso hasta `timeout_cierre` segundos; las que no
+    terminan a tiempo se cancelan.
+    """
+
+    def __init__(self, timeout_cierre: float = THREAD_JOIN_TIMEOUT,
+                 muestras_jitter: int = MUESTRAS_JITTER_SENSORES, agenda: str = "monticulo"):
+        if agenda not in AGENDAS_RUNTIME:
+            raise ValueError(f"Agenda no soportada: {agenda!r}. Opciones: {', '.join(AGENDAS_RUNTIME)}.")
+        self._timeout_cierre = timeout_cierre
+        self._tipo_agenda = agenda
+        # Tarea -> entrada de su próximo turno en la agenda (None si no está en ejecución)
+        self._tareas: dict[TareaPeriodica, object] = {}
+        # Retrasos más recientes de todas las tareas, para los percentiles
+        self._retrasos = deque(maxlen=muestras_jitter)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._agenda: AgendaMonticulo | RuedaTemporizacion | None = None
+        # Future que el despachador espera hasta el próximo turno (o un aviso)
+        self._espera: asyncio.Future | None = None
+        # Lecturas asíncronas en curso, por tarea
+        self._en_vuelo: dict[TareaPeriodica, asyncio.Future] = {}
+        self._deteniendo = False
+        # Lecturas asíncronas canceladas al vencer timeout_cierre
+        self.forzadas = 0
+
+    @property
+    def tareas(self) -> list[TareaPeriodica]:
+        return list(self._tareas)
+
+    @property
+    def agenda(self) -> str:
+        return self._tipo_agenda
+
+    def agregar_sensor(self, sensor: EventoSensor, intervalo: float | None = None) -> TareaPeriodica:
+        """
+        Programa sensor.leer() cada `intervalo` segundos (por defecto, el de
+        constante.py para su tipo).
+
+        Raises:
+            ValueError: si no se indica intervalo y el tipo no tiene uno configurado.
+        """
+        if intervalo is None:
+            intervalo = INTERVALOS_SENSOR.get(sensor.tipo)
+            if intervalo is None:
+                raise ValueError(f"No hay intervalo configurado para sensores de {sensor.tipo!r}.")
+        return self.agregar_periodica(f"{sensor.tipo}-{len(self._tareas)}", sensor.leer, intervalo)
+
+    def agregar_periodica(self, nombre: str, funcion, intervalo: float,
+                          desfase: float | None = None) -> TareaPeriodica:
+        """
+        Programa `funcion()` cada `intervalo` segundos, empezando `desfase`
+        segundos después del inicio (por defecto, repartido en el período).
+        Se puede llamar también con el runtime en marcha.
+        """
+        if desfase is None:
+            desfase = (len(self._tareas) * _RAZON_AUREA) % 1.0 * intervalo
+        tarea = TareaPeriodica(nombre, funcion, intervalo, desfase)
+        self._tareas[tarea] = None
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._programar, tarea)
+        return tarea
+
+    def quitar(self, tarea: TareaPeriodica) -> None:
+        """
+        Deja de ejecutar la tarea (una lectura asíncrona en curso termina
+        igual). Con el runtime en marcha, llamar desde el hilo del loop.
+        """
+        entrada = self._tareas.pop(tarea, None)
+        if entrada is not None and self._agenda is not None:
+            self._agenda.cancelar(entrada)
+
+    async def ejecutar(self, duracion: float | None = None) -> None:
+        """
+        Ejecuta las tareas hasta que se llama a detener() o pasan
+        `duracion` segundos, y luego las cierra.
+
+        Raises:
+            RuntimeError: si el runtime ya está en ejecución.
+        """
+        if self._loop is not None:
+            raise RuntimeError("El runtime de sensores ya está en ejecución.")
+        self._loop = asyncio.get_running_loop()
+        self._deteniendo = False
+        self._agenda = _AGENDAS[self._tipo_agenda](self._loop.time())
+        for tarea in self._tareas:
+            self._programar(tarea)
+        if duracion is not None:
+            self._loop.call_later(duracion, self._pedir_cierre)
+        try:
+            await self._despachar()
+        finally:
+            await self._cerrar()
+            self._loop = None
+
+    def detener(self) -> None:
+        """Pide el cierre del runtime; se puede llamar desde cualquier hilo."""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._pedir_cierre)
+
+    def _pedir_cierre(self) -> None:
+        self._deteniendo = True
+        self._despertar()
+
+    def _despertar(self) -> None:
+        if self._espera is not None and not self._espera.done():
+            self._espera.set_result(None)
+
+    def _programar(self, tarea: TareaPeriodica) -> None:
+        if self._deteniendo or tarea not in self._tareas:
+            return
+        self._tareas[tarea] = self._agenda.programar(self._loop.time() + tarea.desfase, tarea)
+        self._despertar()
+
+    async def _despachar(self) -> None:
+        loop = self._loop
+        agenda = self._agenda
+        tareas = self._tareas
+        while not self._deteniendo:
+            self._espera = loop.create_future()
+            proximo = agenda.proximo()
+            if proximo is not None:
+                temporizador = loop.call_at(proximo, self._despertar)
+                await self._espera
+                temporizador.cancel()
+            else:
+                await self._espera
+            # Ejecuta todo lo vencido hasta ahora; lo que venza durante el lote
+            # espera a la próxima vuelta del loop, para no acaparar a las demás corrutinas
+            for proxima, tarea in agenda.vencidos(loop.time()):
+                if self._deteniendo or tarea not in tareas:
+                    continue
+                self._ejecutar_turno(tarea, proxima)
+                proxima += tarea.intervalo
+                atraso = loop.time() - proxima
+                if atraso >= 0:
+                    perdidos = int(atraso // tarea.intervalo) + 1
+                    tarea.omitidas += perdidos
+                    proxima += perdidos * tarea.intervalo
+                if tarea in tareas:
+                    tareas[tarea] = agenda.programar(proxima, tarea)
+
+    def _ejecutar_turno(self, tarea: TareaPeriodica, proxima: float) -> None:
+        if tarea in self._en_vuelo:
+            # La lectura asíncrona anterior todavía no terminó
+            tarea.omitidas += 1
+            return
+        retraso = self._loop.time() - proxima
+        tarea.registrar(retraso)
+        self._retrasos.append(retraso)
+        try:
+            resultado = tarea.funcion()
+        except Exception:
+            tarea.errores += 1
+            return
+        if inspect.isawaitable(resultado):
+            lectura = asyncio.ensure_future(resultado)
+            self._en_vuelo[tarea] = lectura
+            lectura.add_done_callback(partial(self._terminar_lectura, tarea))
+
+    def _terminar_lectura(self, tarea: TareaPeriodica, lectura: asyncio.Future) -> None:
+        del self._en_vuelo[tarea]
+        if not lectura.cancelled() and lectura.exception() is not None:
+            tarea.errores += 1
+
+    async def _cerrar(self) -> None:
+        self._deteniendo = True
+        self._espera = None
+        self._agenda = None
+        for tarea in self._tareas:
+            self._tareas[tarea] = None
+        en_vuelo = list(self._en_vuelo.values())
+        if not en_vuelo:
+            return
+        _, pendientes = await asyncio.wait(en_vuelo, timeout=self._timeout_cierre)
+        for pendiente in pendientes:
+            pendiente.cancel()
+        if pendientes:
+            await asyncio.wait(pendientes)
+        self.forzadas += len(pendientes)
+
+    def estadisticas(self) -> dict:
+        """
+        Métricas de planificación (en segundos): ejecuciones, omitidas y
+        errores totales; jitter medio, p99 y máximo (retraso respecto del
+        instante planificado) y la mayor deriva de una tarea.
+        """
+        ejecuciones = sum(tarea.ejecuciones for tarea in self._tareas)
+        suma = sum(tarea.retraso_medio * tarea.ejecuciones for tarea in self._tareas)
+        muestras = sorted(self._retrasos)
+        return {
+            "tareas": len(self._tareas),
+            "ejecuciones": ejecuciones,
+            "omitidas": sum(tarea.omitidas for tarea in self._tareas),
+            "errores": sum(tarea.errores for tarea in self._tareas),
+            "jitter_medio": suma / ejecuciones if ejecuciones else 0.0,
+            "jitter_p99": muestras[int(len(muestras) * 0.99)] if muestras else 0.0,
+            "jitter_max": max((tarea.retraso_max for tarea in self._tareas), default=0.0),
+            "deriva_max": max((abs(tarea.deriva) for tarea in self._tareas), default=0.0),
+            "forzadas": self.forzadas,
+        }
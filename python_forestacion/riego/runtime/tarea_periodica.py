@@ -0,0 +1,48 @@
+class TareaPeriodica:
+    """
+    Tarea que RuntimeSensores ejecuta cada `intervalo` segundos, con sus
+    métricas de planificación.
+
+    El retraso de una ejecución es cuánto empezó después de su instante
+    planificado (el jitter). Los instantes forman una grilla fija
+    (inicio + desfase + k * intervalo), así que el retraso no se acumula;
+    la deriva es cuánto se corrió la grilla entre la primera y la última
+    ejecución (último retraso menos el primero).
+    """
+
+    def __init__(self, nombre: str, funcion, intervalo: float, desfase: float = 0.0):
+        if intervalo <= 0:
+            raise ValueError("El intervalo debe ser positivo.")
+        self.nombre = nombre
+        self.funcion = funcion
+        self.intervalo = intervalo
+        self.desfase = desfase
+        self.ejecuciones = 0
+        # Ejecuciones salteadas porque la anterior terminó después de su turno
+        self.omitidas = 0
+        self.errores = 0
+        self.retraso_max = 0.0
+        self._suma_retraso = 0.0
+        self._primer_retraso = 0.0
+        self._ultimo_retraso = 0.0
+
+    def registrar(self, retraso: float) -> None:
+        """Registra el retraso de una ejecución que empieza."""
+        if self.ejecuciones == 0:
+            self._primer_retraso = retraso
+        self.ejecuciones += 1
+        self._suma_retraso += retraso
+        self._ultimo_retraso = retraso
+        if retraso > self.retraso_max:
+            self.retraso_max = retraso
+
+    @property
+    def retraso_medio(self) -> float:
+        return self._suma_retraso / self.ejecuciones if self.ejecuciones else 0.0
+
+    @property
+    def deriva(self) -> float:
+        return self._ultimo_retraso - self._primer_retraso
+
+    def __repr__(self) -> str:
+        return f"TareaPeriodica({self.nombre!r}, intervalo={self.intervalo})"
@@ -4,11 +4,14 @@ from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSen
 class HumedadReaderTask(EventoSensor):
     """Simula un sensor de humedad del suelo."""
 
-    def __init__(self):
-        super().__init__("humedad")
+    def __init__(self, debiles: bool = False):
+        super().__init__("humedad", debiles)
 
     def leer_humedad(self):
         """Genera una lectura aleatoria y notifica a los observadores."""
         valor = round(random.uniform(10, 80), 2)
         self.actualizar_valor(valor)
         return valor
+
+    def leer(self) -> float:
+        return self.leer_humedad()
@@ -4,11 +4,14 @@ from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSen
 class TemperaturaReaderTask(EventoSensor):
     """Simula un sensor de temperatura ambiente."""
 
-    def __init__(self):
-        super().__init__("temperatura")
+    def __init__(self, debiles: bool = False):
+        super().__init__("temperatura", debiles)
 
     def leer_temperatura(self):
         """Genera una lectura aleatoria y notifica a los observadores."""
         valor = round(random.uniform(5, 40), 2)
         self.actualizar_valor(valor)
         return valor
+
+    def leer(self) -> float:
+        return self.leer_temperatura()
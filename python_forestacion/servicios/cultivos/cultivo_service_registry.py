@@ -6,6 +6,12 @@ from python_forestacion.Entidades.cultivos.pino import Pino
 from python_forestacion.Entidades.cultivos.olivo import Olivo
 from python_forestacion.Entidades.cultivos.lechuga import Lechuga
 from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.columnar.vistas_cultivo import (
+    VistaPino,
+    VistaOlivo,
+    VistaLechuga,
+    VistaZanahoria,
+)
 
 @singleton
 class CultivoServiceRegistry:
@@ -18,7 +24,12 @@ class CultivoServiceRegistry:
             Pino: self._mostrar_datos_pino,
             Olivo: self._mostrar_datos_olivo,
             Lechuga: self._mostrar_datos_lechuga,
-            Zanahoria: self._mostrar_datos_zanahoria
+            Zanahoria: self._mostrar_datos_zanahoria,
+            # Vistas de plantaciones columnares: mismos handlers
+            VistaPino: self._mostrar_datos_pino,
+            VistaOlivo: self._mostrar_datos_olivo,
+            VistaLechuga: self._mostrar_datos_lechuga,
+            VistaZanahoria: self._mostrar_datos_zanahoria
         }
 
     def registrar_servicio(self, nombre: str, servicio: CultivoService):
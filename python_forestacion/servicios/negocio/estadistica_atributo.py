@@ -0,0 +1,38 @@
+class EstadisticaAtributo:
+    """Cantidad, total, mínimo y máximo de un atributo numérico; combinable."""
+
+    def __init__(self):
+        self.cantidad = 0
+        self.total = 0.0
+        self.minimo: float | None = None
+        self.maximo: float | None = None
+
+    @property
+    def promedio(self) -> float | None:
+        return self.total / self.cantidad if self.cantidad else None
+
+    def agregar_valores(self, valores: list[float]) -> None:
+        """Acumula una lista de valores (sum/min/max en una pasada cada uno)."""
+        if not valores:
+            return
+        self._acumular(len(valores), sum(valores), min(valores), max(valores))
+
+    def combinar(self, otra: "EstadisticaAtributo") -> None:
+        """Acumula en esta estadística los valores resumidos en `otra`."""
+        if otra.cantidad:
+            self._acumular(otra.cantidad, otra.total, otra.minimo, otra.maximo)
+
+    def _acumular(self, cantidad: int, total: float, minimo: float, maximo: float) -> None:
+        if self.cantidad:
+            self.minimo = min(self.minimo, minimo)
+            self.maximo = max(self.maximo, maximo)
+        else:
+            self.minimo, self.maximo = minimo, maximo
+        self.cantidad += cantidad
+        self.total += total
+
+    def __str__(self) -> str:
+        if not self.cantidad:
+            return "sin datos"
+        return (f"n={self.cantidad}, total={self.total:.2f}, promedio={self.promedio:.2f}, "
+                f"min={self.minimo}, max={self.maximo}")
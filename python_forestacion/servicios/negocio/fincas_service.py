@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
 from python_forestacion.Entidades.terrenos.tierra import Tierra
 from python_forestacion.Entidades.terrenos.plantacion import Plantacion
 from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
@@ -5,19 +8,34 @@ from python_forestacion.Entidades.terrenos.registro_forestal import RegistroFore
 from python_forestacion.servicios.terrenos.tierra_service import TierraService
 from python_forestacion.servicios.terrenos.plantacion_service import PlantacionService
 from python_forestacion.servicios.terrenos.registro_forestal_service import RegistroForestalService
+from python_forestacion.servicios.negocio.paquete_cosecha import PaqueteCosecha, T
+from python_forestacion.servicios.negocio.persistencia.base_sqlite import BaseSQLite, CAMPOS_CULTIVO
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from constante import MAX_HILOS_COSECHA
 
 
 class FincasService:
     """
     Servicio de alto nivel que orquesta la creación y registro de fincas completas.
     Integra los servicios de Tierra, Plantación y RegistroForestal.
+
+    Con una BaseSQLite, al crearse carga las fincas guardadas, cada finca
+    nueva o eliminada se refleja en la base, guardar_cambios escribe las
+    plantaciones modificadas y buscar_cultivos se resuelve en SQL.
     """
 
-    def __init__(self):
+    def __init__(self, base: BaseSQLite | None = None):
         self._tierra_service = TierraService()
         self._plantacion_service = PlantacionService()
-        self._registro_forestal = RegistroForestal()
+        self._base = base
+        self._registro_forestal = base.cargar_registro() if base else RegistroForestal()
         self._registro_service = RegistroForestalService(self._registro_forestal)
+        if base:
+            for plantacion in self._registro_forestal.listar_todas():
+                self._plantacion_service.registrar_plantacion(plantacion)
+            for tierra in base.listar_tierras():
+                tierra.set_plantacion(self._registro_forestal.buscar_plantacion(tierra.nombre_plantacion))
+                self._tierra_service.registrar_tierra(tierra)
 
     def crear_finca(self, id_padron: int, superficie: float, domicilio: str, nombre_plantacion: str) -> Tierra:
         """
@@ -31,7 +49,10 @@ class FincasService:
         tierra.set_plantacion(plantacion)
         self._tierra_service.registrar_tierra(tierra)
         self._plantacion_service.registrar_plantacion(plantacion)
-        self._registro_service.agregar_plantacion(plantacion)
+        self._registro_service.agregar_plantacion(plantacion, id_padron)
+        if self._base:
+            self._base.guardar_finca(tierra, plantacion)
+            plantacion.marcar_guardada()
 
         return tierra
 
@@ -47,9 +68,100 @@ class FincasService:
         """Busca una plantación por su nombre."""
         return self._registro_service.buscar_plantacion(nombre)
 
+    def buscar_por_padron(self, id_padron: int):
+        """Busca la plantación de la tierra con el padrón indicado."""
+        return self._registro_service.buscar_por_padron(id_padron)
+
+    def consultar_plantaciones(self, *predicados):
+        """Plantaciones que cumplen todos los predicados (ver consultas.predicados)."""
+        return self._registro_service.consultar(*predicados)
+
     def eliminar_finca(self, nombre_plantacion: str) -> bool:
         """Elimina una finca del registro."""
-        return self._registro_service.eliminar_plantacion(nombre_plantacion)
+        eliminada = self._registro_service.eliminar_plantacion(nombre_plantacion)
+        if eliminada and self._base:
+            self._base.eliminar_plantacion(nombre_plantacion)
+        return eliminada
+
+    def guardar_cambios(self) -> int:
+        """
+        Escribe en la base las plantaciones modificadas desde el último
+        guardado, en una sola transacción.
+
+        Returns:
+            Cantidad de plantaciones escritas.
+
+        Raises:
+            PersistenciaException: si el servicio no tiene base.
+        """
+        if not self._base:
+            raise PersistenciaException("El servicio no tiene una base SQLite asociada.")
+        registro = self._registro_forestal
+        modificadas = [p for p in registro.listar_todas() if p.modificada]
+        self._base.guardar_plantaciones((p, registro.padron_de(p.nombre)) for p in modificadas)
+        for plantacion in modificadas:
+            plantacion.marcar_guardada()
+        return len(modificadas)
+
+    def buscar_cultivos(self, tipo: type, campo: str | None = None, minimo=None, maximo=None) -> list[tuple[str, object]]:
+        """
+        Cultivos de la clase `tipo` (o subclases) con minimo <= campo <= maximo
+        (None: sin cota), como pares (nombre de plantación, cultivo).
+
+        Con base, primero guarda los cambios pendientes y resuelve la consulta
+        en SQL: los cultivos devueltos son copias. Sin base, recorre las
+        plantaciones y devuelve los cultivos (o vistas) en memoria.
+
+        Raises:
+            ValueError: si `campo` no es uno de CAMPOS_CULTIVO.
+        """
+        if self._base:
+            self.guardar_cambios()
+            return self._base.consultar_cultivos(tipo, campo, minimo, maximo)
+        if campo is not None and campo not in CAMPOS_CULTIVO:
+            raise ValueError(f"Campo de cultivo no consultable: {campo!r}")
+        encontrados = []
+        for plantacion in self._registro_service.listar_todas():
+            for cultivo in plantacion.cultivos_de_tipo(tipo):
+                if campo is not None:
+                    valor = getattr(cultivo, campo, None)
+                    if valor is None:
+                        continue
+                    if minimo is not None and valor < minimo:
+                        continue
+                    if maximo is not None and valor > maximo:
+                        continue
+                encontrados.append((plantacion.nombre, cultivo))
+        return encontrados
+
+    def cosechar_y_empaquetar(self, tipo: type[T], max_hilos: int | None = None) -> PaqueteCosecha[T]:
+        """
+        Cosecha todos los cultivos de la clase `tipo` (o subclases) de todas
+        las plantaciones registradas y los resume en un PaqueteCosecha.
+        Cada plantación se cosecha en un hilo del pool y los paquetes
+        parciales se combinan al terminar.
+
+        Args:
+            tipo: Clase de cultivo a cosechar (por ejemplo Pino o Arbol).
+            max_hilos: Tamaño máximo del pool; por defecto MAX_HILOS_COSECHA.
+        """
+        paquete = PaqueteCosecha(tipo)
+        plantaciones = self._registro_service.listar_todas()
+        if not plantaciones:
+            return paquete
+        hilos = min(max_hilos or MAX_HILOS_COSECHA, len(plantaciones))
+        with ThreadPoolExecutor(max_workers=hilos) as pool:
+            for parcial in pool.map(self._cosechar_plantacion, repeat(tipo), plantaciones):
+                paquete.combinar(parcial)
+        return paquete
+
+    @staticmethod
+    def _cosechar_plantacion(tipo: type[T], plantacion: Plantacion) -> PaqueteCosecha[T]:
+        # Cada hilo quita cultivos solo de su plantación; los avisos de cambio
+        # actualizan los índices del registro, que los protege con su cerrojo
+        parcial = PaqueteCosecha(tipo)
+        parcial.agregar(plantacion.remover_tipo(tipo), plantacion.nombre)
+        return parcial
 
     def obtener_registro(self) -> RegistroForestal:
         """Devuelve el registro forestal activo."""
@@ -1,28 +1,294 @@
+import io
 import os
-import pickle
+from concurrent.futures import Future
+from functools import partial
 from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.servicios.negocio.persistencia import formato_pickle, formato_binario
+from python_forestacion.servicios.negocio.persistencia.journal import Journal
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import escribir_atomico
+from python_forestacion.servicios.negocio.persistencia.escritor_asincrono import EscritorAsincrono
+from python_forestacion.servicios.negocio.persistencia.mutacion import Mutacion
+from python_forestacion.servicios.negocio.persistencia.cache_carga import CacheCarga
+from python_forestacion.servicios.negocio.persistencia.formato_columnar import escribir_registro_columnar
+from python_forestacion.servicios.negocio.persistencia.registro_columnar_mmap import RegistroColumnarMmap
+from python_forestacion.Entidades.terrenos.registro_perezoso import RegistroPerezoso
+from constante import (
+    EXTENSION_DATA, EXTENSION_JOURNAL, EXTENSION_COLUMNAR, COMPACTAR_JOURNAL_CADA, CAPACIDAD_CACHE_PLANTACIONES,
+    FORMATOS_PAQUETE,
+)
 
 class Paquete:
+    """
+    Persistencia de objetos en archivos .dat (pickle).
 
-    def __init__(self, ruta_base: str = "data"):
+    Con journal=True los cambios se registran con aplicar_mutacion en un
+    write-ahead log ({nombre}.wal) en lugar de reescribir el .dat completo;
+    cada `compactar_cada` mutaciones se escribe un snapshot (de forma
+    atómica) y se vacía el log. cargar lee el snapshot y reaplica el log.
+
+    Opciones de formato: `protocolo` de pickle, `compresion` ("zlib", "bz2"
+    o "lzma", en flujo) y `fuera_de_banda` (protocolo 5: los arreglos de los
+    almacenes columnares se escriben como buffers crudos, sin copiarlos
+    dentro del pickle). La cabecera del .dat registra el formato y cargar lo
+    detecta solo, incluidos los .dat anteriores sin cabecera.
+
+    Con formato="binario" los .dat se escriben con el codec propio de
+    formato_binario (más rápido y compacto para las entidades del modelo,
+    sin opciones de pickle); cargar reconoce ambos formatos.
+
+    Todas las escrituras van a un temporal sincronizado que reemplaza al
+    archivo de forma atómica. guardar_async las hace en un hilo escritor.
+
+    Con una CacheCarga (que puede compartirse entre varios Paquete), cargar
+    no vuelve a leer un .dat que no cambió desde la carga anterior; lo que
+    devuelve es siempre una copia independiente.
+    No se combina con journal, donde el objeto cargado se sigue modificando.
+    """
+
+    def __init__(self, ruta_base: str = "data", journal: bool = False,
+                 compactar_cada: int = COMPACTAR_JOURNAL_CADA, sincronizar: bool = False,
+                 protocolo: int | None = None, compresion: str | None = None, fuera_de_banda: bool = False,
+                 formato: str = "pickle", cache: CacheCarga | None = None):
+        if formato not in FORMATOS_PAQUETE:
+            raise ValueError(f"Formato no soportado: {formato!r}. Opciones: {', '.join(FORMATOS_PAQUETE)}.")
+        if formato == "binario" and (protocolo is not None or compresion is not None or fuera_de_banda):
+            raise ValueError("protocolo, compresion y fuera_de_banda solo aplican al formato pickle.")
+        if cache is not None and journal:
+            raise ValueError("La caché de carga no se puede usar en modo journal.")
+        self._protocolo = formato_pickle.validar_opciones(protocolo, compresion, fuera_de_banda)
+        self._formato = formato
+        self._cache = cache
+        self._compresion = compresion
+        self._fuera_de_banda = fuera_de_banda
         self._ruta_base = ruta_base
+        self._journal = journal
+        self._compactar_cada = compactar_cada
+        self._sincronizar = sincronizar
+        # Por archivo: última secuencia registrada y mutaciones desde el último snapshot
+        self._secuencias: dict[str, int] = {}
+        self._sin_compactar: dict[str, int] = {}
+        self._escritor: EscritorAsincrono | None = None
         if not os.path.exists(self._ruta_base):
             os.makedirs(self._ruta_base)
 
+    def _ruta(self, nombre_archivo: str, extension: str = EXTENSION_DATA) -> str:
+        return os.path.join(self._ruta_base, f"{nombre_archivo}{extension}")
+
+    def _journal_de(self, nombre_archivo: str) -> Journal:
+        return Journal(self._ruta(nombre_archivo, EXTENSION_JOURNAL), self._sincronizar)
+
+    def _secuencia_de(self, nombre_archivo: str) -> int:
+        """
+        Última secuencia registrada del archivo. Si este Paquete todavía no
+        lo cargó ni le agregó registros, parte de la mayor entre la del
+        snapshot y la del último registro del journal, para que los
+        registros nuevos no queden por debajo de ellas.
+        """
+        secuencia = self._secuencias.get(nombre_archivo)
+        if secuencia is not None:
+            return secuencia
+        secuencia = self._journal_de(nombre_archivo).ultima_secuencia()
+        try:
+            with open(self._ruta(nombre_archivo), "rb") as archivo:
+                secuencia = max(secuencia, self._leer(archivo)[1] or 0)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            raise PersistenciaException(str(e))
+        self._secuencias[nombre_archivo] = secuencia
+        return secuencia
+
     def guardar(self, objeto, nombre_archivo: str):
-        ruta = os.path.join(self._ruta_base, f"{nombre_archivo}.dat")
+        if self._journal:
+            self.compactar(objeto, nombre_archivo)
+            return
+        try:
+            escribir_atomico(self._ruta(nombre_archivo), partial(self._escribir, objeto))
+        except Exception as e:
+            raise PersistenciaException(str(e))
+        self._al_guardar(objeto)
+
+    @staticmethod
+    def _al_guardar(objeto) -> None:
+        # Un registro perezoso retiene las plantaciones modificadas hasta que se guardan
+        if isinstance(objeto, RegistroPerezoso):
+            objeto.marcar_guardado()
+
+    def _escribir(self, objeto, archivo, secuencia: int | None = None) -> None:
+        if self._formato == "binario":
+            formato_binario.escribir(archivo, objeto, secuencia)
+            return
+        formato_pickle.escribir(archivo, objeto, self._protocolo, self._compresion,
+                                self._fuera_de_banda, secuencia)
+
+    @staticmethod
+    def _leer(archivo) -> tuple:
+        """(objeto, secuencia) de un .dat en cualquiera de los formatos."""
+        es_binario = formato_binario.es_binario(archivo.read(len(formato_binario.MAGICO)))
+        archivo.seek(0)
+        return formato_binario.leer(archivo) if es_binario else formato_pickle.leer(archivo)
+
+    def _leer_objeto(self, ruta: str):
+        with open(ruta, "rb") as archivo:
+            return self._leer(archivo)[0]
+
+    @staticmethod
+    def _volcar(contenido: bytes, archivo) -> None:
+        archivo.write(contenido)
+
+    def guardar_async(self, objeto, nombre_archivo: str, instantanea: bool = True) -> Future:
+        """
+        Guarda en el hilo escritor y devuelve un Future con la ruta escrita
+        (se puede esperar o ignorar). Guardados seguidos del mismo archivo que
+        aún no empezaron se agrupan: se escribe solo el último.
+
+        Por defecto el objeto se serializa ahora, en el hilo llamador, y al
+        hilo escritor le llega esa instantánea: el objeto se puede seguir
+        modificando enseguida. Con instantanea=False se serializa en el hilo
+        escritor (sin la copia en memoria), y entonces no debe modificarse
+        hasta que el Future termine.
+
+        Los guardados pendientes se completan al llamar a cerrar o, si no se
+        llamó, al terminar el intérprete.
+
+        A diferencia de guardar, no marca como guardado un RegistroPerezoso:
+        el objeto puede cambiar antes de que termine la escritura.
+
+        Raises:
+            PersistenciaException: en modo journal (el snapshot debe coincidir con la secuencia del log).
+        """
+        if self._journal:
+            raise PersistenciaException("guardar_async no está disponible en modo journal; usar compactar.")
+        if instantanea:
+            buffer = io.BytesIO()
+            try:
+                self._escribir(objeto, buffer)
+            except Exception as e:
+                # Igual que si fallara en el hilo escritor: el error llega por el Future
+                futuro = Future()
+                futuro.set_exception(PersistenciaException(str(e)))
+                return futuro
+            escribir = partial(self._volcar, buffer.getvalue())
+        else:
+            escribir = partial(self._escribir, objeto)
+        if self._escritor is None:
+            self._escritor = EscritorAsincrono()
+        return self._escritor.encolar(self._ruta(nombre_archivo), escribir)
+
+    def esperar_escrituras(self) -> None:
+        """Bloquea hasta que terminan los guardados asíncronos pendientes."""
+        if self._escritor is not None:
+            self._escritor.esperar()
+
+    def cerrar(self) -> None:
+        """Termina los guardados asíncronos pendientes y detiene el hilo escritor."""
+        if self._escritor is not None:
+            self._escritor.cerrar()
+            self._escritor = None
+
+    def compactar(self, objeto, nombre_archivo: str) -> None:
+        """
+        Escribe un snapshot completo y vacía el journal.
+        El snapshot guarda, después del objeto, el número de secuencia que
+        incluye; se escribe en un temporal y se reemplaza atómicamente.
+        """
+        secuencia = self._secuencia_de(nombre_archivo)
+        try:
+            escribir_atomico(self._ruta(nombre_archivo), partial(self._escribir, objeto, secuencia=secuencia))
+            # Si se interrumpe aquí, al cargar se saltean los registros ya incluidos
+            self._journal_de(nombre_archivo).vaciar()
+        except Exception as e:
+            raise PersistenciaException(str(e))
+        self._sin_compactar[nombre_archivo] = 0
+        self._al_guardar(objeto)
+
+    def aplicar_mutacion(self, objeto, nombre_archivo: str, mutacion: Mutacion):
+        """
+        Aplica la mutación al objeto y la persiste; devuelve su resultado.
+        En modo journal el registro se agrega al log (y llega al disco)
+        antes de aplicar la mutación, y después se compacta si corresponde;
+        sin journal se aplica y se guarda el objeto completo. Si la mutación
+        lanza, no se persiste nada: su registro se retira del log.
+
+        Raises:
+            PersistenciaException: si no se puede escribir el registro (la mutación no se aplica).
+        """
+        if not self._journal:
+            resultado = mutacion.aplicar(objeto)
+            self.guardar(objeto, nombre_archivo)
+            return resultado
+
+        journal = self._journal_de(nombre_archivo)
+        secuencia = self._secuencia_de(nombre_archivo) + 1
         try:
-            with open(ruta, "wb") as archivo:
-                pickle.dump(objeto, archivo)
+            posicion = journal.agregar(secuencia, mutacion)
         except Exception as e:
             raise PersistenciaException(str(e))
+        try:
+            resultado = mutacion.aplicar(objeto)
+        except BaseException:
+            journal.descartar_desde(posicion)
+            raise
+        self._secuencias[nombre_archivo] = secuencia
+        pendientes = self._sin_compactar.get(nombre_archivo, 0) + 1
+        self._sin_compactar[nombre_archivo] = pendientes
+        if pendientes >= self._compactar_cada:
+            self.compactar(objeto, nombre_archivo)
+        return resultado
 
     def cargar(self, nombre_archivo: str):
-        ruta = os.path.join(self._ruta_base, f"{nombre_archivo}.dat")
+        ruta = self._ruta(nombre_archivo)
         try:
+            if self._cache is not None:
+                return self._cache.obtener(ruta, self._leer_objeto)
             with open(ruta, "rb") as archivo:
-                return pickle.load(archivo)
+                objeto, secuencia = self._leer(archivo)
+            # .dat sin journal: solo contiene el objeto
+            secuencia = secuencia or 0
+        except FileNotFoundError:
+            raise PersistenciaException(f"El archivo {nombre_archivo}{EXTENSION_DATA} no existe.")
+        except Exception as e:
+            raise PersistenciaException(str(e))
+
+        if self._journal:
+            try:
+                registros = self._journal_de(nombre_archivo).leer(secuencia)
+                for secuencia, mutacion in registros:
+                    mutacion.aplicar(objeto)
+            except Exception as e:
+                raise PersistenciaException(f"No se pudo reaplicar el journal: {e}")
+            self._secuencias[nombre_archivo] = secuencia
+            self._sin_compactar[nombre_archivo] = len(registros)
+        return objeto
+
+    def guardar_columnar(self, registro, nombre_archivo: str) -> None:
+        """
+        Guarda un RegistroForestal en formato columnar ({nombre}.pfc), pensado
+        para abrirse con abrir_columnar sin deserializar todos los cultivos.
+        """
+        try:
+            escribir_registro_columnar(registro, self._ruta(nombre_archivo, EXTENSION_COLUMNAR))
+        except Exception as e:
+            raise PersistenciaException(str(e))
+        self._al_guardar(registro)
+
+    def cargar_perezoso(self, nombre_archivo: str,
+                        capacidad: int = CAPACIDAD_CACHE_PLANTACIONES) -> RegistroPerezoso:
+        """
+        Abre un registro columnar ({nombre}.pfc) como RegistroPerezoso: cada
+        plantación se decodifica al usarla y a lo sumo `capacidad` quedan en
+        memoria. Un .dat es un único pickle y no admite carga parcial.
+        """
+        return self.abrir_columnar(nombre_archivo).a_registro_perezoso(capacidad)
+
+    def abrir_columnar(self, nombre_archivo: str) -> RegistroColumnarMmap:
+        """
+        Abre un registro columnar con mmap; las plantaciones se decodifican
+        al pedirlas. Cerrarlo con cerrar() o usarlo como context manager.
+        """
+        try:
+            return RegistroColumnarMmap(self._ruta(nombre_archivo, EXTENSION_COLUMNAR))
         except FileNotFoundError:
-            raise PersistenciaException(f"El archivo {nombre_archivo}.dat no existe.")
+            raise PersistenciaException(f"El archivo {nombre_archivo}{EXTENSION_COLUMNAR} no existe.")
         except Exception as e:
             raise PersistenciaException(str(e))
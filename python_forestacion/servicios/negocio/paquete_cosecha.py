@@ -0,0 +1,75 @@
+from typing import Generic, TypeVar
+
+from python_forestacion.Entidades.cultivos.cultivo import Cultivo
+from python_forestacion.servicios.negocio.estadistica_atributo import EstadisticaAtributo
+from constante import ATRIBUTOS_COSECHA
+
+T = TypeVar("T", bound=Cultivo)
+
+
+class PaqueteCosecha(Generic[T]):
+    """
+    Resultado de cosechar cultivos de un tipo.
+    No guarda los cultivos: solo conteos (por clase y por plantación) y
+    estadísticas de sus atributos numéricos. Los paquetes parciales de
+    distintas plantaciones se unen con combinar.
+    """
+
+    def __init__(self, tipo: type[T]):
+        self.tipo = tipo
+        self.cantidad = 0
+        self.cantidad_por_clase: dict[str, int] = {}
+        self.cantidad_por_plantacion: dict[str, int] = {}
+        self._estadisticas: dict[str, EstadisticaAtributo] = {}
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    @property
+    def atributos(self) -> list[str]:
+        return list(self._estadisticas)
+
+    def estadistica(self, atributo: str) -> EstadisticaAtributo | None:
+        return self._estadisticas.get(atributo)
+
+    def _estadistica_de(self, atributo: str) -> EstadisticaAtributo:
+        estadistica = self._estadisticas.get(atributo)
+        if estadistica is None:
+            estadistica = self._estadisticas[atributo] = EstadisticaAtributo()
+        return estadistica
+
+    def agregar(self, cultivos: list[T], origen: str) -> None:
+        """Resume en el paquete los cultivos cosechados en la plantación `origen`."""
+        if not cultivos:
+            return
+        self.cantidad += len(cultivos)
+        self.cantidad_por_plantacion[origen] = self.cantidad_por_plantacion.get(origen, 0) + len(cultivos)
+        for cultivo in cultivos:
+            nombre = type(cultivo).__name__
+            self.cantidad_por_clase[nombre] = self.cantidad_por_clase.get(nombre, 0) + 1
+        for atributo in ATRIBUTOS_COSECHA:
+            valores = [getattr(cultivo, atributo) for cultivo in cultivos if hasattr(cultivo, atributo)]
+            if valores:
+                self._estadistica_de(atributo).agregar_valores(valores)
+
+    def combinar(self, otro: "PaqueteCosecha[T]") -> "PaqueteCosecha[T]":
+        """
+        Suma el contenido de `otro` a este paquete y lo devuelve.
+
+        Raises:
+            ValueError: si los paquetes son de tipos de cultivo distintos.
+        """
+        if otro.tipo is not self.tipo:
+            raise ValueError(f"No se puede combinar un paquete de {otro.tipo.__name__} "
+                             f"con uno de {self.tipo.__name__}.")
+        self.cantidad += otro.cantidad
+        for nombre, cantidad in otro.cantidad_por_clase.items():
+            self.cantidad_por_clase[nombre] = self.cantidad_por_clase.get(nombre, 0) + cantidad
+        for origen, cantidad in otro.cantidad_por_plantacion.items():
+            self.cantidad_por_plantacion[origen] = self.cantidad_por_plantacion.get(origen, 0) + cantidad
+        for atributo, estadistica in otro._estadisticas.items():
+            self._estadistica_de(atributo).combinar(estadistica)
+        return self
+
+    def __str__(self) -> str:
+        return f"PaqueteCosecha[{self.tipo.__name__}] con {self.cantidad} cultivos"
@@ -0,0 +1,206 @@
+import json
+import os
+import sys
+from array import array
+from functools import partial
+
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import AlmacenColumnar, COLUMNAS
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.servicios.negocio.persistencia.almacen_bloques import AlmacenBloques
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import escribir_atomico
+from constante import DIRECTORIO_DATA, DIRECTORIO_BLOQUES, EXTENSION_VERSION, CULTIVOS_POR_BLOQUE_DELTA
+
+VERSION_FORMATO = 1
+# Los bloques de cultivos se guardan siempre en little endian
+_INVERTIR_BYTES = sys.byteorder != "little"
+
+
+def _escribir_json(contenido: dict, archivo) -> None:
+    archivo.write(json.dumps(contenido).encode("utf-8"))
+
+
+class PaqueteDelta:
+    """
+    Snapshots incrementales de un RegistroForestal sobre un almacén de
+    bloques direccionados por contenido ({ruta_base}/bloques/).
+
+    Los cultivos de cada plantación se parten en bloques de filas
+    columnares con cortes definidos por el contenido: se corta después de
+    una fila cuyo hash (de superficie y altura) es múltiplo de
+    `cultivos_por_bloque`, el tamaño medio, con bloques de entre un cuarto
+    y cuatro veces ese tamaño. Así, agregar o quitar un cultivo cambia su
+    bloque y a veces un vecino, en lugar de correr todos los cortes
+    posteriores. Los datos de la plantación (con la lista de sus bloques)
+    forman otro bloque. Cada versión ({nombre}.ver) es solo la lista de bloques de sus plantaciones: al
+    guardar se escriben únicamente los bloques que no existían en ninguna
+    versión anterior, y cualquier versión se reconstruye desde sus bloques.
+
+    Como el formato columnar, guarda nombre, padrón, superficie, agua y
+    cultivos de cada plantación; no guarda la ubicación espacial.
+    """
+
+    def __init__(self, ruta_base: str = DIRECTORIO_DATA, cultivos_por_bloque: int = CULTIVOS_POR_BLOQUE_DELTA):
+        if cultivos_por_bloque <= 0:
+            raise ValueError("La cantidad de cultivos por bloque debe ser positiva.")
+        self._ruta_base = ruta_base
+        self._cultivos_por_bloque = cultivos_por_bloque
+        self._bloques = AlmacenBloques(os.path.join(ruta_base, DIRECTORIO_BLOQUES))
+
+    @property
+    def bloques(self) -> AlmacenBloques:
+        return self._bloques
+
+    def _ruta_version(self, nombre_version: str) -> str:
+        return os.path.join(self._ruta_base, f"{nombre_version}{EXTENSION_VERSION}")
+
+    def _cortes(self, almacen: AlmacenColumnar):
+        """(inicio, fin) de cada bloque de cultivos del almacén."""
+        promedio = self._cultivos_por_bloque
+        minimo = max(1, promedio // 4)
+        maximo = promedio * 4
+        # Filas después de las que se puede cortar, según el hash de su
+        # superficie y altura (el hash de números no depende de PYTHONHASHSEED)
+        candidatas = [
+            fila for fila, valor in enumerate(map(hash, zip(almacen.superficie, almacen.altura)), 1)
+            if valor % promedio == 0
+        ]
+        candidatas.append(len(almacen))
+        inicio = 0
+        for fila in candidatas:
+            while fila - inicio > maximo:
+                yield inicio, inicio + maximo
+                inicio += maximo
+            if fila - inicio >= minimo or fila == len(almacen) > inicio:
+                yield inicio, fila
+                inicio = fila
+
+    @staticmethod
+    def _codificar_cultivos(almacen: AlmacenColumnar, inicio: int, fin: int) -> bytes:
+        partes = []
+        for columna in almacen.columnas():
+            parte = columna[inicio:fin]
+            if _INVERTIR_BYTES:
+                parte.byteswap()
+            partes.append(parte.tobytes())
+        return b"".join(partes)
+
+    @staticmethod
+    def _decodificar_cultivos(contenido: bytes, columnas: list[array]) -> None:
+        """Agrega al final de cada columna su parte del bloque."""
+        cantidad = len(contenido) // sum(columna.itemsize for columna in columnas)
+        offset = 0
+        for columna in columnas:
+            parte = array(columna.typecode)
+            largo = cantidad * parte.itemsize
+            parte.frombytes(contenido[offset:offset + largo])
+            if _INVERTIR_BYTES:
+                parte.byteswap()
+            columna.extend(parte)
+            offset += largo
+
+    def _guardar_plantacion(self, registro: RegistroForestal, plantacion: Plantacion) -> tuple[str, int]:
+        almacen = plantacion.cultivos
+        if not plantacion.es_columnar:
+            almacen = AlmacenColumnar()
+            almacen.extend(plantacion.cultivos)
+        nuevos = 0
+        bloques_cultivos = []
+        for inicio, fin in self._cortes(almacen):
+            clave, nuevo = self._bloques.guardar(self._codificar_cultivos(almacen, inicio, fin))
+            bloques_cultivos.append(clave)
+            nuevos += nuevo
+        datos = {
+            "nombre": plantacion.nombre,
+            "id_padron": registro.padron_de(plantacion.nombre),
+            "superficie": plantacion.superficie,
+            "agua_disponible": plantacion.agua_disponible,
+            "columnar": plantacion.es_columnar,
+            "cultivos": bloques_cultivos,
+        }
+        clave, nuevo = self._bloques.guardar(json.dumps(datos, sort_keys=True).encode("utf-8"))
+        return clave, nuevos + nuevo
+
+    def guardar(self, registro: RegistroForestal, nombre_version: str) -> int:
+        """
+        Guarda una versión del registro y devuelve cuántos bloques nuevos se
+        escribieron. El archivo de versión se reemplaza de forma atómica
+        después de sincronizar los bloques.
+        """
+        try:
+            claves = []
+            nuevos = 0
+            for plantacion in registro.listar_todas():
+                clave, escritos = self._guardar_plantacion(registro, plantacion)
+                claves.append(clave)
+                nuevos += escritos
+            self._bloques.sincronizar()
+            escribir_atomico(
+                self._ruta_version(nombre_version),
+                partial(_escribir_json, {"version": VERSION_FORMATO, "plantaciones": claves}),
+            )
+            return nuevos
+        except Exception as e:
+            raise PersistenciaException(str(e))
+
+    def _leer_version(self, nombre_version: str) -> list[str]:
+        with open(self._ruta_version(nombre_version), "r", encoding="utf-8") as archivo:
+            version = json.load(archivo)
+        if version.get("version") != VERSION_FORMATO:
+            raise ValueError(f"Versión de formato no soportada: {version.get('version')}.")
+        return version["plantaciones"]
+
+    def _leer_plantacion(self, clave: str) -> dict:
+        return json.loads(self._bloques.leer(clave))
+
+    def cargar(self, nombre_version: str) -> RegistroForestal:
+        try:
+            registro = RegistroForestal()
+            # Bloques ya leídos en esta carga: los lotes repetidos comparten bloque
+            leidos: dict[str, bytes] = {}
+            for clave in self._leer_version(nombre_version):
+                datos = self._leer_plantacion(clave)
+                columnas = [array(typecode) for _, typecode in COLUMNAS]
+                for clave_cultivos in datos["cultivos"]:
+                    contenido = leidos.get(clave_cultivos)
+                    if contenido is None:
+                        contenido = leidos[clave_cultivos] = self._bloques.leer(clave_cultivos)
+                    self._decodificar_cultivos(contenido, columnas)
+                almacen = AlmacenColumnar.desde_columnas(columnas)
+                plantacion = Plantacion.desde_cultivos(
+                    datos["nombre"], datos["superficie"], datos["agua_disponible"],
+                    almacen if datos["columnar"] else almacen.materializar(),
+                )
+                registro.agregar_plantacion(plantacion, datos["id_padron"])
+            return registro
+        except Exception as e:
+            raise PersistenciaException(str(e))
+
+    def versiones(self) -> list[str]:
+        """Nombres de las versiones guardadas, en orden alfabético."""
+        return sorted(
+            nombre[:-len(EXTENSION_VERSION)] for nombre in os.listdir(self._ruta_base)
+            if nombre.endswith(EXTENSION_VERSION)
+        )
+
+    def eliminar_version(self, nombre_version: str) -> bool:
+        """Quita la versión; sus bloques se liberan con recolectar()."""
+        ruta = self._ruta_version(nombre_version)
+        if not os.path.exists(ruta):
+            return False
+        os.remove(ruta)
+        return True
+
+    def recolectar(self) -> int:
+        """Elimina los bloques que ninguna versión usa y devuelve cuántos borró."""
+        try:
+            usados = set()
+            for nombre_version in self.versiones():
+                for clave in self._leer_version(nombre_version):
+                    if clave not in usados:
+                        usados.add(clave)
+                        usados.update(self._leer_plantacion(clave)["cultivos"])
+            return self._bloques.eliminar(self._bloques.claves() - usados)
+        except Exception as e:
+            raise PersistenciaException(str(e))
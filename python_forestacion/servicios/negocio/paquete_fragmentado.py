@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import TIPOS_COLUMNARES
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.registro_perezoso import RegistroPerezoso
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.servicios.negocio.persistencia import formato_pickle
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import escribir_atomico
+from constante import (
+    DIRECTORIO_DATA, EXTENSION_DATA, NOMBRE_MANIFIESTO, UMBRAL_CARGA_PARALELA, COMPRESION_FRAGMENTOS,
+    CAPACIDAD_CACHE_PLANTACIONES,
+)
+
+VERSION_MANIFIESTO = 1
+_TIPOS_POR_NOMBRE = {tipo.__name__: tipo for tipo in TIPOS_COLUMNARES}
+
+
+def _leer_fragmento(ruta: str):
+    with open(ruta, "rb") as archivo:
+        plantacion, _ = formato_pickle.leer(archivo)
+    return plantacion
+
+
+def _cargar_fragmento(rutas: dict[str, str], nombre: str):
+    return _leer_fragmento(rutas[nombre])
+
+
+def _resumen_indexable(resumen: dict | None) -> dict | None:
+    """Resumen del manifiesto con los tipos como clases, o None si no se puede usar."""
+    if resumen is None:
+        return None
+    conteo = {}
+    for nombre_tipo, cantidad in resumen["conteo_por_tipo"].items():
+        tipo = _TIPOS_POR_NOMBRE.get(nombre_tipo)
+        if tipo is None:
+            return None
+        conteo[tipo] = cantidad
+    return {"superficie": resumen["superficie"], "agua_disponible": resumen["agua_disponible"],
+            "conteo_por_tipo": conteo}
+
+
+class PaqueteFragmentado:
+    """
+    Persistencia de un RegistroForestal en un archivo por plantación dentro de
+    {ruta_base}/{nombre}/, más un manifiesto JSON con el orden, los archivos,
+    el padrón y la huella (Plantacion.huella) de cada plantación.
+
+    guardar reescribe solo las plantaciones cuya huella no coincide con la
+    del manifiesto, es decir, las que cambiaron desde que se guardaron en
+    este destino (sin importar lo que se haya guardado en otros, como la
+    base SQLite), y las que no tienen archivo. cargar lee los fragmentos
+    con un pool de hilos cuando hay al menos UMBRAL_CARGA_PARALELA
+    comprimidos: la lectura y la descompresión liberan el GIL y se solapan
+    con la deserialización de los demás, sin copiar los datos entre
+    procesos. Por defecto se usa un hilo por CPU; con una sola CPU, o con
+    compresion=None, se leen todos en el hilo que llama.
+    """
+
+    def __init__(self, ruta_base: str = DIRECTORIO_DATA, hilos: int | None = None,
+                 protocolo: int | None = None, compresion: str | None = COMPRESION_FRAGMENTOS):
+        self._protocolo = formato_pickle.validar_opciones(protocolo, compresion, False)
+        self._compresion = compresion
+        self._ruta_base = ruta_base
+        self._hilos = hilos
+
+    def _directorio(self, nombre_archivo: str) -> str:
+        return os.path.join(self._ruta_base, nombre_archivo)
+
+    @staticmethod
+    def archivo_de(nombre_plantacion: str) -> str:
+        """Nombre de archivo estable y válido en cualquier sistema para una plantación."""
+        return hashlib.sha1(nombre_plantacion.encode("utf-8")).hexdigest()[:20] + EXTENSION_DATA
+
+    def _leer_manifiesto(self, directorio: str) -> list[dict] | None:
+        ruta = os.path.join(directorio, NOMBRE_MANIFIESTO)
+        if not os.path.exists(ruta):
+            return None
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            manifiesto = json.load(archivo)
+        if manifiesto.get("version") != VERSION_MANIFIESTO:
+            raise ValueError(f"Versión de manifiesto no soportada: {manifiesto.get('version')}.")
+        return manifiesto["plantaciones"]
+
+    @staticmethod
+    def _escribir_json(contenido: dict, archivo) -> None:
+        archivo.write(json.dumps(contenido, ensure_ascii=False).encode("utf-8"))
+
+    def _escribir(self, plantacion, archivo) -> None:
+        formato_pickle.escribir(archivo, plantacion, self._protocolo, self._compresion)
+
+    @staticmethod
+    def _resumen_de(plantacion) -> dict:
+        """Datos que usa RegistroPerezoso para indexar sin cargar la plantación."""
+        return {
+            "superficie": plantacion.superficie,
+            "agua_disponible": plantacion.agua_disponible,
+            "conteo_por_tipo": {tipo.__name__: cantidad for tipo, cantidad in plantacion.contar_por_tipo().items()},
+        }
+
+    def guardar(self, registro: RegistroForestal, nombre_archivo: str) -> int:
+        """
+        Guarda el registro y devuelve cuántas plantaciones se escribieron.
+        Cada fragmento y el manifiesto se reemplazan de forma atómica; el
+        manifiesto se escribe al final y después se borran los fragmentos de
+        plantaciones que ya no están en el registro.
+        """
+        directorio = self._directorio(nombre_archivo)
+        try:
+            os.makedirs(directorio, exist_ok=True)
+            anteriores = {entrada["nombre"]: entrada for entrada in self._leer_manifiesto(directorio) or ()}
+            entradas = []
+            escritas = []
+            for plantacion in registro.listar_todas():
+                nombre = plantacion.nombre
+                archivo = self.archivo_de(nombre)
+                ruta = os.path.join(directorio, archivo)
+                anterior = anteriores.get(nombre)
+                # La huella se toma antes de escribir, para que el fragmento la incluya
+                huella = plantacion.huella
+                if anterior is None or anterior.get("huella") != huella or not os.path.exists(ruta):
+                    escribir_atomico(ruta, partial(self._escribir, plantacion), sincronizar=False)
+                    escritas.append(plantacion)
+                    compresion = self._compresion
+                    resumen = self._resumen_de(plantacion)
+                else:
+                    compresion = anterior.get("compresion")
+                    resumen = anterior.get("resumen") or self._resumen_de(plantacion)
+                entradas.append({
+                    "nombre": nombre,
+                    "archivo": archivo,
+                    "id_padron": registro.padron_de(nombre),
+                    "compresion": compresion,
+                    "huella": huella,
+                    "resumen": resumen,
+                })
+
+            manifiesto = {"version": VERSION_MANIFIESTO, "plantaciones": entradas}
+            # Sincroniza también el directorio, lo que hace durables los fragmentos
+            escribir_atomico(os.path.join(directorio, NOMBRE_MANIFIESTO), partial(self._escribir_json, manifiesto))
+
+            actuales = {entrada["nombre"] for entrada in entradas}
+            for nombre, entrada in anteriores.items():
+                ruta = os.path.join(directorio, entrada["archivo"])
+                if nombre not in actuales and os.path.exists(ruta):
+                    os.remove(ruta)
+        except Exception as e:
+            raise PersistenciaException(str(e))
+
+        if isinstance(registro, RegistroPerezoso):
+            # Las plantaciones que expulse se releen de los fragmentos recién escritos
+            rutas = {entrada["nombre"]: os.path.join(directorio, entrada["archivo"]) for entrada in entradas}
+            registro.marcar_guardado(partial(_cargar_fragmento, rutas))
+        return len(escritas)
+
+    def cargar(self, nombre_archivo: str) -> RegistroForestal:
+        directorio = self._directorio(nombre_archivo)
+        try:
+            entradas = self._leer_manifiesto(directorio)
+            if entradas is None:
+                raise PersistenciaException(f"No existe el manifiesto de {nombre_archivo}.")
+            rutas = [os.path.join(directorio, entrada["archivo"]) for entrada in entradas]
+            comprimidos = sum(1 for entrada in entradas if entrada.get("compresion"))
+
+            hilos = self._hilos or os.cpu_count() or 1
+            if hilos > 1 and comprimidos >= UMBRAL_CARGA_PARALELA:
+                with ThreadPoolExecutor(max_workers=hilos) as pool:
+                    plantaciones = list(pool.map(_leer_fragmento, rutas))
+            else:
+                plantaciones = map(_leer_fragmento, rutas)
+
+            registro = RegistroForestal()
+            for entrada, plantacion in zip(entradas, plantaciones):
+                plantacion.marcar_guardada()
+                registro.agregar_plantacion(plantacion, entrada["id_padron"])
+            return registro
+        except PersistenciaException:
+            raise
+        except Exception as e:
+            raise PersistenciaException(str(e))
+
+    def cargar_perezoso(self, nombre_archivo: str,
+                        capacidad: int = CAPACIDAD_CACHE_PLANTACIONES) -> RegistroPerezoso:
+        """
+        Devuelve un RegistroPerezoso que lee cada fragmento recién cuando se
+        usa su plantación y retiene a lo sumo `capacidad` en memoria. Los
+        índices se arman con los resúmenes del manifiesto; las plantaciones
+        sin resumen utilizable (manifiestos anteriores o tipos de cultivo sin
+        formato columnar) se cargan para indexarlas.
+        """
+        directorio = self._directorio(nombre_archivo)
+        try:
+            entradas = self._leer_manifiesto(directorio)
+            if entradas is None:
+                raise PersistenciaException(f"No existe el manifiesto de {nombre_archivo}.")
+            rutas = {entrada["nombre"]: os.path.join(directorio, entrada["archivo"]) for entrada in entradas}
+            cargador = partial(_cargar_fragmento, rutas)
+            resumenes = {}
+            for entrada in entradas:
+                resumen = _resumen_indexable(entrada.get("resumen"))
+                if resumen is None:
+                    plantacion = cargador(entrada["nombre"])
+                    resumen = {
+                        "superficie": plantacion.superficie,
+                        "agua_disponible": plantacion.agua_disponible,
+                        "conteo_por_tipo": plantacion.contar_por_tipo(),
+                    }
+                resumen["id_padron"] = entrada["id_padron"]
+                resumen["huella"] = entrada.get("huella")
+                resumenes[entrada["nombre"]] = resumen
+            return RegistroPerezoso(resumenes, cargador, capacidad)
+        except PersistenciaException:
+            raise
+        except Exception as e:
+            raise PersistenciaException(str(e))
@@ -0,0 +1,2 @@
+# Formatos y mecanismos de persistencia usados por Paquete.
+# Journal de mutaciones (write-ahead log) y snapshots.
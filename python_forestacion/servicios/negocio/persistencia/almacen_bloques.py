@@ -0,0 +1,78 @@
+import hashlib
+import os
+import zlib
+from functools import partial
+
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import escribir_atomico, sincronizar_directorio
+
+# Bytes del digest BLAKE2b que identifica cada bloque
+LARGO_DIGEST = 16
+
+
+def _volcar(contenido: bytes, archivo) -> None:
+    archivo.write(contenido)
+
+
+class AlmacenBloques:
+    """
+    Almacén de bloques direccionados por contenido: cada bloque se guarda
+    comprimido en un archivo cuyo nombre es el hash de su contenido, así que
+    un bloque repetido (en la misma versión o en otra) se escribe una vez.
+    """
+
+    def __init__(self, directorio: str):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+
+    @staticmethod
+    def hash_de(contenido: bytes) -> str:
+        return hashlib.blake2b(contenido, digest_size=LARGO_DIGEST).hexdigest()
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave)
+
+    def existe(self, clave: str) -> bool:
+        return os.path.exists(self._ruta(clave))
+
+    def guardar(self, contenido: bytes) -> tuple[str, bool]:
+        """
+        Guarda el bloque si no existe. Los archivos nuevos no sincronizan el
+        directorio: llamar a sincronizar() al terminar el lote.
+
+        Returns:
+            (clave del bloque, True si se escribió).
+        """
+        clave = self.hash_de(contenido)
+        if self.existe(clave):
+            return clave, False
+        escribir_atomico(self._ruta(clave), partial(_volcar, zlib.compress(contenido)), sincronizar=False)
+        return clave, True
+
+    def sincronizar(self) -> None:
+        sincronizar_directorio(self.directorio)
+
+    def leer(self, clave: str) -> bytes:
+        """
+        Raises:
+            ValueError: si el contenido no coincide con su hash.
+        """
+        with open(self._ruta(clave), "rb") as archivo:
+            contenido = zlib.decompress(archivo.read())
+        if self.hash_de(contenido) != clave:
+            raise ValueError(f"Bloque dañado: {clave}")
+        return contenido
+
+    def claves(self) -> set[str]:
+        return {nombre for nombre in os.listdir(self.directorio) if not nombre.endswith(".tmp")}
+
+    def tamano_bytes(self) -> int:
+        """Bytes ocupados en disco por todos los bloques."""
+        return sum(os.path.getsize(self._ruta(clave)) for clave in self.claves())
+
+    def eliminar(self, claves) -> int:
+        cantidad = 0
+        for clave in claves:
+            if self.existe(clave):
+                os.remove(self._ruta(clave))
+                cantidad += 1
+        return cantidad
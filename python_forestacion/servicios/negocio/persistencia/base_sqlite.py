@@ -0,0 +1,370 @@
+import os
+import sqlite3
+from array import array
+from contextlib import contextmanager
+from datetime import date
+from itertools import groupby, repeat
+from operator import itemgetter
+
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import (
+    AlmacenColumnar, COLUMNAS, NOMBRES_COLUMNAS, TIPOS_COLUMNARES,
+)
+from python_forestacion.Entidades.terrenos.tierra import Tierra
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.Entidades.personal.apto_medico import AptoMedico
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from constante import DIRECTORIO_DATA, NOMBRE_BASE_SQLITE
+
+# Campos de cultivo por los que se puede filtrar en consultar_cultivos
+CAMPOS_CULTIVO = ("superficie", "altura", "produccion_anual", "dias_crecimiento", "profundidad")
+
+_COLUMNAS_CULTIVO = ", ".join(NOMBRES_COLUMNAS)
+
+ESQUEMA = f"""
+CREATE TABLE IF NOT EXISTS tierras (
+    id_padron INTEGER PRIMARY KEY,
+    superficie REAL NOT NULL,
+    domicilio TEXT NOT NULL,
+    nombre_plantacion TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plantaciones (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL UNIQUE,
+    superficie REAL NOT NULL,
+    agua_disponible REAL NOT NULL,
+    id_padron INTEGER,
+    columnar INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_plantaciones_padron ON plantaciones (id_padron);
+CREATE TABLE IF NOT EXISTS cultivos (
+    plantacion INTEGER NOT NULL REFERENCES plantaciones (id) ON DELETE CASCADE,
+    tipo INTEGER NOT NULL,
+    superficie REAL NOT NULL,
+    altura REAL NOT NULL,
+    produccion_anual REAL NOT NULL,
+    dias_crecimiento INTEGER NOT NULL,
+    regada INTEGER NOT NULL,
+    profundidad REAL NOT NULL,
+    tipo_aceituna INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cultivos_plantacion ON cultivos (plantacion);
+CREATE INDEX IF NOT EXISTS idx_cultivos_produccion ON cultivos (tipo, produccion_anual);
+CREATE INDEX IF NOT EXISTS idx_cultivos_altura ON cultivos (tipo, altura);
+CREATE TABLE IF NOT EXISTS trabajadores (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    edad INTEGER NOT NULL,
+    apto_emision TEXT,
+    apto_valido_hasta TEXT,
+    apto_observaciones TEXT
+);
+CREATE TABLE IF NOT EXISTS tareas (
+    dni TEXT NOT NULL REFERENCES trabajadores (dni) ON DELETE CASCADE,
+    orden INTEGER NOT NULL,
+    descripcion TEXT NOT NULL,
+    fecha TEXT NOT NULL,
+    herramienta TEXT NOT NULL,
+    estado_herramienta TEXT NOT NULL,
+    completada INTEGER NOT NULL,
+    PRIMARY KEY (dni, orden)
+);
+CREATE INDEX IF NOT EXISTS idx_tareas_pendientes ON tareas (completada, fecha);
+"""
+
+
+class BaseSQLite:
+    """
+    Persistencia de tierras, plantaciones, cultivos, trabajadores y tareas
+    en una base SQLite local (modo WAL).
+
+    Los cultivos se guardan con las mismas columnas que AlmacenColumnar, una
+    fila por cultivo; guardar una plantación reemplaza todas sus filas con
+    un único executemany dentro de una transacción. La ubicación espacial
+    de los cultivos no se persiste.
+
+    Los errores de SQLite se informan como PersistenciaException.
+    """
+
+    def __init__(self, ruta: str = os.path.join(DIRECTORIO_DATA, NOMBRE_BASE_SQLITE)):
+        directorio = os.path.dirname(ruta)
+        if directorio and ruta != ":memory:":
+            os.makedirs(directorio, exist_ok=True)
+        try:
+            self._conexion = sqlite3.connect(ruta)
+            self._conexion.execute("PRAGMA journal_mode = WAL")
+            self._conexion.execute("PRAGMA synchronous = NORMAL")
+            self._conexion.execute("PRAGMA foreign_keys = ON")
+            self._conexion.executescript(ESQUEMA)
+        except sqlite3.Error as e:
+            raise PersistenciaException(str(e))
+
+    def __enter__(self) -> "BaseSQLite":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        self._conexion.close()
+
+    @contextmanager
+    def _transaccion(self):
+        """Cursor dentro de una transacción: confirma al salir o revierte ante un error."""
+        try:
+            with self._conexion:
+                yield self._conexion.cursor()
+        except sqlite3.Error as e:
+            raise PersistenciaException(str(e))
+
+    def _consultar(self, sql: str, parametros=()) -> list[tuple]:
+        try:
+            return self._conexion.execute(sql, parametros).fetchall()
+        except sqlite3.Error as e:
+            raise PersistenciaException(str(e))
+
+    # Tierras y plantaciones
+
+    @staticmethod
+    def _guardar_tierras(cursor, tierras) -> None:
+        cursor.executemany(
+            "INSERT OR REPLACE INTO tierras (id_padron, superficie, domicilio, nombre_plantacion) VALUES (?, ?, ?, ?)",
+            ((t.id_padron, t.superficie, t.domicilio, t.nombre_plantacion) for t in tierras),
+        )
+
+    @staticmethod
+    def _guardar_plantaciones(cursor, pares) -> int:
+        cantidad = 0
+        for plantacion, id_padron in pares:
+            (id_plantacion,) = cursor.execute(
+                "INSERT INTO plantaciones (nombre, superficie, agua_disponible, id_padron, columnar) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (nombre) DO UPDATE SET "
+                "superficie = excluded.superficie, agua_disponible = excluded.agua_disponible, "
+                "id_padron = excluded.id_padron, columnar = excluded.columnar RETURNING id",
+                (plantacion.nombre, plantacion.superficie, plantacion.agua_disponible,
+                 id_padron, int(plantacion.es_columnar)),
+            ).fetchone()
+            cursor.execute("DELETE FROM cultivos WHERE plantacion = ?", (id_plantacion,))
+            almacen = plantacion.cultivos
+            if not plantacion.es_columnar:
+                almacen = AlmacenColumnar()
+                almacen.extend(plantacion.cultivos)
+            cursor.executemany(
+                f"INSERT INTO cultivos (plantacion, {_COLUMNAS_CULTIVO}) VALUES (?{', ?' * len(COLUMNAS)})",
+                zip(repeat(id_plantacion), *almacen.columnas()),
+            )
+            cantidad += 1
+        return cantidad
+
+    def guardar_finca(self, tierra: Tierra, plantacion: Plantacion) -> None:
+        """Guarda la tierra y su plantación en una sola transacción."""
+        with self._transaccion() as cursor:
+            self._guardar_tierras(cursor, (tierra,))
+            self._guardar_plantaciones(cursor, ((plantacion, tierra.id_padron),))
+
+    def guardar_plantaciones(self, pares) -> int:
+        """
+        Inserta o reemplaza plantaciones con todos sus cultivos, en una sola
+        transacción.
+
+        Args:
+            pares: Iterable de (plantacion, id_padron o None).
+
+        Returns:
+            Cantidad de plantaciones guardadas.
+        """
+        with self._transaccion() as cursor:
+            return self._guardar_plantaciones(cursor, pares)
+
+    def importar(self, registro: RegistroForestal, tierras=()) -> int:
+        """Carga masiva de un registro (y sus tierras) en una sola transacción."""
+        with self._transaccion() as cursor:
+            self._guardar_tierras(cursor, tierras)
+            return self._guardar_plantaciones(
+                cursor, ((p, registro.padron_de(p.nombre)) for p in registro.listar_todas()),
+            )
+
+    def eliminar_plantacion(self, nombre: str) -> bool:
+        with self._transaccion() as cursor:
+            return cursor.execute("DELETE FROM plantaciones WHERE nombre = ?", (nombre,)).rowcount > 0
+
+    def listar_tierras(self) -> list[Tierra]:
+        """Tierras guardadas, sin plantación asociada (ver Tierra.set_plantacion)."""
+        return [Tierra(*fila) for fila in self._consultar(
+            "SELECT id_padron, superficie, domicilio, nombre_plantacion FROM tierras ORDER BY rowid"
+        )]
+
+    @staticmethod
+    def _almacen(filas) -> AlmacenColumnar:
+        # Transpone las filas a columnas; sin filas, columnas vacías
+        valores = list(zip(*filas)) or [()] * len(COLUMNAS)
+        return AlmacenColumnar.desde_columnas(
+            [array(typecode, columna) for (_, typecode), columna in zip(COLUMNAS, valores)]
+        )
+
+    @classmethod
+    def _plantacion(cls, nombre: str, superficie: float, agua: float, columnar: int, filas) -> Plantacion:
+        almacen = cls._almacen(filas)
+        plantacion = Plantacion.desde_cultivos(
+            nombre, superficie, agua, almacen if columnar else almacen.materializar(),
+        )
+        plantacion.marcar_guardada()
+        return plantacion
+
+    def cargar_plantacion(self, nombre: str) -> Plantacion | None:
+        encontradas = self._consultar(
+            "SELECT id, superficie, agua_disponible, columnar FROM plantaciones WHERE nombre = ?", (nombre,)
+        )
+        if not encontradas:
+            return None
+        id_plantacion, superficie, agua, columnar = encontradas[0]
+        filas = self._consultar(
+            f"SELECT {_COLUMNAS_CULTIVO} FROM cultivos WHERE plantacion = ? ORDER BY rowid", (id_plantacion,)
+        )
+        return self._plantacion(nombre, superficie, agua, columnar, filas)
+
+    def cargar_registro(self) -> RegistroForestal:
+        """Arma un RegistroForestal con todas las plantaciones, en orden de alta."""
+        plantaciones = self._consultar(
+            "SELECT id, nombre, superficie, agua_disponible, columnar, id_padron FROM plantaciones ORDER BY id"
+        )
+        filas = self._consultar(
+            f"SELECT plantacion, {_COLUMNAS_CULTIVO} FROM cultivos ORDER BY plantacion, rowid"
+        )
+        por_plantacion = {
+            id_plantacion: [fila[1:] for fila in grupo]
+            for id_plantacion, grupo in groupby(filas, itemgetter(0))
+        }
+        registro = RegistroForestal()
+        for id_plantacion, nombre, superficie, agua, columnar, id_padron in plantaciones:
+            plantacion = self._plantacion(nombre, superficie, agua, columnar, por_plantacion.get(id_plantacion, ()))
+            registro.agregar_plantacion(plantacion, id_padron)
+        return registro
+
+    def consultar_cultivos(self, tipo: type, campo: str | None = None,
+                           minimo=None, maximo=None) -> list[tuple[str, object]]:
+        """
+        Cultivos de la clase `tipo` (o subclases) con minimo <= campo <= maximo
+        (None: sin cota), resueltos en la base con sus índices.
+
+        Returns:
+            Pares (nombre de plantación, cultivo materializado).
+
+        Raises:
+            ValueError: si `campo` no es uno de CAMPOS_CULTIVO.
+        """
+        if campo is not None and campo not in CAMPOS_CULTIVO:
+            raise ValueError(f"Campo de cultivo no consultable: {campo!r}")
+        # Solo las clases que tienen el campo (las columnas ausentes valen 0)
+        codigos = [
+            codigo for codigo, clase in enumerate(TIPOS_COLUMNARES)
+            if issubclass(clase, tipo) and (campo is None or hasattr(clase, campo))
+        ]
+        if not codigos:
+            return []
+        condiciones = [f"c.tipo IN ({', '.join('?' * len(codigos))})"]
+        parametros = list(codigos)
+        if campo is not None and minimo is not None:
+            condiciones.append(f"c.{campo} >= ?")
+            parametros.append(minimo)
+        if campo is not None and maximo is not None:
+            condiciones.append(f"c.{campo} <= ?")
+            parametros.append(maximo)
+        filas = self._consultar(
+            f"SELECT p.nombre, {', '.join('c.' + nombre for nombre in NOMBRES_COLUMNAS)} "
+            f"FROM cultivos c JOIN plantaciones p ON p.id = c.plantacion "
+            f"WHERE {' AND '.join(condiciones)} ORDER BY c.plantacion, c.rowid",
+            parametros,
+        )
+        cultivos = self._almacen(fila[1:] for fila in filas).materializar()
+        return [(fila[0], cultivo) for fila, cultivo in zip(filas, cultivos)]
+
+    # Trabajadores y tareas
+
+    def guardar_trabajadores(self, trabajadores) -> None:
+        """Inserta o reemplaza trabajadores con su apto médico y sus tareas."""
+        with self._transaccion() as cursor:
+            for trabajador in trabajadores:
+                apto = trabajador.apto_medico
+                cursor.execute(
+                    "INSERT INTO trabajadores (dni, nombre, edad, apto_emision, apto_valido_hasta, apto_observaciones) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (dni) DO UPDATE SET nombre = excluded.nombre, "
+                    "edad = excluded.edad, apto_emision = excluded.apto_emision, "
+                    "apto_valido_hasta = excluded.apto_valido_hasta, apto_observaciones = excluded.apto_observaciones",
+                    (trabajador.dni, trabajador.nombre, trabajador.edad,
+                     apto and apto.fecha_emision.isoformat(), apto and apto.valido_hasta.isoformat(),
+                     apto and apto.observaciones),
+                )
+                cursor.execute("DELETE FROM tareas WHERE dni = ?", (trabajador.dni,))
+                cursor.executemany(
+                    "INSERT INTO tareas (dni, orden, descripcion, fecha, herramienta, estado_herramienta, completada) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((trabajador.dni, orden, t.descripcion, t.fecha.isoformat(), t.herramienta.nombre,
+                      t.herramienta.estado, int(t.completada)) for orden, t in enumerate(trabajador.tareas)),
+                )
+
+    def eliminar_trabajador(self, dni: str) -> bool:
+        with self._transaccion() as cursor:
+            return cursor.execute("DELETE FROM trabajadores WHERE dni = ?", (dni,)).rowcount > 0
+
+    @staticmethod
+    def _tarea(descripcion: str, fecha: str, herramienta: str, estado: str, completada: int) -> Tarea:
+        tarea = Tarea(descripcion, date.fromisoformat(fecha), Herramienta(herramienta, estado))
+        tarea.completada = bool(completada)
+        return tarea
+
+    def cargar_trabajadores(self) -> list[Trabajador]:
+        """Trabajadores guardados con sus tareas (cada tarea con su propia Herramienta)."""
+        tareas = self._consultar(
+            "SELECT dni, descripcion, fecha, herramienta, estado_herramienta, completada FROM tareas ORDER BY dni, orden"
+        )
+        por_dni = {
+            dni: [self._tarea(*fila[1:]) for fila in grupo]
+            for dni, grupo in groupby(tareas, itemgetter(0))
+        }
+        trabajadores = []
+        for dni, nombre, edad, emision, valido_hasta, observaciones in self._consultar(
+            "SELECT dni, nombre, edad, apto_emision, apto_valido_hasta, apto_observaciones "
+            "FROM trabajadores ORDER BY rowid"
+        ):
+            trabajador = Trabajador(nombre, dni, edad)
+            if emision is not None:
+                trabajador.asignar_apto_medico(
+                    AptoMedico(date.fromisoformat(emision), date.fromisoformat(valido_hasta), observaciones)
+                )
+            trabajador.tareas = por_dni.get(dni, [])
+            trabajadores.append(trabajador)
+        return trabajadores
+
+    def consultar_tareas(self, completada: bool | None = None, desde: date | None = None,
+                         hasta: date | None = None) -> list[tuple[str, Tarea]]:
+        """
+        Tareas filtradas por estado y por fecha (desde <= fecha <= hasta;
+        None: sin filtro).
+
+        Returns:
+            Pares (dni del trabajador, tarea), ordenados por fecha.
+        """
+        condiciones = []
+        parametros = []
+        if completada is not None:
+            condiciones.append("completada = ?")
+            parametros.append(int(completada))
+        if desde is not None:
+            condiciones.append("fecha >= ?")
+            parametros.append(desde.isoformat())
+        if hasta is not None:
+            condiciones.append("fecha <= ?")
+            parametros.append(hasta.isoformat())
+        donde = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        return [
+            (fila[0], self._tarea(*fila[1:]))
+            for fila in self._consultar(
+                "SELECT dni, descripcion, fecha, herramienta, estado_herramienta, completada "
+                f"FROM tareas {donde} ORDER BY fecha, dni, orden",
+                parametros,
+            )
+        ]
@@ -0,0 +1,155 @@
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from functools import partial
+
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.registro_perezoso import RegistroPerezoso
+from constante import CAPACIDAD_CACHE_CARGA_BYTES, MODOS_CACHE_CARGA
+
+
+def _copia_plantacion(serializadas: dict[str, bytes], nombre: str):
+    return pickle.loads(serializadas[nombre])
+
+
+def _instantanea_registro(registro: RegistroForestal) -> tuple:
+    """(resúmenes, plantaciones serializadas por nombre) de un registro."""
+    resumenes = {}
+    serializadas = {}
+    for plantacion in registro.listar_todas():
+        resumenes[plantacion.nombre] = {
+            "id_padron": registro.padron_de(plantacion.nombre),
+            "superficie": plantacion.superficie,
+            "agua_disponible": plantacion.agua_disponible,
+            "conteo_por_tipo": plantacion.contar_por_tipo(),
+            "huella": plantacion.huella,
+        }
+        serializadas[plantacion.nombre] = pickle.dumps(plantacion, protocol=5)
+    return resumenes, serializadas
+
+
+class CacheCarga:
+    """
+    Caché de objetos cargados desde archivo, compartible entre varios
+    Paquete (y servicios) del proceso. Cada entrada se identifica por la
+    ruta y se valida con el tamaño, el mtime y el inodo del archivo: si el
+    archivo cambió (un guardado lo reemplaza de forma atómica, con inodo
+    nuevo) se vuelve a cargar.
+
+    El único modo es "copia": se guarda el objeto serializado en memoria
+    (pickle 5) y cada carga devuelve una copia independiente, así que nadie
+    puede modificar por descuido lo que otro cargó. Un RegistroForestal se
+    guarda por plantación y se entrega siempre (también en la primera
+    carga) como RegistroPerezoso: cada plantación se copia recién cuando se
+    usa, así que abrir el registro para modificar unas pocas no paga la
+    copia de todas. RegistroPerezoso es un RegistroForestal (misma
+    interfaz, isinstance se cumple y al guardarlo se escribe como
+    RegistroForestal), pero type() es distinto. Las subclases de
+    RegistroForestal se copian enteras y conservan su tipo.
+
+    El límite de memoria es `capacidad_bytes`, medido con el tamaño del
+    objeto serializado; al superarlo se expulsan las entradas menos usadas
+    recientemente. Un objeto más grande que la capacidad no se guarda.
+    Los contadores `aciertos`, `fallos` y `expulsiones` permiten ver si la
+    caché compensa la memoria que ocupa.
+    """
+
+    def __init__(self, capacidad_bytes: int = CAPACIDAD_CACHE_CARGA_BYTES, modo: str = "copia"):
+        if capacidad_bytes <= 0:
+            raise ValueError("La capacidad de la caché debe ser positiva.")
+        if modo not in MODOS_CACHE_CARGA:
+            raise ValueError(f"Modo no soportado: {modo!r}. Opciones: {', '.join(MODOS_CACHE_CARGA)}.")
+        self._capacidad_bytes = capacidad_bytes
+        self._modo = modo
+        self._candado = threading.Lock()
+        # ruta -> (firma del archivo, contenido, bytes), de la menos a la más reciente
+        self._entradas: OrderedDict[str, tuple] = OrderedDict()
+        self._tamano_bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    @property
+    def modo(self) -> str:
+        return self._modo
+
+    @property
+    def tamano_bytes(self) -> int:
+        return self._tamano_bytes
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    @staticmethod
+    def _firma(ruta: str) -> tuple:
+        estado = os.stat(ruta)
+        return estado.st_size, estado.st_mtime_ns, estado.st_ino
+
+    def obtener(self, ruta: str, cargar):
+        """
+        Devuelve una copia del objeto de `ruta`, usando la entrada en
+        caché si el archivo no cambió; si no, lo carga con `cargar(ruta)`.
+
+        Raises:
+            FileNotFoundError: si el archivo no existe.
+        """
+        ruta = os.path.abspath(ruta)
+        firma = self._firma(ruta)
+        with self._candado:
+            entrada = self._entradas.get(ruta)
+            if entrada is not None and entrada[0] == firma:
+                self._entradas.move_to_end(ruta)
+                self.aciertos += 1
+                return self._entregar(entrada[1])
+            self.fallos += 1
+
+        # La carga se hace fuera del candado: no bloquea a los demás archivos
+        objeto = cargar(ruta)
+        contenido, tamano = self._instantanea(objeto)
+        with self._candado:
+            self._descartar(ruta)
+            if tamano <= self._capacidad_bytes:
+                self._entradas[ruta] = (firma, contenido, tamano)
+                self._tamano_bytes += tamano
+                self._expulsar()
+        if type(contenido) is bytes:
+            # Nadie más tiene el objeto recién cargado: no hace falta copiarlo
+            return objeto
+        return self._entregar(contenido)
+
+    def _instantanea(self, objeto) -> tuple:
+        """(contenido a guardar, bytes que ocupa)."""
+        if type(objeto) is RegistroForestal:
+            resumenes, serializadas = _instantanea_registro(objeto)
+            return (resumenes, serializadas), sum(map(len, serializadas.values()))
+        datos = pickle.dumps(objeto, protocol=5)
+        return datos, len(datos)
+
+    def _entregar(self, contenido):
+        if type(contenido) is bytes:
+            return pickle.loads(contenido)
+        resumenes, serializadas = contenido
+        return RegistroPerezoso(resumenes, partial(_copia_plantacion, serializadas))
+
+    def _descartar(self, ruta: str) -> None:
+        entrada = self._entradas.pop(ruta, None)
+        if entrada is not None:
+            self._tamano_bytes -= entrada[2]
+
+    def _expulsar(self) -> None:
+        while self._tamano_bytes > self._capacidad_bytes:
+            _, (_, _, tamano) = self._entradas.popitem(last=False)
+            self._tamano_bytes -= tamano
+            self.expulsiones += 1
+
+    def invalidar(self, ruta: str) -> None:
+        """Quita la entrada de `ruta`, si la hay."""
+        with self._candado:
+            self._descartar(os.path.abspath(ruta))
+
+    def vaciar(self) -> None:
+        """Quita todas las entradas (los contadores se conservan)."""
+        with self._candado:
+            self._entradas.clear()
+            self._tamano_bytes = 0
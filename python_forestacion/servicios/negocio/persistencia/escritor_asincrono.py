@@ -0,0 +1,111 @@
+import atexit
+import os
+import threading
+from concurrent.futures import Future
+
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import (
+    escribir_atomico,
+    sincronizar_directorio,
+)
+
+
+class EscritorAsincrono:
+    """
+    Hilo escritor dedicado para guardar archivos fuera del hilo llamador.
+
+    Las escrituras pendientes se agrupan por ruta: si se encola una ruta que
+    todavía no empezó a escribirse, se reemplaza el contenido pendiente y se
+    devuelve el mismo Future (solo se escribe la versión más reciente). El
+    hilo toma todas las pendientes juntas, escribe cada una con
+    escribir_atomico y sincroniza cada directorio una sola vez por lote.
+
+    El hilo es daemon; para no perder escrituras encoladas, al arrancarlo se
+    registra cerrar con atexit y se quita al cerrar.
+    """
+
+    def __init__(self, nombre_hilo: str = "EscritorPaquete"):
+        self._nombre_hilo = nombre_hilo
+        self._condicion = threading.Condition()
+        # ruta -> (función de escritura, future), en orden de llegada
+        self._pendientes: dict[str, tuple] = {}
+        self._ocupado = False
+        self._cerrado = False
+        self._hilo: threading.Thread | None = None
+        self.escrituras = 0
+        self.agrupadas = 0
+
+    def encolar(self, ruta: str, escribir) -> Future:
+        """
+        Programa `escribir(archivo)` sobre `ruta` y devuelve un Future que
+        se resuelve con la ruta (o con PersistenciaException).
+
+        Raises:
+            RuntimeError: si el escritor ya fue cerrado.
+        """
+        with self._condicion:
+            if self._cerrado:
+                raise RuntimeError("El escritor asíncrono está cerrado.")
+            pendiente = self._pendientes.get(ruta)
+            if pendiente is None:
+                futuro = Future()
+            else:
+                futuro = pendiente[1]
+                self.agrupadas += 1
+            self._pendientes[ruta] = (escribir, futuro)
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._trabajar, name=self._nombre_hilo, daemon=True)
+                self._hilo.start()
+                atexit.register(self.cerrar)
+            self._condicion.notify_all()
+        return futuro
+
+    def _trabajar(self) -> None:
+        while True:
+            with self._condicion:
+                while not self._pendientes and not self._cerrado:
+                    self._condicion.wait()
+                if not self._pendientes:
+                    return
+                lote = self._pendientes
+                self._pendientes = {}
+                self._ocupado = True
+            self._escribir_lote(lote)
+            with self._condicion:
+                self._ocupado = False
+                self._condicion.notify_all()
+
+    def _escribir_lote(self, lote: dict) -> None:
+        completados = []
+        directorios = set()
+        for ruta, (escribir, futuro) in lote.items():
+            if not futuro.set_running_or_notify_cancel():
+                continue
+            try:
+                escribir_atomico(ruta, escribir, sincronizar=False)
+            except Exception as e:
+                futuro.set_exception(PersistenciaException(str(e)))
+                continue
+            directorios.add(os.path.dirname(ruta))
+            completados.append((futuro, ruta))
+        for directorio in directorios:
+            sincronizar_directorio(directorio)
+        self.escrituras += len(completados)
+        for futuro, ruta in completados:
+            futuro.set_result(ruta)
+
+    def esperar(self) -> None:
+        """Bloquea hasta que no quedan escrituras pendientes ni en curso."""
+        with self._condicion:
+            while self._pendientes or self._ocupado:
+                self._condicion.wait()
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente y detiene el hilo."""
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify_all()
+            hilo = self._hilo
+        if hilo is not None:
+            hilo.join()
+            atexit.unregister(self.cerrar)
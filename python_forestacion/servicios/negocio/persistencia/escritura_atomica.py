@@ -0,0 +1,43 @@
+"""Escritura de archivos a prueba de cortes: temporal, fsync y reemplazo atómico."""
+import os
+import uuid
+
+
+def sincronizar_directorio(directorio: str) -> None:
+    """Hace durable el renombre de archivos dentro del directorio (POSIX)."""
+    try:
+        descriptor = os.open(directorio or ".", os.O_RDONLY)
+    except OSError:
+        # Plataformas que no permiten abrir directorios (Windows)
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def escribir_atomico(ruta: str, escribir, sincronizar: bool = True) -> None:
+    """
+    Llama a `escribir(archivo)` sobre un temporal junto a `ruta`, lo sincroniza
+    y lo renombra sobre `ruta`: un corte deja el archivo anterior o el nuevo
+    completo, nunca uno truncado. Cada llamada usa un temporal con nombre
+    propio, así que dos escrituras simultáneas de la misma ruta (por ejemplo,
+    un guardado síncrono y uno asíncrono) no se pisan: gana la última. Con
+    sincronizar=False el llamador se encarga de sincronizar el directorio
+    (por ejemplo, una vez por lote).
+    """
+    temporal = f"{ruta}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temporal, "xb") as archivo:
+            escribir(archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+    if sincronizar:
+        sincronizar_directorio(os.path.dirname(ruta))
@@ -0,0 +1,367 @@
+"""
+Formato binario propio (struct/array) para las entidades del modelo, como
+alternativa a pickle en Paquete.
+
+    [cabecera][registro raíz]
+    registro = [etiqueta][largo del contenido][campos ...]
+
+Todo se escribe en little endian. Los cultivos de una plantación van como
+las columnas de un AlmacenColumnar, una tras otra. Cada registro lleva su
+largo: un lector solo lee los campos que conoce y saltea los que una
+versión posterior del esquema agregue al final, así que puede leer
+archivos de versiones más nuevas.
+
+Entidades soportadas: cultivos, Plantacion (también sus proxies), Tierra,
+RegistroForestal, Trabajador, Tarea y listas de ellas. Las tareas de un
+trabajador que comparten Herramienta la cargan como objetos separados.
+"""
+import struct
+import sys
+from array import array
+from datetime import date
+
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import AlmacenColumnar, COLUMNAS
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.proxy_plantacion import ProxyPlantacion
+from python_forestacion.Entidades.terrenos.tierra import Tierra
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.Entidades.personal.apto_medico import AptoMedico
+
+MAGICO = b"PFBIN\x00"
+VERSION_ESQUEMA = 1
+SIN_SECUENCIA = -1
+
+# mágico, versión del esquema, secuencia del journal (SIN_SECUENCIA si no hay)
+CABECERA = struct.Struct("<6sHq")
+# etiqueta, largo del contenido
+REGISTRO = struct.Struct("<BQ")
+LARGO_TEXTO = struct.Struct("<I")
+CANTIDAD = struct.Struct("<Q")
+BANDERA = struct.Struct("<B")
+# superficie, agua, columnar, cantidad de cultivos
+PLANTACION = struct.Struct("<ddBQ")
+# ancho, alto, tamaño de celda, cantidad de cultivos ubicados
+ESPACIAL = struct.Struct("<dddQ")
+# id de padrón, superficie
+TIERRA = struct.Struct("<qd")
+# tiene padrón, id de padrón
+PADRON = struct.Struct("<Bq")
+# fecha (ordinal), completada
+TAREA = struct.Struct("<iB")
+EDAD = struct.Struct("<i")
+# fecha de emisión y vencimiento (ordinales)
+APTO = struct.Struct("<ii")
+
+ETIQUETA_CULTIVO = 1
+ETIQUETA_PLANTACION = 2
+ETIQUETA_TIERRA = 3
+ETIQUETA_REGISTRO = 4
+ETIQUETA_TAREA = 5
+ETIQUETA_TRABAJADOR = 6
+ETIQUETA_LISTA = 7
+
+_INVERTIR_BYTES = sys.byteorder != "little"
+
+
+def _columna_a_bytes(columna: array) -> bytes:
+    if _INVERTIR_BYTES:
+        columna = array(columna.typecode, columna)
+        columna.byteswap()
+    return columna.tobytes()
+
+
+# Escritura
+
+def _texto(salida: bytearray, texto: str) -> None:
+    datos = texto.encode("utf-8")
+    salida += LARGO_TEXTO.pack(len(datos))
+    salida += datos
+
+
+def _registro(salida: bytearray, objeto) -> None:
+    codificador = _CODIFICADORES.get(type(objeto))
+    if codificador is None:
+        codificador = next((_CODIFICADORES[clase] for clase in type(objeto).__mro__ if clase in _CODIFICADORES), None)
+        if codificador is None:
+            raise TypeError(f"Tipo no soportado por el formato binario: {type(objeto).__name__}")
+    etiqueta, codificar = codificador
+    inicio = len(salida)
+    salida += REGISTRO.pack(etiqueta, 0)
+    codificar(salida, objeto)
+    REGISTRO.pack_into(salida, inicio, etiqueta, len(salida) - inicio - REGISTRO.size)
+
+
+def _codificar_cultivo(salida: bytearray, cultivo) -> None:
+    almacen = AlmacenColumnar()
+    almacen.append(cultivo)
+    for columna in almacen.columnas():
+        salida += _columna_a_bytes(columna)
+
+
+def _codificar_plantacion(salida: bytearray, plantacion) -> None:
+    almacen = plantacion.cultivos
+    if not plantacion.es_columnar:
+        almacen = AlmacenColumnar()
+        almacen.extend(plantacion.cultivos)
+    _texto(salida, plantacion.nombre)
+    salida += PLANTACION.pack(plantacion.superficie, plantacion.agua_disponible,
+                              int(plantacion.es_columnar), len(almacen))
+    for columna in almacen.columnas():
+        salida += _columna_a_bytes(columna)
+
+    espacial = plantacion.indice_espacial
+    salida += BANDERA.pack(espacial is not None)
+    if espacial is not None:
+        indices, xs, ys = array("q"), array("d"), array("d")
+        for indice, cultivo in enumerate(plantacion.cultivos):
+            posicion = espacial.posicion(cultivo)
+            if posicion is not None:
+                indices.append(indice)
+                xs.append(posicion[0])
+                ys.append(posicion[1])
+        salida += ESPACIAL.pack(espacial.ancho, espacial.alto, espacial.tamano_celda, len(indices))
+        for columna in (indices, xs, ys):
+            salida += _columna_a_bytes(columna)
+
+
+def _codificar_tierra(salida: bytearray, tierra: Tierra) -> None:
+    salida += TIERRA.pack(tierra.id_padron, tierra.superficie)
+    _texto(salida, tierra.domicilio)
+    _texto(salida, tierra.nombre_plantacion)
+    salida += BANDERA.pack(tierra.plantacion is not None)
+    if tierra.plantacion is not None:
+        _registro(salida, tierra.plantacion)
+
+
+def _codificar_registro(salida: bytearray, registro: RegistroForestal) -> None:
+    plantaciones = registro.listar_todas()
+    salida += CANTIDAD.pack(len(plantaciones))
+    for plantacion in plantaciones:
+        padron = registro.padron_de(plantacion.nombre)
+        salida += PADRON.pack(padron is not None, padron or 0)
+        _registro(salida, plantacion)
+
+
+def _codificar_tarea(salida: bytearray, tarea: Tarea) -> None:
+    _texto(salida, tarea.descripcion)
+    salida += TAREA.pack(tarea.fecha.toordinal(), int(tarea.completada))
+    _texto(salida, tarea.herramienta.nombre)
+    _texto(salida, tarea.herramienta.estado)
+
+
+def _codificar_trabajador(salida: bytearray, trabajador: Trabajador) -> None:
+    _texto(salida, trabajador.nombre)
+    _texto(salida, trabajador.dni)
+    salida += EDAD.pack(trabajador.edad)
+    apto = trabajador.apto_medico
+    salida += BANDERA.pack(apto is not None)
+    if apto is not None:
+        salida += APTO.pack(apto.fecha_emision.toordinal(), apto.valido_hasta.toordinal())
+        _texto(salida, apto.observaciones)
+    salida += CANTIDAD.pack(len(trabajador.tareas))
+    for tarea in trabajador.tareas:
+        _registro(salida, tarea)
+
+
+def _codificar_lista(salida: bytearray, objetos: list) -> None:
+    salida += CANTIDAD.pack(len(objetos))
+    for objeto in objetos:
+        _registro(salida, objeto)
+
+
+# clase -> (etiqueta, codificador); las subclases usan el de su clase base
+_CODIFICADORES = {
+    Pino: (ETIQUETA_CULTIVO, _codificar_cultivo),
+    Olivo: (ETIQUETA_CULTIVO, _codificar_cultivo),
+    Lechuga: (ETIQUETA_CULTIVO, _codificar_cultivo),
+    Zanahoria: (ETIQUETA_CULTIVO, _codificar_cultivo),
+    Plantacion: (ETIQUETA_PLANTACION, _codificar_plantacion),
+    ProxyPlantacion: (ETIQUETA_PLANTACION, _codificar_plantacion),
+    Tierra: (ETIQUETA_TIERRA, _codificar_tierra),
+    RegistroForestal: (ETIQUETA_REGISTRO, _codificar_registro),
+    Tarea: (ETIQUETA_TAREA, _codificar_tarea),
+    Trabajador: (ETIQUETA_TRABAJADOR, _codificar_trabajador),
+    list: (ETIQUETA_LISTA, _codificar_lista),
+}
+
+
+def codificar(objeto, secuencia: int | None = None) -> bytes:
+    """
+    Codifica el objeto con cabecera.
+
+    Raises:
+        TypeError: si el objeto (o algo que contiene) no tiene formato binario.
+        ValueError: si algún cultivo no tiene representación columnar.
+    """
+    salida = bytearray(CABECERA.pack(MAGICO, VERSION_ESQUEMA, SIN_SECUENCIA if secuencia is None else secuencia))
+    _registro(salida, objeto)
+    return bytes(salida)
+
+
+def escribir(archivo, objeto, secuencia: int | None = None) -> None:
+    archivo.write(codificar(objeto, secuencia))
+
+
+# Lectura
+
+class _Lector:
+    """Cursor sobre los bytes de un registro; no lee más allá de `fin`."""
+
+    __slots__ = ("_vista", "posicion", "fin")
+
+    def __init__(self, vista: memoryview, posicion: int, fin: int):
+        self._vista = vista
+        self.posicion = posicion
+        self.fin = fin
+
+    def bytes(self, largo: int) -> memoryview:
+        inicio = self.posicion
+        if inicio + largo > self.fin:
+            raise ValueError("Registro binario truncado.")
+        self.posicion += largo
+        return self._vista[inicio:self.posicion]
+
+    def struct(self, formato: struct.Struct) -> tuple:
+        return formato.unpack(self.bytes(formato.size))
+
+    def texto(self) -> str:
+        (largo,) = self.struct(LARGO_TEXTO)
+        return str(self.bytes(largo), "utf-8")
+
+    def columna(self, typecode: str, cantidad: int) -> array:
+        columna = array(typecode)
+        columna.frombytes(self.bytes(cantidad * columna.itemsize))
+        if _INVERTIR_BYTES:
+            columna.byteswap()
+        return columna
+
+    def registro(self):
+        etiqueta, largo = self.struct(REGISTRO)
+        fin = self.posicion + largo
+        if fin > self.fin:
+            raise ValueError("Registro binario truncado.")
+        decodificar = _DECODIFICADORES.get(etiqueta)
+        if decodificar is None:
+            raise ValueError(f"Etiqueta de registro desconocida: {etiqueta}.")
+        objeto = decodificar(_Lector(self._vista, self.posicion, fin))
+        # Los campos agregados por versiones posteriores quedan sin leer
+        self.posicion = fin
+        return objeto
+
+
+def _almacen(lector: _Lector, cantidad: int) -> AlmacenColumnar:
+    return AlmacenColumnar.desde_columnas([lector.columna(typecode, cantidad) for _, typecode in COLUMNAS])
+
+
+def _decodificar_cultivo(lector: _Lector):
+    return _almacen(lector, 1).materializar()[0]
+
+
+def _decodificar_plantacion(lector: _Lector) -> Plantacion:
+    nombre = lector.texto()
+    superficie, agua, columnar, cantidad = lector.struct(PLANTACION)
+    almacen = _almacen(lector, cantidad)
+    plantacion = Plantacion.desde_cultivos(
+        nombre, superficie, agua, almacen if columnar else almacen.materializar(),
+    )
+    (con_espacial,) = lector.struct(BANDERA)
+    if con_espacial:
+        ancho, alto, tamano_celda, ubicados = lector.struct(ESPACIAL)
+        indices = lector.columna("q", ubicados)
+        xs = lector.columna("d", ubicados)
+        ys = lector.columna("d", ubicados)
+        plantacion.habilitar_indice_espacial(ancho, alto, tamano_celda)
+        cultivos = plantacion.cultivos
+        for indice, x, y in zip(indices, xs, ys):
+            plantacion.ubicar_cultivo(cultivos[indice], x, y)
+    return plantacion
+
+
+def _decodificar_tierra(lector: _Lector) -> Tierra:
+    id_padron, superficie = lector.struct(TIERRA)
+    tierra = Tierra(id_padron, superficie, lector.texto(), lector.texto())
+    (con_plantacion,) = lector.struct(BANDERA)
+    if con_plantacion:
+        tierra.set_plantacion(lector.registro())
+    return tierra
+
+
+def _decodificar_registro(lector: _Lector) -> RegistroForestal:
+    registro = RegistroForestal()
+    (cantidad,) = lector.struct(CANTIDAD)
+    for _ in range(cantidad):
+        con_padron, padron = lector.struct(PADRON)
+        registro.agregar_plantacion(lector.registro(), padron if con_padron else None)
+    return registro
+
+
+def _decodificar_tarea(lector: _Lector) -> Tarea:
+    descripcion = lector.texto()
+    fecha, completada = lector.struct(TAREA)
+    tarea = Tarea(descripcion, date.fromordinal(fecha), Herramienta(lector.texto(), lector.texto()))
+    tarea.completada = bool(completada)
+    return tarea
+
+
+def _decodificar_trabajador(lector: _Lector) -> Trabajador:
+    trabajador = Trabajador(lector.texto(), lector.texto(), lector.struct(EDAD)[0])
+    (con_apto,) = lector.struct(BANDERA)
+    if con_apto:
+        emision, valido_hasta = lector.struct(APTO)
+        trabajador.asignar_apto_medico(
+            AptoMedico(date.fromordinal(emision), date.fromordinal(valido_hasta), lector.texto())
+        )
+    (cantidad,) = lector.struct(CANTIDAD)
+    for _ in range(cantidad):
+        trabajador.asignar_tarea(lector.registro())
+    return trabajador
+
+
+def _decodificar_lista(lector: _Lector) -> list:
+    (cantidad,) = lector.struct(CANTIDAD)
+    return [lector.registro() for _ in range(cantidad)]
+
+
+_DECODIFICADORES = {
+    ETIQUETA_CULTIVO: _decodificar_cultivo,
+    ETIQUETA_PLANTACION: _decodificar_plantacion,
+    ETIQUETA_TIERRA: _decodificar_tierra,
+    ETIQUETA_REGISTRO: _decodificar_registro,
+    ETIQUETA_TAREA: _decodificar_tarea,
+    ETIQUETA_TRABAJADOR: _decodificar_trabajador,
+    ETIQUETA_LISTA: _decodificar_lista,
+}
+
+
+def es_binario(cabecera: bytes) -> bool:
+    """True si los primeros bytes de un archivo son los de este formato."""
+    return cabecera[:len(MAGICO)] == MAGICO
+
+
+def decodificar(datos) -> tuple:
+    """
+    Decodifica bytes escritos con `codificar`.
+    Devuelve (objeto, secuencia); la secuencia es None si no se guardó.
+
+    Raises:
+        ValueError: si los datos no están en este formato o están truncados.
+    """
+    vista = memoryview(datos)
+    if len(vista) < CABECERA.size or not es_binario(vista):
+        raise ValueError("Los datos no están en formato binario.")
+    _, version, secuencia = CABECERA.unpack_from(vista)
+    if version < 1:
+        raise ValueError(f"Versión de esquema inválida: {version}.")
+    objeto = _Lector(vista, CABECERA.size, len(vista)).registro()
+    return objeto, None if secuencia == SIN_SECUENCIA else secuencia
+
+
+def leer(archivo) -> tuple:
+    return decodificar(archivo.read())
@@ -0,0 +1,87 @@
+"""
+Formato columnar de RegistroForestal para abrir con mmap.
+
+    [cabecera][bloque de cultivos de cada plantación ...][directorio]
+
+La cabecera indica dónde está el directorio. El directorio tiene, por
+plantación, su nombre, padrón, datos resumidos (superficie, agua, conteo por
+tipo) y la ubicación de su bloque. Cada bloque son las columnas de un
+AlmacenColumnar escritas una tras otra en el orden de COLUMNAS.
+"""
+import struct
+import sys
+from functools import partial
+
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import AlmacenColumnar, TIPOS_COLUMNARES
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import escribir_atomico
+
+MAGICO = b"PFCOLUM\x00"
+VERSION = 1
+SIN_PADRON = -1
+
+# magico, versión, orden de bytes (0 little, 1 big), cantidad de tipos,
+# cantidad de plantaciones, offset y largo del directorio
+CABECERA = struct.Struct("<8sHBBIQQ")
+LARGO_NOMBRE = struct.Struct("<H")
+# padrón, superficie, agua, superficie ocupada, cantidad de cultivos, offset del bloque, columnar
+ENTRADA = struct.Struct("<qdddQQB")
+CONTEOS = struct.Struct(f"<{len(TIPOS_COLUMNARES)}Q")
+
+ORDEN_BYTES = {"little": 0, "big": 1}
+
+
+def _entrada_directorio(registro, plantacion, offset: int) -> bytes:
+    nombre = plantacion.nombre.encode("utf-8")
+    padron = registro.padron_de(plantacion.nombre)
+    conteos = [0] * len(TIPOS_COLUMNARES)
+    for tipo, cantidad in plantacion.contar_por_tipo().items():
+        conteos[AlmacenColumnar.codigo_de(tipo)] = cantidad
+    return b"".join((
+        LARGO_NOMBRE.pack(len(nombre)),
+        nombre,
+        ENTRADA.pack(
+            SIN_PADRON if padron is None else padron,
+            plantacion.superficie,
+            plantacion.agua_disponible,
+            plantacion.superficie_ocupada,
+            len(plantacion.cultivos),
+            offset,
+            1 if plantacion.es_columnar else 0,
+        ),
+        CONTEOS.pack(*conteos),
+    ))
+
+
+def escribir_registro_columnar(registro, ruta: str) -> None:
+    """
+    Escribe el registro en formato columnar (temporal + reemplazo atómico).
+    No se guardan observadores ni ubicaciones espaciales.
+
+    Raises:
+        ValueError: si algún cultivo no tiene representación columnar.
+    """
+    escribir_atomico(ruta, partial(_escribir_contenido, registro))
+
+
+def _escribir_contenido(registro, archivo) -> None:
+    plantaciones = registro.listar_todas()
+    directorio = []
+    archivo.write(bytes(CABECERA.size))
+    for plantacion in plantaciones:
+        almacen = plantacion.cultivos
+        if not plantacion.es_columnar:
+            almacen = AlmacenColumnar()
+            almacen.extend(plantacion.cultivos)
+        offset = archivo.tell()
+        for columna in almacen.columnas():
+            columna.tofile(archivo)
+        directorio.append(_entrada_directorio(registro, plantacion, offset))
+
+    contenido_directorio = b"".join(directorio)
+    offset_directorio = archivo.tell()
+    archivo.write(contenido_directorio)
+    archivo.seek(0)
+    archivo.write(CABECERA.pack(
+        MAGICO, VERSION, ORDEN_BYTES[sys.byteorder], len(TIPOS_COLUMNARES),
+        len(plantaciones), offset_directorio, len(contenido_directorio),
+    ))
@@ -0,0 +1,137 @@
+"""
+Formato de los .dat de Paquete: cabecera + pickle, opcionalmente comprimido
+y con buffers fuera de banda (protocolo 5).
+
+    [cabecera][flujo, comprimido o no: [buffers]? pickle del objeto [pickle de la secuencia]?]
+
+La cabecera registra protocolo, compresión y si hay buffers fuera de banda,
+así que la lectura no necesita opciones. Los .dat sin cabecera (pickle
+plano, formato anterior) se siguen leyendo.
+"""
+import bz2
+import gzip
+import lzma
+import pickle
+import struct
+from contextlib import nullcontext
+
+MAGICO = b"PFPAQ\x00"
+VERSION = 1
+NIVEL_ZLIB = 6
+
+# mágico, versión, protocolo, código de compresión, flags
+CABECERA = struct.Struct("<6sBBBB")
+CANTIDAD_BUFFERS = struct.Struct("<I")
+LARGO_BUFFER = struct.Struct("<Q")
+FLAG_FUERA_DE_BANDA = 1
+
+
+def _sin_compresion(archivo, modo: str):
+    return nullcontext(archivo)
+
+
+def _zlib(archivo, modo: str):
+    # Deflate (zlib) en contenedor gzip, que ya ofrece un flujo de archivo
+    return gzip.GzipFile(fileobj=archivo, mode=modo, compresslevel=NIVEL_ZLIB)
+
+
+def _bz2(archivo, modo: str):
+    return bz2.BZ2File(archivo, modo)
+
+
+def _lzma(archivo, modo: str):
+    return lzma.LZMAFile(archivo, modo)
+
+
+# nombre -> (código en la cabecera, función que envuelve el archivo)
+COMPRESIONES = {
+    None: (0, _sin_compresion),
+    "zlib": (1, _zlib),
+    "bz2": (2, _bz2),
+    "lzma": (3, _lzma),
+}
+_POR_CODIGO = {codigo: abrir for codigo, abrir in COMPRESIONES.values()}
+
+
+def validar_opciones(protocolo: int | None, compresion: str | None, fuera_de_banda: bool) -> int:
+    """
+    Devuelve el protocolo efectivo.
+
+    Raises:
+        ValueError: si la compresión no existe o el protocolo no admite buffers fuera de banda.
+    """
+    if compresion not in COMPRESIONES:
+        raise ValueError(f"Compresión no soportada: {compresion!r}. Opciones: zlib, bz2, lzma.")
+    protocolo = pickle.DEFAULT_PROTOCOL if protocolo is None else protocolo
+    if not 0 <= protocolo <= pickle.HIGHEST_PROTOCOL:
+        raise ValueError(f"Protocolo de pickle inválido: {protocolo}.")
+    if fuera_de_banda and protocolo < 5:
+        raise ValueError("Los buffers fuera de banda requieren protocolo 5 o superior.")
+    return protocolo
+
+
+def escribir(archivo, objeto, protocolo: int, compresion: str | None = None,
+             fuera_de_banda: bool = False, secuencia: int | None = None) -> None:
+    """Escribe cabecera y contenido (y la secuencia del journal, si se indica) en un archivo binario abierto."""
+    codigo, abrir = COMPRESIONES[compresion]
+    flags = FLAG_FUERA_DE_BANDA if fuera_de_banda else 0
+    archivo.write(CABECERA.pack(MAGICO, VERSION, protocolo, codigo, flags))
+    with abrir(archivo, "wb") as flujo:
+        if fuera_de_banda:
+            buffers = []
+            contenido = pickle.dumps(objeto, protocol=protocolo, buffer_callback=buffers.append)
+            flujo.write(CANTIDAD_BUFFERS.pack(len(buffers)))
+            for buffer in buffers:
+                with buffer.raw() as datos:
+                    flujo.write(LARGO_BUFFER.pack(datos.nbytes))
+                    flujo.write(datos)
+            flujo.write(contenido)
+        else:
+            pickle.dump(objeto, flujo, protocol=protocolo)
+        if secuencia is not None:
+            pickle.dump(secuencia, flujo, protocol=protocolo)
+
+
+def _leer_exacto(flujo, largo: int) -> bytearray:
+    datos = bytearray(largo)
+    vista = memoryview(datos)
+    leidos = 0
+    while leidos < largo:
+        cantidad = flujo.readinto(vista[leidos:])
+        if not cantidad:
+            raise EOFError("Archivo truncado.")
+        leidos += cantidad
+    return datos
+
+
+def _leer_contenido(flujo, fuera_de_banda: bool) -> tuple:
+    buffers = None
+    if fuera_de_banda:
+        (cantidad,) = CANTIDAD_BUFFERS.unpack(_leer_exacto(flujo, CANTIDAD_BUFFERS.size))
+        buffers = []
+        for _ in range(cantidad):
+            (largo,) = LARGO_BUFFER.unpack(_leer_exacto(flujo, LARGO_BUFFER.size))
+            buffers.append(_leer_exacto(flujo, largo))
+    objeto = pickle.load(flujo, buffers=buffers)
+    try:
+        secuencia = pickle.load(flujo)
+    except EOFError:
+        secuencia = None
+    return objeto, secuencia
+
+
+def leer(archivo) -> tuple:
+    """
+    Lee un archivo escrito con `escribir` o un pickle plano.
+    Devuelve (objeto, secuencia); la secuencia es None si no se guardó.
+    """
+    cabecera = archivo.read(CABECERA.size)
+    if len(cabecera) < CABECERA.size or not cabecera.startswith(MAGICO):
+        archivo.seek(0)
+        return _leer_contenido(archivo, False)
+    _, version, _, codigo, flags = CABECERA.unpack(cabecera)
+    abrir = _POR_CODIGO.get(codigo)
+    if version != VERSION or abrir is None:
+        raise ValueError(f"Formato de archivo no soportado (versión {version}, compresión {codigo}).")
+    with abrir(archivo, "rb") as flujo:
+        return _leer_contenido(flujo, bool(flags & FLAG_FUERA_DE_BANDA))
@@ -0,0 +1,29 @@
+"""
+Formato de los segmentos del historial de sensores en disco.
+
+    segmento (.pfs): [cabecera][registro 0][registro 1][registro 2]...
+    índice (.pfi):   [instante del registro 0][del registro N][del registro 2N]...
+
+Cada registro es (instante, valor) en dos doubles de ancho fijo, así que la
+posición del registro i se calcula sin leer nada. Los segmentos solo crecen
+por el final y los instantes no decrecen. El índice disperso guarda el
+instante del primer registro de cada bloque de N registros (N va en la
+cabecera); se puede reconstruir desde el segmento si queda incompleto.
+"""
+import os
+import struct
+
+from constante import EXTENSION_INDICE_SERIE
+
+MAGICO = b"PFSERIE\x00"
+VERSION = 1
+
+# magico, versión, orden de bytes (0 little, 1 big), registros por entrada del índice
+CABECERA = struct.Struct("<8sHBxI")
+# instante, valor (en el orden de bytes de la cabecera)
+REGISTRO = struct.Struct("=dd")
+
+
+def ruta_indice(ruta_segmento: str) -> str:
+    """Ruta del índice disperso que acompaña al segmento."""
+    return os.path.splitext(ruta_segmento)[0] + EXTENSION_INDICE_SERIE
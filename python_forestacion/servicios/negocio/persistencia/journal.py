@@ -0,0 +1,85 @@
+import os
+import pickle
+import struct
+import zlib
+
+from python_forestacion.servicios.negocio.persistencia.mutacion import Mutacion
+
+# Cabecera de cada registro: largo del contenido y CRC32 del contenido
+_CABECERA = struct.Struct("<II")
+
+
+class Journal:
+    """
+    Write-ahead log de mutaciones en un archivo solo de agregado.
+    Cada registro es [largo][crc32][pickle de (secuencia, mutacion)]. Un
+    registro incompleto o corrupto al final (escritura interrumpida) marca
+    el fin del log: se descarta al leer y se trunca al volver a escribir.
+    """
+
+    def __init__(self, ruta: str, sincronizar: bool = False):
+        self.ruta = ruta
+        self.sincronizar = sincronizar
+
+    def agregar(self, secuencia: int, mutacion: Mutacion) -> int:
+        """
+        Agrega el registro y lo vacía al sistema operativo (con fsync si
+        sincronizar=True) antes de volver. Devuelve la posición donde empieza,
+        para retirarlo con descartar_desde. Si la escritura falla, el log
+        queda como estaba.
+        """
+        contenido = pickle.dumps((secuencia, mutacion), protocol=pickle.HIGHEST_PROTOCOL)
+        registro = _CABECERA.pack(len(contenido), zlib.crc32(contenido)) + contenido
+        with open(self.ruta, "ab") as archivo:
+            posicion = archivo.tell()
+            try:
+                archivo.write(registro)
+                archivo.flush()
+                if self.sincronizar:
+                    os.fsync(archivo.fileno())
+            except BaseException:
+                self.descartar_desde(posicion)
+                raise
+        return posicion
+
+    def descartar_desde(self, posicion: int) -> None:
+        """Retira los registros desde `posicion` (la que devolvió agregar)."""
+        with open(self.ruta, "r+b") as archivo:
+            archivo.truncate(posicion)
+            if self.sincronizar:
+                os.fsync(archivo.fileno())
+
+    def leer(self, desde_secuencia: int = 0) -> list[tuple[int, Mutacion]]:
+        """Registros válidos con secuencia > desde_secuencia, en orden; trunca una cola dañada."""
+        if not os.path.exists(self.ruta):
+            return []
+        registros = []
+        valido_hasta = 0
+        with open(self.ruta, "rb") as archivo:
+            datos = archivo.read()
+        posicion = 0
+        while posicion + _CABECERA.size <= len(datos):
+            largo, crc = _CABECERA.unpack_from(datos, posicion)
+            inicio = posicion + _CABECERA.size
+            contenido = datos[inicio:inicio + largo]
+            if len(contenido) < largo or zlib.crc32(contenido) != crc:
+                break
+            secuencia, mutacion = pickle.loads(contenido)
+            if secuencia > desde_secuencia:
+                registros.append((secuencia, mutacion))
+            posicion = valido_hasta = inicio + largo
+        if valido_hasta < len(datos):
+            with open(self.ruta, "r+b") as archivo:
+                archivo.truncate(valido_hasta)
+        return registros
+
+    def ultima_secuencia(self) -> int:
+        """Secuencia del último registro válido (0 si el log está vacío)."""
+        registros = self.leer()
+        return registros[-1][0] if registros else 0
+
+    def vaciar(self) -> None:
+        """Descarta todos los registros (después de un snapshot)."""
+        if os.path.exists(self.ruta):
+            with open(self.ruta, "wb"):
+                pass
@@ -0,0 +1,41 @@
+class Mutacion:
+    """
+    Cambio registrable en el journal: llamar `metodo(*args, **kwargs)` sobre
+    el objeto persistido o, si se indica `destino`, sobre la plantación con
+    ese nombre dentro del registro (via buscar_plantacion).
+
+    Ejemplo:
+        Mutacion("plantar_lote", "Pino", 10, destino="Finca 1")
+    """
+
+    __slots__ = ("metodo", "args", "kwargs", "destino")
+
+    def __init__(self, metodo: str, *args, destino: str | None = None, **kwargs):
+        self.metodo = metodo
+        self.args = args
+        self.kwargs = kwargs
+        self.destino = destino
+
+    def __getstate__(self) -> tuple:
+        return self.metodo, self.args, self.kwargs, self.destino
+
+    def __setstate__(self, estado: tuple) -> None:
+        self.metodo, self.args, self.kwargs, self.destino = estado
+
+    def aplicar(self, objeto):
+        """
+        Aplica la mutación y devuelve el resultado del método.
+
+        Raises:
+            ValueError: si el destino no existe en el objeto.
+        """
+        if self.destino is not None:
+            destino = objeto.buscar_plantacion(self.destino)
+            if destino is None:
+                raise ValueError(f"No existe la plantación destino {self.destino!r}.")
+            objeto = destino
+        return getattr(objeto, self.metodo)(*self.args, **self.kwargs)
+
+    def __repr__(self) -> str:
+        destino = f", destino={self.destino!r}" if self.destino is not None else ""
+        return f"Mutacion({self.metodo!r}, *{self.args!r}{destino})"
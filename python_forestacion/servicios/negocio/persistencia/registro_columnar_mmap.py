@@ -0,0 +1,149 @@
+import mmap
+import sys
+from array import array
+
+from python_forestacion.Entidades.cultivos.columnar.almacen_columnar import AlmacenColumnar, COLUMNAS, TIPOS_COLUMNARES
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.registro_perezoso import RegistroPerezoso
+from python_forestacion.servicios.negocio.persistencia.formato_columnar import (
+    MAGICO, VERSION, SIN_PADRON, CABECERA, LARGO_NOMBRE, ENTRADA, CONTEOS, ORDEN_BYTES,
+)
+from constante import CAPACIDAD_CACHE_PLANTACIONES
+
+
+class RegistroColumnarMmap:
+    """
+    Registro forestal de solo lectura sobre un archivo en formato columnar.
+    Al abrir solo se leen la cabecera y el directorio (vía mmap): nombres,
+    padrones y resúmenes están disponibles sin decodificar cultivos. Cada
+    plantación se decodifica la primera vez que se pide y queda en caché.
+    """
+
+    def __init__(self, ruta: str):
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            self._leer_directorio()
+        except Exception:
+            self.cerrar()
+            raise
+        self._decodificadas: dict[str, Plantacion] = {}
+
+    def _leer_directorio(self) -> None:
+        mapa = self._mapa
+        if len(mapa) < CABECERA.size:
+            raise ValueError("Archivo columnar truncado.")
+        magico, version, orden, tipos, cantidad, offset, largo = CABECERA.unpack_from(mapa, 0)
+        if magico != MAGICO:
+            raise ValueError("El archivo no está en formato columnar.")
+        if version != VERSION or tipos != len(TIPOS_COLUMNARES):
+            raise ValueError(f"Versión de formato columnar no soportada: {version}.")
+        if offset + largo > len(mapa):
+            raise ValueError("Archivo columnar truncado.")
+        self._invertir_bytes = orden != ORDEN_BYTES[sys.byteorder]
+
+        # nombre -> (offset del bloque, cantidad de cultivos, columnar)
+        self._bloques: dict[str, tuple[int, int, bool]] = {}
+        self._resumenes: dict[str, dict] = {}
+        posicion = offset
+        for _ in range(cantidad):
+            (largo_nombre,) = LARGO_NOMBRE.unpack_from(mapa, posicion)
+            posicion += LARGO_NOMBRE.size
+            nombre = mapa[posicion:posicion + largo_nombre].decode("utf-8")
+            posicion += largo_nombre
+            padron, superficie, agua, ocupada, cultivos, bloque, columnar = ENTRADA.unpack_from(mapa, posicion)
+            posicion += ENTRADA.size
+            conteos = CONTEOS.unpack_from(mapa, posicion)
+            posicion += CONTEOS.size
+
+            self._bloques[nombre] = (bloque, cultivos, bool(columnar))
+            self._resumenes[nombre] = {
+                "id_padron": None if padron == SIN_PADRON else padron,
+                "superficie": superficie,
+                "agua_disponible": agua,
+                "superficie_ocupada": ocupada,
+                "cantidad_cultivos": cultivos,
+                "conteo_por_tipo": {
+                    tipo: conteo for tipo, conteo in zip(TIPOS_COLUMNARES, conteos) if conteo
+                },
+            }
+
+    def __enter__(self) -> "RegistroColumnarMmap":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        mapa = getattr(self, "_mapa", None)
+        if mapa is not None:
+            mapa.close()
+        self._archivo.close()
+
+    def __len__(self) -> int:
+        return len(self._bloques)
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self._bloques
+
+    def nombres(self) -> list[str]:
+        return list(self._bloques)
+
+    def resumen(self, nombre: str) -> dict | None:
+        """Datos de la plantación leídos del directorio, sin decodificar cultivos."""
+        resumen = self._resumenes.get(nombre)
+        if resumen is None:
+            return None
+        copia = dict(resumen)
+        copia["conteo_por_tipo"] = dict(resumen["conteo_por_tipo"])
+        return copia
+
+    def padron_de(self, nombre: str) -> int | None:
+        resumen = self._resumenes.get(nombre)
+        return None if resumen is None else resumen["id_padron"]
+
+    def buscar_plantacion(self, nombre: str) -> Plantacion | None:
+        plantacion = self._decodificadas.get(nombre)
+        if plantacion is None and nombre in self._bloques:
+            plantacion = self._decodificadas[nombre] = self._decodificar(nombre)
+        return plantacion
+
+    def listar_todas(self) -> list[Plantacion]:
+        return [self.buscar_plantacion(nombre) for nombre in self._bloques]
+
+    def a_registro(self) -> RegistroForestal:
+        """Decodifica todo y lo carga en un RegistroForestal independiente del archivo."""
+        registro = RegistroForestal()
+        for nombre in self._bloques:
+            registro.agregar_plantacion(self._decodificar(nombre), self.padron_de(nombre))
+        return registro
+
+    def a_registro_perezoso(self, capacidad: int = CAPACIDAD_CACHE_PLANTACIONES) -> RegistroPerezoso:
+        """
+        RegistroPerezoso indexado con el directorio, que decodifica cada
+        plantación al usarla (sin la caché propia de este objeto). El archivo
+        debe seguir abierto mientras se use el registro.
+        """
+        return RegistroPerezoso(
+            {nombre: self.resumen(nombre) for nombre in self._bloques}, self._decodificar, capacidad,
+        )
+
+    def _decodificar(self, nombre: str) -> Plantacion:
+        offset, cantidad, columnar = self._bloques[nombre]
+        columnas = []
+        with memoryview(self._mapa) as vista:
+            for _, typecode in COLUMNAS:
+                columna = array(typecode)
+                largo = cantidad * columna.itemsize
+                columna.frombytes(vista[offset:offset + largo])
+                if self._invertir_bytes:
+                    columna.byteswap()
+                columnas.append(columna)
+                offset += largo
+        almacen = AlmacenColumnar.desde_columnas(columnas)
+        resumen = self._resumenes[nombre]
+        return Plantacion.desde_cultivos(
+            nombre, resumen["superficie"], resumen["agua_disponible"],
+            almacen if columnar else almacen.materializar(),
+        )
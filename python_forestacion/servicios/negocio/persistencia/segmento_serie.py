@@ -0,0 +1,176 @@
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from python_forestacion.servicios.negocio.persistencia.formato_columnar import ORDEN_BYTES
+from python_forestacion.servicios.negocio.persistencia.formato_segmento_serie import (
+    MAGICO, VERSION, CABECERA, REGISTRO, ruta_indice,
+)
+
+
+class SegmentoSerie:
+    """
+    Un segmento del historial de un sensor (ver formato_segmento_serie) con
+    su índice disperso cargado en memoria. Las búsquedas van por mmap: la
+    búsqueda binaria en el índice elige un bloque y la búsqueda dentro del
+    bloque toca solo sus páginas; leer un rango toca solo las páginas del
+    rango.
+
+    Abierto para escritura recorta un registro incompleto al final (una
+    escritura interrumpida) y completa el índice si quedó corto. Con
+    solo_lectura=True no modifica nada y ve los registros que había al abrir.
+    """
+
+    def __init__(self, ruta: str, solo_lectura: bool = False):
+        self.ruta = ruta
+        self._solo_lectura = solo_lectura
+        self._archivo = open(ruta, "rb" if solo_lectura else "r+b")
+        self._archivo_indice = None
+        self._mapa = None
+        self._mapeado = 0
+        try:
+            self._abrir()
+        except Exception:
+            self.cerrar()
+            raise
+
+    @classmethod
+    def crear(cls, ruta: str, registros_por_entrada: int) -> "SegmentoSerie":
+        """Crea un segmento vacío (falla si ya existe) y lo abre para escritura."""
+        if registros_por_entrada <= 0:
+            raise ValueError("Los registros por entrada del índice deben ser positivos.")
+        with open(ruta, "xb") as archivo:
+            archivo.write(CABECERA.pack(MAGICO, VERSION, ORDEN_BYTES[sys.byteorder], registros_por_entrada))
+        with open(ruta_indice(ruta), "wb"):
+            pass
+        return cls(ruta)
+
+    def _abrir(self) -> None:
+        contenido = self._archivo.read(CABECERA.size)
+        if len(contenido) < CABECERA.size:
+            raise ValueError("Segmento de serie truncado.")
+        magico, version, orden, registros_por_entrada = CABECERA.unpack(contenido)
+        if magico != MAGICO:
+            raise ValueError("El archivo no es un segmento de serie.")
+        if version != VERSION or not registros_por_entrada:
+            raise ValueError(f"Versión de segmento de serie no soportada: {version}.")
+        if orden != ORDEN_BYTES[sys.byteorder]:
+            raise ValueError("El segmento se escribió con otro orden de bytes.")
+        self._registros_por_entrada = registros_por_entrada
+
+        tamano = os.fstat(self._archivo.fileno()).st_size - CABECERA.size
+        self._cantidad = tamano // REGISTRO.size
+        if tamano % REGISTRO.size and not self._solo_lectura:
+            self._archivo.truncate(CABECERA.size + self._cantidad * REGISTRO.size)
+        self._cargar_indice()
+
+    def _cargar_indice(self) -> None:
+        ruta = ruta_indice(self.ruta)
+        contenido = b""
+        if os.path.exists(ruta):
+            with open(ruta, "rb") as archivo:
+                contenido = archivo.read()
+        self._indice = array("d")
+        self._indice.frombytes(contenido[:len(contenido) - len(contenido) % self._indice.itemsize])
+        entradas = -(-self._cantidad // self._registros_por_entrada)
+        del self._indice[entradas:]
+        for bloque in range(len(self._indice), entradas):
+            self._indice.append(self._instante(bloque * self._registros_por_entrada))
+        if self._solo_lectura:
+            return
+        if len(contenido) != len(self._indice) * self._indice.itemsize:
+            # Índice incompleto o más largo que el segmento: se reescribe
+            with open(ruta, "wb") as archivo:
+                self._indice.tofile(archivo)
+        self._archivo_indice = open(ruta, "ab")
+
+    def __enter__(self) -> "SegmentoSerie":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        if self._archivo_indice is not None:
+            self._archivo_indice.close()
+        self._archivo.close()
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    @property
+    def primer_instante(self) -> float | None:
+        return self._indice[0] if self._indice else None
+
+    @property
+    def ultimo_instante(self) -> float | None:
+        return self._instante(self._cantidad - 1) if self._cantidad else None
+
+    def agregar(self, registros: array) -> None:
+        """
+        Agrega registros al final: un array 'd' con instante y valor
+        intercalados. El llamador garantiza que los instantes no decrecen.
+        """
+        if self._solo_lectura:
+            raise ValueError("El segmento está abierto solo para lectura.")
+        cantidad = self._cantidad
+        por_entrada = self._registros_por_entrada
+        # Registros nuevos que abren un bloque del índice
+        primero = -(-cantidad // por_entrada) * por_entrada - cantidad
+        entradas = registros[2 * primero::2 * por_entrada]
+        self._archivo.seek(0, os.SEEK_END)
+        registros.tofile(self._archivo)
+        self._archivo.flush()
+        entradas.tofile(self._archivo_indice)
+        self._archivo_indice.flush()
+        self._indice.extend(entradas)
+        self._cantidad += len(registros) // 2
+
+    def sincronizar(self) -> None:
+        """Hace durables los registros agregados (fsync del segmento y del índice)."""
+        os.fsync(self._archivo.fileno())
+        if self._archivo_indice is not None:
+            os.fsync(self._archivo_indice.fileno())
+
+    def _mapear(self) -> mmap.mmap:
+        """Mapa del segmento, rehecho si se agregaron registros desde el último."""
+        tamano = CABECERA.size + self._cantidad * REGISTRO.size
+        if tamano > self._mapeado:
+            if self._mapa is not None:
+                self._mapa.close()
+            self._mapa = mmap.mmap(self._archivo.fileno(), tamano, access=mmap.ACCESS_READ)
+            self._mapeado = tamano
+        return self._mapa
+
+    def _instante(self, indice: int) -> float:
+        return REGISTRO.unpack_from(self._mapear(), CABECERA.size + indice * REGISTRO.size)[0]
+
+    def buscar(self, instante: float, despues: bool = False) -> int:
+        """
+        Primer registro con instante >= `instante` (o > si despues=True);
+        len si no hay.
+        """
+        busqueda = bisect_right if despues else bisect_left
+        bloque = busqueda(self._indice, instante)
+        if not bloque:
+            return 0
+        por_entrada = self._registros_por_entrada
+        fin = min(bloque * por_entrada, self._cantidad)
+        with memoryview(self._mapear()) as vista, \
+                vista[CABECERA.size:].cast("d") as dobles, dobles[::2] as instantes:
+            return busqueda(instantes, instante, (bloque - 1) * por_entrada, fin)
+
+    def leer(self, primero: int, ultimo: int) -> array:
+        """Registros [primero, ultimo) con instante y valor intercalados."""
+        registros = array("d")
+        if primero < ultimo:
+            inicio = CABECERA.size + primero * REGISTRO.size
+            fin = CABECERA.size + ultimo * REGISTRO.size
+            with memoryview(self._mapear()) as vista, vista[inicio:fin] as tramo:
+                registros.frombytes(tramo)
+        return registros
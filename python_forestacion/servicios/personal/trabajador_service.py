@@ -1,16 +1,107 @@
+from datetime import date
+
 from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.servicios.negocio.persistencia.base_sqlite import BaseSQLite
 
 class TrabajadorService:
-    """Servicio para gestionar los trabajadores."""
+    """
+    Servicio para gestionar los trabajadores.
+    Con una BaseSQLite carga los trabajadores guardados y cada registro
+    (también el de un trabajador ya registrado, para guardar sus cambios)
+    se escribe en la base. asignar_tarea también guarda; los cambios hechos
+    directamente sobre un trabajador o sus tareas los escribe
+    guardar_cambios, que buscar_tareas llama antes de consultar.
+    """
 
-    def __init__(self):
+    def __init__(self, base: BaseSQLite | None = None):
+        self._base = base
         self._trabajadores: dict[str, Trabajador] = {}
+        # dni -> datos persistidos del trabajador en el último guardado
+        self._guardados: dict[str, tuple] = {}
+        if base:
+            for trabajador in base.cargar_trabajadores():
+                self._trabajadores[trabajador.dni] = trabajador
+                self._guardados[trabajador.dni] = _datos_persistidos(trabajador)
 
     def registrar_trabajador(self, trabajador: Trabajador):
         self._trabajadores[trabajador.dni] = trabajador
+        if self._base:
+            self._guardar((trabajador,))
+
+    def _guardar(self, trabajadores) -> None:
+        self._base.guardar_trabajadores(trabajadores)
+        for trabajador in trabajadores:
+            self._guardados[trabajador.dni] = _datos_persistidos(trabajador)
+
+    def asignar_tarea(self, dni: str, tarea: Tarea) -> None:
+        """Asigna la tarea al trabajador y, con base, lo guarda."""
+        trabajador = self._trabajadores.get(dni)
+        if trabajador is None:
+            raise ValueError("Trabajador no encontrado.")
+        trabajador.asignar_tarea(tarea)
+        if self._base:
+            self._guardar((trabajador,))
+
+    def guardar_cambios(self) -> int:
+        """
+        Escribe en la base, en una sola transacción, los trabajadores cuyos
+        datos o tareas cambiaron desde el último guardado.
+
+        Returns:
+            Cantidad de trabajadores escritos.
+        """
+        if not self._base:
+            return 0
+        modificados = [
+            trabajador for dni, trabajador in self._trabajadores.items()
+            if self._guardados.get(dni) != _datos_persistidos(trabajador)
+        ]
+        if modificados:
+            self._guardar(modificados)
+        return len(modificados)
 
     def listar_trabajadores(self) -> list[Trabajador]:
         return list(self._trabajadores.values())
 
     def buscar_trabajador(self, dni: str) -> Trabajador | None:
         return self._trabajadores.get(dni)
+
+    def buscar_tareas(self, completada: bool | None = None, desde: date | None = None,
+                      hasta: date | None = None) -> list[tuple[str, Tarea]]:
+        """
+        Pares (dni, tarea) filtrados por estado y por fecha (None: sin
+        filtro), ordenados por fecha. Con base, primero guarda los cambios
+        pendientes y la consulta se hace en SQL: las tareas devueltas son
+        copias.
+        """
+        if self._base:
+            self.guardar_cambios()
+            return self._base.consultar_tareas(completada, desde, hasta)
+        encontradas = [
+            (trabajador.dni, tarea)
+            for trabajador in self._trabajadores.values()
+            for tarea in trabajador.tareas
+            if (completada is None or tarea.completada == completada)
+            and (desde is None or tarea.fecha >= desde)
+            and (hasta is None or tarea.fecha <= hasta)
+        ]
+        encontradas.sort(key=_fecha_de_par)
+        return encontradas
+
+
+def _datos_persistidos(trabajador: Trabajador) -> tuple:
+    """Lo que BaseSQLite guarda del trabajador, para detectar cambios sin escribir."""
+    apto = trabajador.apto_medico
+    return (
+        trabajador.nombre, trabajador.edad,
+        apto and (apto.fecha_emision, apto.valido_hasta, apto.observaciones),
+        tuple(
+            (t.descripcion, t.fecha, t.herramienta.nombre, t.herramienta.estado, t.completada)
+            for t in trabajador.tareas
+        ),
+    )
+
+
+def _fecha_de_par(par: tuple[str, Tarea]) -> date:
+    return par[1].fecha
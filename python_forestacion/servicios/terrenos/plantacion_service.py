@@ -13,13 +13,13 @@ class PlantacionService:
             raise SuperficieInsuficienteException()
         self._plantaciones[plantacion.nombre] = plantacion
 
-    def regar(self, nombre: str, cantidad: float):
+    def regar(self, nombre: str, cantidad: float, en_lote: bool = False):
         plantacion = self._plantaciones.get(nombre)
         if not plantacion:
             raise ValueError("Plantación no encontrada.")
         if cantidad > plantacion.agua_disponible:
             raise AguaAgotadaException()
-        plantacion.regar_todos(cantidad)
+        plantacion.regar_todos(cantidad, en_lote=en_lote)
 
     def listar_plantaciones(self) -> list[Plantacion]:
         return list(self._plantaciones.values())
@@ -6,8 +6,8 @@ class RegistroForestalService:
     def __init__(self, registro: RegistroForestal):
         self._registro = registro
 
-    def agregar_plantacion(self, plantacion):
-        self._registro.agregar_plantacion(plantacion)
+    def agregar_plantacion(self, plantacion, id_padron: int | None = None):
+        self._registro.agregar_plantacion(plantacion, id_padron)
 
     def listar_todas(self):
         return self._registro.listar_todas()
@@ -15,5 +15,11 @@ class RegistroForestalService:
     def buscar_plantacion(self, nombre: str):
         return self._registro.buscar_plantacion(nombre)
 
+    def buscar_por_padron(self, id_padron: int):
+        return self._registro.buscar_por_padron(id_padron)
+
+    def consultar(self, *predicados):
+        return self._registro.consultar(*predicados)
+
     def eliminar_plantacion(self, nombre: str) -> bool:
         return self._registro.eliminar_plantacion(nombre)
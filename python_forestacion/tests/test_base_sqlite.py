@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+from python_forestacion.servicios.negocio.fincas_service import FincasService
+from python_forestacion.servicios.negocio.persistencia.base_sqlite import BaseSQLite
+from python_forestacion.servicios.personal.trabajador_service import TrabajadorService
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.cultivos.arbol import Arbol
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.Entidades.personal.apto_medico import AptoMedico
+
+
+class TestBaseSQLite(unittest.TestCase):
+    """Persistencia en SQLite de plantaciones, cultivos y trabajadores."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "forestal.db")
+        self.base = BaseSQLite(self.ruta)
+
+    def tearDown(self):
+        self.base.cerrar()
+        shutil.rmtree(self.directorio)
+
+    def _reabrir(self) -> BaseSQLite:
+        self.base.cerrar()
+        self.base = BaseSQLite(self.ruta)
+        return self.base
+
+    def test_importa_y_carga_registro(self):
+        registro = RegistroForestal()
+        lista = Plantacion("Lista", 1000.0, 100.0)
+        lista.agregar_cultivo(Olivo(3.0, 1.5, TipoAceituna.PICUAL))
+        lista.plantar_lote("Zanahoria", 2)
+        columnar = Plantacion("Columnar", 1000.0, 50.0, columnar=True)
+        columnar.plantar_lote("Pino", 3)
+        registro.agregar_plantacion(lista, id_padron=1)
+        registro.agregar_plantacion(columnar, id_padron=2)
+
+        self.assertEqual(self.base.importar(registro), 2)
+        cargado = self._reabrir().cargar_registro()
+
+        self.assertEqual([p.nombre for p in cargado.listar_todas()], ["Lista", "Columnar"])
+        self.assertEqual(cargado.padron_de("Columnar"), 2)
+        lista_cargada = cargado.buscar_plantacion("Lista")
+        self.assertFalse(lista_cargada.es_columnar)
+        self.assertEqual(lista_cargada.contar_por_tipo(), {Olivo: 1, Zanahoria: 2})
+        self.assertEqual(lista_cargada.cultivos_de_tipo(Olivo)[0].tipo_aceituna, TipoAceituna.PICUAL)
+        self.assertTrue(cargado.buscar_plantacion("Columnar").es_columnar)
+        self.assertEqual(cargado.buscar_plantacion("Columnar").contar_por_tipo(), {Pino: 3})
+
+    def test_consulta_cultivos_por_campo(self):
+        plantacion = Plantacion("Olivar", 1000.0, 100.0)
+        for produccion in (1.0, 5.0, 9.0):
+            olivo = Olivo(3.0, 1.0, TipoAceituna.ARBEQUINA)
+            olivo.produccion_anual = produccion
+            plantacion.agregar_cultivo(olivo)
+        plantacion.plantar_lote("Pino", 2)
+        self.base.guardar_plantaciones([(plantacion, None)])
+
+        encontrados = self.base.consultar_cultivos(Olivo, "produccion_anual", minimo=5.0)
+        self.assertEqual([c.produccion_anual for _, c in encontrados], [5.0, 9.0])
+        self.assertEqual({nombre for nombre, _ in encontrados}, {"Olivar"})
+        self.assertEqual(len(self.base.consultar_cultivos(Arbol, "altura", maximo=1.0)), 5)
+        with self.assertRaises(ValueError):
+            self.base.consultar_cultivos(Olivo, "nombre")
+
+    def test_fincas_service_sobre_base(self):
+        servicio = FincasService(self.base)
+        servicio.crear_finca(1, 500.0, "Ruta 7", "Finca Norte")
+        servicio.crear_finca(2, 500.0, "Ruta 8", "Finca Sur")
+        servicio.buscar_plantacion("Finca Norte").plantar_lote("Olivo", 4)
+        servicio.eliminar_finca("Finca Sur")
+
+        self.assertEqual(len(servicio.buscar_cultivos(Olivo)), 4)
+        self.assertEqual(servicio.guardar_cambios(), 0)
+
+        recargado = FincasService(self._reabrir())
+        self.assertEqual([p.nombre for p in recargado.listar_plantaciones()], ["Finca Norte"])
+        self.assertEqual(recargado.buscar_por_padron(1).contar_por_tipo(), {Olivo: 4})
+        self.assertIs(recargado.listar_tierras()[0].plantacion, recargado.buscar_plantacion("Finca Norte"))
+
+    def test_buscar_cultivos_sin_base_coincide(self):
+        servicio = FincasService()
+        servicio.crear_finca(1, 500.0, "Ruta 7", "Finca Norte")
+        plantacion = servicio.buscar_plantacion("Finca Norte")
+        plantacion.plantar_lote("Pino", 2)
+        plantacion.plantar_lote("Lechuga", 3)
+        plantacion.cultivos[0].altura = 4.0
+
+        self.assertEqual(len(servicio.buscar_cultivos(Arbol, "altura", minimo=2.0)), 1)
+        self.assertEqual(len(servicio.buscar_cultivos(Arbol)), 2)
+
+    def test_trabajador_service_sobre_base(self):
+        servicio = TrabajadorService(self.base)
+        trabajador = Trabajador("Ana", "30123456", 35)
+        trabajador.asignar_apto_medico(AptoMedico(date(2026, 1, 1), date(2027, 1, 1), "Apto"))
+        pala = Herramienta("Pala", "operativa")
+        trabajador.asignar_tarea(Tarea("Podar", date(2026, 5, 2), pala))
+        trabajador.asignar_tarea(Tarea("Regar", date(2026, 5, 1), pala))
+        servicio.registrar_trabajador(trabajador)
+        trabajador.tareas[0].completar()
+        servicio.registrar_trabajador(trabajador)
+
+        recargado = TrabajadorService(self._reabrir())
+        cargado = recargado.buscar_trabajador("30123456")
+        self.assertEqual([t.descripcion for t in cargado.tareas], ["Podar", "Regar"])
+        self.assertEqual(cargado.apto_medico.valido_hasta, date(2027, 1, 1))
+        pendientes = recargado.buscar_tareas(completada=False)
+        self.assertEqual([(dni, t.descripcion) for dni, t in pendientes], [("30123456", "Regar")])
+        self.assertEqual(len(recargado.buscar_tareas(desde=date(2026, 5, 2))), 1)
+
+    def test_tareas_asignadas_despues_de_registrar(self):
+        servicio = TrabajadorService(self.base)
+        trabajador = Trabajador("Ana", "30123456", 35)
+        servicio.registrar_trabajador(trabajador)
+        pala = Herramienta("Pala", "operativa")
+        servicio.asignar_tarea("30123456", Tarea("Podar", date(2026, 5, 2), pala))
+        # Cambios directos sobre el trabajador: se guardan antes de consultar
+        trabajador.asignar_tarea(Tarea("Regar", date(2026, 5, 1), pala))
+        trabajador.tareas[0].completar()
+
+        pendientes = servicio.buscar_tareas(completada=False)
+        self.assertEqual([(dni, t.descripcion) for dni, t in pendientes], [("30123456", "Regar")])
+        self.assertEqual(servicio.guardar_cambios(), 0)
+        recargado = TrabajadorService(self._reabrir())
+        self.assertEqual([t.descripcion for t in recargado.buscar_trabajador("30123456").tareas], ["Podar", "Regar"])
+        with self.assertRaises(ValueError):
+            servicio.asignar_tarea("99999999", Tarea("Podar", date(2026, 5, 2), pala))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from python_forestacion.patrones.factory.cultivo_factory import CultivoFactory
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.hortaliza import Hortaliza
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+
+
+class Rabanito(Hortaliza):
+    """Cultivo de prueba registrado desde fuera de la factory."""
+
+    def __init__(self, superficie: float, dias_crecimiento: int):
+        super().__init__("Rabanito", superficie, dias_crecimiento)
+
+    def absorber_agua(self, cantidad: float) -> None:
+        self.regar()
+
+
+class TestCultivoFactory(unittest.TestCase):
+    """Pruebas de la factory de cultivos basada en registro."""
+
+    def test_tipos_y_valores_por_defecto(self):
+        pino = CultivoFactory.crear_cultivo("Pino")
+        self.assertIs(type(pino), Pino)
+        self.assertEqual((pino.superficie, pino.altura), (10, 1.0))
+
+        olivo = CultivoFactory.crear_cultivo("OLIVO", altura=2.0, desconocido=1)
+        self.assertIs(type(olivo), Olivo)
+        self.assertEqual(olivo.altura, 2.0)
+        self.assertEqual(olivo.tipo_aceituna, TipoAceituna.MANZANILLA)
+
+    def test_tipo_desconocido(self):
+        with self.assertRaises(ValueError):
+            CultivoFactory.crear_cultivo("Palmera")
+
+    def test_registrar_tipo_nuevo(self):
+        CultivoFactory.registrar_tipo("rabanito", Rabanito, superficie=1, dias_crecimiento=25)
+        try:
+            rabanito = CultivoFactory.crear_cultivo("Rabanito")
+            self.assertIs(type(rabanito), Rabanito)
+            self.assertEqual(rabanito.dias_crecimiento, 25)
+        finally:
+            del CultivoFactory._registro["rabanito"]
+            CultivoFactory._alias.clear()
+
+    def test_crear_lote_genera_instancias_independientes(self):
+        lote = CultivoFactory.crear_lote("zanahoria", 5, profundidad=0.5)
+        self.assertEqual(len(lote), 5)
+        self.assertEqual(len({id(cultivo) for cultivo in lote}), 5)
+        self.assertTrue(all(cultivo.profundidad == 0.5 for cultivo in lote))
+
+        lote[0].regar()
+        self.assertFalse(lote[1].regada)
+        self.assertEqual(CultivoFactory.crear_lote("pino", 0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
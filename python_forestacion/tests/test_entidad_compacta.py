@@ -0,0 +1,79 @@
+import os
+import pickle
+import shutil
+import unittest
+from datetime import date
+
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.Entidades.personal.apto_medico import AptoMedico
+from python_forestacion.Entidades.terrenos.tierra import Tierra
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.servicios.negocio.paquete import Paquete
+
+RUTA_DATA = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+
+
+class TestEntidadCompacta(unittest.TestCase):
+    """Entidades con __slots__ y su compatibilidad con pickle."""
+
+    def setUp(self):
+        self.test_dir = "data_test_compacta"
+        self.paquete = Paquete(self.test_dir)
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_instancias_sin_dict(self):
+        instancias = [
+            Pino(10, 1.0),
+            Olivo(8, 1.2, TipoAceituna.PICUAL),
+            Trabajador("Ana", "1", 30),
+            Tarea("Podar", date.today(), Herramienta("Tijera", "operativa")),
+            AptoMedico(date.today(), date.today(), ""),
+            Tierra(1, 10.0, "Ruta 1", "Finca"),
+            Plantacion("Finca", 10.0, 5.0),
+        ]
+        for instancia in instancias:
+            self.assertFalse(hasattr(instancia, "__dict__"), type(instancia).__name__)
+
+    def test_ida_y_vuelta_con_paquete(self):
+        trabajador = Trabajador("Ana", "1", 30)
+        trabajador.asignar_tarea(Tarea("Podar", date(2025, 1, 1), Herramienta("Tijera", "operativa")))
+        self.paquete.guardar(trabajador, "trabajador")
+
+        recuperado = self.paquete.cargar("trabajador")
+        self.assertEqual(recuperado.nombre, "Ana")
+        self.assertEqual(recuperado.tareas[0].herramienta.nombre, "Tijera")
+        self.assertIsNone(recuperado.apto_medico)
+
+    def test_estado_con_formato_dict_anterior(self):
+        """El estado tal como lo guardaban las entidades con __dict__."""
+        pino = Pino.__new__(Pino)
+        pino.__setstate__({"nombre": "Pino", "superficie": 10, "altura": 1.05, "produccion_anual": 0})
+        self.assertEqual(pino.altura, 1.05)
+
+        olivo = Olivo.__new__(Olivo)
+        olivo.__setstate__((None, {"nombre": "Olivo", "superficie": 8, "altura": 1.2,
+                                   "produccion_anual": 0, "tipo_aceituna": TipoAceituna.PICUAL}))
+        self.assertEqual(olivo.tipo_aceituna, TipoAceituna.PICUAL)
+
+    def test_carga_dat_existente(self):
+        """Los .dat escritos con el esquema de __dict__ siguen cargando."""
+        for nombre in ("registro_inicial.dat", "registro_final.dat"):
+            with open(os.path.join(RUTA_DATA, nombre), "rb") as archivo:
+                registro = pickle.load(archivo)
+            for plantacion in registro.listar_todas():
+                self.assertEqual(plantacion.superficie_ocupada,
+                                 sum(cultivo.superficie for cultivo in plantacion.cultivos))
+                for cultivo in plantacion.cultivos:
+                    self.assertFalse(hasattr(cultivo, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
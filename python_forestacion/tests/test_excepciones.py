@@ -23,6 +23,10 @@ class TestExcepciones(unittest.TestCase):
         self.assertIsInstance(exc_superficie, ForestacionException)
         self.assertIsInstance(exc_persistencia, ForestacionException)
 
+    def test_superficie_es_value_error(self):
+        """SuperficieInsuficienteException se sigue capturando como ValueError."""
+        self.assertIsInstance(SuperficieInsuficienteException(), ValueError)
+
     def test_mensaje_personalizado(self):
         """PersistenciaException debe incluir detalles personalizados."""
         exc = PersistenciaException("Error al guardar")
@@ -1,9 +1,13 @@
 import unittest
 import os
 import shutil
+import sys
 from python_forestacion.servicios.negocio.fincas_service import FincasService
 from python_forestacion.servicios.negocio.paquete import Paquete
 from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.cultivos.arbol import Arbol
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
 from python_forestacion.excepciones.persistencia_exception import PersistenciaException
 
 
@@ -121,5 +125,59 @@ class TestFincasService(unittest.TestCase):
             self.paquete.cargar("archivo_inexistente")
 
 
+class TestCosecha(unittest.TestCase):
+    """Pruebas de cosechar_y_empaquetar sobre varias fincas."""
+
+    def setUp(self):
+        self.service = FincasService()
+        for i in range(5):
+            plantacion = self.service.crear_finca(i, 500.0, f"Ruta {i}", f"Finca {i}").plantacion
+            plantacion.plantar_lote("Pino", 4 + i, altura=1.0 + i)
+            plantacion.plantar_lote("Olivo", 2)
+            plantacion.plantar_lote("Lechuga", 10)
+
+    def test_cosecha_resume_todas_las_fincas(self):
+        paquete = self.service.cosechar_y_empaquetar(Pino, max_hilos=3)
+        self.assertEqual(len(paquete), 30)
+        self.assertEqual(paquete.cantidad_por_clase, {"Pino": 30})
+        self.assertEqual(paquete.cantidad_por_plantacion["Finca 4"], 8)
+
+        altura = paquete.estadistica("altura")
+        self.assertEqual((altura.minimo, altura.maximo), (1.0, 5.0))
+        self.assertAlmostEqual(altura.total, sum((4 + i) * (1.0 + i) for i in range(5)))
+        self.assertIsNone(paquete.estadistica("dias_crecimiento"))
+
+    def test_cosecha_quita_los_cultivos(self):
+        paquete = self.service.cosechar_y_empaquetar(Arbol)
+        self.assertEqual(paquete.cantidad_por_clase, {"Pino": 30, "Olivo": 10})
+        for plantacion in self.service.listar_plantaciones():
+            self.assertEqual(plantacion.contar_por_tipo(), {Lechuga: 10})
+            self.assertEqual(plantacion.superficie_ocupada, 20.0)
+        self.assertEqual(len(self.service.cosechar_y_empaquetar(Arbol)), 0)
+
+    def test_indices_del_registro_con_hilos(self):
+        # Muchas fincas y cambios de hilo frecuentes: los avisos de cada hilo tocan los índices compartidos
+        for i in range(5, 200):
+            plantacion = self.service.crear_finca(i, 500.0, f"Ruta {i}", f"Finca {i}").plantacion
+            plantacion.plantar_lote("Pino", 2)
+            plantacion.plantar_lote("Lechuga", 1)
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            paquete = self.service.cosechar_y_empaquetar(Pino, max_hilos=8)
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        registro = self.service.obtener_registro()
+        self.assertEqual(len(paquete), 30 + 2 * 195)
+        self.assertEqual(registro.nombres_con_tipo(Pino), [])
+        self.assertEqual(len(registro.nombres_con_tipo(Lechuga)), 200)
+
+    def test_combinar_tipos_distintos(self):
+        paquete = self.service.cosechar_y_empaquetar(Pino)
+        with self.assertRaises(ValueError):
+            paquete.combinar(self.service.cosechar_y_empaquetar(Lechuga))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
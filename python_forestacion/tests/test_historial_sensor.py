@@ -0,0 +1,153 @@
+import os
+import shutil
+import tempfile
+import unittest
+from itertools import count
+
+from python_forestacion.riego.historial.archivo_serie import ArchivoSerie
+from python_forestacion.riego.historial.buffer_circular import BufferCircular
+from python_forestacion.riego.historial.serie_sensor import SerieSensor
+from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
+from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+
+
+class TestBufferCircular(unittest.TestCase):
+    """Columnas paralelas de capacidad fija que pisan lo más antiguo."""
+
+    def test_vuelta_y_busqueda(self):
+        buffer = BufferCircular(4, (("instante", "d"), ("valor", "q")))
+        memoria = buffer.memoria_bytes()
+        for i in range(6):
+            buffer.agregar(float(i), i * 10)
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(list(buffer.columna("valor")), [20, 30, 40, 50])
+        self.assertEqual(len(buffer.tramos("valor")), 2)
+        self.assertEqual(list(buffer.columna("valor", 3)), [50])
+        self.assertEqual(buffer.buscar("instante", 3.5), 2)
+        self.assertEqual(buffer.valor("valor", -1), 50)
+        self.assertEqual(buffer.memoria_bytes(), memoria)
+        with self.assertRaises(IndexError):
+            buffer.valor("valor", 4)
+
+
+class TestSerieSensor(unittest.TestCase):
+    """Historial de lecturas con agregados por minuto y por hora."""
+
+    def setUp(self):
+        # Una lectura cada 10 segundos: valores 0, 1, 2, ... en t = 0, 10, 20, ...
+        self.serie = SerieSensor(capacidad=100, capacidad_minutos=30, capacidad_horas=5)
+        for i in range(3 * 360):
+            self.serie.agregar(float(i), instante=i * 10.0)
+        self.ahora = 3 * 3600.0
+
+    def test_ventana_cruda(self):
+        resumen = self.serie.resumen(300, ahora=self.ahora)
+        self.assertEqual(resumen["resolucion"], "cruda")
+        self.assertEqual((resumen["minimo"], resumen["maximo"], resumen["cantidad"]), (1050.0, 1079.0, 30))
+        self.assertEqual(resumen["promedio"], 1064.5)
+        instantes, valores = self.serie.lecturas(desde=self.ahora - 30)
+        self.assertEqual(list(valores), [1077.0, 1078.0, 1079.0])
+        self.assertEqual(len(self.serie), 100)
+
+    def test_ventanas_por_minuto_y_hora(self):
+        por_minuto = self.serie.resumen(1200, ahora=self.ahora)
+        self.assertEqual(por_minuto["resolucion"], "minuto")
+        self.assertEqual((por_minuto["minimo"], por_minuto["maximo"], por_minuto["cantidad"]), (960.0, 1079.0, 120))
+        por_hora = self.serie.resumen(2 * 3600, ahora=self.ahora)
+        self.assertEqual(por_hora["resolucion"], "hora")
+        self.assertEqual((por_hora["minimo"], por_hora["cantidad"]), (360.0, 720))
+
+        self.assertEqual(self.serie.por_minuto()[-1], (10740.0, 1074.0, 1079.0, 1076.5, 6))
+        self.assertEqual(len(self.serie.por_minuto()), 30 + 1)
+        self.assertEqual([hora[0] for hora in self.serie.por_hora()], [0.0, 3600.0, 7200.0])
+
+    def test_memoria_acotada(self):
+        memoria = self.serie.memoria_bytes()
+        for i in range(10_000):
+            self.serie.agregar(1.0, instante=self.ahora + i * 10.0)
+        self.assertEqual(self.serie.memoria_bytes(), memoria)
+        self.assertEqual(len(self.serie.por_hora()), 5 + 1)
+
+    def test_adjuntar_a_sensores(self):
+        reloj = count(100.0)
+        temperatura = TemperaturaReaderTask()
+        humedad = HumedadReaderTask()
+        serie_temperatura = SerieSensor.adjuntar(temperatura, reloj=reloj.__next__)
+        serie_humedad = SerieSensor.adjuntar(humedad, capacidad=8)
+        lecturas = [temperatura.leer() for _ in range(3)]
+        humedad.leer()
+
+        self.assertEqual(list(serie_temperatura.lecturas()[1]), lecturas)
+        self.assertEqual(list(serie_temperatura.lecturas()[0]), [100.0, 101.0, 102.0])
+        self.assertEqual(len(serie_humedad), 1)
+
+
+class TestArchivoSerie(unittest.TestCase):
+    """Historial en disco: segmentos de solo agregado con índice disperso."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        # Tres lecturas por instante (0, 0, 0, 1, 1, 1, ...), valores 0, 1, 2, ...
+        self.lecturas = [(float(i // 3), float(i)) for i in range(200)]
+        with self._abrir() as archivo:
+            for instante, valor in self.lecturas:
+                archivo.agregar(valor, instante)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _abrir(self, **opciones) -> ArchivoSerie:
+        return ArchivoSerie(self.directorio, registros_por_segmento=50, registros_por_entrada=4,
+                            registros_buffer=7, **opciones)
+
+    def _esperado(self, desde, hasta) -> list[float]:
+        return [valor for instante, valor in self.lecturas if desde <= instante <= hasta]
+
+    def test_rangos_entre_segmentos(self):
+        with self._abrir(solo_lectura=True) as archivo:
+            self.assertEqual(len(archivo), 200)
+            self.assertEqual(len(os.listdir(self.directorio)), 2 * 4)
+            for desde, hasta in ((0, 66), (5, 5), (16, 17), (10.5, 40.2), (-3, 1), (66, 99), (70, 80)):
+                instantes, valores = archivo.rango(desde, hasta)
+                self.assertEqual(list(valores), self._esperado(desde, hasta), (desde, hasta))
+                self.assertTrue(all(desde <= instante <= hasta for instante in instantes))
+            self.assertEqual(list(archivo.rango()[1]), [valor for _, valor in self.lecturas])
+
+    def test_reabre_y_sigue_agregando(self):
+        with self._abrir() as archivo:
+            archivo.agregar(500.0, 70.0)
+            with self.assertRaises(ValueError):
+                archivo.agregar(1.0, 69.0)
+            self.assertEqual(archivo.resumen(10, ahora=75.0),
+                             {"minimo": 195.0, "maximo": 500.0, "promedio": 247.5, "cantidad": 6})
+        with self._abrir(solo_lectura=True) as archivo:
+            self.assertEqual(len(archivo), 201)
+            with self.assertRaises(ValueError):
+                archivo.agregar(1.0, 80.0)
+
+    def test_repara_escritura_interrumpida(self):
+        segmento = os.path.join(self.directorio, "00000003.pfs")
+        with open(segmento, "ab") as archivo:
+            archivo.write(b"\x01\x02\x03")
+        # Índice sin su última entrada
+        indice = os.path.join(self.directorio, "00000003.pfi")
+        os.truncate(indice, os.path.getsize(indice) - 8)
+
+        with self._abrir() as archivo:
+            self.assertEqual(list(archivo.rango(60, 66)[1]), self._esperado(60, 66))
+        self.assertEqual((os.path.getsize(segmento) - 16) % 16, 0)
+        self.assertEqual(os.path.getsize(indice), 8 * 13)
+
+    def test_adjuntar_a_sensor(self):
+        directorio = os.path.join(self.directorio, "temperatura")
+        temperatura = TemperaturaReaderTask()
+        with ArchivoSerie.adjuntar(temperatura, directorio, reloj=count(1000.0).__next__) as archivo:
+            lecturas = [temperatura.leer() for _ in range(3)]
+            instantes, valores = archivo.rango(1001.0)
+        self.assertEqual(list(instantes), [1001.0, 1002.0])
+        self.assertEqual(list(valores), lecturas[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
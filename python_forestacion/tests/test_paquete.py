@@ -0,0 +1,669 @@
+import os
+import pickle
+import shutil
+import tempfile
+import struct
+import threading
+import unittest
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from unittest.mock import patch
+
+from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.negocio import paquete_fragmentado
+from python_forestacion.servicios.negocio.paquete_fragmentado import PaqueteFragmentado
+from python_forestacion.servicios.negocio.paquete_delta import PaqueteDelta
+from python_forestacion.servicios.negocio.persistencia.mutacion import Mutacion
+from python_forestacion.servicios.negocio.persistencia.journal import Journal
+from python_forestacion.servicios.negocio.persistencia import formato_binario
+from python_forestacion.servicios.negocio.persistencia.escritor_asincrono import EscritorAsincrono
+from python_forestacion.servicios.negocio.persistencia.escritura_atomica import escribir_atomico
+from python_forestacion.servicios.negocio.persistencia.cache_carga import CacheCarga
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.registro_perezoso import RegistroPerezoso
+from python_forestacion.Entidades.terrenos.tierra import Tierra
+from python_forestacion.Entidades.personal.trabajador import Trabajador
+from python_forestacion.Entidades.personal.tarea import Tarea
+from python_forestacion.Entidades.personal.herramienta import Herramienta
+from python_forestacion.Entidades.personal.apto_medico import AptoMedico
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.excepciones.persistencia_exception import PersistenciaException
+from python_forestacion.excepciones.superficie_insuficiente_exception import SuperficieInsuficienteException
+from constante import UMBRAL_CARGA_PARALELA
+
+
+def _registro() -> RegistroForestal:
+    registro = RegistroForestal()
+    registro.agregar_plantacion(Plantacion("Finca 1", 1000.0, 100.0), id_padron=1)
+    return registro
+
+
+class _Registro(RegistroForestal):
+    """Subclase de registro definida por el usuario."""
+
+
+def _escribir_bytes(contenido: bytes, archivo) -> None:
+    archivo.write(contenido)
+
+
+class TestPaqueteJournal(unittest.TestCase):
+    """Persistencia con write-ahead log y snapshots."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.paquete = Paquete(self.directorio, journal=True, compactar_cada=5)
+        self.registro = _registro()
+        self.paquete.guardar(self.registro, "registro")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _ruta(self, extension: str) -> str:
+        return os.path.join(self.directorio, f"registro{extension}")
+
+    def _mutar(self, *mutaciones: Mutacion) -> None:
+        for mutacion in mutaciones:
+            self.paquete.aplicar_mutacion(self.registro, "registro", mutacion)
+
+    def test_recupera_snapshot_y_journal(self):
+        tamano_snapshot = os.path.getsize(self._ruta(".dat"))
+        self._mutar(
+            Mutacion("plantar_lote", "Pino", 3, destino="Finca 1"),
+            Mutacion("agregar_plantacion", Plantacion("Finca 2", 50.0, 10.0), id_padron=2),
+        )
+        self.assertEqual(os.path.getsize(self._ruta(".dat")), tamano_snapshot)
+
+        cargado = Paquete(self.directorio, journal=True).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 3})
+        self.assertEqual(cargado.buscar_por_padron(2).nombre, "Finca 2")
+
+    def test_compacta_cada_n_mutaciones(self):
+        self._mutar(*[Mutacion("plantar_lote", "Pino", 1, destino="Finca 1") for _ in range(5)])
+        self.assertEqual(os.path.getsize(self._ruta(".wal")), 0)
+        self._mutar(Mutacion("plantar_lote", "Pino", 1, destino="Finca 1"))
+
+        paquete = Paquete(self.directorio, journal=True, compactar_cada=5)
+        cargado = paquete.cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 6})
+        # La secuencia continúa después de cargar
+        paquete.aplicar_mutacion(cargado, "registro", Mutacion("plantar_lote", "Pino", 1, destino="Finca 1"))
+        self.assertEqual(paquete.cargar("registro").buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 7})
+
+    def test_paquete_nuevo_continua_la_secuencia(self):
+        # Tras compactar, el snapshot incluye la secuencia 5
+        self._mutar(*[Mutacion("plantar_lote", "Pino", 1, destino="Finca 1") for _ in range(5)])
+        Paquete(self.directorio, journal=True).aplicar_mutacion(
+            self.registro, "registro", Mutacion("plantar_lote", "Pino", 1, destino="Finca 1"))
+        # Sin compactar, la secuencia sigue la del último registro del journal
+        Paquete(self.directorio, journal=True).aplicar_mutacion(
+            self.registro, "registro", Mutacion("plantar_lote", "Pino", 1, destino="Finca 1"))
+
+        cargado = Paquete(self.directorio, journal=True).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 7})
+
+    def test_descarta_registro_incompleto(self):
+        self._mutar(Mutacion("plantar_lote", "Pino", 2, destino="Finca 1"))
+        with open(self._ruta(".wal"), "ab") as archivo:
+            archivo.write(b"\x40\x00\x00\x00basura")
+
+        cargado = Paquete(self.directorio, journal=True).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 2})
+
+    def test_mutacion_fallida_no_se_registra(self):
+        self._mutar(Mutacion("plantar_lote", "Pino", 2, destino="Finca 1"))
+        tamano_log = os.path.getsize(self._ruta(".wal"))
+        with self.assertRaises(SuperficieInsuficienteException):
+            self._mutar(Mutacion("plantar_lote", "Pino", 1000, destino="Finca 1"))
+        self.assertEqual(os.path.getsize(self._ruta(".wal")), tamano_log)
+
+        self._mutar(Mutacion("plantar_lote", "Pino", 1, destino="Finca 1"))
+        cargado = Paquete(self.directorio, journal=True).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 3})
+
+    def test_registra_antes_de_aplicar(self):
+        with patch.object(Journal, "agregar", side_effect=OSError("disco lleno")):
+            with self.assertRaises(PersistenciaException):
+                self._mutar(Mutacion("plantar_lote", "Pino", 2, destino="Finca 1"))
+        self.assertEqual(self.registro.buscar_plantacion("Finca 1").cultivos, [])
+
+    def test_compatible_con_modo_sin_journal(self):
+        self._mutar(Mutacion("plantar_lote", "Pino", 2, destino="Finca 1"))
+        self.paquete.compactar(self.registro, "registro")
+        cargado = Paquete(self.directorio).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 2})
+
+    def test_journal_sin_snapshot(self):
+        os.remove(self._ruta(".dat"))
+        with self.assertRaises(PersistenciaException):
+            Paquete(self.directorio, journal=True).cargar("registro")
+
+
+class TestFormatoColumnar(unittest.TestCase):
+    """Snapshot columnar abierto con mmap y decodificado bajo demanda."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.paquete = Paquete(self.directorio)
+        self.registro = RegistroForestal()
+        lista = Plantacion("Lista", 1000.0, 80.0)
+        lista.plantar_lote("Olivo", 3, tipo_aceituna=TipoAceituna.PICUAL)
+        lista.plantar_lote("Lechuga", 4)
+        columnar = Plantacion("Columnar", 1000.0, 40.0, columnar=True)
+        columnar.plantar_lote("Pino", 5, altura=3.5)
+        self.registro.agregar_plantacion(lista, id_padron=7)
+        self.registro.agregar_plantacion(columnar)
+        self.registro.agregar_plantacion(Plantacion("Vacía", 10.0, 0.0))
+        self.paquete.guardar_columnar(self.registro, "registro")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_resumen_sin_decodificar(self):
+        with self.paquete.abrir_columnar("registro") as abierto:
+            self.assertEqual(abierto.nombres(), ["Lista", "Columnar", "Vacía"])
+            resumen = abierto.resumen("Lista")
+            self.assertEqual(resumen["id_padron"], 7)
+            self.assertEqual(resumen["cantidad_cultivos"], 7)
+            self.assertEqual(resumen["conteo_por_tipo"], {Olivo: 3, Lechuga: 4})
+            self.assertEqual(resumen["superficie_ocupada"], 32.0)
+            self.assertEqual(abierto._decodificadas, {})
+
+    def test_decodifica_al_acceder(self):
+        with self.paquete.abrir_columnar("registro") as abierto:
+            lista = abierto.buscar_plantacion("Lista")
+            self.assertFalse(lista.es_columnar)
+            self.assertEqual(lista.cultivos_de_tipo(Olivo)[0].tipo_aceituna, TipoAceituna.PICUAL)
+            self.assertIs(abierto.buscar_plantacion("Lista"), lista)
+            columnar = abierto.buscar_plantacion("Columnar")
+            self.assertTrue(columnar.es_columnar)
+            self.assertEqual([c.altura for c in columnar.cultivos], [3.5] * 5)
+            self.assertIsNone(abierto.buscar_plantacion("No existe"))
+
+    def test_a_registro(self):
+        with self.paquete.abrir_columnar("registro") as abierto:
+            registro = abierto.a_registro()
+        self.assertEqual(registro.buscar_por_padron(7).nombre, "Lista")
+        self.assertEqual(registro.buscar_plantacion("Columnar").agua_disponible, 40.0)
+        self.assertEqual(len(registro.buscar_plantacion("Vacía").cultivos), 0)
+
+    def test_archivo_invalido(self):
+        self.paquete.guardar(self.registro, "pickle")
+        os.replace(os.path.join(self.directorio, "pickle.dat"), os.path.join(self.directorio, "pickle.pfc"))
+        with self.assertRaises(PersistenciaException):
+            self.paquete.abrir_columnar("pickle")
+        with self.assertRaises(PersistenciaException):
+            self.paquete.abrir_columnar("no_existe")
+
+
+class TestFormatoPaquete(unittest.TestCase):
+    """Protocolo, compresión y buffers fuera de banda en los .dat."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.registro = RegistroForestal()
+        columnar = Plantacion("Columnar", 1e6, 40.0, columnar=True)
+        columnar.plantar_lote("Pino", 2000, altura=2.5)
+        columnar.plantar_lote("Zanahoria", 500)
+        lista = Plantacion("Lista", 1000.0, 10.0)
+        lista.plantar_lote("Lechuga", 20)
+        self.registro.agregar_plantacion(columnar, id_padron=1)
+        self.registro.agregar_plantacion(lista)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _ida_y_vuelta(self, **opciones) -> RegistroForestal:
+        paquete = Paquete(self.directorio, **opciones)
+        paquete.guardar(self.registro, "registro")
+        # La lectura no necesita las opciones: las toma de la cabecera
+        return Paquete(self.directorio).cargar("registro")
+
+    def test_combinaciones(self):
+        for compresion in (None, "zlib", "bz2", "lzma"):
+            for protocolo, fuera_de_banda in ((4, False), (5, False), (5, True)):
+                with self.subTest(compresion=compresion, protocolo=protocolo, fuera_de_banda=fuera_de_banda):
+                    cargado = self._ida_y_vuelta(protocolo=protocolo, compresion=compresion,
+                                                 fuera_de_banda=fuera_de_banda)
+                    columnar = cargado.buscar_plantacion("Columnar")
+                    self.assertTrue(columnar.es_columnar)
+                    self.assertEqual(len(columnar.cultivos_de_tipo(Pino)), 2000)
+                    self.assertEqual(columnar.cultivos[1999].altura, 2.5)
+                    self.assertEqual(cargado.buscar_por_padron(1), columnar)
+                    self.assertEqual(len(cargado.buscar_plantacion("Lista").cultivos), 20)
+
+    def test_compresion_reduce_tamano(self):
+        ruta = os.path.join(self.directorio, "registro.dat")
+        self._ida_y_vuelta(protocolo=5, fuera_de_banda=True)
+        sin_comprimir = os.path.getsize(ruta)
+        self._ida_y_vuelta(protocolo=5, fuera_de_banda=True, compresion="zlib")
+        self.assertLess(os.path.getsize(ruta), sin_comprimir / 5)
+
+    def test_lee_pickle_plano(self):
+        with open(os.path.join(self.directorio, "registro.dat"), "wb") as archivo:
+            pickle.dump(self.registro, archivo)
+        cargado = Paquete(self.directorio, compresion="lzma").cargar("registro")
+        self.assertEqual(len(cargado.buscar_plantacion("Columnar").cultivos), 2500)
+
+    def test_opciones_invalidas(self):
+        with self.assertRaises(ValueError):
+            Paquete(self.directorio, compresion="zip")
+        with self.assertRaises(ValueError):
+            Paquete(self.directorio, protocolo=4, fuera_de_banda=True)
+
+    def test_journal_comprimido(self):
+        paquete = Paquete(self.directorio, journal=True, compresion="bz2", protocolo=5, fuera_de_banda=True)
+        paquete.guardar(self.registro, "registro")
+        paquete.aplicar_mutacion(self.registro, "registro", Mutacion("plantar_lote", "Pino", 5, destino="Lista"))
+        cargado = Paquete(self.directorio, journal=True).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Lista").contar_por_tipo()[Pino], 5)
+
+
+class TestFormatoBinario(unittest.TestCase):
+    """Codec binario propio como formato de Paquete."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_registro_ida_y_vuelta(self):
+        registro = RegistroForestal()
+        columnar = Plantacion("Columnar", 1000.0, 40.0, columnar=True)
+        columnar.plantar_lote("Pino", 30, altura=2.5)
+        lista = Plantacion("Lista", 1000.0, 10.0)
+        olivo = Olivo(3.0, 1.0, TipoAceituna.ARBEQUINA)
+        lista.habilitar_indice_espacial(50.0, 50.0)
+        lista.agregar_cultivo(olivo, posicion=(10.0, 20.0))
+        lista.plantar_lote("Zanahoria", 3, profundidad=0.3)
+        registro.agregar_plantacion(columnar, id_padron=7)
+        registro.agregar_plantacion(lista)
+
+        Paquete(self.directorio, formato="binario").guardar(registro, "registro")
+        cargado = Paquete(self.directorio).cargar("registro")
+
+        self.assertEqual(cargado.buscar_por_padron(7).cultivos[29].altura, 2.5)
+        self.assertTrue(cargado.buscar_plantacion("Columnar").es_columnar)
+        self.assertIsNone(cargado.padron_de("Lista"))
+        lista_cargada = cargado.buscar_plantacion("Lista")
+        olivo_cargado = lista_cargada.cultivos_de_tipo(Olivo)[0]
+        self.assertEqual(olivo_cargado.tipo_aceituna, TipoAceituna.ARBEQUINA)
+        self.assertEqual(lista_cargada.posicion_de(olivo_cargado), (10.0, 20.0))
+        self.assertEqual(lista_cargada.cultivos[-1].profundidad, 0.3)
+
+    def test_tierra_y_trabajadores(self):
+        tierra = Tierra(5, 200.0, "Ruta 3", "Finca")
+        tierra.set_plantacion(Plantacion("Finca", 200.0, 5.0))
+        trabajador = Trabajador("Ana", "30123456", 35)
+        trabajador.asignar_apto_medico(AptoMedico(date(2026, 1, 1), date(2027, 1, 1), "Apto"))
+        trabajador.asignar_tarea(Tarea("Podar", date(2026, 5, 2), Herramienta("Tijera", "operativa")))
+        trabajador.tareas[0].completar()
+
+        tierra_cargada, _ = formato_binario.decodificar(formato_binario.codificar(tierra))
+        self.assertEqual((tierra_cargada.id_padron, tierra_cargada.domicilio), (5, "Ruta 3"))
+        self.assertEqual(tierra_cargada.plantacion.nombre, "Finca")
+
+        (cargado,), _ = formato_binario.decodificar(formato_binario.codificar([trabajador]))
+        self.assertEqual(cargado.apto_medico.valido_hasta, date(2027, 1, 1))
+        self.assertTrue(cargado.tareas[0].completada)
+        self.assertEqual(cargado.tareas[0].herramienta.nombre, "Tijera")
+
+    def test_lee_campos_de_versiones_posteriores(self):
+        datos = bytearray(formato_binario.codificar(Tarea("Regar", date(2026, 1, 1), Herramienta("Pala", "ok"))))
+        inicio = formato_binario.CABECERA.size
+        etiqueta, largo = formato_binario.REGISTRO.unpack_from(datos, inicio)
+        # Una versión posterior del esquema agrega un campo al final del registro
+        datos += struct.pack("<d", 1.5)
+        formato_binario.REGISTRO.pack_into(datos, inicio, etiqueta, largo + 8)
+        formato_binario.CABECERA.pack_into(datos, 0, formato_binario.MAGICO, formato_binario.VERSION_ESQUEMA + 1, -1)
+
+        tarea, secuencia = formato_binario.decodificar(bytes(datos))
+        self.assertEqual(tarea.descripcion, "Regar")
+        self.assertIsNone(secuencia)
+        with self.assertRaises(ValueError):
+            formato_binario.decodificar(bytes(datos[:-12]))
+
+    def test_journal_y_errores(self):
+        paquete = Paquete(self.directorio, journal=True, formato="binario")
+        registro = _registro()
+        paquete.guardar(registro, "registro")
+        paquete.aplicar_mutacion(registro, "registro", Mutacion("plantar_lote", "Pino", 2, destino="Finca 1"))
+        cargado = Paquete(self.directorio, journal=True).cargar("registro")
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 2})
+
+        with self.assertRaises(PersistenciaException):
+            Paquete(self.directorio, formato="binario").guardar({"no": "soportado"}, "otro")
+        with self.assertRaises(ValueError):
+            Paquete(self.directorio, formato="binario", compresion="zlib")
+        with self.assertRaises(ValueError):
+            Paquete(self.directorio, formato="json")
+
+
+class TestCacheCarga(unittest.TestCase):
+    """Caché de cargas validada por tamaño, mtime e inodo del archivo."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_copia_independiente_y_recarga_al_cambiar(self):
+        cache = CacheCarga()
+        paquete = Paquete(self.directorio, cache=cache)
+        paquete.guardar(_registro(), "registro")
+        primera = paquete.cargar("registro")
+        segunda = Paquete(self.directorio, cache=cache).cargar("registro")
+        segunda.buscar_plantacion("Finca 1").plantar_lote("Pino", 2)
+        self.assertEqual((cache.aciertos, cache.fallos), (1, 1))
+        self.assertIsNot(primera, segunda)
+        self.assertEqual(paquete.cargar("registro").buscar_plantacion("Finca 1").contar_por_tipo(), {})
+
+        paquete.guardar(segunda, "registro")
+        self.assertEqual(paquete.cargar("registro").buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 2})
+        self.assertEqual((cache.aciertos, cache.fallos), (2, 2))
+
+    def test_copia_de_registro_es_perezosa(self):
+        paquete = Paquete(self.directorio, cache=CacheCarga())
+        paquete.guardar(_registro(), "registro")
+        cargas = [paquete.cargar("registro") for _ in range(2)]
+
+        for registro in cargas:
+            self.assertIs(type(registro), RegistroPerezoso)
+            self.assertIsInstance(registro, RegistroForestal)
+            self.assertEqual(registro.buscar_por_padron(1).nombre, "Finca 1")
+        self.assertIs(type(pickle.loads(pickle.dumps(cargas[0]))), RegistroForestal)
+
+        Paquete(self.directorio).guardar(_Registro(), "subclase")
+        self.assertIs(type(paquete.cargar("subclase")), _Registro)
+        self.assertIs(type(paquete.cargar("subclase")), _Registro)
+
+    def test_modo_no_soportado(self):
+        with self.assertRaises(ValueError):
+            CacheCarga(modo="solo_lectura")
+
+    def test_expulsa_por_memoria(self):
+        for nombre in ("a", "b", "c"):
+            Paquete(self.directorio).guardar(list(range(1000)), nombre)
+        tamano = len(pickle.dumps(list(range(1000)), protocol=5))
+        cache = CacheCarga(capacidad_bytes=2 * tamano)
+        paquete = Paquete(self.directorio, cache=cache)
+        for nombre in ("a", "b", "a", "c", "a", "b"):
+            paquete.cargar(nombre)
+
+        self.assertEqual((cache.aciertos, cache.fallos, cache.expulsiones), (2, 4, 2))
+        self.assertEqual((len(cache), cache.tamano_bytes), (2, 2 * tamano))
+        with self.assertRaises(PersistenciaException):
+            paquete.cargar("no_existe")
+
+    def test_opciones_invalidas(self):
+        with self.assertRaises(ValueError):
+            Paquete(self.directorio, journal=True, cache=CacheCarga())
+        with self.assertRaises(ValueError):
+            CacheCarga(modo="compartido")
+
+
+class TestGuardadoAsincrono(unittest.TestCase):
+    """Hilo escritor con reemplazo atómico y agrupación de guardados."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.paquete = Paquete(self.directorio)
+
+    def tearDown(self):
+        self.paquete.cerrar()
+        shutil.rmtree(self.directorio)
+
+    def test_guardar_async(self):
+        registro = _registro()
+        futuro = self.paquete.guardar_async(registro, "registro")
+        self.assertEqual(futuro.result(timeout=5), os.path.join(self.directorio, "registro.dat"))
+        self.assertEqual(self.paquete.cargar("registro").buscar_por_padron(1).nombre, "Finca 1")
+        self.assertEqual([n for n in os.listdir(self.directorio) if n.endswith(".tmp")], [])
+
+    def test_instantanea_por_defecto(self):
+        registro = _registro()
+        futuro = self.paquete.guardar_async(registro, "registro")
+        registro.buscar_plantacion("Finca 1").plantar_lote("Pino", 3)
+        futuro.result(timeout=5)
+        self.assertEqual(len(self.paquete.cargar("registro").buscar_plantacion("Finca 1").cultivos), 0)
+
+    def test_sin_instantanea(self):
+        futuro = self.paquete.guardar_async(_registro(), "registro", instantanea=False)
+        self.assertEqual(futuro.result(timeout=5), os.path.join(self.directorio, "registro.dat"))
+        self.assertEqual(self.paquete.cargar("registro").buscar_por_padron(1).nombre, "Finca 1")
+
+    def test_escrituras_simultaneas_del_mismo_archivo(self):
+        ruta = os.path.join(self.directorio, "compartido")
+        errores = []
+
+        def escribir(contenido):
+            try:
+                for _ in range(50):
+                    escribir_atomico(ruta, partial(_escribir_bytes, contenido), sincronizar=False)
+            except Exception as e:
+                errores.append(e)
+
+        hilos = [threading.Thread(target=escribir, args=(bytes([i]) * 4096,)) for i in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(errores, [])
+        with open(ruta, "rb") as archivo:
+            contenido = archivo.read()
+        self.assertEqual(len(set(contenido)), 1)
+        self.assertEqual(len(contenido), 4096)
+        self.assertEqual([n for n in os.listdir(self.directorio) if n.endswith(".tmp")], [])
+
+    def test_cerrar_se_registra_al_salir(self):
+        escritor = EscritorAsincrono()
+        with patch("atexit.register") as registrar, patch("atexit.unregister") as desregistrar:
+            escritor.encolar(os.path.join(self.directorio, "a"), partial(_escribir_bytes, b"a")).result(timeout=5)
+            escritor.cerrar()
+        registrar.assert_called_once_with(escritor.cerrar)
+        desregistrar.assert_called_once_with(escritor.cerrar)
+
+    def test_agrupa_guardados_pendientes(self):
+        escritor = EscritorAsincrono()
+        liberar = threading.Event()
+        escritos = []
+
+        def bloquear(archivo):
+            liberar.wait(5)
+
+        def escribir_version(version):
+            def escribir(archivo):
+                escritos.append(version)
+                archivo.write(version.encode())
+            return escribir
+
+        escritor.encolar(os.path.join(self.directorio, "a"), bloquear)
+        ruta = os.path.join(self.directorio, "b")
+        futuros = [escritor.encolar(ruta, escribir_version(str(i))) for i in range(5)]
+        liberar.set()
+        escritor.cerrar()
+
+        self.assertTrue(all(futuro is futuros[0] for futuro in futuros))
+        self.assertEqual(escritos, ["4"])
+        self.assertEqual((escritor.escrituras, escritor.agrupadas), (2, 4))
+        with open(ruta) as archivo:
+            self.assertEqual(archivo.read(), "4")
+
+    def test_error_en_future(self):
+        futuro = self.paquete.guardar_async(threading.Lock(), "no_serializable")
+        with self.assertRaises(PersistenciaException):
+            futuro.result(timeout=5)
+        self.assertFalse(os.path.exists(os.path.join(self.directorio, "no_serializable.dat")))
+
+    def test_no_disponible_en_modo_journal(self):
+        with self.assertRaises(PersistenciaException):
+            Paquete(self.directorio, journal=True).guardar_async(_registro(), "registro")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestPaqueteFragmentado(unittest.TestCase):
+    """Un archivo por plantación con manifiesto y guardado incremental."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.registro = RegistroForestal()
+        for i in range(3):
+            plantacion = Plantacion(f"Finca {i}", 500.0, 100.0)
+            plantacion.plantar_lote("Pino", i + 1)
+            self.registro.agregar_plantacion(plantacion, id_padron=10 + i)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _fragmentos(self) -> set[str]:
+        return {n for n in os.listdir(os.path.join(self.directorio, "registro")) if n.endswith(".dat")}
+
+    def test_guarda_solo_las_plantaciones_modificadas(self):
+        paquete = PaqueteFragmentado(self.directorio)
+        self.assertEqual(paquete.guardar(self.registro, "registro"), 3)
+        self.assertEqual(paquete.guardar(self.registro, "registro"), 0)
+
+        self.registro.buscar_plantacion("Finca 1").plantar_lote("Pino", 2)
+        self.assertEqual(paquete.guardar(self.registro, "registro"), 1)
+
+        cargado = paquete.cargar("registro")
+        self.assertEqual([p.nombre for p in cargado.listar_todas()], ["Finca 0", "Finca 1", "Finca 2"])
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 4})
+        self.assertEqual(cargado.padron_de("Finca 2"), 12)
+        self.assertFalse(cargado.buscar_plantacion("Finca 0").modificada)
+
+    def test_cada_destino_sabe_que_guardo(self):
+        paquete = PaqueteFragmentado(self.directorio)
+        paquete.guardar(self.registro, "a")
+        plantacion = self.registro.buscar_plantacion("Finca 1")
+        plantacion.plantar_lote("Pino", 2)
+
+        # Guardar en otro destino no limpia la marca de modificada (la base
+        # SQLite sigue viendo el cambio) ni hace que "a" se saltee el cambio
+        # cuando otro destino sí la limpia
+        self.assertEqual(paquete.guardar(self.registro, "b"), 3)
+        self.assertTrue(plantacion.modificada)
+        plantacion.marcar_guardada()
+        self.assertEqual(paquete.guardar(self.registro, "a"), 1)
+        self.assertEqual(paquete.guardar(self.registro, "b"), 0)
+
+        # Lo cargado conserva la huella: volver a guardarlo no escribe nada
+        cargado = PaqueteFragmentado(self.directorio).cargar("a")
+        self.assertEqual(PaqueteFragmentado(self.directorio).guardar(cargado, "a"), 0)
+        self.assertEqual(cargado.buscar_plantacion("Finca 1").contar_por_tipo(), {Pino: 4})
+
+    def test_borra_fragmentos_de_plantaciones_quitadas(self):
+        paquete = PaqueteFragmentado(self.directorio)
+        paquete.guardar(self.registro, "registro")
+        self.registro.eliminar_plantacion("Finca 0")
+        paquete.guardar(self.registro, "registro")
+
+        self.assertNotIn(PaqueteFragmentado.archivo_de("Finca 0"), self._fragmentos())
+        self.assertEqual(len(self._fragmentos()), 2)
+        self.assertIsNone(paquete.cargar("registro").buscar_plantacion("Finca 0"))
+
+    def test_carga_con_hilos_fragmentos_comprimidos(self):
+        for i in range(3, UMBRAL_CARGA_PARALELA + 3):
+            self.registro.agregar_plantacion(Plantacion(f"Finca {i}", 50.0, 10.0), id_padron=10 + i)
+        # Comprimidos por defecto
+        PaqueteFragmentado(self.directorio).guardar(self.registro, "registro")
+
+        with patch.object(paquete_fragmentado, "ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            cargado = PaqueteFragmentado(self.directorio, hilos=2).cargar("registro")
+        pool.assert_called_once_with(max_workers=2)
+        self.assertEqual(len(cargado.listar_todas()), UMBRAL_CARGA_PARALELA + 3)
+        self.assertEqual(cargado.buscar_por_padron(UMBRAL_CARGA_PARALELA + 12).nombre,
+                         f"Finca {UMBRAL_CARGA_PARALELA + 2}")
+        self.assertEqual(cargado.buscar_plantacion("Finca 2").contar_por_tipo(), {Pino: 3})
+
+    def test_sin_compresion_carga_en_este_proceso(self):
+        for i in range(3, UMBRAL_CARGA_PARALELA + 3):
+            self.registro.agregar_plantacion(Plantacion(f"Finca {i}", 50.0, 10.0), id_padron=10 + i)
+        PaqueteFragmentado(self.directorio, compresion=None).guardar(self.registro, "registro")
+
+        with patch.object(paquete_fragmentado, "ThreadPoolExecutor") as pool:
+            cargado = PaqueteFragmentado(self.directorio, hilos=2).cargar("registro")
+        pool.assert_not_called()
+        self.assertEqual(len(cargado.listar_todas()), UMBRAL_CARGA_PARALELA + 3)
+
+    def test_cargar_sin_manifiesto_lanza_excepcion(self):
+        with self.assertRaises(PersistenciaException):
+            PaqueteFragmentado(self.directorio).cargar("inexistente")
+
+
+class TestPaqueteDelta(unittest.TestCase):
+    """Versiones del registro sobre bloques direccionados por contenido."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.paquete = PaqueteDelta(self.directorio, cultivos_por_bloque=4)
+        self.registro = RegistroForestal()
+        for i in range(3):
+            plantacion = Plantacion(f"Finca {i}", 500.0, 100.0, columnar=i == 2)
+            plantacion.plantar_lote("Pino", 8)
+            plantacion.agregar_cultivo(Olivo(3.0, 1.0, TipoAceituna.PICUAL))
+            self.registro.agregar_plantacion(plantacion, id_padron=i)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_guarda_solo_bloques_cambiados(self):
+        self.paquete.guardar(self.registro, "v1")
+        self.assertEqual(self.paquete.guardar(self.registro, "v1_copia"), 0)
+
+        self.registro.buscar_plantacion("Finca 1").cultivos[0].altura = 7.0
+        # Un bloque de cultivos y el bloque de la plantación
+        self.assertEqual(self.paquete.guardar(self.registro, "v2"), 2)
+
+        v1 = self.paquete.cargar("v1")
+        v2 = self.paquete.cargar("v2")
+        self.assertEqual(v1.buscar_plantacion("Finca 1").cultivos[0].altura, 1.0)
+        self.assertEqual(v2.buscar_plantacion("Finca 1").cultivos[0].altura, 7.0)
+        self.assertEqual(v2.buscar_plantacion("Finca 0").contar_por_tipo(), {Pino: 8, Olivo: 1})
+        self.assertTrue(v2.buscar_plantacion("Finca 2").es_columnar)
+        self.assertEqual(v2.padron_de("Finca 2"), 2)
+        self.assertEqual(self.paquete.versiones(), ["v1", "v1_copia", "v2"])
+
+    def test_quitar_un_cultivo_no_corre_los_bloques(self):
+        plantacion = Plantacion("Grande", float("inf"), 100.0, columnar=True)
+        for i in range(400):
+            plantacion.agregar_cultivo(Pino(1.0, 1.0 + i / 100))
+        self.registro.agregar_plantacion(plantacion)
+        self.paquete.guardar(self.registro, "v1")
+
+        plantacion.remover_cultivo(plantacion.cultivos[5])
+        # Con cortes por posición cambiarían los ~100 bloques siguientes
+        self.assertLessEqual(self.paquete.guardar(self.registro, "v2"), 4)
+        alturas = [cultivo.altura for cultivo in self.paquete.cargar("v2").buscar_plantacion("Grande").cultivos]
+        self.assertEqual(alturas, [1.0 + i / 100 for i in range(400) if i != 5])
+
+    def test_recolecta_bloques_sin_versiones(self):
+        self.paquete.guardar(self.registro, "v1")
+        self.registro.eliminar_plantacion("Finca 0")
+        self.registro.buscar_plantacion("Finca 1").cultivos[-1].produccion_anual = 3.0
+        self.paquete.guardar(self.registro, "v2")
+        antes = len(self.paquete.bloques.claves())
+
+        self.assertTrue(self.paquete.eliminar_version("v1"))
+        self.assertGreater(self.paquete.recolectar(), 0)
+        self.assertLess(len(self.paquete.bloques.claves()), antes)
+        self.assertEqual(len(self.paquete.cargar("v2").listar_todas()), 2)
+
+    def test_bloque_danado_lanza_excepcion(self):
+        self.paquete.guardar(self.registro, "v1")
+        bloques = self.paquete.bloques
+        clave = sorted(bloques.claves())[0]
+        with open(os.path.join(bloques.directorio, clave), "wb") as archivo:
+            archivo.write(zlib.compress(b"otro contenido"))
+        with self.assertRaises(PersistenciaException):
+            self.paquete.cargar("v1")
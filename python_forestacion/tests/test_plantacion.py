@@ -0,0 +1,374 @@
+import io
+import os
+import pickle
+import unittest
+from contextlib import redirect_stdout
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.cultivos.arbol import Arbol
+from python_forestacion.Entidades.cultivos.hortaliza import Hortaliza
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.Entidades.cultivos.zanahoria import Zanahoria
+from python_forestacion.Entidades.cultivos.tipo_aceituna import TipoAceituna
+from python_forestacion.servicios.cultivos.cultivo_service_registry import CultivoServiceRegistry
+from python_forestacion.riego.lote.motor_riego_lote import MotorRiegoLote, np
+from python_forestacion.excepciones.superficie_insuficiente_exception import SuperficieInsuficienteException
+
+
+class TestPlantacionColumnar(unittest.TestCase):
+    """Pruebas del modo de almacenamiento columnar de Plantacion."""
+
+    def setUp(self):
+        self.plantacion = Plantacion("Columnar", 1000.0, 500.0, columnar=True)
+        self.plantacion.agregar_cultivo(Pino(10, 1.0))
+        self.plantacion.agregar_cultivo(Olivo(8, 1.2, TipoAceituna.PICUAL))
+        self.plantacion.agregar_cultivo(Lechuga(2, 60))
+        self.plantacion.agregar_cultivo(Zanahoria(3, 80, 0.3))
+
+    def test_vistas_exponen_atributos(self):
+        """Cada fila debe leerse como el cultivo original."""
+        pino, olivo, lechuga, zanahoria = self.plantacion.cultivos
+        self.assertTrue(self.plantacion.es_columnar)
+        self.assertEqual(len(self.plantacion.cultivos), 4)
+        self.assertEqual(pino.nombre, "Pino")
+        self.assertEqual(pino.altura, 1.0)
+        self.assertEqual(olivo.tipo_aceituna, TipoAceituna.PICUAL)
+        self.assertEqual(lechuga.dias_crecimiento, 60)
+        self.assertFalse(lechuga.regada)
+        self.assertEqual(zanahoria.profundidad, 0.3)
+        self.assertEqual(str(pino), "Pino (10.0 m²)")
+
+    def test_regar_todos_escribe_en_columnas(self):
+        """El riego debe aplicar las mismas reglas que los objetos."""
+        self.plantacion.regar_todos(10)
+        pino, olivo, lechuga, zanahoria = self.plantacion.cultivos
+        self.assertAlmostEqual(pino.altura, 1.05)
+        self.assertAlmostEqual(olivo.produccion_anual, 2.0)
+        self.assertTrue(lechuga.regada)
+        self.assertTrue(zanahoria.regada)
+        self.assertEqual(self.plantacion.agua_disponible, 490.0)
+
+    def test_mostrar_datos_con_vistas(self):
+        """El registry debe despachar las vistas a los handlers de cada tipo."""
+        registry = CultivoServiceRegistry()
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            for cultivo in self.plantacion.cultivos[:4]:
+                registry.mostrar_datos(cultivo)
+        self.assertIn("Tipo: Pino", salida.getvalue())
+        self.assertIn("Tipo de aceituna: Picual", salida.getvalue())
+        self.assertNotIn("Dias de crecimiento: 0", salida.getvalue())
+
+    def test_materializar_y_remover(self):
+        """Las filas se pueden convertir en objetos y eliminar."""
+        olivo = self.plantacion.cultivos[1].materializar()
+        self.assertIs(type(olivo), Olivo)
+        self.assertEqual(olivo.tipo_aceituna, TipoAceituna.PICUAL)
+
+        self.plantacion.cultivos.remove(self.plantacion.cultivos[0])
+        self.assertEqual([c.nombre for c in self.plantacion.cultivos], ["Olivo", "Lechuga", "Zanahoria"])
+
+
+    def test_vistas_tomadas_antes_de_borrar(self):
+        """Las vistas siguen su fila aunque un borrado la desplace."""
+        almacen = self.plantacion.cultivos
+        almacen.append(Pino(5, 2.0))
+        almacen.append(Lechuga(1, 30))
+        pinos = [vista for vista in almacen if vista.nombre == "Pino"]
+        lechugas = [vista for vista in almacen if vista.nombre == "Lechuga"]
+        for vista in pinos:
+            almacen.remove(vista)
+        self.assertEqual([c.nombre for c in almacen], ["Olivo", "Lechuga", "Zanahoria", "Lechuga"])
+        self.assertEqual([vista.dias_crecimiento for vista in lechugas], [60, 30])
+
+        almacen.remove(lechugas[1])
+        self.assertEqual([c.nombre for c in almacen], ["Olivo", "Lechuga", "Zanahoria"])
+        with self.assertRaises(ValueError):
+            pinos[0].altura
+        with self.assertRaises(ValueError):
+            almacen.remove(lechugas[1])
+        self.assertEqual(len(almacen), 3)
+
+
+def _poblar(plantacion: Plantacion) -> None:
+    for _ in range(3):
+        plantacion.agregar_cultivo(Pino(10, 1.0))
+        plantacion.agregar_cultivo(Olivo(8, 1.2, TipoAceituna.ARBEQUINA))
+        plantacion.agregar_cultivo(Lechuga(2, 60))
+        plantacion.agregar_cultivo(Zanahoria(3, 80, 0.3))
+
+
+def _estado(plantacion: Plantacion) -> list[tuple]:
+    return [
+        (c.nombre, round(getattr(c, "altura", 0), 6), round(getattr(c, "produccion_anual", 0), 6),
+         bool(getattr(c, "regada", False)))
+        for c in plantacion.cultivos
+    ]
+
+
+class TestRiegoLote(unittest.TestCase):
+    """El riego en lote debe producir el mismo estado que el riego por cultivo."""
+
+    def _comparar(self, columnar: bool, motor: MotorRiegoLote):
+        esperado = Plantacion("Uno a uno", 1000.0, 500.0, columnar=columnar)
+        obtenido = Plantacion("Lote", 1000.0, 500.0, columnar=columnar)
+        _poblar(esperado)
+        _poblar(obtenido)
+
+        esperado.regar_todos(12)
+        motor.regar(obtenido.cultivos, 12)
+        self.assertEqual(_estado(esperado), _estado(obtenido))
+
+    def test_lote_lista(self):
+        self._comparar(False, MotorRiegoLote())
+
+    def test_lote_columnar_python_puro(self):
+        self._comparar(True, MotorRiegoLote(usar_numpy=False))
+
+    @unittest.skipIf(np is None, "NumPy no está instalado")
+    def test_lote_columnar_numpy(self):
+        self._comparar(True, MotorRiegoLote())
+
+    def test_regar_todos_en_lote_descuenta_agua(self):
+        plantacion = Plantacion("Lote", 1000.0, 500.0)
+        _poblar(plantacion)
+        plantacion.regar_todos(10, en_lote=True)
+        self.assertEqual(plantacion.agua_disponible, 490.0)
+
+    def test_lote_rechaza_con_mensaje_del_tipo(self):
+        """Un tipo por debajo de su mínimo lanza el error propio del cultivo."""
+        for columnar in (False, True):
+            plantacion = Plantacion("Lote", 1000.0, 500.0, columnar=columnar)
+            _poblar(plantacion)
+            with self.assertRaisesRegex(ValueError, "pino"):
+                plantacion.regar_todos(6, en_lote=True)
+
+
+class TestRiegoTransaccional(unittest.TestCase):
+    """El riego transaccional valida todo antes de modificar algún cultivo."""
+
+    def setUp(self):
+        self.plantacion = Plantacion("Transaccional", 1000.0, 500.0)
+        _poblar(self.plantacion)
+
+    def test_rechazo_no_modifica_nada(self):
+        antes = _estado(self.plantacion)
+        resultado = self.plantacion.regar_transaccional(6)
+
+        self.assertFalse(resultado)
+        self.assertEqual(list(resultado.rechazos), ["Pino"])
+        self.assertEqual(_estado(self.plantacion), antes)
+        self.assertEqual(self.plantacion.agua_disponible, 500.0)
+
+    def test_agua_insuficiente(self):
+        resultado = self.plantacion.regar_transaccional(600)
+        self.assertFalse(resultado.exitoso)
+        self.assertIn("Agua insuficiente", resultado.motivo)
+
+    def test_exito_aplica_y_descuenta(self):
+        for columnar in (False, True):
+            plantacion = Plantacion("Transaccional", 1000.0, 500.0, columnar=columnar)
+            _poblar(plantacion)
+            resultado = plantacion.regar_transaccional(10)
+
+            self.assertTrue(resultado.exitoso)
+            self.assertEqual(resultado.cultivos_regados, 12)
+            self.assertEqual(plantacion.agua_disponible, 490.0)
+            self.assertTrue(all(c.regada for c in plantacion.cultivos if c.nombre == "Lechuga"))
+
+    def test_estado_derivado_se_reconstruye_al_cargar(self):
+        """Los pickles no guardan el conteo por tipo: se recalcula al cargar."""
+        copia = pickle.loads(pickle.dumps(self.plantacion))
+        self.assertFalse(copia.regar_transaccional(6))
+        self.assertTrue(copia.regar_transaccional(10))
+
+    def test_carga_archivo_formato_anterior(self):
+        ruta = os.path.join(os.path.dirname(__file__), "..", "..", "data", "registro_inicial.dat")
+        with open(ruta, "rb") as archivo:
+            registro = pickle.load(archivo)
+        plantacion = registro.listar_todas()[0]
+        self.assertTrue(plantacion.regar_transaccional(10))
+
+
+class TestSuperficiePlantacion(unittest.TestCase):
+    """Contabilidad incremental de superficie y plantado en lote."""
+
+    def test_contadores_al_agregar_y_remover(self):
+        plantacion = Plantacion("Superficie", 20.0, 100.0)
+        pino = Pino(10, 1.0)
+        plantacion.agregar_cultivo(pino)
+        plantacion.agregar_cultivo(Lechuga(2, 60))
+        self.assertEqual(plantacion.superficie_ocupada, 12.0)
+        self.assertEqual(plantacion.superficie_libre, 8.0)
+
+        with self.assertRaises(SuperficieInsuficienteException):
+            plantacion.agregar_cultivo(Pino(10, 1.0))
+
+        plantacion.remover_cultivo(pino)
+        self.assertEqual(plantacion.superficie_libre, 18.0)
+        plantacion.agregar_cultivo(Pino(10, 1.0))
+
+    def test_plantar_lote(self):
+        for columnar in (False, True):
+            plantacion = Plantacion("Lote", 100.0, 100.0, columnar=columnar)
+            plantacion.plantar_lote("Zanahoria", 10, profundidad=0.4)
+            self.assertEqual(len(plantacion.cultivos), 10)
+            self.assertEqual(plantacion.superficie_ocupada, 30.0)
+            self.assertEqual(plantacion.cultivos[9].profundidad, 0.4)
+            self.assertTrue(plantacion.regar_transaccional(1))
+
+    def test_plantar_lote_valida_antes_de_agregar(self):
+        plantacion = Plantacion("Lote", 100.0, 100.0)
+        plantacion.plantar_lote("Pino", 5)
+        with self.assertRaises(SuperficieInsuficienteException):
+            plantacion.plantar_lote("Pino", 6)
+        self.assertEqual(len(plantacion.cultivos), 5)
+        self.assertEqual(plantacion.superficie_ocupada, 50.0)
+
+
+class TestIndicePorTipo(unittest.TestCase):
+    """Buckets por clase de cultivo: consultas, conteos y bajas por tipo."""
+
+    def test_cultivos_de_tipo_incluye_subclases(self):
+        for columnar in (False, True):
+            plantacion = Plantacion("Tipos", 1000.0, 500.0, columnar=columnar)
+            _poblar(plantacion)
+            arboles = plantacion.cultivos_de_tipo(Arbol)
+            self.assertEqual(sorted(c.nombre for c in arboles), ["Olivo"] * 3 + ["Pino"] * 3)
+            self.assertEqual(len(plantacion.cultivos_de_tipo(Lechuga)), 3)
+            self.assertEqual(plantacion.cultivos_de_tipo(Olivo)[0].tipo_aceituna, TipoAceituna.ARBEQUINA)
+
+    def test_contar_por_tipo(self):
+        plantacion = Plantacion("Tipos", 1000.0, 500.0)
+        _poblar(plantacion)
+        plantacion.plantar_lote("Pino", 2)
+        self.assertEqual(plantacion.contar_por_tipo(), {Pino: 5, Olivo: 3, Lechuga: 3, Zanahoria: 3})
+
+    def test_remover_tipo(self):
+        for columnar in (False, True):
+            plantacion = Plantacion("Tipos", 1000.0, 500.0, columnar=columnar)
+            _poblar(plantacion)
+            removidos = plantacion.remover_tipo(Hortaliza)
+            self.assertEqual(len(removidos), 6)
+            self.assertTrue(all(isinstance(c, Hortaliza) for c in removidos))
+            self.assertEqual([c.nombre for c in plantacion.cultivos], ["Pino", "Olivo"] * 3)
+            self.assertEqual(plantacion.superficie_ocupada, 54.0)
+            self.assertEqual(plantacion.cultivos_de_tipo(Lechuga), [])
+            self.assertNotIn(Lechuga, plantacion.contar_por_tipo())
+
+    def test_indice_coherente_tras_remover_y_cargar(self):
+        plantacion = Plantacion("Tipos", 1000.0, 500.0)
+        _poblar(plantacion)
+        plantacion.remover_cultivo(plantacion.cultivos_de_tipo(Pino)[0])
+        plantacion.remover_tipo(Olivo)
+        plantacion.agregar_cultivo(Olivo(8, 1.2, TipoAceituna.PICUAL))
+
+        copia = pickle.loads(pickle.dumps(plantacion))
+        for p in (plantacion, copia):
+            self.assertEqual(len(p.cultivos), 9)
+            self.assertEqual(p.contar_por_tipo(), {Pino: 2, Olivo: 1, Lechuga: 3, Zanahoria: 3})
+            self.assertEqual(len(p.cultivos_de_tipo(Arbol)), 3)
+
+    def test_remover_cultivos_uno_por_uno(self):
+        for columnar in (False, True):
+            plantacion = Plantacion("Tipos", 1000.0, 500.0, columnar=columnar)
+            _poblar(plantacion)
+            registro = RegistroForestal()
+            registro.agregar_plantacion(plantacion)
+            pinos = plantacion.cultivos_de_tipo(Pino)
+            for pino in pinos:
+                plantacion.remover_cultivo(pino)
+
+            self.assertEqual(plantacion.contar_por_tipo(), {Olivo: 3, Lechuga: 3, Zanahoria: 3})
+            self.assertEqual(plantacion.superficie_ocupada, 39.0)
+            self.assertEqual(registro.nombres_con_tipo(Pino), [])
+            self.assertEqual(registro.nombres_con_tipo(Lechuga), ["Tipos"])
+            # Un cultivo ya quitado se rechaza sin tocar los conteos
+            with self.assertRaises(ValueError):
+                plantacion.remover_cultivo(pinos[0])
+            self.assertEqual(len(plantacion.cultivos), 9)
+            self.assertEqual(plantacion.superficie_ocupada, 39.0)
+
+    def test_volver_a_agregar_removidos(self):
+        plantacion = Plantacion("Tipos", 1000.0, 500.0)
+        _poblar(plantacion)
+        removidos = plantacion.remover_tipo(Pino)
+        plantacion.agregar_cultivo(removidos[0])
+
+        self.assertEqual(plantacion.contar_por_tipo()[Pino], 1)
+        self.assertEqual(sum(1 for c in plantacion.cultivos if c is removidos[0]), 1)
+        self.assertEqual(len(plantacion.cultivos), sum(plantacion.contar_por_tipo().values()))
+        self.assertEqual(plantacion.superficie_ocupada, sum(c.superficie for c in plantacion.cultivos))
+
+    def test_riego_en_lote_usa_buckets(self):
+        plantacion = Plantacion("Tipos", 1000.0, 500.0)
+        _poblar(plantacion)
+        plantacion.remover_tipo(Pino)
+        self.assertTrue(plantacion.regar_transaccional(6))
+        self.assertTrue(all(c.regada for c in plantacion.cultivos_de_tipo(Hortaliza)))
+
+
+class TestUbicacionEspacial(unittest.TestCase):
+    """Ubicación (x, y) de cultivos y consultas por zona."""
+
+    def setUp(self):
+        self.plantacion = Plantacion("Espacial", 10_000.0, 500.0)
+        self.plantacion.habilitar_indice_espacial(100.0, 100.0, tamano_celda=10.0)
+        # Lechugas de 4 m² (2 x 2) en una grilla con centros cada 5 m
+        self.lechugas = {}
+        for x in range(5, 100, 5):
+            for y in range(5, 100, 5):
+                lechuga = Lechuga(4, 60)
+                self.plantacion.agregar_cultivo(lechuga, posicion=(x, y))
+                self.lechugas[(x, y)] = lechuga
+
+    def test_consultas_por_rectangulo_y_radio(self):
+        en_rectangulo = self.plantacion.cultivos_en_rectangulo(10, 10, 20, 20)
+        self.assertEqual(len(en_rectangulo), 9)
+        en_radio = self.plantacion.cultivos_en_radio(50, 50, 5)
+        self.assertEqual({self.plantacion.posicion_de(c) for c in en_radio},
+                         {(50, 50), (45, 50), (55, 50), (50, 45), (50, 55)})
+        self.assertEqual(len(self.plantacion.cultivos_en_radio(0, 0, 1000)), len(self.lechugas))
+
+    def test_posicion_invalida(self):
+        with self.assertRaises(ValueError):
+            self.plantacion.agregar_cultivo(Lechuga(4, 60), posicion=(6, 5))
+        with self.assertRaises(ValueError):
+            self.plantacion.agregar_cultivo(Lechuga(4, 60), posicion=(99.5, 50))
+        self.assertEqual(len(self.plantacion.cultivos), len(self.lechugas))
+
+    def test_buscar_lugar_y_mover(self):
+        self.assertIsNone(self.plantacion.buscar_lugar(25))
+        lugar = self.plantacion.buscar_lugar(1)
+        self.assertIsNotNone(lugar)
+        self.plantacion.agregar_cultivo(Lechuga(1, 60), posicion=lugar)
+
+        lechuga = self.lechugas[(50, 50)]
+        self.plantacion.remover_cultivo(self.lechugas[(55, 50)])
+        self.plantacion.ubicar_cultivo(lechuga, 52.5, 50)
+        self.assertEqual(self.plantacion.cultivos_en_rectangulo(51, 49, 54, 51), [lechuga])
+
+    def test_bajas_por_tipo_y_persistencia(self):
+        pino = Pino(9, 1.0)
+        self.plantacion.agregar_cultivo(pino)
+        self.assertIsNone(self.plantacion.posicion_de(pino))
+
+        copia = pickle.loads(pickle.dumps(self.plantacion))
+        self.assertEqual(len(copia.cultivos_en_rectangulo(10, 10, 20, 20)), 9)
+
+        self.plantacion.remover_tipo(Lechuga)
+        self.assertEqual(self.plantacion.cultivos_en_radio(50, 50, 1000), [])
+        self.assertEqual(self.plantacion.buscar_lugar(9), (1.5, 1.5))
+
+    def test_requiere_modo_lista(self):
+        with self.assertRaises(ValueError):
+            Plantacion("Columnar", 100.0, 10.0, columnar=True).habilitar_indice_espacial(10, 10)
+        with self.assertRaises(ValueError):
+            Plantacion("Sin índice", 100.0, 10.0).cultivos_en_radio(0, 0, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
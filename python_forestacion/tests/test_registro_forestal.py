@@ -0,0 +1,89 @@
+import pickle
+import unittest
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.consultas.predicados import Igual, Rango, ContieneTipo, Filtro
+from python_forestacion.Entidades.cultivos.arbol import Arbol
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.olivo import Olivo
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+
+
+def _nombres(plantaciones) -> list[str]:
+    return sorted(p.nombre for p in plantaciones)
+
+
+def _es_par(plantacion: Plantacion) -> bool:
+    return int(plantacion.nombre.split()[-1]) % 2 == 0
+
+
+class TestConsultasRegistro(unittest.TestCase):
+    """Índices secundarios y consultas por predicados de RegistroForestal."""
+
+    def setUp(self):
+        self.registro = RegistroForestal()
+        for i in range(10):
+            plantacion = Plantacion(f"Finca {i}", 100.0 + 10 * i, 50.0 * i)
+            plantacion.plantar_lote("Pino" if i < 5 else "Lechuga", 2)
+            self.registro.agregar_plantacion(plantacion, id_padron=1000 + i)
+        self.registro.buscar_plantacion("Finca 9").plantar_lote("Olivo", 1)
+
+    def test_buscar_por_padron(self):
+        self.assertEqual(self.registro.buscar_por_padron(1003).nombre, "Finca 3")
+        self.assertIsNone(self.registro.buscar_por_padron(1))
+        self.assertEqual(_nombres(self.registro.consultar(Igual("id_padron", 1007))), ["Finca 7"])
+
+    def test_padron_reasignado(self):
+        self.registro.agregar_plantacion(Plantacion("Finca 10", 100.0, 0.0), id_padron=1003)
+        self.assertEqual(self.registro.buscar_por_padron(1003).nombre, "Finca 10")
+        self.assertIsNone(self.registro.padron_de("Finca 3"))
+
+        # Eliminar al dueño anterior no borra el padrón del nuevo
+        self.registro.eliminar_plantacion("Finca 3")
+        self.assertEqual(self.registro.buscar_por_padron(1003).nombre, "Finca 10")
+        self.assertEqual(_nombres(self.registro.consultar(Igual("id_padron", 1003))), ["Finca 10"])
+
+    def test_rangos_y_tipos(self):
+        self.assertEqual(_nombres(self.registro.consultar(Rango("agua_disponible", 100, 200))),
+                         ["Finca 2", "Finca 3", "Finca 4"])
+        self.assertEqual(_nombres(self.registro.consultar(ContieneTipo(Arbol))),
+                         ["Finca 0", "Finca 1", "Finca 2", "Finca 3", "Finca 4", "Finca 9"])
+        self.assertEqual(_nombres(self.registro.consultar(ContieneTipo(Olivo), Rango("superficie", 150))),
+                         ["Finca 9"])
+        self.assertEqual(_nombres(self.registro.consultar(Igual("superficie", 120.0))), ["Finca 2"])
+
+    def test_predicados_sin_indice(self):
+        self.assertEqual(_nombres(self.registro.consultar(Filtro(_es_par), ContieneTipo(Lechuga))),
+                         ["Finca 6", "Finca 8"])
+        self.assertEqual(_nombres(self.registro.consultar(Rango("superficie_ocupada", 4, 4))),
+                         ["Finca 5", "Finca 6", "Finca 7", "Finca 8"])
+
+    def test_indices_siguen_los_cambios(self):
+        plantacion = self.registro.buscar_plantacion("Finca 0")
+        plantacion.agua_disponible = 1000.0
+        plantacion.remover_tipo(Pino)
+        plantacion.plantar_lote("Lechuga", 1)
+
+        self.assertEqual(_nombres(self.registro.consultar(Rango("agua_disponible", 500))), ["Finca 0"])
+        self.assertNotIn("Finca 0", _nombres(self.registro.consultar(ContieneTipo(Pino))))
+        self.assertIn("Finca 0", _nombres(self.registro.consultar(ContieneTipo(Lechuga))))
+
+    def test_eliminar_quita_de_los_indices(self):
+        plantacion = self.registro.buscar_plantacion("Finca 4")
+        self.registro.eliminar_plantacion("Finca 4")
+        plantacion.agua_disponible = 175.0
+        self.assertIsNone(self.registro.buscar_por_padron(1004))
+        self.assertEqual(self.registro.consultar(Rango("agua_disponible", 175, 200)), [])
+        self.assertNotIn("Finca 4", _nombres(self.registro.consultar(ContieneTipo(Pino))))
+
+    def test_indices_se_reconstruyen_al_cargar(self):
+        copia = pickle.loads(pickle.dumps(self.registro))
+        self.assertEqual(copia.buscar_por_padron(1005).nombre, "Finca 5")
+        copia.buscar_plantacion("Finca 1").agua_disponible = 999.0
+        self.assertEqual(_nombres(copia.consultar(Rango("agua_disponible", 900))), ["Finca 1"])
+        self.assertEqual(self.registro.consultar(Rango("agua_disponible", 900)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import gc
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from python_forestacion.Entidades.terrenos.plantacion import Plantacion
+from python_forestacion.Entidades.terrenos.registro_forestal import RegistroForestal
+from python_forestacion.Entidades.terrenos.registro_perezoso import RegistroPerezoso
+from python_forestacion.Entidades.terrenos.consultas.predicados import Rango, ContieneTipo
+from python_forestacion.Entidades.cultivos.pino import Pino
+from python_forestacion.Entidades.cultivos.lechuga import Lechuga
+from python_forestacion.servicios.negocio.paquete import Paquete
+from python_forestacion.servicios.negocio.paquete_fragmentado import PaqueteFragmentado
+
+
+class _Fuente:
+    """Plantaciones serializadas que se cargan contando los pedidos."""
+
+    def __init__(self, cantidad: int):
+        self.pickles = {}
+        self.resumenes = {}
+        self.pedidos = []
+        for i in range(cantidad):
+            plantacion = Plantacion(f"Finca {i}", 100.0, float(i))
+            plantacion.plantar_lote("Pino" if i % 2 else "Lechuga", 2)
+            self.pickles[plantacion.nombre] = pickle.dumps(plantacion)
+            self.resumenes[plantacion.nombre] = {
+                "id_padron": i, "superficie": 100.0, "agua_disponible": float(i),
+                "conteo_por_tipo": plantacion.contar_por_tipo(),
+            }
+
+    def cargar(self, nombre: str) -> Plantacion:
+        self.pedidos.append(nombre)
+        return pickle.loads(self.pickles[nombre])
+
+
+class TestRegistroPerezoso(unittest.TestCase):
+    """Proxies de plantaciones cargadas a pedido con caché LRU."""
+
+    def setUp(self):
+        self.fuente = _Fuente(10)
+        self.registro = RegistroPerezoso(self.fuente.resumenes, self.fuente.cargar, capacidad=2)
+
+    def test_indices_sin_cargar(self):
+        self.assertEqual(len(self.registro.consultar(ContieneTipo(Pino))), 5)
+        self.assertEqual([p.nombre for p in self.registro.consultar(Rango("agua_disponible", 3, 4))],
+                         ["Finca 3", "Finca 4"])
+        self.assertEqual(self.registro.buscar_por_padron(7).nombre, "Finca 7")
+        self.assertEqual(self.fuente.pedidos, [])
+
+    def test_carga_al_usar_y_expulsa_lo_menos_reciente(self):
+        proxy = self.registro.buscar_plantacion("Finca 1")
+        self.assertFalse(proxy.cargada)
+        self.assertEqual(proxy.contar_por_tipo(), {Pino: 2})
+        for nombre in ("Finca 2", "Finca 3"):
+            self.registro.buscar_plantacion(nombre).superficie_ocupada
+        gc.collect()
+
+        self.assertEqual(self.registro.cargadas(), ["Finca 2", "Finca 3"])
+        self.assertFalse(proxy.cargada)
+        proxy.agua_disponible
+        self.assertEqual(self.fuente.pedidos, ["Finca 1", "Finca 2", "Finca 3", "Finca 1"])
+
+    def test_reutiliza_plantacion_en_uso_y_retiene_modificadas(self):
+        real = self.registro.buscar_plantacion("Finca 0").plantacion
+        modificada = self.registro.buscar_plantacion("Finca 1")
+        modificada.plantar_lote("Pino", 1)
+        for i in range(2, 6):
+            self.registro.buscar_plantacion(f"Finca {i}").agua_disponible
+        gc.collect()
+
+        self.assertIs(self.registro.buscar_plantacion("Finca 0").plantacion, real)
+        self.assertIn("Finca 1", self.registro.cargadas())
+        self.assertEqual(self.fuente.pedidos.count("Finca 0"), 1)
+        self.assertEqual(self.fuente.pedidos.count("Finca 1"), 1)
+
+    def test_expulsa_modificadas_despues_de_guardar(self):
+        directorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directorio)
+        for i in range(4):
+            self.registro.buscar_plantacion(f"Finca {i}").plantar_lote("Pino", 1)
+        self.assertEqual(len(self.registro.cargadas()), 4)
+
+        Paquete(directorio).guardar(self.registro, "registro")
+        gc.collect()
+        self.assertEqual(self.registro.cargadas(), ["Finca 2", "Finca 3"])
+        self.assertEqual([nombre for nombre in ("Finca 0", "Finca 1") if self.registro.en_memoria(nombre)], [])
+        # Al volver a cargarla conserva los cambios guardados, sin pedirla a la fuente
+        self.assertEqual(self.registro.buscar_plantacion("Finca 0").contar_por_tipo(), {Lechuga: 2, Pino: 1})
+        self.assertEqual(self.fuente.pedidos.count("Finca 0"), 1)
+
+    def test_indices_siguen_cambios_por_proxy(self):
+        proxy = self.registro.buscar_plantacion("Finca 0")
+        proxy.agua_disponible = 50.0
+        proxy.plantar_lote("Pino", 1)
+        self.assertEqual([p.nombre for p in self.registro.consultar(Rango("agua_disponible", 50, 60))],
+                         ["Finca 0"])
+        self.assertIn("Finca 0", self.registro.nombres_con_tipo(Pino))
+
+    def test_agregar_eliminar_y_serializar(self):
+        nueva = Plantacion("Nueva", 100.0, 1.0)
+        self.registro.agregar_plantacion(nueva, id_padron=99)
+        self.assertTrue(self.registro.eliminar_plantacion("Finca 4"))
+        self.assertIsNone(self.registro.buscar_plantacion("Finca 4"))
+        self.assertNotIn("Finca 4", self.registro.nombres_con_tipo(Lechuga))
+
+        copia = pickle.loads(pickle.dumps(self.registro))
+        self.assertIs(type(copia), RegistroForestal)
+        self.assertEqual(len(copia.listar_todas()), 10)
+        self.assertEqual(copia.buscar_por_padron(99).nombre, "Nueva")
+        self.assertEqual(copia.buscar_plantacion("Finca 3").contar_por_tipo(), {Pino: 2})
+
+
+class TestCargaPerezosa(unittest.TestCase):
+    """Registros perezosos sobre fragmentos y sobre el formato columnar."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.registro = RegistroForestal()
+        for i in range(6):
+            plantacion = Plantacion(f"Finca {i}", 100.0, 10.0, columnar=i % 2 == 0)
+            plantacion.plantar_lote("Pino", i + 1)
+            self.registro.agregar_plantacion(plantacion, id_padron=i)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_fragmentos_guarda_solo_lo_cargado_y_modificado(self):
+        paquete = PaqueteFragmentado(self.directorio)
+        paquete.guardar(self.registro, "registro")
+        perezoso = paquete.cargar_perezoso("registro", capacidad=2)
+
+        perezoso.buscar_por_padron(3).plantar_lote("Pino", 1)
+        self.assertEqual(paquete.guardar(perezoso, "registro"), 1)
+        self.assertEqual(perezoso.cargadas(), ["Finca 3"])
+        self.assertEqual(paquete.cargar("registro").buscar_plantacion("Finca 3").contar_por_tipo(), {Pino: 5})
+
+    def test_fragmentos_expulsa_y_relee_lo_guardado(self):
+        paquete = PaqueteFragmentado(self.directorio)
+        paquete.guardar(self.registro, "registro")
+        perezoso = paquete.cargar_perezoso("registro", capacidad=2)
+        for i in range(4):
+            perezoso.buscar_por_padron(i).plantar_lote("Pino", 1)
+
+        self.assertEqual(paquete.guardar(perezoso, "copia"), 6)
+        gc.collect()
+        # Las modificadas ya no se retienen: quedan las más recientes
+        self.assertEqual(perezoso.cargadas(), ["Finca 2", "Finca 3"])
+        self.assertEqual([f"Finca {i}" for i in range(6) if perezoso.en_memoria(f"Finca {i}")],
+                         ["Finca 2", "Finca 3"])
+        self.assertEqual(perezoso.buscar_plantacion("Finca 0").contar_por_tipo(), {Pino: 2})
+
+    def test_columnar(self):
+        paquete = Paquete(self.directorio)
+        paquete.guardar_columnar(self.registro, "registro")
+        perezoso = paquete.cargar_perezoso("registro", capacidad=1)
+        self.assertEqual(perezoso.consultar(ContieneTipo(Pino))[0].nombre, "Finca 0")
+        self.assertEqual(perezoso.cargadas(), [])
+        self.assertEqual(perezoso.buscar_plantacion("Finca 5").contar_por_tipo(), {Pino: 6})
+        self.assertTrue(perezoso.buscar_plantacion("Finca 4").es_columnar)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,10 @@
+import gc
+import pickle
+import threading
 import unittest
+from functools import partial
+from python_forestacion.patrones.observer.observable import Observable
+from python_forestacion.patrones.observer.observer import Observer
 from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
 from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
 from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
@@ -168,5 +174,113 @@ class TestSistemaRiego(unittest.TestCase):
         self.assertFalse(self.controlador.riego_activado)
 
 
+class _ObservadorRegistro(Observer):
+    """Anota las notificaciones y ejecuta `al_notificar` en la primera."""
+
+    def __init__(self, al_notificar=None):
+        self.recibidas = []
+        self.al_notificar = al_notificar
+
+    def actualizar(self, observable, *args, **kwargs):
+        self.recibidas.append(kwargs)
+        if self.al_notificar is not None:
+            al_notificar, self.al_notificar = self.al_notificar, None
+            al_notificar()
+
+
+class TestObservable(unittest.TestCase):
+    """Observable con instantánea copy-on-write, cerrojo y referencias débiles."""
+
+    def test_orden_y_sin_duplicados(self):
+        observable = Observable()
+        primero, segundo = _ObservadorRegistro(), _ObservadorRegistro()
+        for observador in (primero, segundo, primero):
+            observable.agregar_observador(observador)
+        self.assertEqual(observable.observadores(), [primero, segundo])
+        observable.eliminar_observador(primero)
+        observable.eliminar_observador(primero)
+        self.assertEqual(observable.observadores(), [segundo])
+
+    def test_cambios_durante_notificar(self):
+        observable = Observable()
+        nuevo = _ObservadorRegistro()
+        quitado = _ObservadorRegistro()
+        primero = _ObservadorRegistro()
+        primero.al_notificar = partial(self._cambiar, observable, nuevo, quitado)
+        for observador in (primero, quitado):
+            observable.agregar_observador(observador)
+
+        # La notificación en curso sigue con la instantánea del comienzo
+        observable.notificar(valor=1)
+        observable.notificar(valor=2)
+        self.assertEqual(primero.recibidas, [{"valor": 1}, {"valor": 2}])
+        self.assertEqual(quitado.recibidas, [{"valor": 1}])
+        self.assertEqual(nuevo.recibidas, [{"valor": 2}])
+
+    @staticmethod
+    def _cambiar(observable, nuevo, quitado):
+        observable.agregar_observador(nuevo)
+        observable.eliminar_observador(quitado)
+
+    def test_referencias_debiles(self):
+        sensor = TemperaturaReaderTask(debiles=True)
+        controlador = ControlRiegoTask()
+        descartado = ControlRiegoTask()
+        sensor.agregar_observador(controlador)
+        sensor.agregar_observador(descartado)
+        del descartado
+        gc.collect()
+
+        self.assertEqual(sensor.observadores(), [controlador])
+        temperatura = sensor.leer_temperatura()
+        self.assertEqual(controlador.temperatura, temperatura)
+        self.assertEqual(len(sensor._observadores), 1)
+
+    def test_pickle_sin_cerrojo(self):
+        sensor = HumedadReaderTask(debiles=True)
+        controlador = ControlRiegoTask()
+        sensor.agregar_observador(controlador)
+        copia_sensor, copia_controlador = pickle.loads(pickle.dumps((sensor, controlador)))
+        self.assertEqual(copia_sensor.tipo, "humedad")
+        self.assertEqual(copia_sensor.observadores(), [copia_controlador])
+        self.assertIsNot(copia_sensor._cerrojo, sensor._cerrojo)
+        humedad = copia_sensor.leer_humedad()
+        self.assertEqual(copia_controlador.humedad, humedad)
+
+    def test_altas_y_bajas_concurrentes(self):
+        observable = Observable()
+        fijo = _ObservadorRegistro()
+        observable.agregar_observador(fijo)
+        errores = []
+        hilos = [threading.Thread(target=self._notificar, args=(observable, 200, errores)) for _ in range(4)]
+        hilos += [threading.Thread(target=self._suscribir, args=(observable, 200, errores)) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(errores, [])
+        self.assertEqual(observable.observadores(), [fijo])
+        self.assertEqual(len(fijo.recibidas), 4 * 200)
+
+    @staticmethod
+    def _notificar(observable, veces, errores):
+        try:
+            for i in range(veces):
+                observable.notificar(valor=i)
+        except Exception as error:
+            errores.append(error)
+
+    @staticmethod
+    def _suscribir(observable, veces, errores):
+        try:
+            for _ in range(veces):
+                observador = _ObservadorRegistro()
+                observable.agregar_observador(observador)
+                observable.eliminar_observador(observador)
+        except Exception as error:
+            errores.append(error)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
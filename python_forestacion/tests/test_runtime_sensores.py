@@ -0,0 +1,170 @@
+import asyncio
+import math
+import random
+import time
+import unittest
+
+from python_forestacion.riego.runtime.runtime_sensores import RuntimeSensores
+from python_forestacion.riego.runtime.rueda_temporizacion import RuedaTemporizacion
+from python_forestacion.riego.runtime.agenda_monticulo import AgendaMonticulo
+from python_forestacion.riego.sensores.temperatura_reader_task import TemperaturaReaderTask
+from python_forestacion.riego.sensores.humedad_reader_task import HumedadReaderTask
+from python_forestacion.riego.control.control_riego_task import ControlRiegoTask
+from python_forestacion.patrones.observer.eventos.evento_sensor import EventoSensor
+from constante import INTERVALO_SENSOR_TEMPERATURA, INTERVALO_SENSOR_HUMEDAD, RESOLUCION_RUEDA
+
+
+class _SensorPresion(EventoSensor):
+    def __init__(self):
+        super().__init__("presion")
+
+    def leer(self) -> float:
+        self.actualizar_valor(1013.0)
+        return self.valor
+
+
+class TestRuntimeSensores(unittest.TestCase):
+    """Tareas periódicas de sensores sobre un único event loop."""
+
+    def test_intervalos_de_constante(self):
+        runtime = RuntimeSensores()
+        temperatura = runtime.agregar_sensor(TemperaturaReaderTask())
+        humedad = runtime.agregar_sensor(HumedadReaderTask())
+        self.assertEqual((temperatura.intervalo, humedad.intervalo),
+                         (INTERVALO_SENSOR_TEMPERATURA, INTERVALO_SENSOR_HUMEDAD))
+        with self.assertRaises(ValueError):
+            runtime.agregar_sensor(_SensorPresion())
+        with self.assertRaises(TypeError):
+            EventoSensor("presion")
+
+    def test_lecturas_periodicas_notifican(self):
+        runtime = RuntimeSensores()
+        controlador = ControlRiegoTask()
+        sensores = [TemperaturaReaderTask() if i % 2 else HumedadReaderTask() for i in range(200)]
+        for sensor in sensores:
+            sensor.agregar_observador(controlador)
+            runtime.agregar_sensor(sensor, intervalo=0.05)
+        asyncio.run(runtime.ejecutar(0.32))
+
+        estadisticas = runtime.estadisticas()
+        for tarea in runtime.tareas:
+            self.assertIn(tarea.ejecuciones, range(5, 8))
+        self.assertIsNotNone(controlador.temperatura)
+        self.assertEqual((estadisticas["errores"], estadisticas["forzadas"]), (0, 0))
+        self.assertLess(estadisticas["jitter_max"], 0.05)
+
+    def test_saltea_turnos_perdidos_y_cuenta_errores(self):
+        runtime = RuntimeSensores()
+        lenta = runtime.agregar_periodica("lenta", _bloquear, 0.01, desfase=0.0)
+        fallida = runtime.agregar_periodica("fallida", _fallar, 0.01)
+        asyncio.run(runtime.ejecutar(0.1))
+
+        self.assertGreater(lenta.omitidas, 0)
+        self.assertLessEqual(lenta.ejecuciones, 4)
+        self.assertEqual(fallida.errores, fallida.ejecuciones)
+
+    def test_cierre_dentro_del_timeout(self):
+        runtime = RuntimeSensores(timeout_cierre=0.1)
+        runtime.agregar_periodica("corta", _esperar_corto, 0.01, desfase=0.0)
+        runtime.agregar_periodica("colgada", _esperar_largo, 0.01, desfase=0.0)
+
+        async def detener_pronto():
+            asyncio.get_running_loop().call_later(0.02, runtime.detener)
+            await runtime.ejecutar()
+
+        inicio = time.perf_counter()
+        asyncio.run(detener_pronto())
+        self.assertLess(time.perf_counter() - inicio, 1.0)
+        self.assertEqual(runtime.forzadas, 1)
+
+    def test_agenda_rueda_y_quitar(self):
+        runtime = RuntimeSensores(agenda="rueda")
+        tareas = [runtime.agregar_sensor(TemperaturaReaderTask(), intervalo=0.05) for _ in range(100)]
+        quitada = tareas[0]
+
+        async def quitar_pronto():
+            asyncio.get_running_loop().call_later(0.12, runtime.quitar, quitada)
+            await runtime.ejecutar(0.32)
+
+        asyncio.run(quitar_pronto())
+        self.assertLessEqual(quitada.ejecuciones, 3)
+        for tarea in tareas[1:]:
+            self.assertIn(tarea.ejecuciones, range(5, 8))
+        self.assertEqual(runtime.estadisticas()["tareas"], 99)
+        with self.assertRaises(ValueError):
+            RuntimeSensores(agenda="lista")
+
+
+class TestAgendas(unittest.TestCase):
+    """Rueda de temporización jerárquica frente al montículo."""
+
+    def _verificar(self, agenda, resolucion: float):
+        azar = random.Random(7)
+        # Alcance de la rueda chica: 4 ** 3 = 64 ticks; hay turnos más lejanos
+        entradas = {}
+        for dato in range(3000):
+            instante = azar.uniform(0, 200) * resolucion
+            entradas[dato] = (instante, agenda.programar(instante, dato))
+        canceladas = set(azar.sample(range(3000), 300))
+        for dato in canceladas:
+            agenda.cancelar(entradas[dato][1])
+        self.assertEqual(len(agenda), 2700)
+
+        pendientes = {dato: instante for dato, (instante, _) in entradas.items() if dato not in canceladas}
+        ahora = 0.0
+        while pendientes:
+            proximo = agenda.proximo()
+            self.assertLessEqual(proximo, math.ceil(min(pendientes.values()) / resolucion) * resolucion + 1e-9)
+            ahora += azar.uniform(0, 5) * resolucion
+            vencidos = agenda.vencidos(ahora)
+            esperados = {dato for dato, instante in pendientes.items()
+                         if math.ceil(instante / resolucion) <= math.floor(ahora / resolucion)}
+            self.assertEqual({dato for _, dato in vencidos}, esperados)
+            for dato in esperados:
+                del pendientes[dato]
+        self.assertEqual(len(agenda), 0)
+        self.assertIsNone(agenda.proximo())
+
+    def test_rueda_con_cascadas_y_desborde(self):
+        self._verificar(RuedaTemporizacion(resolucion=0.5, ranuras=4, niveles=3), 0.5)
+
+    def test_rueda_por_defecto(self):
+        self._verificar(RuedaTemporizacion(), RESOLUCION_RUEDA)
+
+    def test_monticulo_exacto(self):
+        agenda = AgendaMonticulo()
+        agenda.programar(0.3, "b")
+        entrada = agenda.programar(0.2, "x")
+        agenda.programar(0.1, "a")
+        agenda.cancelar(entrada)
+        self.assertEqual(agenda.proximo(), 0.1)
+        self.assertEqual(agenda.vencidos(0.3), [(0.1, "a"), (0.3, "b")])
+
+    def test_turno_pasado_vence_en_el_proximo_tick(self):
+        rueda = RuedaTemporizacion(resolucion=1.0)
+        rueda.vencidos(10.0)
+        rueda.programar(3.0, "tarde")
+        self.assertEqual(rueda.proximo(), 11.0)
+        self.assertEqual(rueda.vencidos(11.0), [(3.0, "tarde")])
+        with self.assertRaises(ValueError):
+            RuedaTemporizacion(ranuras=100)
+
+
+def _bloquear():
+    time.sleep(0.03)
+
+
+def _fallar():
+    raise RuntimeError("sensor desconectado")
+
+
+async def _esperar_corto():
+    await asyncio.sleep(0.05)
+
+
+async def _esperar_largo():
+    await asyncio.sleep(10)
+
+
+if __name__ == "__main__":
+    unittest.main()